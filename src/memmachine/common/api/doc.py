@@ -79,6 +79,25 @@ class SpecDoc:
 
     EPISODE_COUNT = "The total number of episodic memories in the project."
 
+    DELETE_IN_BACKGROUND = """
+    Whether to delete the project in the background.
+
+    If true, the deletion is started and the request returns immediately with
+    the progress of the deletion. The progress can then be polled with the
+    project deletion status endpoint. Defaults to false, which returns only
+    once the project is deleted.
+    """
+
+    DELETION_STATUS = """
+    The status of the project deletion: `running`, `completed`, `failed`, or
+    `unknown` if the server has no record of a background deletion of the
+    project.
+    """
+
+    DELETED_EPISODES = "The number of episodic memories deleted so far."
+
+    DELETION_ERROR = "The error that made the deletion fail, if it failed."
+
     EPISODE_CONTENT = "The content payload of the episode."
 
     EPISODE_PRODUCER_ID = "Identifier of the episode producer."
@@ -141,6 +160,10 @@ class SpecDoc:
 
     LIST_SEMANTIC_MEMORY = "Listed semantic memory entries."
 
+    LIST_EPISODIC_MEMORY_NEXT_CURSOR = """
+    Cursor for the next page of episodic memory entries, if the page is full.
+    """
+
     MEMORY_CONTENT = "The content or text of the message."
 
     MEMORY_PRODUCER = """
@@ -221,6 +244,13 @@ class SpecDoc:
     The zero-based page number to retrieve. Use this for pagination.
     """
 
+    EPISODIC_CURSOR = """
+    Cursor returned with the previous page of episodic memory entries.
+    Listing continues after the cursor instead of skipping `page_num` pages,
+    which stays fast deep into long sessions. `page_num` is ignored for
+    episodic memory when a cursor is given.
+    """
+
     MEMORY_TYPE_SINGLE = """
     The specific memory type to list (e.g., episodic or semantic).
     """
@@ -378,9 +408,27 @@ class RouterDoc:
     This operation removes the project and all associated memories (episodes)
     permanently from the system. It cannot be undone.
 
+    If `background` is true, the deletion runs in the background and the
+    request returns immediately with status 202 and the progress of the
+    deletion. Deleting a project that is already being deleted returns the
+    running deletion.
+
     If the project does not exist, a not-found error is returned.
     """
 
+    GET_PROJECT_DELETION_STATUS = """
+    Retrieve the status of a background project deletion.
+
+    Returns the status of the latest background deletion of the specified
+    project and the number of episodes deleted so far. A failed deletion can be
+    resumed by deleting the project again.
+
+    Deletion status is tracked in memory by the server process that started
+    the deletion, so it is lost on restart and is not shared between workers
+    of a multi-worker deployment. If this process has no record of a
+    background deletion of the project, the status is `unknown`.
+    """
+
     ADD_MEMORIES = """
     Add memory messages to a project.
 
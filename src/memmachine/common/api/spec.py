@@ -434,6 +434,52 @@ class DeleteProjectSpec(BaseModel):
             examples=Examples.PROJECT_ID,
         ),
     ]
+    background: Annotated[
+        bool,
+        Field(description=SpecDoc.DELETE_IN_BACKGROUND),
+    ] = False
+
+
+class ProjectDeletionStatus(Enum):
+    """Enumeration for the status of a background project deletion."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    UNKNOWN = "unknown"
+
+
+class ProjectDeletionResponse(BaseModel):
+    """
+    Response model representing the progress of a background project deletion.
+
+    Episodes are deleted in batches, so `deleted_episodes` grows while the
+    deletion is running.
+    """
+
+    org_id: Annotated[
+        SafeId,
+        Field(description=SpecDoc.ORG_ID_RETURN),
+    ]
+    project_id: Annotated[
+        SafeId,
+        Field(description=SpecDoc.PROJECT_ID_RETURN),
+    ]
+    status: Annotated[
+        ProjectDeletionStatus,
+        Field(description=SpecDoc.DELETION_STATUS),
+    ]
+    deleted_episodes: Annotated[
+        int,
+        Field(
+            description=SpecDoc.DELETED_EPISODES,
+            ge=0,
+        ),
+    ] = 0
+    error: Annotated[
+        str | None,
+        Field(description=SpecDoc.DELETION_ERROR),
+    ] = None
 
 
 # Type alias for timestamp input
@@ -626,6 +672,10 @@ class ListMemoriesSpec(_WithOrgAndProj):
             examples=Examples.PAGE_NUM,
         ),
     ]
+    episodic_cursor: Annotated[
+        str | None,
+        Field(description=SpecDoc.EPISODIC_CURSOR),
+    ] = None
     filter: Annotated[
         str,
         Field(
@@ -822,6 +872,10 @@ class ListResultContent(BaseModel):
         list[SemanticFeature] | None,
         Field(default=None, description=SpecDoc.LIST_SEMANTIC_MEMORY),
     ]
+    episodic_memory_next_cursor: Annotated[
+        str | None,
+        Field(description=SpecDoc.LIST_EPISODIC_MEMORY_NEXT_CURSOR),
+    ] = None
 
 
 class RestErrorModel(BaseModel):
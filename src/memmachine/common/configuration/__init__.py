@@ -82,6 +82,36 @@ class SemanticMemoryConf(YamlSerializableMixin):
         default=timedelta(minutes=5),
         description="The amount of time a message is uningested before triggering an ingestion.",
     )
+    ingestion_batch_token_budget: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Approximate token budget of the messages sent to the LLM together "
+            "during ingestion. If None, each message is sent on its own."
+        ),
+    )
+    ingestion_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="The maximum number of sets ingested concurrently.",
+    )
+    ingestion_reconcile_interval: timedelta = Field(
+        default=timedelta(minutes=1),
+        description=(
+            "How often the database is checked for sets with uningested messages "
+            "that were not reported by notifications. Databases without "
+            "notifications are checked every 2 seconds instead."
+        ),
+    )
+    hnsw_ef_search: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Size of the candidate list scanned by the HNSW vector indexes "
+            "during semantic search on PostgreSQL. Higher values improve "
+            "recall at the cost of latency. If None, the server setting is used."
+        ),
+    )
 
 
 def _read_txt(filename: str) -> str:
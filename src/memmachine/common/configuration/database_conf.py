@@ -69,6 +69,20 @@ class Neo4jConf(YamlSerializableMixin, PasswordMixin):
         return f"bolt://{self.host}:{self.port}"
 
 
+class NumpyGraphConf(YamlSerializableMixin):
+    """Configuration options for an in-process NumPy vector graph store."""
+
+    snapshot_path: str | None = Field(
+        default=None,
+        description=(
+            "Directory to load snapshots from and save snapshots to. "
+            "Snapshots are loaded with pickle, "
+            "so the directory must only be writable by trusted users. "
+            "If not set, data is kept in memory only and lost on shutdown."
+        ),
+    )
+
+
 class SqlAlchemyConf(YamlSerializableMixin, PasswordMixin):
     """Configuration for SQLAlchemy-backed relational databases."""
 
@@ -152,18 +166,19 @@ class SupportedDB(str, Enum):
     """Supported database providers."""
 
     # <-- Add these annotations so mypy knows these attributes exist
-    conf_cls: type[Neo4jConf] | type[SqlAlchemyConf]
+    conf_cls: type[Neo4jConf] | type[NumpyGraphConf] | type[SqlAlchemyConf]
     dialect: str | None
     driver: str | None
 
     NEO4J = ("neo4j", Neo4jConf, None, None)
     POSTGRES = ("postgres", SqlAlchemyConf, "postgresql", "asyncpg")
     SQLITE = ("sqlite", SqlAlchemyConf, "sqlite", "aiosqlite")
+    NUMPY = ("numpy", NumpyGraphConf, None, None)
 
     def __new__(
         cls,
         value: str,
-        conf_cls: type[Neo4jConf] | type[SqlAlchemyConf],
+        conf_cls: type[Neo4jConf] | type[NumpyGraphConf] | type[SqlAlchemyConf],
         dialect: str | None,
         driver: str | None,
     ) -> Self:
@@ -184,8 +199,8 @@ class SupportedDB(str, Enum):
             f"Unsupported provider '{provider}'. Supported providers are: {valid}"
         )
 
-    def build_config(self, conf: dict) -> Neo4jConf | SqlAlchemyConf:
-        if self is SupportedDB.NEO4J:
+    def build_config(self, conf: dict) -> Neo4jConf | NumpyGraphConf | SqlAlchemyConf:
+        if self.is_vector_graph_store:
             return self.conf_cls(**conf)
         conf_copy = {**conf, "dialect": self.dialect, "driver": self.driver}
         return self.conf_cls(**conf_copy)
@@ -194,16 +209,26 @@ class SupportedDB(str, Enum):
     def is_neo4j(self) -> bool:
         return self is SupportedDB.NEO4J
 
+    @property
+    def is_numpy(self) -> bool:
+        return self is SupportedDB.NUMPY
+
+    @property
+    def is_vector_graph_store(self) -> bool:
+        return self.is_neo4j or self.is_numpy
+
 
 class DatabasesConf(BaseModel):
     """Top-level storage configuration mapping identifiers to backends."""
 
     neo4j_confs: dict[str, Neo4jConf] = {}
+    numpy_graph_confs: dict[str, NumpyGraphConf] = {}
     relational_db_confs: dict[str, SqlAlchemyConf] = {}
 
     PROVIDER_KEY: ClassVar[str] = "provider"
     CONFIG_KEY: ClassVar[str] = "config"
     NEO4J: ClassVar[str] = "neo4j"
+    NUMPY: ClassVar[str] = "numpy"
     RELATIONAL_DB: ClassVar[str] = "relational-db"
     POSTGRES: ClassVar[str] = "postgres"
     POSTGRESQL: ClassVar[str] = "postgresql"
@@ -218,6 +243,8 @@ class DatabasesConf(BaseModel):
             provider = self.SQLITE
             if db_type == self.NEO4J:
                 provider = self.NEO4J
+            elif db_type == self.NUMPY:
+                provider = self.NUMPY
             elif db_type == self.RELATIONAL_DB:
                 dialect = config.get(self.DIALECT)
                 if dialect == self.POSTGRESQL:
@@ -229,11 +256,18 @@ class DatabasesConf(BaseModel):
                 self.CONFIG_KEY: config,
             }
 
-        for database_id, conf in self.neo4j_confs.items():
-            add_database(database_id, self.NEO4J, conf.to_yaml_dict())
+        for database_id, neo4j_conf in self.neo4j_confs.items():
+            add_database(database_id, self.NEO4J, neo4j_conf.to_yaml_dict())
+
+        for database_id, numpy_graph_conf in self.numpy_graph_confs.items():
+            add_database(database_id, self.NUMPY, numpy_graph_conf.to_yaml_dict())
 
-        for database_id, conf in self.relational_db_confs.items():
-            add_database(database_id, self.RELATIONAL_DB, conf.to_yaml_dict())
+        for database_id, relational_db_conf in self.relational_db_confs.items():
+            add_database(
+                database_id,
+                self.RELATIONAL_DB,
+                relational_db_conf.to_yaml_dict(),
+            )
 
         return databases
 
@@ -249,6 +283,7 @@ class DatabasesConf(BaseModel):
             return databases
 
         neo4j_dict = {}
+        numpy_graph_dict = {}
         relational_db_dict = {}
 
         for database_id, resource_definition in databases.items():
@@ -260,10 +295,13 @@ class DatabasesConf(BaseModel):
 
             if provider.is_neo4j:
                 neo4j_dict[database_id] = config_obj
+            elif provider.is_numpy:
+                numpy_graph_dict[database_id] = config_obj
             else:
                 relational_db_dict[database_id] = config_obj
 
         return cls(
             neo4j_confs=neo4j_dict,
+            numpy_graph_confs=numpy_graph_dict,
             relational_db_confs=relational_db_dict,
         )
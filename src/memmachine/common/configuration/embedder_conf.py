@@ -10,12 +10,103 @@ from memmachine.common.configuration.mixin_confs import (
     ApiKeyMixin,
     AWSCredentialsMixin,
     MetricsFactoryIdMixin,
+    RequestSchedulerMixin,
     YamlSerializableMixin,
 )
 from memmachine.common.data_types import SimilarityMetric
 
 
-class AmazonBedrockEmbedderConf(YamlSerializableMixin, AWSCredentialsMixin):
+class EmbedderCacheConf(MetricsFactoryIdMixin, YamlSerializableMixin):
+    """Configuration for the query embedding cache of an embedder."""
+
+    max_size: int = Field(
+        default=1024,
+        description="Maximum number of query embeddings to keep in the cache.",
+        gt=0,
+    )
+    ttl_seconds: float | None = Field(
+        default=600,
+        description=(
+            "Time in seconds a cached query embedding stays valid. "
+            "If None, cached query embeddings do not expire."
+        ),
+        gt=0,
+    )
+
+
+class EmbedderPersistentCacheConf(MetricsFactoryIdMixin, YamlSerializableMixin):
+    """Configuration for the persistent ingest embedding cache of an embedder."""
+
+    path: str = Field(
+        ...,
+        min_length=1,
+        description="Path to the SQLite database file storing the embeddings.",
+    )
+
+
+class EmbedderBatchingConf(MetricsFactoryIdMixin, YamlSerializableMixin):
+    """Configuration for batching concurrent calls to an embedder."""
+
+    max_batch_size: int = Field(
+        default=256,
+        description=(
+            "Number of inputs at which a batch is sent without waiting further."
+        ),
+        gt=0,
+    )
+    max_wait_seconds: float = Field(
+        default=0.005,
+        description="Time in seconds a call waits for other calls to join its batch.",
+        ge=0,
+    )
+    max_pending_inputs: int = Field(
+        default=8192,
+        description=(
+            "Maximum number of inputs queued or being embedded. "
+            "Further calls wait until earlier batches complete."
+        ),
+        gt=0,
+    )
+
+
+class EmbedderCacheMixin(BaseModel):
+    """Pydantic mixin for embedder configs that support caching."""
+
+    cache: EmbedderCacheConf | None = Field(
+        default=None,
+        description=(
+            "Query embedding cache configuration. "
+            "If None, query embeddings are not cached."
+        ),
+    )
+    persistent_cache: EmbedderPersistentCacheConf | None = Field(
+        default=None,
+        description=(
+            "Persistent ingest embedding cache configuration. "
+            "If None, ingest embeddings are not cached."
+        ),
+    )
+
+
+class EmbedderBatchingMixin(BaseModel):
+    """Pydantic mixin for embedder configs that support batching calls."""
+
+    batching: EmbedderBatchingConf | None = Field(
+        default=None,
+        description=(
+            "Configuration for batching concurrent calls into shared requests. "
+            "If None, each call is sent as its own request."
+        ),
+    )
+
+
+class AmazonBedrockEmbedderConf(
+    EmbedderCacheMixin,
+    EmbedderBatchingMixin,
+    RequestSchedulerMixin,
+    YamlSerializableMixin,
+    AWSCredentialsMixin,
+):
     """Configuration for AmazonBedrockEmbedder."""
 
     region: str = Field(
@@ -42,7 +133,14 @@ class AmazonBedrockEmbedderConf(YamlSerializableMixin, AWSCredentialsMixin):
     )
 
 
-class OpenAIEmbedderConf(MetricsFactoryIdMixin, YamlSerializableMixin, ApiKeyMixin):
+class OpenAIEmbedderConf(
+    EmbedderCacheMixin,
+    EmbedderBatchingMixin,
+    RequestSchedulerMixin,
+    MetricsFactoryIdMixin,
+    YamlSerializableMixin,
+    ApiKeyMixin,
+):
     """Configuration for OpenAI embedding models."""
 
     model: str = Field(
@@ -81,7 +179,12 @@ class OpenAIEmbedderConf(MetricsFactoryIdMixin, YamlSerializableMixin, ApiKeyMix
         return v
 
 
-class SentenceTransformerEmbedderConf(MetricsFactoryIdMixin, YamlSerializableMixin):
+class SentenceTransformerEmbedderConf(
+    EmbedderCacheMixin,
+    EmbedderBatchingMixin,
+    MetricsFactoryIdMixin,
+    YamlSerializableMixin,
+):
     """Configuration for sentence-transformer based embedders."""
 
     model: str = Field(
@@ -120,6 +120,21 @@ class LongTermMemoryConf(BaseModel):
         False,
         description="Whether to chunk message episodes into sentences for embedding",
     )
+    lexical_search: bool = Field(
+        False,
+        description=(
+            "Whether to search a per-session BM25 index of the derivatives "
+            "alongside vector search"
+        ),
+    )
+    lexical_search_tokenizer: str = Field(
+        "default",
+        description="Tokenizer function to split text into tokens for lexical search",
+    )
+    lexical_search_language: str = Field(
+        "english",
+        description="Language for stop words in the default lexical search tokenizer",
+    )
 
 
 class LongTermMemoryConfPartial(BaseModel):
@@ -141,6 +156,21 @@ class LongTermMemoryConfPartial(BaseModel):
         default=None,
         description="ID of the Reranker instance for reranking search results",
     )
+    lexical_search: bool | None = Field(
+        default=None,
+        description=(
+            "Whether to search a per-session BM25 index of the derivatives "
+            "alongside vector search"
+        ),
+    )
+    lexical_search_tokenizer: str | None = Field(
+        default=None,
+        description="Tokenizer function to split text into tokens for lexical search",
+    )
+    lexical_search_language: str | None = Field(
+        default=None,
+        description="Language for stop words in the default lexical search tokenizer",
+    )
 
     def merge(self, other: Self) -> LongTermMemoryConf:
         """Merge with another partial into a complete long-term config."""
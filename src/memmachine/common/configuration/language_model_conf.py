@@ -10,6 +10,7 @@ from memmachine.common.configuration.mixin_confs import (
     ApiKeyMixin,
     AWSCredentialsMixin,
     MetricsFactoryIdMixin,
+    RequestSchedulerMixin,
     YamlSerializableMixin,
 )
 from memmachine.common.language_model.amazon_bedrock_language_model import (
@@ -20,7 +21,7 @@ DEFAULT_OLLAMA_BASE_URL = "http://host.docker.internal:11434/v1"
 
 
 class OpenAIResponsesLanguageModelConf(
-    MetricsFactoryIdMixin, YamlSerializableMixin, ApiKeyMixin
+    RequestSchedulerMixin, MetricsFactoryIdMixin, YamlSerializableMixin, ApiKeyMixin
 ):
     """Configuration for OpenAI Responses-compatible models."""
 
@@ -55,7 +56,7 @@ class OpenAIResponsesLanguageModelConf(
 
 
 class OpenAIChatCompletionsLanguageModelConf(
-    MetricsFactoryIdMixin, YamlSerializableMixin, ApiKeyMixin
+    RequestSchedulerMixin, MetricsFactoryIdMixin, YamlSerializableMixin, ApiKeyMixin
 ):
     """Configuration for OpenAI Chat Completions-compatible models."""
 
@@ -87,7 +88,10 @@ class OpenAIChatCompletionsLanguageModelConf(
 
 
 class AmazonBedrockLanguageModelConf(
-    MetricsFactoryIdMixin, YamlSerializableMixin, AWSCredentialsMixin
+    RequestSchedulerMixin,
+    MetricsFactoryIdMixin,
+    YamlSerializableMixin,
+    AWSCredentialsMixin,
 ):
     """
     Configuration for AmazonBedrockLanguageModel.
@@ -101,6 +105,7 @@ class AmazonBedrockLanguageModelConf(
         inference_config (AmazonBedrockConverseInferenceConfig | None): Inference config.
         additional_model_request_fields (dict[str, Any] | None): Extra request fields.
         max_retry_interval_seconds (int): Max retry interval when retrying API calls.
+        scheduler (RequestSchedulerConf | None): Request scheduler configuration.
 
     """
 
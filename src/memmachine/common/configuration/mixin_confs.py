@@ -14,6 +14,10 @@ from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.metrics_factory.prometheus_metrics_factory import (
     PrometheusMetricsFactory,
 )
+from memmachine.common.request_scheduler import (
+    RequestScheduler,
+    RequestSchedulerParams,
+)
 
 
 class UnknownMetricsFactoryError(ValueError):
@@ -259,3 +263,84 @@ type YamlObjType = (
     | bool
     | None
 )
+
+
+class RequestSchedulerConf(MetricsFactoryIdMixin, YamlSerializableMixin):
+    """Configuration for scheduling requests to a rate-limited API."""
+
+    max_concurrency: int | None = Field(
+        default=None,
+        description=(
+            "Maximum number of requests in flight. "
+            "The limit is lowered after rate limit responses "
+            "and raised again after successful requests. "
+            "If None, the number of requests in flight is not limited."
+        ),
+        gt=0,
+    )
+    min_concurrency: int = Field(
+        default=1,
+        description="Lowest limit of requests in flight after rate limit responses.",
+        gt=0,
+    )
+    requests_per_minute: float | None = Field(
+        default=None,
+        description=(
+            "Maximum number of requests started per minute. "
+            "If None, it is learned from rate limit response headers."
+        ),
+        gt=0,
+    )
+    tokens_per_minute: float | None = Field(
+        default=None,
+        description=(
+            "Maximum number of estimated tokens sent per minute. "
+            "If None, it is learned from rate limit response headers."
+        ),
+        gt=0,
+    )
+
+
+class RequestSchedulerMixin(BaseModel):
+    """Pydantic mixin for configs of models behind a rate-limited API."""
+
+    scheduler: RequestSchedulerConf | None = Field(
+        default=None,
+        description=(
+            "Configuration for scheduling requests to the API. "
+            "If None, requests are not limited "
+            "until the API responds with a rate limit error."
+        ),
+    )
+
+    def build_request_scheduler(
+        self,
+        max_backoff_seconds: float,
+    ) -> RequestScheduler | None:
+        """
+        Build the configured request scheduler.
+
+        Args:
+            max_backoff_seconds (float):
+                Maximum time in seconds requests are paused
+                after a rate limit response without a retry-after header.
+
+        Returns:
+            RequestScheduler | None:
+                The scheduler, or None if no scheduler is configured.
+
+        """
+        if self.scheduler is None:
+            return None
+
+        return RequestScheduler(
+            RequestSchedulerParams(
+                max_concurrency=self.scheduler.max_concurrency,
+                min_concurrency=self.scheduler.min_concurrency,
+                requests_per_minute=self.scheduler.requests_per_minute,
+                tokens_per_minute=self.scheduler.tokens_per_minute,
+                max_backoff_seconds=max_backoff_seconds,
+                metrics_factory=self.scheduler.get_metrics_factory(),
+                user_metrics_labels=self.scheduler.user_metrics_labels,
+            ),
+        )
@@ -88,6 +88,14 @@ class EmbedderRerankerConf(YamlSerializableMixin):
         ...,
         description="The embedder model resource id to use for reranking",
     )
+    candidate_cache_size: int = Field(
+        default=1024,
+        description=(
+            "Maximum number of candidate embeddings to cache by candidate content. "
+            "If 0, candidates are embedded on every rerank."
+        ),
+        ge=0,
+    )
 
 
 class IdentityRerankerConf(YamlSerializableMixin):
@@ -13,6 +13,11 @@ from langchain_aws import BedrockEmbeddings
 from pydantic import BaseModel, Field, InstanceOf
 
 from memmachine.common.data_types import ExternalServiceAPIError, SimilarityMetric
+from memmachine.common.request_scheduler import (
+    RequestScheduler,
+    RequestSchedulerParams,
+    estimate_token_count,
+)
 from memmachine.common.utils import chunk_text_balanced, unflatten_like
 
 from .embedder import Embedder
@@ -48,6 +53,13 @@ class AmazonBedrockEmbedderParams(BaseModel):
         description="Maximal retry interval in seconds (defualt: 120).",
         gt=0,
     )
+    request_scheduler: InstanceOf[RequestScheduler] | None = Field(
+        default=None,
+        description=(
+            "Scheduler shared by all requests to the Bedrock API. "
+            "If None, a scheduler without limits is used."
+        ),
+    )
 
 
 class AmazonBedrockEmbedder(Embedder):
@@ -63,6 +75,11 @@ class AmazonBedrockEmbedder(Embedder):
         self._max_input_length = params.max_input_length
         self._similarity_metric = params.similarity_metric
         self._max_retry_interval_seconds = params.max_retry_interval_seconds
+        self._request_scheduler = params.request_scheduler or RequestScheduler(
+            RequestSchedulerParams(
+                max_backoff_seconds=params.max_retry_interval_seconds,
+            ),
+        )
 
         # Get dimensions by embedding a dummy string.
         try:
@@ -155,7 +172,10 @@ class AmazonBedrockEmbedder(Embedder):
             )
 
             try:
-                chunk_embeddings = await async_embed_func(chunks)
+                async with self._request_scheduler.request(
+                    estimated_tokens=estimate_token_count(*chunks),
+                ):
+                    chunk_embeddings = await async_embed_func(chunks)
                 break
             except Exception as e:
                 # Assume all exceptions may be retried.
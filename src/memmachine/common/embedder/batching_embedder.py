@@ -0,0 +1,262 @@
+"""Embedder wrapper coalescing concurrent calls into batched requests."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, InstanceOf
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+
+from .embedder import Embedder
+
+_EmbedMethod = Literal["ingest", "search"]
+_QueueKey = tuple[_EmbedMethod, int]
+
+
+class BatchingEmbedderParams(BaseModel):
+    """Parameters for BatchingEmbedder."""
+
+    embedder: InstanceOf[Embedder] = Field(
+        ...,
+        description="Embedder to wrap.",
+    )
+    max_batch_size: int = Field(
+        default=256,
+        description=(
+            "Number of inputs at which a batch is sent without waiting further. "
+            "A single call with more inputs is sent as its own batch."
+        ),
+        gt=0,
+    )
+    max_wait_seconds: float = Field(
+        default=0.005,
+        description="Time in seconds a call waits for other calls to join its batch.",
+        ge=0,
+    )
+    max_pending_inputs: int = Field(
+        default=8192,
+        description=(
+            "Maximum number of inputs queued or being embedded. "
+            "Further calls wait until earlier batches complete."
+        ),
+        gt=0,
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        default=None,
+        description="An instance of MetricsFactory for collecting usage metrics.",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics.",
+    )
+
+
+@dataclass
+class _PendingCall:
+    inputs: list[Any]
+    future: asyncio.Future[list[list[float]]]
+
+
+@dataclass
+class _BatchQueue:
+    calls: list[_PendingCall] = field(default_factory=list)
+    num_inputs: int = 0
+    flush_handle: asyncio.TimerHandle | None = None
+
+
+class BatchingEmbedder(Embedder):
+    """
+    Micro-batching as an Embedder decorator.
+
+    Calls made within max_wait_seconds of each other
+    are sent to the wrapped embedder as a single request,
+    and the embeddings are scattered back to the callers.
+    Ingest and search calls, and calls with different max_attempts,
+    are batched separately.
+    """
+
+    def __init__(self, params: BatchingEmbedderParams) -> None:
+        """Initialize the decorator with a wrapped Embedder."""
+        super().__init__()
+
+        self._wrapped = params.embedder
+        self._max_batch_size = params.max_batch_size
+        self._max_wait_seconds = params.max_wait_seconds
+        self._max_pending_inputs = params.max_pending_inputs
+
+        self._queues: dict[_QueueKey, _BatchQueue] = {}
+        self._num_pending_inputs = 0
+        self._capacity_available = asyncio.Condition()
+        self._batch_tasks: set[asyncio.Task] = set()
+
+        metrics_factory = params.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = [*self._user_metrics_labels.keys(), "method"]
+
+            self._batch_size_histogram = metrics_factory.get_histogram(
+                "embedder_batch_size",
+                "Number of inputs in batches sent by BatchingEmbedder",
+                label_names=label_names,
+            )
+            self._batch_calls_histogram = metrics_factory.get_histogram(
+                "embedder_batch_calls",
+                "Number of coalesced calls in batches sent by BatchingEmbedder",
+                label_names=label_names,
+            )
+            self._batch_latency_histogram = metrics_factory.get_histogram(
+                "embedder_batch_latency_seconds",
+                "Latency in seconds for batches sent by BatchingEmbedder",
+                label_names=label_names,
+            )
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed the provided inputs in a batch shared with concurrent calls."""
+        return await self._embed("ingest", inputs, max_attempts)
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed search queries in a batch shared with concurrent calls."""
+        return await self._embed("search", queries, max_attempts)
+
+    async def _embed(
+        self,
+        method: _EmbedMethod,
+        inputs: list[Any],
+        max_attempts: int,
+    ) -> list[list[float]]:
+        if not inputs:
+            return []
+
+        await self._acquire_capacity(len(inputs))
+
+        future: asyncio.Future[list[list[float]]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        key = (method, max_attempts)
+        queue = self._queues.setdefault(key, _BatchQueue())
+        queue.calls.append(_PendingCall(inputs=list(inputs), future=future))
+        queue.num_inputs += len(inputs)
+
+        if queue.num_inputs >= self._max_batch_size:
+            self._flush(key)
+        elif queue.flush_handle is None:
+            queue.flush_handle = asyncio.get_running_loop().call_later(
+                self._max_wait_seconds,
+                self._flush,
+                key,
+            )
+
+        return await future
+
+    async def _acquire_capacity(self, num_inputs: int) -> None:
+        """Wait until the inputs fit within max_pending_inputs."""
+        async with self._capacity_available:
+            # A call larger than the limit proceeds once nothing else is pending.
+            await self._capacity_available.wait_for(
+                lambda: (
+                    self._num_pending_inputs == 0
+                    or self._num_pending_inputs + num_inputs <= self._max_pending_inputs
+                ),
+            )
+            self._num_pending_inputs += num_inputs
+
+    async def _release_capacity(self, num_inputs: int) -> None:
+        async with self._capacity_available:
+            self._num_pending_inputs -= num_inputs
+            self._capacity_available.notify_all()
+
+    def _flush(self, key: _QueueKey) -> None:
+        """Send the queued calls for the key as batches of at most max_batch_size."""
+        queue = self._queues[key]
+        if queue.flush_handle is not None:
+            queue.flush_handle.cancel()
+            queue.flush_handle = None
+
+        while queue.calls:
+            batch: list[_PendingCall] = []
+            batch_size = 0
+            while queue.calls and (
+                not batch
+                or batch_size + len(queue.calls[0].inputs) <= self._max_batch_size
+            ):
+                call = queue.calls.pop(0)
+                batch.append(call)
+                batch_size += len(call.inputs)
+            queue.num_inputs -= batch_size
+
+            task = asyncio.create_task(self._send_batch(key, batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+        del self._queues[key]
+
+    async def _send_batch(self, key: _QueueKey, batch: list[_PendingCall]) -> None:
+        """Embed a batch of calls and scatter the embeddings to the callers."""
+        method, max_attempts = key
+        inputs = [input_ for call in batch for input_ in call.inputs]
+
+        embed = (
+            self._wrapped.ingest_embed
+            if method == "ingest"
+            else self._wrapped.search_embed
+        )
+
+        start_time = time.monotonic()
+        try:
+            embeddings = await embed(inputs, max_attempts)
+        except Exception as err:
+            for call in batch:
+                if not call.future.done():
+                    call.future.set_exception(err)
+        except BaseException:
+            for call in batch:
+                call.future.cancel()
+            raise
+        else:
+            offset = 0
+            for call in batch:
+                if not call.future.done():
+                    call.future.set_result(
+                        embeddings[offset : offset + len(call.inputs)],
+                    )
+                offset += len(call.inputs)
+        finally:
+            await self._release_capacity(len(inputs))
+
+        if self._collect_metrics:
+            labels = {**self._user_metrics_labels, "method": method}
+            self._batch_size_histogram.observe(value=len(inputs), labels=labels)
+            self._batch_calls_histogram.observe(value=len(batch), labels=labels)
+            self._batch_latency_histogram.observe(
+                value=time.monotonic() - start_time,
+                labels=labels,
+            )
+
+    @property
+    def model_id(self) -> str:
+        """Return the embedding model identifier."""
+        return self._wrapped.model_id
+
+    @property
+    def dimensions(self) -> int:
+        """Return the embedding dimensionality."""
+        return self._wrapped.dimensions
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        """Return the similarity metric used by this embedder."""
+        return self._wrapped.similarity_metric
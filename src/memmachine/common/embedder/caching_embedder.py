@@ -0,0 +1,245 @@
+"""Embedder wrapper adding an in-memory query embedding cache."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from pydantic import BaseModel, Field, InstanceOf
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+
+from .embedder import Embedder
+
+_CacheKey = tuple[str, int, Hashable]
+
+
+class CachingEmbedderParams(BaseModel):
+    """Parameters for CachingEmbedder."""
+
+    embedder: InstanceOf[Embedder] = Field(
+        ...,
+        description="Embedder to wrap.",
+    )
+    max_size: int = Field(
+        default=1024,
+        description="Maximum number of query embeddings to keep in the cache.",
+        gt=0,
+    )
+    ttl_seconds: float | None = Field(
+        default=600,
+        description=(
+            "Time in seconds a cached query embedding stays valid. "
+            "If None, cached query embeddings do not expire."
+        ),
+        gt=0,
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        default=None,
+        description="An instance of MetricsFactory for collecting usage metrics.",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics.",
+    )
+
+
+class CachingEmbedder(Embedder):
+    """
+    Query embedding cache as an Embedder decorator.
+
+    Search embeddings are cached by (model_id, dimensions, query)
+    with least-recently-used and time-to-live eviction.
+    Concurrent searches for a query that is not cached yet
+    share a single request to the wrapped embedder,
+    which is not cancelled when one of the searches is.
+    Ingest embeddings are not cached.
+    """
+
+    def __init__(self, params: CachingEmbedderParams) -> None:
+        """Initialize the decorator with a wrapped Embedder."""
+        super().__init__()
+
+        self._wrapped = params.embedder
+        self._max_size = params.max_size
+        self._ttl_seconds = params.ttl_seconds
+
+        # Maps keys to (expiration time, embedding), least recently used first.
+        self._cache: OrderedDict[_CacheKey, tuple[float, list[float]]] = OrderedDict()
+        self._pending: dict[_CacheKey, asyncio.Future[list[float]]] = {}
+        self._resolve_tasks: set[asyncio.Task] = set()
+
+        metrics_factory = params.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = self._user_metrics_labels.keys()
+
+            self._hits_counter = metrics_factory.get_counter(
+                "embedder_cache_hits",
+                "Number of query embeddings served from the embedder cache",
+                label_names=label_names,
+            )
+            self._misses_counter = metrics_factory.get_counter(
+                "embedder_cache_misses",
+                "Number of query embeddings requested from the wrapped embedder",
+                label_names=label_names,
+            )
+            self._coalesced_counter = metrics_factory.get_counter(
+                "embedder_cache_coalesced",
+                "Number of query embeddings awaited from an identical pending request",
+                label_names=label_names,
+            )
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed the provided inputs using the wrapped embedder."""
+        return await self._wrapped.ingest_embed(inputs, max_attempts)
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed search queries, reusing cached and pending embeddings."""
+        if not queries:
+            return []
+
+        keys = [self._cache_key(query) for query in queries]
+        now = time.monotonic()
+
+        embeddings: list[list[float] | None] = [None] * len(queries)
+        waiting: dict[int, asyncio.Future[list[float]]] = {}
+        owned: dict[_CacheKey, asyncio.Future[list[float]]] = {}
+        owned_queries: list[Any] = []
+
+        num_hits = 0
+        for index, (key, query) in enumerate(zip(keys, queries, strict=True)):
+            cached_embedding = self._get_cached(key, now)
+            if cached_embedding is not None:
+                embeddings[index] = cached_embedding
+                num_hits += 1
+                continue
+
+            future = self._pending.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._pending[key] = future
+                owned[key] = future
+                owned_queries.append(query)
+            waiting[index] = future
+
+        if self._collect_metrics:
+            self._hits_counter.increment(
+                value=num_hits,
+                labels=self._user_metrics_labels,
+            )
+            self._misses_counter.increment(
+                value=len(owned),
+                labels=self._user_metrics_labels,
+            )
+            self._coalesced_counter.increment(
+                value=len(waiting) - len(owned),
+                labels=self._user_metrics_labels,
+            )
+
+        if owned:
+            # Run by its own task so that cancelling this call
+            # does not cancel the searches waiting for the same queries.
+            task = asyncio.create_task(
+                self._resolve_owned(owned, owned_queries, max_attempts),
+            )
+            self._resolve_tasks.add(task)
+            task.add_done_callback(self._resolve_tasks.discard)
+
+        for index, future in waiting.items():
+            embeddings[index] = list(await asyncio.shield(future))
+
+        return [embedding for embedding in embeddings if embedding is not None]
+
+    async def _resolve_owned(
+        self,
+        owned: dict[_CacheKey, asyncio.Future[list[float]]],
+        owned_queries: list[Any],
+        max_attempts: int,
+    ) -> None:
+        """Embed the queries this call is responsible for and publish the results."""
+        try:
+            owned_embeddings = await self._wrapped.search_embed(
+                owned_queries,
+                max_attempts,
+            )
+        except BaseException as err:
+            for key, future in owned.items():
+                self._pending.pop(key, None)
+                if not future.done():
+                    if isinstance(err, Exception):
+                        future.set_exception(err)
+                        # Mark as retrieved, as there may be no other waiters.
+                        future.exception()
+                    else:
+                        future.cancel()
+            if not isinstance(err, Exception):
+                raise
+            return
+
+        expires_at = (
+            time.monotonic() + self._ttl_seconds
+            if self._ttl_seconds is not None
+            else float("inf")
+        )
+        for (key, future), embedding in zip(
+            owned.items(), owned_embeddings, strict=True
+        ):
+            self._pending.pop(key, None)
+            self._put_cached(key, embedding, expires_at)
+            future.set_result(embedding)
+
+    def _cache_key(self, query: Hashable) -> _CacheKey:
+        return (self._wrapped.model_id, self._wrapped.dimensions, query)
+
+    def _get_cached(self, key: _CacheKey, now: float) -> list[float] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, embedding = entry
+        if expires_at <= now:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return list(embedding)
+
+    def _put_cached(
+        self,
+        key: _CacheKey,
+        embedding: list[float],
+        expires_at: float,
+    ) -> None:
+        self._cache[key] = (expires_at, list(embedding))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    @property
+    def model_id(self) -> str:
+        """Return the embedding model identifier."""
+        return self._wrapped.model_id
+
+    @property
+    def dimensions(self) -> int:
+        """Return the embedding dimensionality."""
+        return self._wrapped.dimensions
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        """Return the similarity metric used by this embedder."""
+        return self._wrapped.similarity_metric
@@ -8,10 +8,16 @@ from uuid import UUID, uuid4
 
 import numpy as np
 import openai
+from openai.types import CreateEmbeddingResponse
 from pydantic import BaseModel, Field, InstanceOf
 
 from memmachine.common.data_types import ExternalServiceAPIError, SimilarityMetric
 from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+from memmachine.common.request_scheduler import (
+    RequestScheduler,
+    RequestSchedulerParams,
+    estimate_token_count,
+)
 from memmachine.common.utils import chunk_text_balanced, cluster_texts, unflatten_like
 
 from .embedder import Embedder
@@ -50,6 +56,13 @@ class OpenAIEmbedderParams(BaseModel):
         description="Maximal retry interval in seconds when retrying API calls.",
         gt=0,
     )
+    request_scheduler: InstanceOf[RequestScheduler] | None = Field(
+        default=None,
+        description=(
+            "Scheduler shared by all requests to the OpenAI API. "
+            "If None, a scheduler without limits is used."
+        ),
+    )
     metrics_factory: InstanceOf[MetricsFactory] | None = Field(
         default=None,
         description="An instance of MetricsFactory for collecting usage metrics.",
@@ -82,6 +95,11 @@ class OpenAIEmbedder(Embedder):
         self._use_dimensions_parameter = True
 
         self._max_retry_interval_seconds = params.max_retry_interval_seconds
+        self._request_scheduler = params.request_scheduler or RequestScheduler(
+            RequestSchedulerParams(
+                max_backoff_seconds=params.max_retry_interval_seconds
+            ),
+        )
 
         self._max_input_length = params.max_input_length
 
@@ -226,36 +244,34 @@ class OpenAIEmbedder(Embedder):
             )
 
             try:
-                # Internal try-except is required
-                # for models that do not support dimensions parameter
-
-                # Avoid concurrency issues by tracking whether dimensions parameter is used for this request only.
-                dimensions_parameter_used = self._use_dimensions_parameter
-                try:
-                    response = (
-                        await self._client.embeddings.create(
-                            input=chunk_cluster,
-                            model=self._model,
-                            dimensions=self._dimensions,
-                        )
-                        if dimensions_parameter_used
-                        else await self._client.embeddings.create(
-                            input=chunk_cluster,
-                            model=self._model,
-                        )
-                    )
-                except openai.BadRequestError as err:
-                    if "dimension" in str(err).lower() and dimensions_parameter_used:
-                        response = await self._client.embeddings.create(
-                            input=chunk_cluster,
-                            model=self._model,
-                        )
-                        self._use_dimensions_parameter = False
-                        break
-                    raise
+                response = await self._create_embeddings(chunk_cluster)
                 break
+            except openai.RateLimitError as err:
+                # The scheduler pauses requests until the rate limit resets.
+                if attempt >= max_attempts:
+                    error_message = (
+                        f"[call uuid: {embed_call_uuid}] "
+                        "Giving up creating embeddings "
+                        f"for cluster number {cluster_number} "
+                        f"after failed attempt {attempt} "
+                        f"due to retryable {type(err).__name__}: "
+                        f"max attempts {max_attempts} reached"
+                    )
+                    logger.exception(error_message)
+                    raise ExternalServiceAPIError(error_message) from err
+
+                logger.info(
+                    "[call uuid: %s] "
+                    "Retrying creating embeddings for cluster number %d "
+                    "when the rate limit allows "
+                    "after failed attempt %d due to retryable %s...",
+                    embed_call_uuid,
+                    cluster_number,
+                    attempt,
+                    type(err).__name__,
+                )
+                continue
             except (
-                openai.RateLimitError,
                 openai.APITimeoutError,
                 openai.APIConnectionError,
             ) as err:
@@ -320,6 +336,48 @@ class OpenAIEmbedder(Embedder):
 
         return [datum.embedding for datum in response.data]
 
+    async def _create_embeddings(
+        self,
+        chunk_cluster: list[str],
+    ) -> CreateEmbeddingResponse:
+        """Send one embeddings request when the scheduler allows it."""
+        async with self._request_scheduler.request(
+            estimated_tokens=estimate_token_count(*chunk_cluster),
+        ) as permit:
+            # Internal try-except is required
+            # for models that do not support dimensions parameter
+
+            # Avoid concurrency issues by tracking whether dimensions parameter is used for this request only.
+            dimensions_parameter_used = self._use_dimensions_parameter
+            try:
+                response = (
+                    await self._client.embeddings.create(
+                        input=chunk_cluster,
+                        model=self._model,
+                        dimensions=self._dimensions,
+                    )
+                    if dimensions_parameter_used
+                    else await self._client.embeddings.create(
+                        input=chunk_cluster,
+                        model=self._model,
+                    )
+                )
+            except openai.BadRequestError as err:
+                if "dimension" not in str(err).lower() or not dimensions_parameter_used:
+                    raise
+                response = await self._client.embeddings.create(
+                    input=chunk_cluster,
+                    model=self._model,
+                )
+                self._use_dimensions_parameter = False
+            except openai.RateLimitError as err:
+                permit.report_rate_limited(err.response.headers)
+                raise
+
+            if response.usage is not None:
+                permit.report_usage(response.usage.total_tokens)
+            return response
+
     @property
     def model_id(self) -> str:
         """Return the embedding model identifier."""
@@ -0,0 +1,202 @@
+"""Embedder wrapper adding a persistent ingest embedding cache."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, Field, InstanceOf
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+
+from .embedder import Embedder
+
+
+class PersistentCachingEmbedderParams(BaseModel):
+    """Parameters for PersistentCachingEmbedder."""
+
+    embedder: InstanceOf[Embedder] = Field(
+        ...,
+        description="Embedder to wrap.",
+    )
+    path: str = Field(
+        ...,
+        description="Path to the SQLite database file storing the embeddings.",
+        min_length=1,
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        default=None,
+        description="An instance of MetricsFactory for collecting usage metrics.",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics.",
+    )
+
+
+class PersistentCachingEmbedder(Embedder):
+    """
+    Persistent ingest embedding cache as an Embedder decorator.
+
+    Ingest embeddings are stored in a SQLite database as float32 blobs,
+    keyed by a SHA-256 hash of (model_id, dimensions, input).
+    Only inputs missing from the database are sent to the wrapped embedder,
+    in a single batch.
+    Search embeddings are not cached.
+    """
+
+    # Stay below the SQLite limit on the number of host parameters.
+    _max_keys_per_statement = 500
+
+    def __init__(self, params: PersistentCachingEmbedderParams) -> None:
+        """Initialize the decorator with a wrapped Embedder."""
+        super().__init__()
+
+        self._wrapped = params.embedder
+
+        path = Path(params.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Accessed from worker threads, serialized by the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection_lock = threading.Lock()
+        with self._connection_lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB PRIMARY KEY, "
+                "embedding BLOB NOT NULL"
+                ") WITHOUT ROWID",
+            )
+
+        metrics_factory = params.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = self._user_metrics_labels.keys()
+
+            self._hits_counter = metrics_factory.get_counter(
+                "embedder_persistent_cache_hits",
+                "Number of ingest embeddings served from the persistent embedder cache",
+                label_names=label_names,
+            )
+            self._misses_counter = metrics_factory.get_counter(
+                "embedder_persistent_cache_misses",
+                "Number of ingest embeddings requested from the wrapped embedder",
+                label_names=label_names,
+            )
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed the provided inputs, reusing stored embeddings."""
+        if not inputs:
+            return []
+
+        keys = [self._cache_key(input_value) for input_value in inputs]
+        stored_embeddings = await asyncio.to_thread(self._load, set(keys))
+
+        missing_inputs: dict[bytes, Any] = {}
+        for key, input_value in zip(keys, inputs, strict=True):
+            if key not in stored_embeddings:
+                missing_inputs.setdefault(key, input_value)
+
+        if self._collect_metrics:
+            self._hits_counter.increment(
+                value=len(inputs) - len(missing_inputs),
+                labels=self._user_metrics_labels,
+            )
+            self._misses_counter.increment(
+                value=len(missing_inputs),
+                labels=self._user_metrics_labels,
+            )
+
+        if missing_inputs:
+            missing_embeddings = await self._wrapped.ingest_embed(
+                list(missing_inputs.values()),
+                max_attempts,
+            )
+            new_embeddings = dict(
+                zip(missing_inputs.keys(), missing_embeddings, strict=True)
+            )
+            await asyncio.to_thread(self._store, new_embeddings)
+            stored_embeddings.update(new_embeddings)
+
+        return [list(stored_embeddings[key]) for key in keys]
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed search queries using the wrapped embedder."""
+        return await self._wrapped.search_embed(queries, max_attempts)
+
+    async def close(self) -> None:
+        """Close the database connection once pending reads and writes finish."""
+        await asyncio.to_thread(self._close)
+
+    def _close(self) -> None:
+        with self._connection_lock:
+            self._connection.close()
+
+    def _cache_key(self, input_value: Any) -> bytes:  # noqa: ANN401
+        key_hash = hashlib.sha256()
+        key_hash.update(self._wrapped.model_id.encode())
+        key_hash.update(b"\0")
+        key_hash.update(str(self._wrapped.dimensions).encode())
+        key_hash.update(b"\0")
+        key_hash.update(str(input_value).encode())
+        return key_hash.digest()
+
+    def _load(self, keys: Iterable[bytes]) -> dict[bytes, list[float]]:
+        keys = list(keys)
+        embeddings: dict[bytes, list[float]] = {}
+        with self._connection_lock:
+            for start in range(0, len(keys), self._max_keys_per_statement):
+                batch = keys[start : start + self._max_keys_per_statement]
+                placeholders = ", ".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    embedding = np.frombuffer(blob, dtype=np.float32)
+                    if len(embedding) == self._wrapped.dimensions:
+                        embeddings[key] = embedding.astype(float).tolist()
+        return embeddings
+
+    def _store(self, embeddings: dict[bytes, list[float]]) -> None:
+        rows = [
+            (key, np.asarray(embedding, dtype=np.float32).tobytes())
+            for key, embedding in embeddings.items()
+        ]
+        with self._connection_lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                rows,
+            )
+
+    @property
+    def model_id(self) -> str:
+        """Return the embedding model identifier."""
+        return self._wrapped.model_id
+
+    @property
+    def dimensions(self) -> int:
+        """Return the embedding dimensionality."""
+        return self._wrapped.dimensions
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        """Return the similarity metric used by this embedder."""
+        return self._wrapped.similarity_metric
@@ -4,6 +4,7 @@ from .count_caching_episode_storage import CountCachingEpisodeStorage
 from .episode_model import (
     ContentType,
     Episode,
+    EpisodeCursor,
     EpisodeEntry,
     EpisodeIdT,
     EpisodeResponse,
@@ -15,6 +16,7 @@ __all__ = [
     "ContentType",
     "CountCachingEpisodeStorage",
     "Episode",
+    "EpisodeCursor",
     "EpisodeEntry",
     "EpisodeIdT",
     "EpisodeResponse",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import cast
 
@@ -10,6 +11,7 @@ from pydantic import AwareDatetime
 
 from memmachine.common.episode_store.episode_model import (
     Episode,
+    EpisodeCursor,
     EpisodeEntry,
     EpisodeIdT,
 )
@@ -68,17 +70,51 @@ class CountCachingEpisodeStorage(EpisodeStorage):
 
         return stored
 
+    async def import_episodes(
+        self,
+        session_key: str,
+        episodes: Iterable[EpisodeEntry],
+    ) -> int:
+        num_imported = await self._wrapped.import_episodes(session_key, episodes)
+
+        async with self._lock:
+            entry = self._count_cache.get(session_key)
+            if entry is not None:
+                self._count_cache[session_key] = _CacheEntry(
+                    count=entry.count + num_imported,
+                )
+
+        return num_imported
+
     async def get_episode(
         self,
         history_id: EpisodeIdT,
     ) -> Episode | None:
         return await self._wrapped.get_episode(history_id)
 
+    async def get_episodes(
+        self,
+        episode_ids: list[EpisodeIdT],
+    ) -> list[Episode]:
+        return await self._wrapped.get_episodes(episode_ids)
+
+    async def get_latest_episodes(
+        self,
+        session_key: str,
+        *,
+        max_content_length: int,
+    ) -> list[Episode]:
+        return await self._wrapped.get_latest_episodes(
+            session_key,
+            max_content_length=max_content_length,
+        )
+
     async def get_episode_messages(
         self,
         *,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: EpisodeCursor | None = None,
         filter_expr: FilterExpr | None = None,
         start_time: AwareDatetime | None = None,
         end_time: AwareDatetime | None = None,
@@ -86,6 +122,7 @@ class CountCachingEpisodeStorage(EpisodeStorage):
         return await self._wrapped.get_episode_messages(
             page_size=page_size,
             page_num=page_num,
+            cursor=cursor,
             filter_expr=filter_expr,
             start_time=start_time,
             end_time=end_time,
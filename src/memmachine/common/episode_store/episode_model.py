@@ -1,8 +1,12 @@
 """Data models for representing episodes and related enumerations."""
 
+import base64
+import binascii
+from datetime import UTC
 from enum import Enum
+from typing import Self
 
-from pydantic import AwareDatetime, BaseModel, JsonValue
+from pydantic import AwareDatetime, BaseModel, JsonValue, ValidationError
 
 from memmachine.common.api import EpisodeType
 from memmachine.common.data_types import FilterablePropertyValue
@@ -60,3 +64,38 @@ class Episode(BaseModel):
     def __hash__(self) -> int:
         """Hash an episode by its UID."""
         return hash(self.uid)
+
+
+class EpisodeCursor(BaseModel):
+    """
+    Position in a list of episodes ordered by creation time and UID.
+
+    Listing episodes after a cursor seeks directly to the position
+    instead of skipping all earlier episodes.
+    """
+
+    created_at: AwareDatetime
+    uid: EpisodeIdT
+
+    @classmethod
+    def from_episode(cls, episode: Episode) -> Self:
+        """Create a cursor positioned at the episode."""
+        return cls(created_at=episode.created_at.astimezone(UTC), uid=episode.uid)
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """
+        Decode a cursor from a token created by encode.
+
+        Raises:
+            ValueError: If the token is not a valid cursor.
+
+        """
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(token.encode()))
+        except (binascii.Error, ValidationError) as e:
+            raise ValueError(f"Invalid episode cursor: {token}") from e
@@ -1,7 +1,9 @@
 """SQLAlchemy implementation of the episode storage layer."""
 
 import socket
+from collections.abc import Iterable
 from datetime import UTC
+from itertools import batched
 from typing import Any, TypeVar, overload
 
 from pydantic import (
@@ -16,16 +18,20 @@ from sqlalchemy import (
     Delete,
     Index,
     Integer,
+    MetaData,
     String,
-    and_,
     delete,
     func,
     insert,
-    or_,
+    inspect,
+    literal,
     select,
+    text,
+    tuple_,
 )
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, mapped_column
@@ -33,24 +39,19 @@ from sqlalchemy.sql import Select
 from sqlalchemy.sql.elements import ColumnElement
 
 from memmachine.common.episode_store.episode_model import Episode as EpisodeE
-from memmachine.common.episode_store.episode_model import EpisodeEntry, EpisodeType
+from memmachine.common.episode_store.episode_model import (
+    EpisodeCursor,
+    EpisodeEntry,
+    EpisodeType,
+)
 from memmachine.common.episode_store.episode_storage import EpisodeIdT, EpisodeStorage
 from memmachine.common.errors import (
     ConfigurationError,
     InvalidArgumentError,
     ResourceNotFoundError,
 )
-from memmachine.common.filter.filter_parser import (
-    And as FilterAnd,
-)
-from memmachine.common.filter.filter_parser import (
-    Comparison as FilterComparison,
-)
+from memmachine.common.filter.filter_compiler import compile_sql_filter
 from memmachine.common.filter.filter_parser import FilterExpr
-from memmachine.common.filter.filter_parser import (
-    Or as FilterOr,
-)
-from memmachine.common.filter.sql_filter_util import parse_sql_filter
 
 
 class BaseEpisodeStore(DeclarativeBase):
@@ -97,6 +98,13 @@ class Episode(BaseEpisodeStore):
         Index("idx_producer_id", "producer_id"),
         Index("idx_producer_role", "producer_role"),
         Index("idx_session_key_producer_id", "session_key", "producer_id"),
+        Index("idx_session_key_id", "session_key", "id"),
+        Index(
+            "idx_session_key_created_at_id",
+            "session_key",
+            "created_at",
+            "id",
+        ),
         Index(
             "idx_session_key_producer_id_producer_role_produced_for_id",
             "session_key",
@@ -128,6 +136,12 @@ class Episode(BaseEpisodeStore):
 class SqlAlchemyEpisodeStore(EpisodeStorage):
     """SQLAlchemy episode store implementation."""
 
+    # Rows fetched per round trip when reading the latest episodes of a session.
+    _latest_episodes_batch_size = 64
+
+    # Rows sent per executemany when importing episodes.
+    _import_batch_size = 1000
+
     def __init__(self, engine: AsyncEngine) -> None:
         """Initialize the store with an async SQLAlchemy engine."""
         self._engine: AsyncEngine = engine
@@ -143,11 +157,77 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         try:
             async with self._engine.begin() as conn:
                 await conn.run_sync(BaseEpisodeStore.metadata.create_all)
+
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+            async with self._engine.connect() as conn:
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.run_sync(SqlAlchemyEpisodeStore._create_missing_indexes)
         except (OperationalError, socket.gaierror) as err:
             raise ConfigurationError(
                 "Failed to connect to the database during startup, please check your configuration."
             ) from err
 
+    @staticmethod
+    def _create_missing_indexes(conn: Connection) -> None:
+        # create_all skips tables that already exist,
+        # so indexes added to the model are created here for existing tables.
+        # They are built on a copy of the table so that the model indexes
+        # are not marked concurrent for create_all.
+        table = BaseEpisodeStore.metadata.tables[Episode.__tablename__].to_metadata(
+            MetaData()
+        )
+        is_postgresql = conn.dialect.name == "postgresql"
+
+        if is_postgresql:
+            # An interrupted concurrent build leaves an invalid index behind,
+            # which is dropped so that it is built again.
+            invalid_index_names = conn.scalars(
+                text(
+                    "SELECT index_class.relname FROM pg_index"
+                    " JOIN pg_class AS index_class"
+                    " ON index_class.oid = pg_index.indexrelid"
+                    " WHERE pg_index.indrelid = CAST(:table_name AS regclass)"
+                    " AND NOT pg_index.indisvalid"
+                ),
+                {"table_name": table.name},
+            ).all()
+            for index_name in invalid_index_names:
+                conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"'))
+
+        existing_index_names = {
+            index["name"] for index in inspect(conn).get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name in existing_index_names:
+                continue
+            if is_postgresql:
+                index.dialect_kwargs["postgresql_concurrently"] = True
+            index.create(conn)
+
+    @staticmethod
+    def _entry_values(session_key: str, entry: EpisodeEntry) -> dict[str, Any]:
+        # Unset optional fields are left out so that column defaults apply.
+        entry_values: dict[str, Any] = {
+            "content": entry.content,
+            "session_key": session_key,
+            "producer_id": entry.producer_id,
+            "producer_role": entry.producer_role,
+        }
+
+        if entry.produced_for_id is not None:
+            entry_values["produced_for_id"] = entry.produced_for_id
+
+        if entry.episode_type is not None:
+            entry_values["episode_type"] = entry.episode_type
+
+        if entry.metadata is not None:
+            entry_values["json_metadata"] = entry.metadata
+
+        if entry.created_at is not None:
+            entry_values["created_at"] = entry.created_at
+
+        return entry_values
+
     @validate_call
     async def add_episodes(
         self,
@@ -157,55 +237,42 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         if not episodes:
             return []
 
-        values_to_insert: list[dict[str, Any]] = []
-        for entry in episodes:
-            entry_values: dict[str, Any] = {
-                "content": entry.content,
-                "session_key": session_key,
-                "producer_id": entry.producer_id,
-                "producer_role": entry.producer_role,
-            }
-
-            if entry.produced_for_id is not None:
-                entry_values["produced_for_id"] = entry.produced_for_id
-
-            if entry.episode_type is not None:
-                entry_values["episode_type"] = entry.episode_type
-
-            if entry.metadata is not None:
-                entry_values["json_metadata"] = entry.metadata
-
-            if entry.created_at is not None:
-                entry_values["created_at"] = entry.created_at
-
-            values_to_insert.append(entry_values)
+        values_to_insert = [
+            self._entry_values(session_key, entry) for entry in episodes
+        ]
 
-        insert_stmt = insert(Episode).returning(Episode.id)
+        # Return the inserted rows in parameter order,
+        # so no second query is needed to build the models.
+        insert_stmt = insert(Episode).returning(
+            Episode,
+            sort_by_parameter_order=True,
+        )
 
         async with self._create_session() as session:
-            result = await session.execute(insert_stmt, values_to_insert)
-            inserted_ids = result.scalars().all()
+            result = await session.scalars(insert_stmt, values_to_insert)
+            persisted_episodes = result.all()
             await session.commit()
 
-        int_episode_ids = [int(episode_id) for episode_id in inserted_ids]
-        if not int_episode_ids:
-            return []
+        return [episode_row.to_typed_model() for episode_row in persisted_episodes]
 
-        select_stmt = (
-            select(Episode)
-            .where(Episode.id.in_(int_episode_ids))
-            .order_by(Episode.id.asc())
-        )
+    async def import_episodes(
+        self,
+        session_key: str,
+        episodes: Iterable[EpisodeEntry],
+    ) -> int:
+        num_imported = 0
 
+        # Without RETURNING, each batch is sent as a single executemany.
         async with self._create_session() as session:
-            result = await session.execute(select_stmt)
-            persisted_episodes = result.scalars().all()
+            for batch in batched(episodes, self._import_batch_size):
+                await session.execute(
+                    insert(Episode),
+                    [self._entry_values(session_key, entry) for entry in batch],
+                )
+                num_imported += len(batch)
+            await session.commit()
 
-        episodes_by_id = {
-            episode_row.id: episode_row.to_typed_model()
-            for episode_row in persisted_episodes
-        }
-        return [episodes_by_id[episode_id] for episode_id in int_episode_ids]
+        return num_imported
 
     @validate_call
     async def get_episode(self, episode_id: EpisodeIdT) -> EpisodeE | None:
@@ -226,6 +293,62 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
 
         return episode.to_typed_model() if episode else None
 
+    async def get_latest_episodes(
+        self,
+        session_key: str,
+        *,
+        max_content_length: int,
+    ) -> list[EpisodeE]:
+        if max_content_length <= 0:
+            return []
+
+        # Walk the session backwards on (session_key, id) and stop reading
+        # as soon as the budget is exhausted.
+        stmt = (
+            select(Episode)
+            .where(Episode.session_key == session_key)
+            .order_by(Episode.id.desc())
+            .execution_options(yield_per=self._latest_episodes_batch_size)
+        )
+
+        latest_episodes: list[EpisodeE] = []
+        content_length = 0
+        async with self._create_session() as session:
+            result = await session.stream_scalars(stmt)
+            async for episode in result:
+                content_length += len(episode.content)
+                if content_length > max_content_length:
+                    break
+                latest_episodes.append(episode.to_typed_model())
+            await result.close()
+
+        latest_episodes.reverse()
+        return latest_episodes
+
+    @validate_call
+    async def get_episodes(self, episode_ids: list[EpisodeIdT]) -> list[EpisodeE]:
+        try:
+            int_episode_ids = TypeAdapter(list[int]).validate_python(episode_ids)
+        except ValidationError as e:
+            raise ResourceNotFoundError("Invalid episode IDs") from e
+        if not int_episode_ids:
+            return []
+
+        stmt = select(Episode).where(Episode.id.in_(int_episode_ids))
+
+        async with self._create_session() as session:
+            result = await session.execute(stmt)
+            episodes_by_id = {
+                episode.id: episode.to_typed_model()
+                for episode in result.scalars().all()
+            }
+
+        return [
+            episodes_by_id[episode_id]
+            for episode_id in int_episode_ids
+            if episode_id in episodes_by_id
+        ]
+
     @overload
     def _apply_episode_filter(
         self,
@@ -257,7 +380,10 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         filters: list[ColumnElement[bool]] = []
 
         if filter_expr is not None:
-            parsed_filter = self._compile_episode_filter_expr(filter_expr)
+            parsed_filter = compile_sql_filter(
+                filter_expr,
+                SqlAlchemyEpisodeStore._resolve_episode_field,
+            )
             if parsed_filter is not None:
                 filters.append(parsed_filter)
 
@@ -276,36 +402,6 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
             return stmt.where(*filters)
         raise TypeError(f"Unsupported statement type: {type(stmt)}")
 
-    def _compile_episode_comparison_expr(
-        self,
-        expr: FilterComparison,
-    ) -> ColumnElement[bool] | None:
-        column, is_metadata = self._resolve_episode_field(expr.field)
-
-        return parse_sql_filter(
-            column=column,
-            is_metadata=is_metadata,
-            expr=expr,
-        )
-
-    def _compile_episode_filter_expr(
-        self, expr: FilterExpr
-    ) -> ColumnElement[bool] | None:
-        if isinstance(expr, FilterComparison):
-            return self._compile_episode_comparison_expr(expr)
-
-        if isinstance(expr, FilterAnd):
-            left = self._compile_episode_filter_expr(expr.left)
-            right = self._compile_episode_filter_expr(expr.right)
-            return and_(left, right)
-
-        if isinstance(expr, FilterOr):
-            left = self._compile_episode_filter_expr(expr.left)
-            right = self._compile_episode_filter_expr(expr.right)
-            return or_(left, right)
-
-        raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
-
     @staticmethod
     def _resolve_episode_field(
         field: str,
@@ -337,6 +433,7 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         *,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: EpisodeCursor | None = None,
         filter_expr: FilterExpr | None = None,
         start_time: AwareDatetime | None = None,
         end_time: AwareDatetime | None = None,
@@ -350,15 +447,33 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
             end_time=end_time,
         )
 
+        if cursor is not None:
+            if page_num is not None:
+                raise InvalidArgumentError("Cannot specify both cursor and offset")
+            try:
+                cursor_id = int(cursor.uid)
+            except ValueError as e:
+                raise InvalidArgumentError("Invalid episode cursor") from e
+            # Seek on (created_at, id), which the session index covers.
+            stmt = stmt.where(
+                tuple_(Episode.created_at, Episode.id)
+                > tuple_(
+                    literal(cursor.created_at.astimezone(UTC), Episode.created_at.type),
+                    literal(cursor_id, Episode.id.type),
+                ),
+            )
+
         if page_size is not None:
             stmt = stmt.limit(page_size)
-            stmt = stmt.order_by(Episode.created_at.asc())
+            stmt = stmt.order_by(Episode.created_at.asc(), Episode.id.asc())
 
             if page_num is not None:
                 stmt = stmt.offset(page_size * page_num)
 
         elif page_num is not None:
             raise InvalidArgumentError("Cannot specify offset without limit")
+        elif cursor is not None:
+            stmt = stmt.order_by(Episode.created_at.asc(), Episode.id.asc())
 
         async with self._create_session() as session:
             result = await session.execute(stmt)
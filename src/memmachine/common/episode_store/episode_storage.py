@@ -1,11 +1,13 @@
 """Abstract storage interface for episodic history."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from pydantic import AwareDatetime
 
 from memmachine.common.episode_store.episode_model import (
     Episode,
+    EpisodeCursor,
     EpisodeEntry,
     EpisodeIdT,
 )
@@ -27,6 +29,32 @@ class EpisodeStorage(ABC):
     ) -> list[Episode]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def import_episodes(
+        self,
+        session_key: str,
+        episodes: Iterable[EpisodeEntry],
+    ) -> int:
+        """
+        Bulk-load episodes without returning them.
+
+        Use this instead of add_episodes for large batches,
+        such as from migration tools, that do not need the stored models.
+        All episodes are imported in one transaction.
+
+        Args:
+            session_key (str):
+                Session key of the episodes.
+            episodes (Iterable[EpisodeEntry]):
+                Episodes to import, in insertion order.
+
+        Returns:
+            int:
+                Number of episodes imported.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_episode(
         self,
@@ -34,16 +62,67 @@ class EpisodeStorage(ABC):
     ) -> Episode | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_episodes(
+        self,
+        episode_ids: list[EpisodeIdT],
+    ) -> list[Episode]:
+        """
+        Get multiple episodes by ID in one query.
+
+        Args:
+            episode_ids (list[EpisodeIdT]):
+                IDs of the episodes to get.
+
+        Returns:
+            list[Episode]:
+                The episodes found, in the order of episode_ids.
+                IDs without an episode are skipped.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_latest_episodes(
+        self,
+        session_key: str,
+        *,
+        max_content_length: int,
+    ) -> list[Episode]:
+        """
+        Get the most recent episodes of a session within a content budget.
+
+        Args:
+            session_key (str):
+                The session to get episodes from.
+            max_content_length (int):
+                Maximum total length of the contents of the returned episodes.
+
+        Returns:
+            list[Episode]:
+                The longest run of most recent episodes whose total content
+                length does not exceed max_content_length, oldest first.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_episode_messages(
         self,
         *,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: EpisodeCursor | None = None,
         filter_expr: FilterExpr | None = None,
         start_time: AwareDatetime | None = None,
         end_time: AwareDatetime | None = None,
     ) -> list[Episode]:
+        """
+        Get episodes ordered by creation time and ID.
+
+        Pages are selected either by page_num, which skips earlier pages,
+        or by cursor, which seeks to the episodes after the cursor.
+        """
         raise NotImplementedError
 
     @abstractmethod
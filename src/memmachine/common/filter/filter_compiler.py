@@ -0,0 +1,295 @@
+"""
+Compile filter expressions once into backend-specific predicates.
+
+A filter expression is usually evaluated many times per request: against
+every episode in short-term memory, in every sub-query sent to the graph
+store, and in every SQL statement. The functions in this module compile an
+expression into a Python closure, a Cypher fragment with parameters, or an
+SQLAlchemy clause, and cache the result keyed by the expression tree, so each
+distinct expression is compiled only once.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, cast
+
+from sqlalchemy import ColumnElement, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute, MappedColumn
+
+from memmachine.common.data_types import FilterablePropertyValue
+from memmachine.common.filter.filter_parser import And, Comparison, FilterExpr, Or
+from memmachine.common.filter.sql_filter_util import parse_sql_filter
+
+CypherFilter = tuple[
+    str, dict[str, FilterablePropertyValue | list[FilterablePropertyValue]]
+]
+
+SQLFieldResolver = Callable[
+    [str],
+    tuple[MappedColumn[Any] | InstrumentedAttribute[Any] | None, bool],
+]
+
+_COMPILE_CACHE_SIZE = 1024
+
+
+class _CompileCache:
+    """Thread-safe LRU cache of compiled filter expressions."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compile[R](self, key: Hashable, compile_entry: Callable[[], R]) -> R:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return cast(R, self._entries[key])
+
+        entry = compile_entry()
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_compile_cache = _CompileCache(_COMPILE_CACHE_SIZE)
+
+
+def _freeze_value(
+    value: FilterablePropertyValue | list[FilterablePropertyValue],
+) -> Hashable:
+    # Keep the type so that equal values of different types (1, 1.0, True)
+    # do not share a compiled expression.
+    if isinstance(value, list):
+        return ("list", tuple(_freeze_value(item) for item in value))
+    return (type(value).__name__, value)
+
+
+def filter_cache_key(expr: FilterExpr) -> Hashable:
+    """
+    Get a hashable key identifying a filter expression tree.
+
+    Comparison values may be lists, which makes expression trees unhashable,
+    so lists are converted to tuples in the key.
+
+    Args:
+        expr (FilterExpr):
+            The filter expression.
+
+    Returns:
+        Hashable:
+            Key equal for structurally equal expression trees.
+
+    """
+    if isinstance(expr, Comparison):
+        return ("comparison", expr.field, expr.op, _freeze_value(expr.value))
+    if isinstance(expr, And):
+        return ("and", filter_cache_key(expr.left), filter_cache_key(expr.right))
+    if isinstance(expr, Or):
+        return ("or", filter_cache_key(expr.left), filter_cache_key(expr.right))
+    raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+
+
+def filter_shape_key(expr: FilterExpr) -> Hashable:
+    """
+    Get a hashable key identifying the shape of a filter expression tree.
+
+    The shape keeps the fields, operators, and structure of the expression
+    but not the compared values, so filters such as `producer_id = 'a'`
+    and `producer_id = 'b'` have the same shape.
+
+    Args:
+        expr (FilterExpr):
+            The filter expression.
+
+    Returns:
+        Hashable:
+            Key equal for expression trees differing only in values.
+
+    """
+    if isinstance(expr, Comparison):
+        return ("comparison", expr.field, expr.op)
+    if isinstance(expr, And):
+        return ("and", filter_shape_key(expr.left), filter_shape_key(expr.right))
+    if isinstance(expr, Or):
+        return ("or", filter_shape_key(expr.left), filter_shape_key(expr.right))
+    raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+
+
+def clear_compile_cache() -> None:
+    """Clear all compiled filter expressions."""
+    _compile_cache.clear()
+
+
+def compile_predicate[T](
+    expr: FilterExpr,
+    compile_comparison: Callable[[Comparison], Callable[[T], bool]],
+) -> Callable[[T], bool]:
+    """
+    Compile a filter expression into a Python predicate.
+
+    Args:
+        expr (FilterExpr):
+            The filter expression.
+        compile_comparison (Callable[[Comparison], Callable[[T], bool]]):
+            Function compiling a comparison into a predicate on items.
+            It is part of the cache key,
+            so it should be a module-level function or static method.
+
+    Returns:
+        Callable[[T], bool]:
+            Predicate returning whether an item matches the expression.
+
+    """
+
+    def _compile(expr: FilterExpr) -> Callable[[T], bool]:
+        if isinstance(expr, Comparison):
+            return compile_comparison(expr)
+        if isinstance(expr, And):
+            left, right = _compile(expr.left), _compile(expr.right)
+            return lambda item: left(item) and right(item)
+        if isinstance(expr, Or):
+            left, right = _compile(expr.left), _compile(expr.right)
+            return lambda item: left(item) or right(item)
+        raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+
+    return _compile_cache.get_or_compile(
+        ("predicate", filter_cache_key(expr), compile_comparison),
+        lambda: _compile(expr),
+    )
+
+
+def compile_cypher_filter(
+    expr: FilterExpr,
+    entity_query_alias: str,
+    query_value_parameter: str,
+    render_property_name: Callable[[str], str],
+) -> CypherFilter:
+    """
+    Compile a filter expression into a Cypher condition with parameters.
+
+    Args:
+        expr (FilterExpr):
+            The filter expression.
+        entity_query_alias (str):
+            Alias of the node or relationship in the query.
+        query_value_parameter (str):
+            Name of the query parameter holding the parameter map.
+        render_property_name (Callable[[str], str]):
+            Function rendering a field as a property name.
+            It is part of the cache key,
+            so it should be a module-level function or static method.
+
+    Returns:
+        CypherFilter:
+            The condition and the parameter map to bind
+            to query_value_parameter.
+
+    """
+
+    def _compile() -> CypherFilter:
+        params: dict[str, FilterablePropertyValue | list[FilterablePropertyValue]] = {}
+
+        def _render(expr: FilterExpr) -> str:
+            if isinstance(expr, Comparison):
+                param_name = f"filter_expr_param_{len(params)}"
+                condition, uses_value = _render_cypher_comparison(
+                    expr,
+                    f"{entity_query_alias}.{render_property_name(expr.field)}",
+                    f"${query_value_parameter}.{param_name}",
+                )
+                if uses_value:
+                    params[param_name] = expr.value
+                return condition
+            if isinstance(expr, And):
+                return f"({_render(expr.left)}) AND ({_render(expr.right)})"
+            if isinstance(expr, Or):
+                return f"({_render(expr.left)}) OR ({_render(expr.right)})"
+            raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+
+        condition = _render(expr)
+        return condition, params
+
+    condition, params = _compile_cache.get_or_compile(
+        (
+            "cypher",
+            filter_cache_key(expr),
+            entity_query_alias,
+            query_value_parameter,
+            render_property_name,
+        ),
+        _compile,
+    )
+    return condition, dict(params)
+
+
+def _render_cypher_comparison(
+    expr: Comparison,
+    field_ref: str,
+    param_ref: str,
+) -> tuple[str, bool]:
+    """Render a comparison and whether it references the comparison value."""
+    if expr.op in (">", "<", ">=", "<=", "="):
+        if isinstance(expr.value, list):
+            raise ValueError(f"'{expr.op}' comparison cannot accept list values")
+        return f"{field_ref} {expr.op} {param_ref}", True
+    if expr.op == "in":
+        if not isinstance(expr.value, list):
+            raise ValueError("IN comparison requires a list of values")
+        return f"{field_ref} IN {param_ref}", True
+    if expr.op == "is_null":
+        return f"{field_ref} IS NULL", False
+    if expr.op == "is_not_null":
+        return f"{field_ref} IS NOT NULL", False
+    raise ValueError(f"Unsupported operator: {expr.op}")
+
+
+def compile_sql_filter(
+    expr: FilterExpr,
+    resolve_field: SQLFieldResolver,
+) -> ColumnElement[bool] | None:
+    """
+    Compile a filter expression into an SQLAlchemy boolean clause.
+
+    Args:
+        expr (FilterExpr):
+            The filter expression.
+        resolve_field (SQLFieldResolver):
+            Function resolving a field to its column
+            and whether the column is a metadata value.
+            It is part of the cache key,
+            so it should be a module-level function or static method.
+
+    Returns:
+        ColumnElement[bool] | None:
+            The clause, or None for a comparison on an unsupported field.
+
+    """
+
+    def _compile(expr: FilterExpr) -> ColumnElement[bool] | None:
+        if isinstance(expr, Comparison):
+            column, is_metadata = resolve_field(expr.field)
+            return parse_sql_filter(
+                column=column,
+                is_metadata=is_metadata,
+                expr=expr,
+            )
+        if isinstance(expr, And):
+            return and_(_compile(expr.left), _compile(expr.right))
+        if isinstance(expr, Or):
+            return or_(_compile(expr.left), _compile(expr.right))
+        raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+
+    return _compile_cache.get_or_compile(
+        ("sql", filter_cache_key(expr), resolve_field),
+        lambda: _compile(expr),
+    )
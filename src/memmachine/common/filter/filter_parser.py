@@ -2,6 +2,7 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import NamedTuple, Protocol
 
 from memmachine.common.data_types import FilterablePropertyValue
@@ -216,12 +217,22 @@ def _looks_like_float(value: str) -> bool:
 
 
 def parse_filter(spec: str | None) -> FilterExpr | None:
-    """Parse the given textual filter specification."""
+    """
+    Parse the given textual filter specification.
+
+    Parsed expressions are cached by specification,
+    so the returned expression must not be modified.
+    """
     if spec is None:
         return None
     spec = spec.strip()
     if not spec:
         return None
+    return _parse_filter_spec(spec)
+
+
+@lru_cache(maxsize=1024)
+def _parse_filter_spec(spec: str) -> FilterExpr | None:
     tokens = _tokenize(spec)
     return _Parser(tokens).parse()
 
@@ -10,10 +10,16 @@ from typing import Any, TypeVar
 from uuid import uuid4
 
 import instructor
+from botocore.exceptions import ClientError
 from pydantic import BaseModel, Field, InstanceOf, TypeAdapter
 
 from memmachine.common.data_types import ExternalServiceAPIError
 from memmachine.common.metrics_factory import MetricsFactory
+from memmachine.common.request_scheduler import (
+    RequestScheduler,
+    RequestSchedulerParams,
+    estimate_token_count,
+)
 
 from .language_model import LanguageModel
 
@@ -100,6 +106,10 @@ class AmazonBedrockLanguageModelParams(BaseModel):
         max_retry_interval_seconds (int):
             Maximal retry interval in seconds when retrying API calls
             (default: 120).
+        request_scheduler (RequestScheduler | None):
+            Scheduler shared by all requests to the Bedrock API.
+            If None, a scheduler without limits is used
+            (default: None).
         metrics_factory (MetricsFactory | None):
             An instance of MetricsFactory
             for collecting usage metrics
@@ -145,6 +155,13 @@ class AmazonBedrockLanguageModelParams(BaseModel):
         ),
         gt=0,
     )
+    request_scheduler: InstanceOf[RequestScheduler] | None = Field(
+        None,
+        description=(
+            "Scheduler shared by all requests to the Bedrock API. "
+            "If None, a scheduler without limits is used (default: None)."
+        ),
+    )
     metrics_factory: InstanceOf[MetricsFactory] | None = Field(
         None,
         description=(
@@ -195,6 +212,11 @@ class AmazonBedrockLanguageModel(LanguageModel):
 
         self._additional_model_request_fields = params.additional_model_request_fields
         self._max_retry_interval_seconds = params.max_retry_interval_seconds
+        self._request_scheduler = params.request_scheduler or RequestScheduler(
+            RequestSchedulerParams(
+                max_backoff_seconds=params.max_retry_interval_seconds,
+            ),
+        )
 
         metrics_factory = params.metrics_factory
 
@@ -276,10 +298,22 @@ class AmazonBedrockLanguageModel(LanguageModel):
         start_time = time.monotonic()
 
         try:
-            (
-                response,
-                raw_response,
-            ) = await client.chat.completions.create_with_completion(**converse_kwargs)
+            async with self._request_scheduler.request(
+                estimated_tokens=estimate_token_count(system_prompt, user_prompt),
+            ) as permit:
+                try:
+                    (
+                        response,
+                        raw_response,
+                    ) = await client.chat.completions.create_with_completion(
+                        **converse_kwargs
+                    )
+                except ClientError as e:
+                    if AmazonBedrockLanguageModel._is_throttling_error(e):
+                        permit.report_rate_limited(
+                            AmazonBedrockLanguageModel._response_headers(e),
+                        )
+                    raise
         except instructor.core.exceptions.InstructorRetryException as exc:  # type: ignore[attr-defined]
             parsed = self._try_parse_bedrock_completion(
                 completion=getattr(exc, "last_completion", None),
@@ -353,9 +387,9 @@ class AmazonBedrockLanguageModel(LanguageModel):
             )
 
             try:
-                response = await asyncio.to_thread(
-                    self._client.converse,
-                    **converse_kwargs,
+                response = await self._converse(
+                    converse_kwargs,
+                    estimated_tokens=estimate_token_count(system_prompt, user_prompt),
                 )
                 break
             except Exception as e:
@@ -371,6 +405,18 @@ class AmazonBedrockLanguageModel(LanguageModel):
                     logger.exception(error_message)
                     raise ExternalServiceAPIError(error_message) from e
 
+                if AmazonBedrockLanguageModel._is_throttling_error(e):
+                    # The request scheduler waits until the rate limit allows.
+                    logger.info(
+                        "[call uuid: %s] "
+                        "Retrying generating response when the rate limit allows "
+                        "after failed attempt %d due to %s...",
+                        generate_response_call_uuid,
+                        attempt,
+                        type(e).__name__,
+                    )
+                    continue
+
                 logger.info(
                     "[call uuid: %s] "
                     "Retrying generating response in %d seconds "
@@ -426,6 +472,42 @@ class AmazonBedrockLanguageModel(LanguageModel):
             function_calls_arguments,
         )
 
+    async def _converse(
+        self,
+        converse_kwargs: dict[str, Any],
+        estimated_tokens: int,
+    ) -> dict[str, Any]:
+        """Send one Converse request when the scheduler allows it."""
+        async with self._request_scheduler.request(
+            estimated_tokens=estimated_tokens,
+        ) as permit:
+            try:
+                response = await asyncio.to_thread(
+                    self._client.converse,
+                    **converse_kwargs,
+                )
+            except ClientError as e:
+                if AmazonBedrockLanguageModel._is_throttling_error(e):
+                    permit.report_rate_limited(
+                        AmazonBedrockLanguageModel._response_headers(e),
+                    )
+                raise
+            total_tokens = response.get("usage", {}).get("totalTokens")
+            if isinstance(total_tokens, int):
+                permit.report_usage(total_tokens)
+            return response
+
+    @staticmethod
+    def _is_throttling_error(error: Exception) -> bool:
+        if not isinstance(error, ClientError):
+            return False
+        error_code = error.response.get("Error", {}).get("Code")
+        return error_code in ("ThrottlingException", "TooManyRequestsException")
+
+    @staticmethod
+    def _response_headers(error: ClientError) -> dict[str, str] | None:
+        return error.response.get("ResponseMetadata", {}).get("HTTPHeaders")
+
     @staticmethod
     def _object_output_content_blocks(
         completion: Any,  # noqa: ANN401
@@ -13,6 +13,11 @@ from pydantic import BaseModel, Field, InstanceOf, TypeAdapter
 
 from memmachine.common.data_types import ExternalServiceAPIError
 from memmachine.common.metrics_factory import MetricsFactory
+from memmachine.common.request_scheduler import (
+    RequestScheduler,
+    RequestSchedulerParams,
+    estimate_token_count,
+)
 
 from .language_model import LanguageModel
 
@@ -34,6 +39,10 @@ class OpenAIChatCompletionsLanguageModelParams(BaseModel):
         max_retry_interval_seconds (int):
             Maximal retry interval in seconds when retrying API calls
             (default: 120).
+        request_scheduler (RequestScheduler | None):
+            Scheduler shared by all requests to the OpenAI API.
+            If None, a scheduler without limits is used
+            (default: None).
         metrics_factory (MetricsFactory | None):
             An instance of MetricsFactory
             for collecting usage metrics
@@ -57,6 +66,13 @@ class OpenAIChatCompletionsLanguageModelParams(BaseModel):
         description="Maximal retry interval in seconds when retrying API calls",
         gt=0,
     )
+    request_scheduler: InstanceOf[RequestScheduler] | None = Field(
+        None,
+        description=(
+            "Scheduler shared by all requests to the OpenAI API. "
+            "If None, a scheduler without limits is used"
+        ),
+    )
     metrics_factory: InstanceOf[MetricsFactory] | None = Field(
         None,
         description="An instance of MetricsFactory for collecting usage metrics",
@@ -86,6 +102,11 @@ class OpenAIChatCompletionsLanguageModel(LanguageModel):
         self._model = params.model
 
         self._max_retry_interval_seconds = params.max_retry_interval_seconds
+        self._request_scheduler = params.request_scheduler or RequestScheduler(
+            RequestSchedulerParams(
+                max_backoff_seconds=params.max_retry_interval_seconds,
+            ),
+        )
 
         metrics_factory = params.metrics_factory
 
@@ -137,13 +158,22 @@ class OpenAIChatCompletionsLanguageModel(LanguageModel):
         start_time = time.monotonic()
 
         try:
-            response = await self._client.with_options(
-                max_retries=max_attempts,
-            ).chat.completions.parse(
-                model=self._model,  # type: ignore[arg-type]
-                messages=input_prompts,  # type: ignore[arg-type]
-                response_format=output_format,
-            )
+            async with self._request_scheduler.request(
+                estimated_tokens=estimate_token_count(system_prompt, user_prompt),
+            ) as permit:
+                try:
+                    response = await self._client.with_options(
+                        max_retries=max_attempts,
+                    ).chat.completions.parse(
+                        model=self._model,  # type: ignore[arg-type]
+                        messages=input_prompts,  # type: ignore[arg-type]
+                        response_format=output_format,
+                    )
+                except openai.RateLimitError as e:
+                    permit.report_rate_limited(e.response.headers)
+                    raise
+                if response.usage is not None:
+                    permit.report_usage(response.usage.total_tokens)
         except openai.OpenAIError as e:
             error_message = (
                 f"[call uuid: {generate_response_call_uuid}] "
@@ -196,7 +226,10 @@ class OpenAIChatCompletionsLanguageModel(LanguageModel):
                     args["tool_choice"] = (
                         tool_choice if tool_choice is not None else "auto"
                     )
-                response = await self._client.chat.completions.create(**args)  # type: ignore
+                response = await self._create_chat_completion(
+                    args,
+                    estimated_tokens=estimate_token_count(system_prompt, user_prompt),
+                )
                 break
             except (
                 openai.RateLimitError,
@@ -215,6 +248,18 @@ class OpenAIChatCompletionsLanguageModel(LanguageModel):
                     logger.exception(error_message)
                     raise ExternalServiceAPIError(error_message) from e
 
+                if isinstance(e, openai.RateLimitError):
+                    # The request scheduler waits until the rate limit allows.
+                    logger.info(
+                        "[call uuid: %s] "
+                        "Retrying generating response when the rate limit allows "
+                        "after failed attempt %d due to retryable %s...",
+                        generate_response_call_uuid,
+                        attempt,
+                        type(e).__name__,
+                    )
+                    continue
+
                 logger.info(
                     "[call uuid: %s] "
                     "Retrying generating response in %d seconds "
@@ -278,6 +323,24 @@ class OpenAIChatCompletionsLanguageModel(LanguageModel):
             function_calls_arguments,
         )
 
+    async def _create_chat_completion(
+        self,
+        args: dict[str, Any],
+        estimated_tokens: int,
+    ) -> ChatCompletion:
+        """Send one chat completion request when the scheduler allows it."""
+        async with self._request_scheduler.request(
+            estimated_tokens=estimated_tokens,
+        ) as permit:
+            try:
+                response = await self._client.chat.completions.create(**args)
+            except openai.RateLimitError as e:
+                permit.report_rate_limited(e.response.headers)
+                raise
+            if response.usage is not None:
+                permit.report_usage(response.usage.total_tokens)
+            return response
+
     def _collect_metrics(
         self,
         response: ChatCompletion,
@@ -13,6 +13,11 @@ from pydantic import BaseModel, Field, InstanceOf
 
 from memmachine.common.data_types import ExternalServiceAPIError
 from memmachine.common.metrics_factory import MetricsFactory
+from memmachine.common.request_scheduler import (
+    RequestScheduler,
+    RequestSchedulerParams,
+    estimate_token_count,
+)
 
 from .language_model import LanguageModel
 
@@ -34,6 +39,10 @@ class OpenAIResponsesLanguageModelParams(BaseModel):
         max_retry_interval_seconds (int):
             Maximal retry interval in seconds when retrying API calls
             (default: 120).
+        request_scheduler (RequestScheduler | None):
+            Scheduler shared by all requests to the OpenAI API.
+            If None, a scheduler without limits is used
+            (default: None).
         metrics_factory (MetricsFactory | None):
             An instance of MetricsFactory
             for collecting usage metrics
@@ -57,6 +66,13 @@ class OpenAIResponsesLanguageModelParams(BaseModel):
         description="Maximal retry interval in seconds when retrying API calls",
         gt=0,
     )
+    request_scheduler: InstanceOf[RequestScheduler] | None = Field(
+        None,
+        description=(
+            "Scheduler shared by all requests to the OpenAI API. "
+            "If None, a scheduler without limits is used"
+        ),
+    )
     metrics_factory: InstanceOf[MetricsFactory] | None = Field(
         None,
         description="An instance of MetricsFactory for collecting usage metrics",
@@ -86,6 +102,11 @@ class OpenAIResponsesLanguageModel(LanguageModel):
         self._model = params.model
 
         self._max_retry_interval_seconds = params.max_retry_interval_seconds
+        self._request_scheduler = params.request_scheduler or RequestScheduler(
+            RequestSchedulerParams(
+                max_backoff_seconds=params.max_retry_interval_seconds,
+            ),
+        )
 
         metrics_factory = params.metrics_factory
 
@@ -150,13 +171,22 @@ class OpenAIResponsesLanguageModel(LanguageModel):
         start_time = time.monotonic()
 
         try:
-            response = await self._client.with_options(
-                max_retries=max_attempts,
-            ).responses.parse(
-                model=self._model,  # type: ignore[arg-type]
-                input=input_prompts,  # type: ignore[arg-type]
-                text_format=output_format,
-            )
+            async with self._request_scheduler.request(
+                estimated_tokens=estimate_token_count(system_prompt, user_prompt),
+            ) as permit:
+                try:
+                    response = await self._client.with_options(
+                        max_retries=max_attempts,
+                    ).responses.parse(
+                        model=self._model,  # type: ignore[arg-type]
+                        input=input_prompts,  # type: ignore[arg-type]
+                        text_format=output_format,
+                    )
+                except openai.RateLimitError as e:
+                    permit.report_rate_limited(e.response.headers)
+                    raise
+                if response.usage is not None:
+                    permit.report_usage(response.usage.total_tokens)
         except openai.OpenAIError as e:
             error_message = (
                 f"[call uuid: {generate_response_call_uuid}] "
@@ -209,12 +239,12 @@ class OpenAIResponsesLanguageModel(LanguageModel):
                     attempt,
                     max_attempts,
                 )
-                response = await self._client.responses.create(
-                    model=self._model,
-                    input=input_prompts,
-                    tools=tools,
-                    tool_choice=tool_choice if tool_choice is not None else "auto",
-                )  # type: ignore
+                response = await self._create_response(
+                    input_prompts,
+                    tools,
+                    tool_choice,
+                    estimated_tokens=estimate_token_count(system_prompt, user_prompt),
+                )
                 break
             except (
                 openai.RateLimitError,
@@ -233,6 +263,18 @@ class OpenAIResponsesLanguageModel(LanguageModel):
                     logger.exception(error_message)
                     raise ExternalServiceAPIError(error_message) from e
 
+                if isinstance(e, openai.RateLimitError):
+                    # The request scheduler waits until the rate limit allows.
+                    logger.info(
+                        "[call uuid: %s] "
+                        "Retrying generating response when the rate limit allows "
+                        "after failed attempt %d due to retryable %s...",
+                        generate_response_call_uuid,
+                        attempt,
+                        type(e).__name__,
+                    )
+                    continue
+
                 logger.info(
                     "[call uuid: %s] "
                     "Retrying generating response in %d seconds "
@@ -292,6 +334,31 @@ class OpenAIResponsesLanguageModel(LanguageModel):
             function_calls_arguments,
         )
 
+    async def _create_response(
+        self,
+        input_prompts: list[dict[str, str]],
+        tools: list[dict[str, Any]] | None,
+        tool_choice: str | dict[str, str] | None,
+        estimated_tokens: int,
+    ) -> Response:
+        """Send one response request when the scheduler allows it."""
+        async with self._request_scheduler.request(
+            estimated_tokens=estimated_tokens,
+        ) as permit:
+            try:
+                response = await self._client.responses.create(
+                    model=self._model,
+                    input=input_prompts,
+                    tools=tools,
+                    tool_choice=tool_choice if tool_choice is not None else "auto",
+                )  # type: ignore
+            except openai.RateLimitError as e:
+                permit.report_rate_limited(e.response.headers)
+                raise
+            if response.usage is not None:
+                permit.report_usage(response.usage.total_tokens)
+            return response
+
     def _collect_metrics(
         self,
         response: Response,
@@ -0,0 +1,522 @@
+"""
+Client-side scheduling of requests to external model APIs.
+
+A RequestScheduler is shared by all callers of one model client.
+It limits the requests in flight with AIMD (additive increase,
+multiplicative decrease) concurrency control, spaces requests and tokens
+with token buckets, pauses all requests after a rate limit response
+instead of letting each caller back off blindly, and starts interactive
+requests before background requests.
+"""
+
+import asyncio
+import heapq
+import math
+import time
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Self
+
+from pydantic import BaseModel, Field, InstanceOf, model_validator
+
+from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+
+
+class RequestPriority(IntEnum):
+    """Priority of requests, lower values start first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    MAINTENANCE = 2
+
+
+_current_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "current_request_priority",
+    default=RequestPriority.INTERACTIVE,
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Set the priority of requests scheduled within the context.
+
+    Tasks created within the context inherit the priority.
+
+    Args:
+        priority (RequestPriority):
+            Priority of the requests.
+
+    """
+    token = _current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_request_priority.reset(token)
+
+
+def current_request_priority() -> RequestPriority:
+    """Return the priority of requests scheduled in the current context."""
+    return _current_request_priority.get()
+
+
+def estimate_token_count(*texts: str | None) -> int:
+    """Estimate the number of tokens in the texts (about 4 characters per token)."""
+    return sum(len(text) for text in texts if text) // 4 + 1
+
+
+def _parse_float(value: str | None) -> float | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    """Token bucket refilling its capacity over one minute."""
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self._capacity = per_minute
+        self._level = per_minute
+        self._updated_at = now
+
+    def _refill(self, now: float) -> None:
+        self._level = min(
+            self._capacity,
+            self._level + (now - self._updated_at) * self._capacity / 60,
+        )
+        self._updated_at = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Return the time in seconds until the amount can be taken."""
+        self._refill(now)
+        # Amounts larger than the capacity wait for a full bucket.
+        missing = min(amount, self._capacity) - self._level
+        if missing <= 0:
+            return 0
+        return missing * 60 / self._capacity
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self._level -= amount
+
+    def give_back(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self._level = min(self._capacity, self._level + amount)
+
+    def update(self, limit: float | None, remaining: float | None, now: float) -> None:
+        """Update the bucket from limits reported by the API."""
+        self._refill(now)
+        if limit is not None and limit > 0:
+            self._capacity = limit
+            self._level = min(self._level, limit)
+        if remaining is not None:
+            self._level = min(self._level, remaining)
+
+
+class RequestSchedulerParams(BaseModel):
+    """Parameters for RequestScheduler."""
+
+    max_concurrency: int | None = Field(
+        default=None,
+        description=(
+            "Maximum number of requests in flight. "
+            "The limit is lowered after rate limit responses "
+            "and raised again after successful requests. "
+            "If None, the number of requests in flight is not limited."
+        ),
+        gt=0,
+    )
+    min_concurrency: int = Field(
+        default=1,
+        description="Lowest limit of requests in flight after rate limit responses.",
+        gt=0,
+    )
+    requests_per_minute: float | None = Field(
+        default=None,
+        description=(
+            "Maximum number of requests started per minute. "
+            "If None, it is learned from rate limit response headers."
+        ),
+        gt=0,
+    )
+    tokens_per_minute: float | None = Field(
+        default=None,
+        description=(
+            "Maximum number of estimated tokens sent per minute. "
+            "If None, it is learned from rate limit response headers."
+        ),
+        gt=0,
+    )
+    max_backoff_seconds: float = Field(
+        default=120,
+        description=(
+            "Maximum time in seconds requests are paused after a rate limit "
+            "response without a retry-after header."
+        ),
+        gt=0,
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        default=None,
+        description="An instance of MetricsFactory for collecting usage metrics.",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics.",
+    )
+
+    @model_validator(mode="after")
+    def _check_concurrency_bounds(self) -> Self:
+        if self.max_concurrency is not None and (
+            self.min_concurrency > self.max_concurrency
+        ):
+            raise ValueError("min_concurrency must not exceed max_concurrency")
+        return self
+
+
+class RequestPermit:
+    """Permit to send one request, used to report how the request went."""
+
+    def __init__(self, estimated_tokens: int, started_at: float) -> None:
+        """Initialize a permit for a request started at started_at."""
+        self.estimated_tokens = estimated_tokens
+        self.started_at = started_at
+        self.rate_limited = False
+        self.retry_after_seconds: float | None = None
+        self.headers: Mapping[str, str] | None = None
+        self.used_tokens: int | None = None
+
+    def report_rate_limited(self, headers: Mapping[str, str] | None = None) -> None:
+        """
+        Report that the request was rejected by rate limiting.
+
+        Args:
+            headers (Mapping[str, str] | None):
+                Headers of the rate limit response, if available.
+                Retry-after and rate limit headers are read from them
+                (default: None).
+
+        """
+        self.rate_limited = True
+        self.headers = headers
+        if headers is not None:
+            retry_after_ms = _parse_float(headers.get("retry-after-ms"))
+            retry_after = _parse_float(headers.get("retry-after"))
+            if retry_after_ms is not None:
+                self.retry_after_seconds = retry_after_ms / 1000
+            elif retry_after is not None:
+                self.retry_after_seconds = retry_after
+
+    def report_usage(self, used_tokens: int) -> None:
+        """Report the number of tokens the request actually used."""
+        self.used_tokens = used_tokens
+
+
+class RequestScheduler:
+    """
+    Scheduler for requests to one external model API.
+
+    Requests wait in a priority queue until the concurrency limit,
+    the token buckets, and any rate limit pause allow them to start.
+    """
+
+    def __init__(self, params: RequestSchedulerParams) -> None:
+        """Initialize the scheduler with the provided parameters."""
+        self._max_concurrency = params.max_concurrency
+        self._min_concurrency = params.min_concurrency
+        self._max_backoff_seconds = params.max_backoff_seconds
+
+        now = time.monotonic()
+        self._request_bucket = (
+            _TokenBucket(params.requests_per_minute, now)
+            if params.requests_per_minute is not None
+            else None
+        )
+        self._token_bucket = (
+            _TokenBucket(params.tokens_per_minute, now)
+            if params.tokens_per_minute is not None
+            else None
+        )
+
+        self._concurrency_limit = (
+            float(params.max_concurrency)
+            if params.max_concurrency is not None
+            else math.inf
+        )
+        self._num_in_flight = 0
+        self._paused_until = 0.0
+        self._backoff_seconds = 1.0
+        self._last_decrease_at = -math.inf
+
+        # Heap of (priority, sequence number, estimated tokens, future).
+        self._waiters: list[tuple[int, int, int, asyncio.Future[float]]] = []
+        self._sequence_number = 0
+        self._dispatch_handle: asyncio.TimerHandle | None = None
+
+        metrics_factory = params.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = self._user_metrics_labels.keys()
+
+            self._queue_depth_gauge = metrics_factory.get_gauge(
+                "request_scheduler_queue_depth",
+                "Number of requests waiting in the request scheduler",
+                label_names=label_names,
+            )
+            self._in_flight_gauge = metrics_factory.get_gauge(
+                "request_scheduler_in_flight",
+                "Number of requests in flight in the request scheduler",
+                label_names=label_names,
+            )
+            self._concurrency_limit_gauge = metrics_factory.get_gauge(
+                "request_scheduler_concurrency_limit",
+                "Current limit of requests in flight in the request scheduler",
+                label_names=label_names,
+            )
+            self._wait_summary = metrics_factory.get_summary(
+                "request_scheduler_wait_seconds",
+                "Time in seconds requests waited in the request scheduler",
+                label_names=[*label_names, "priority"],
+            )
+            self._rate_limited_counter = metrics_factory.get_counter(
+                "request_scheduler_rate_limited",
+                "Number of requests rejected by rate limiting",
+                label_names=label_names,
+            )
+
+    @property
+    def concurrency_limit(self) -> int | None:
+        """Return the current limit of requests in flight, if any."""
+        if math.isinf(self._concurrency_limit):
+            return None
+        return math.floor(self._concurrency_limit)
+
+    @property
+    def num_waiting(self) -> int:
+        """Return the number of requests waiting to start."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def request(self, estimated_tokens: int = 0) -> AsyncIterator[RequestPermit]:
+        """
+        Wait for a turn to send a request.
+
+        The request has the priority of the current context.
+        On exit, a request that raised no exception counts as successful
+        unless it was reported as rate limited on the permit.
+
+        Args:
+            estimated_tokens (int):
+                Estimated number of tokens of the request (default: 0).
+
+        Yields:
+            RequestPermit:
+                Permit to report rate limiting and usage on.
+
+        """
+        priority = current_request_priority()
+        wait_start = time.monotonic()
+        started_at = await self._acquire(priority, estimated_tokens)
+
+        if self._collect_metrics:
+            self._wait_summary.observe(
+                value=started_at - wait_start,
+                labels={**self._user_metrics_labels, "priority": priority.name},
+            )
+
+        permit = RequestPermit(estimated_tokens, started_at)
+        succeeded = False
+        try:
+            yield permit
+            succeeded = True
+        finally:
+            self._release(permit, succeeded=succeeded)
+
+    async def _acquire(self, priority: RequestPriority, estimated_tokens: int) -> float:
+        """Wait until the request can start and return its start time."""
+        now = time.monotonic()
+        if not self._waiters and self._start_delay(estimated_tokens, now) == 0:
+            self._start(estimated_tokens, now)
+            return now
+
+        future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters,
+            (priority, self._sequence_number, estimated_tokens, future),
+        )
+        self._sequence_number += 1
+        self._dispatch()
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Cancelled after being started, so give the turn back.
+                self._num_in_flight -= 1
+            self._dispatch()
+            raise
+
+    def _start_delay(self, estimated_tokens: int, now: float) -> float | None:
+        """
+        Return the time in seconds until a request can start.
+
+        Return None if the request has to wait for a request to finish.
+        """
+        if self._num_in_flight + 1 > self._concurrency_limit:
+            return None
+
+        delay = max(self._paused_until - now, 0)
+        if self._request_bucket is not None:
+            delay = max(delay, self._request_bucket.delay(1, now))
+        if self._token_bucket is not None and estimated_tokens > 0:
+            delay = max(delay, self._token_bucket.delay(estimated_tokens, now))
+        return delay
+
+    def _start(self, estimated_tokens: int, now: float) -> None:
+        self._num_in_flight += 1
+        if self._request_bucket is not None:
+            self._request_bucket.take(1, now)
+        if self._token_bucket is not None:
+            self._token_bucket.take(estimated_tokens, now)
+        self._update_gauges()
+
+    def _dispatch(self) -> None:
+        """Start waiting requests in priority order while they are allowed to."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+
+        now = time.monotonic()
+        while self._waiters:
+            _, _, estimated_tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            delay = self._start_delay(estimated_tokens, now)
+            if delay is None:
+                # Dispatched again when a request finishes.
+                break
+            if delay > 0:
+                self._dispatch_handle = asyncio.get_running_loop().call_later(
+                    delay,
+                    self._dispatch,
+                )
+                break
+
+            heapq.heappop(self._waiters)
+            self._start(estimated_tokens, now)
+            future.set_result(now)
+
+        self._update_gauges()
+
+    def _release(self, permit: RequestPermit, *, succeeded: bool) -> None:
+        now = time.monotonic()
+        self._num_in_flight -= 1
+
+        if permit.headers is not None:
+            self.update_rate_limits(permit.headers)
+
+        if permit.used_tokens is not None and self._token_bucket is not None:
+            # Correct the estimate with the actual usage.
+            difference = permit.used_tokens - permit.estimated_tokens
+            if difference > 0:
+                self._token_bucket.take(difference, now)
+            else:
+                self._token_bucket.give_back(-difference, now)
+
+        if permit.rate_limited:
+            self._on_rate_limited(permit, now)
+        elif succeeded:
+            self._on_success()
+
+        self._dispatch()
+
+    def _on_success(self) -> None:
+        self._backoff_seconds = 1.0
+        if self._max_concurrency is not None:
+            # Additive increase of about one request per window of requests.
+            self._concurrency_limit = min(
+                float(self._max_concurrency),
+                self._concurrency_limit + 1 / self._concurrency_limit,
+            )
+
+    def _on_rate_limited(self, permit: RequestPermit, now: float) -> None:
+        if self._collect_metrics:
+            self._rate_limited_counter.increment(labels=self._user_metrics_labels)
+
+        if permit.retry_after_seconds is not None:
+            pause_seconds = permit.retry_after_seconds
+        else:
+            pause_seconds = min(self._backoff_seconds, self._max_backoff_seconds)
+        self._paused_until = max(self._paused_until, now + pause_seconds)
+
+        # Requests started before the last decrease saw the old limit,
+        # so their rate limit responses do not decrease it again.
+        if permit.started_at < self._last_decrease_at:
+            return
+        self._last_decrease_at = now
+        self._backoff_seconds = min(
+            self._backoff_seconds * 2,
+            self._max_backoff_seconds,
+        )
+        if self._max_concurrency is not None:
+            self._concurrency_limit = max(
+                float(self._min_concurrency),
+                self._concurrency_limit / 2,
+            )
+
+    def update_rate_limits(self, headers: Mapping[str, str]) -> None:
+        """
+        Update the token buckets from rate limit response headers.
+
+        Reads the x-ratelimit-limit-* and x-ratelimit-remaining-* headers
+        for requests and tokens, creating buckets for limits not configured.
+
+        Args:
+            headers (Mapping[str, str]):
+                Response headers.
+
+        """
+        now = time.monotonic()
+        for kind in ("requests", "tokens"):
+            limit = _parse_float(headers.get(f"x-ratelimit-limit-{kind}"))
+            remaining = _parse_float(headers.get(f"x-ratelimit-remaining-{kind}"))
+            if limit is None and remaining is None:
+                continue
+
+            bucket = self._request_bucket if kind == "requests" else self._token_bucket
+            if bucket is None:
+                if limit is None or limit <= 0:
+                    continue
+                bucket = _TokenBucket(limit, now)
+                if kind == "requests":
+                    self._request_bucket = bucket
+                else:
+                    self._token_bucket = bucket
+            bucket.update(limit, remaining, now)
+
+    def _update_gauges(self) -> None:
+        if not self._collect_metrics:
+            return
+        self._queue_depth_gauge.set(
+            value=self.num_waiting,
+            labels=self._user_metrics_labels,
+        )
+        self._in_flight_gauge.set(
+            value=self._num_in_flight,
+            labels=self._user_metrics_labels,
+        )
+        concurrency_limit = self.concurrency_limit
+        if concurrency_limit is not None:
+            self._concurrency_limit_gauge.set(
+                value=concurrency_limit,
+                labels=self._user_metrics_labels,
+            )
@@ -0,0 +1,395 @@
+"""Incrementally maintained BM25 index with vectorized scoring."""
+
+import asyncio
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from typing import cast
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+
+def get_tokenizer(name: str, language: str) -> Callable[[str], list[str]]:
+    """
+    Get a tokenizer function for BM25 scoring by name.
+
+    Args:
+        name (str):
+            Name of the tokenizer:
+            "default" normalizes text and filters stop words,
+            "simple" splits normalized text on whitespace.
+        language (str):
+            Language for stop words in the default tokenizer.
+
+    Returns:
+        Callable[[str], list[str]]:
+            The tokenizer function.
+
+    """
+    if name == "default":
+        from nltk import word_tokenize
+        from nltk.corpus import stopwords
+
+        stop_words = stopwords.words(language)
+
+        def _default_tokenize(text: str) -> list[str]:
+            """Tokenize text by normalizing and filtering stop words."""
+            alphanumeric_text = re.sub(r"\W+", " ", text)
+            lower_text = alphanumeric_text.lower()
+            words = word_tokenize(lower_text, language)
+            tokens = [word for word in words if word and word not in stop_words]
+            return tokens
+
+        return _default_tokenize
+    if name == "simple":
+        return lambda text: re.sub(r"\W+", " ", text).lower().split()
+    raise ValueError(f"Unknown tokenizer: {name}")
+
+
+def okapi_idf(
+    document_frequencies: np.ndarray,
+    num_documents: int,
+    epsilon: float,
+) -> np.ndarray:
+    """
+    Compute BM25 Okapi inverse document frequencies.
+
+    Negative inverse document frequencies are replaced
+    by epsilon times the average inverse document frequency.
+
+    Args:
+        document_frequencies (np.ndarray):
+            Number of documents containing each term.
+            Every term must occur in at least one document.
+        num_documents (int):
+            Number of documents in the corpus.
+        epsilon (float):
+            Floor for negative inverse document frequencies,
+            as a fraction of the average inverse document frequency.
+
+    Returns:
+        np.ndarray:
+            Inverse document frequency of each term.
+
+    """
+    idf = np.log(
+        (num_documents - document_frequencies + 0.5) / (document_frequencies + 0.5),
+    )
+    if len(idf) > 0:
+        idf[idf < 0] = epsilon * idf.mean()
+    return idf
+
+
+def saturated_term_frequencies(
+    term_frequencies: np.ndarray,
+    document_lengths: np.ndarray,
+    average_document_length: float,
+    k1: float,
+    b: float,
+) -> np.ndarray:
+    """
+    Apply BM25 term frequency saturation and document length normalization.
+
+    Args:
+        term_frequencies (np.ndarray):
+            Frequencies of terms in documents.
+        document_lengths (np.ndarray):
+            Lengths of the documents, broadcastable to term_frequencies.
+        average_document_length (float):
+            Average document length in the corpus.
+        k1 (float):
+            BM25 k1 parameter.
+        b (float):
+            BM25 b parameter.
+
+    Returns:
+        np.ndarray:
+            Saturated term frequencies, shaped like term_frequencies.
+
+    """
+    return (
+        term_frequencies
+        * (k1 + 1)
+        / (
+            term_frequencies
+            + k1 * (1 - b + b * document_lengths / average_document_length)
+        )
+    )
+
+
+class BM25IndexParams(BaseModel):
+    """Parameters for BM25Index."""
+
+    k1: float = Field(1.5, description="BM25 k1 parameter")
+    b: float = Field(0.75, description="BM25 b parameter")
+    epsilon: float = Field(0.25, description="BM25 epsilon parameter")
+    tokenize: Callable[[str], list[str]] = Field(
+        ...,
+        description="Tokenizer function to split text into tokens",
+    )
+
+
+class BM25Index:
+    """
+    BM25 Okapi index over a changing corpus of documents.
+
+    Term statistics are updated as documents are added and removed,
+    so scores use the statistics of the whole corpus.
+    Each term keeps a posting list of the documents containing it,
+    and queries are scored by accumulating posting list contributions
+    with vectorized NumPy operations.
+    """
+
+    def __init__(self, params: BM25IndexParams) -> None:
+        """Initialize an empty BM25Index with the provided parameters."""
+        self._k1 = params.k1
+        self._b = params.b
+        self._epsilon = params.epsilon
+        self._tokenize = params.tokenize
+
+        self._term_ids: dict[str, int] = {}
+        self._document_frequencies: list[int] = []
+
+        # Posting lists of (row, term frequency), appended to as documents are added.
+        self._postings: list[tuple[list[int], list[int]]] = []
+
+        self._row_by_uid: dict[str, int] = {}
+        # UIDs of rows, None for removed documents.
+        self._uid_by_row: list[str | None] = []
+        self._row_terms: list[tuple[np.ndarray, np.ndarray]] = []
+        self._document_lengths: list[int] = []
+        self._total_document_length = 0
+
+    @property
+    def num_documents(self) -> int:
+        """Return the number of documents in the index."""
+        return len(self._row_by_uid)
+
+    def document_frequencies(self, terms: Iterable[str]) -> np.ndarray:
+        """
+        Return the number of documents in the index containing each term.
+
+        Args:
+            terms (Iterable[str]):
+                The terms, as produced by the tokenizer of the index.
+
+        Returns:
+            np.ndarray:
+                Document frequency of each term,
+                zero for terms not in the index.
+
+        """
+        return np.array(
+            [
+                self._document_frequencies[self._term_ids[term]]
+                if term in self._term_ids
+                else 0
+                for term in terms
+            ],
+            dtype=np.int64,
+        )
+
+    def __contains__(self, uid: str) -> bool:
+        """Return whether a document with the UID is in the index."""
+        return uid in self._row_by_uid
+
+    async def add_documents(self, documents: Mapping[str, str]) -> None:
+        """
+        Add documents to the index.
+
+        Documents with the UID of a document already in the index replace it.
+
+        Args:
+            documents (Mapping[str, str]):
+                Mapping of document UIDs to document contents.
+
+        """
+        uids = list(documents.keys())
+        tokenized_documents = await asyncio.to_thread(
+            self._tokenize_multiple,
+            list(documents.values()),
+        )
+
+        self.remove_documents(uid for uid in uids if uid in self._row_by_uid)
+        for uid, tokens in zip(uids, tokenized_documents, strict=True):
+            self._add_tokenized_document(uid, tokens)
+
+    def remove_documents(self, uids: Iterable[str]) -> None:
+        """
+        Remove documents from the index.
+
+        UIDs of documents not in the index are ignored.
+
+        Args:
+            uids (Iterable[str]):
+                UIDs of the documents to remove.
+
+        """
+        for uid in uids:
+            row = self._row_by_uid.pop(uid, None)
+            if row is None:
+                continue
+
+            term_ids, _ = self._row_terms[row]
+            for term_id in term_ids:
+                self._document_frequencies[term_id] -= 1
+            self._total_document_length -= self._document_lengths[row]
+            self._document_lengths[row] = 0
+            self._uid_by_row[row] = None
+
+        # Postings of removed documents are skipped when scoring
+        # until they outnumber the documents in the index.
+        if len(self._uid_by_row) > 2 * self.num_documents + 64:
+            self._compact()
+
+    async def search(
+        self,
+        query: str,
+        limit: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Search for the documents most relevant to the query.
+
+        Args:
+            query (str):
+                The search query.
+            limit (int | None):
+                Maximum number of documents to return.
+                If None, return all documents sharing a term with the query
+                (default: None).
+
+        Returns:
+            list[tuple[str, float]]:
+                UIDs and scores of documents sharing a term with the query,
+                ordered by descending score.
+
+        """
+        query_tokens = await asyncio.to_thread(self._tokenize, query)
+        rows, scores = self._score_rows(query_tokens)
+        if len(rows) == 0 or limit == 0:
+            return []
+
+        if limit is not None and limit < len(rows):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+
+        order = np.argsort(-scores, kind="stable")
+        return [
+            (cast("str", self._uid_by_row[row]), float(score))
+            for row, score in zip(rows[order], scores[order], strict=True)
+        ]
+
+    def _score_rows(self, query_tokens: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Return the rows sharing a term with the query and their scores."""
+        query_term_counts = Counter(
+            self._term_ids[token]
+            for token in query_tokens
+            if token in self._term_ids
+            and self._document_frequencies[self._term_ids[token]] > 0
+        )
+        num_documents = self.num_documents
+        if not query_term_counts or self._total_document_length == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        document_frequencies = np.array(self._document_frequencies)
+        present_terms = document_frequencies > 0
+        idf = np.zeros(len(document_frequencies))
+        idf[present_terms] = okapi_idf(
+            document_frequencies[present_terms],
+            num_documents,
+            self._epsilon,
+        )
+
+        document_lengths = np.array(self._document_lengths)
+        average_document_length = self._total_document_length / num_documents
+
+        posting_rows = []
+        posting_scores = []
+        for term_id, query_count in query_term_counts.items():
+            rows = np.array(self._postings[term_id][0], dtype=np.int64)
+            term_frequencies = np.array(self._postings[term_id][1], dtype=float)
+            # Removed documents have zero length, unlike any document in a posting list.
+            live = document_lengths[rows] > 0
+            rows, term_frequencies = rows[live], term_frequencies[live]
+
+            posting_rows.append(rows)
+            posting_scores.append(
+                query_count
+                * idf[term_id]
+                * saturated_term_frequencies(
+                    term_frequencies,
+                    document_lengths[rows],
+                    average_document_length,
+                    self._k1,
+                    self._b,
+                ),
+            )
+
+        all_rows = np.concatenate(posting_rows)
+        row_scores = np.bincount(
+            all_rows,
+            weights=np.concatenate(posting_scores),
+            minlength=len(self._uid_by_row),
+        )
+        matched_rows = np.unique(all_rows)
+        return matched_rows, row_scores[matched_rows]
+
+    def _add_tokenized_document(self, uid: str, tokens: list[str]) -> None:
+        row = len(self._uid_by_row)
+        token_counts = Counter(tokens)
+
+        term_ids = np.empty(len(token_counts), dtype=np.int64)
+        term_frequencies = np.empty(len(token_counts), dtype=np.int64)
+        for index, (token, count) in enumerate(token_counts.items()):
+            term_id = self._term_ids.get(token)
+            if term_id is None:
+                term_id = len(self._term_ids)
+                self._term_ids[token] = term_id
+                self._document_frequencies.append(0)
+                self._postings.append(([], []))
+
+            self._document_frequencies[term_id] += 1
+            self._postings[term_id][0].append(row)
+            self._postings[term_id][1].append(count)
+            term_ids[index] = term_id
+            term_frequencies[index] = count
+
+        self._row_by_uid[uid] = row
+        self._uid_by_row.append(uid)
+        self._row_terms.append((term_ids, term_frequencies))
+        self._document_lengths.append(len(tokens))
+        self._total_document_length += len(tokens)
+
+    def _compact(self) -> None:
+        """Rebuild the posting lists without removed documents."""
+        live_documents = [
+            (uid, self._row_terms[row], self._document_lengths[row])
+            for row, uid in enumerate(self._uid_by_row)
+            if uid is not None
+        ]
+
+        self._postings = [([], []) for _ in self._term_ids]
+        self._row_by_uid = {}
+        self._uid_by_row = []
+        self._row_terms = []
+        self._document_lengths = []
+
+        for row, (uid, (term_ids, term_frequencies), length) in enumerate(
+            live_documents,
+        ):
+            for term_id, term_frequency in zip(
+                term_ids,
+                term_frequencies,
+                strict=True,
+            ):
+                self._postings[term_id][0].append(row)
+                self._postings[term_id][1].append(int(term_frequency))
+
+            self._row_by_uid[uid] = row
+            self._uid_by_row.append(uid)
+            self._row_terms.append((term_ids, term_frequencies))
+            self._document_lengths.append(length)
+
+    def _tokenize_multiple(self, corpus: list[str]) -> list[list[str]]:
+        return [self._tokenize(document) for document in corpus]
@@ -1,13 +1,42 @@
 """BM25-based reranker implementation."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
+import numpy as np
 from pydantic import BaseModel, Field
-from rank_bm25 import BM25Okapi
 
+from .bm25_index import BM25Index, okapi_idf, saturated_term_frequencies
 from .reranker import Reranker
 
+_current_corpus_index: ContextVar[BM25Index | None] = ContextVar(
+    "current_bm25_corpus_index",
+    default=None,
+)
+
+
+@contextmanager
+def bm25_corpus_index(index: BM25Index) -> Iterator[None]:
+    """
+    Score candidates within the context with the statistics of a BM25 index.
+
+    Inverse document frequencies are computed from the document frequencies
+    and the document count of the index, instead of from the candidates alone.
+    Terms not in the index are counted in the candidates.
+
+    Args:
+        index (BM25Index):
+            Index over the corpus the candidates are drawn from.
+
+    """
+    token = _current_corpus_index.set(index)
+    try:
+        yield
+    finally:
+        _current_corpus_index.reset(token)
+
 
 class BM25RerankerParams(BaseModel):
     """Parameters for BM25Reranker."""
@@ -49,16 +78,48 @@ class BM25Reranker(Reranker):
             return [0.0 for _ in candidates]
 
         # There is at least one token in the corpus.
-        bm25 = BM25Okapi(
-            tokenized_candidates,
-            k1=self._k1,
-            b=self._b,
-            epsilon=self._epsilon,
-        )
+        term_ids: dict[str, int] = {}
+        rows = []
+        columns = []
+        for row, tokens in enumerate(tokenized_candidates):
+            for token in tokens:
+                rows.append(row)
+                columns.append(term_ids.setdefault(token, len(term_ids)))
+
+        term_frequencies = np.zeros((len(candidates), len(term_ids)))
+        np.add.at(term_frequencies, (rows, columns), 1)
+
+        document_frequencies = np.count_nonzero(term_frequencies, axis=0)
+        num_documents = len(candidates)
+        corpus_index = _current_corpus_index.get()
+        if corpus_index is not None and corpus_index.num_documents > 0:
+            document_frequencies = np.maximum(
+                corpus_index.document_frequencies(term_ids),
+                document_frequencies,
+            )
+            num_documents = max(corpus_index.num_documents, num_documents)
+
+        idf = okapi_idf(document_frequencies, num_documents, self._epsilon)
+
+        query_term_ids = [
+            term_ids[token] for token in tokenized_query if token in term_ids
+        ]
+        if not query_term_ids:
+            return [0.0 for _ in candidates]
 
-        scores = [float(score) for score in bm25.get_scores(tokenized_query)]
+        document_lengths = term_frequencies.sum(axis=1, keepdims=True)
+        scores = (
+            saturated_term_frequencies(
+                term_frequencies[:, query_term_ids],
+                document_lengths,
+                document_lengths.mean(),
+                self._k1,
+                self._b,
+            )
+            @ idf[query_term_ids]
+        )
 
-        return scores
+        return scores.astype(float).tolist()
 
     def _tokenize_multiple(self, corpus: list[str]) -> list[list[str]]:
         return [self._tokenize(document) for document in corpus]
@@ -1,5 +1,8 @@
 """Embedder-based reranker implementation."""
 
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 from pydantic import BaseModel, Field, InstanceOf
 
@@ -16,6 +19,14 @@ class EmbedderRerankerParams(BaseModel):
         ...,
         description="An instance of an Embedder to use for generating embeddings",
     )
+    candidate_cache_size: int = Field(
+        default=1024,
+        description=(
+            "Maximum number of candidate embeddings to cache by candidate content. "
+            "If 0, candidates are embedded on every call."
+        ),
+        ge=0,
+    )
 
 
 class EmbedderReranker(Reranker):
@@ -26,6 +37,10 @@ class EmbedderReranker(Reranker):
         super().__init__()
 
         self._embedder = params.embedder
+        self._candidate_cache_size = params.candidate_cache_size
+
+        # Maps candidate content hashes to embeddings, least recently used first.
+        self._candidate_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
 
     async def score(self, query: str, candidates: list[str]) -> list[float]:
         """Score candidates for a query using embedder similarity."""
@@ -33,7 +48,7 @@ class EmbedderReranker(Reranker):
             return []
 
         query_embedding = np.array(await self._embedder.search_embed([query])).flatten()
-        candidate_embeddings = np.array(await self._embedder.ingest_embed(candidates))
+        candidate_embeddings = await self._embed_candidates(candidates)
 
         match self._embedder.similarity_metric:
             case SimilarityMetric.COSINE:
@@ -71,3 +86,37 @@ class EmbedderReranker(Reranker):
                 )
 
         return scores.astype(float).tolist()
+
+    async def _embed_candidates(self, candidates: list[str]) -> np.ndarray:
+        """Embed candidates, reusing cached embeddings of identical candidates."""
+        if self._candidate_cache_size == 0:
+            return np.array(await self._embedder.ingest_embed(candidates))
+
+        keys = [hashlib.sha256(candidate.encode()).digest() for candidate in candidates]
+
+        embeddings: dict[bytes, np.ndarray] = {}
+        missing_candidates: dict[bytes, str] = {}
+        for key, candidate in zip(keys, candidates, strict=True):
+            cached_embedding = self._candidate_cache.get(key)
+            if cached_embedding is not None:
+                self._candidate_cache.move_to_end(key)
+                embeddings[key] = cached_embedding
+            else:
+                missing_candidates.setdefault(key, candidate)
+
+        if missing_candidates:
+            missing_embeddings = await self._embedder.ingest_embed(
+                list(missing_candidates.values()),
+            )
+            for key, embedding in zip(
+                missing_candidates.keys(),
+                missing_embeddings,
+                strict=True,
+            ):
+                embeddings[key] = np.array(embedding)
+                self._candidate_cache[key] = embeddings[key]
+
+            while len(self._candidate_cache) > self._candidate_cache_size:
+                self._candidate_cache.popitem(last=False)
+
+        return np.array([embeddings[key] for key in keys])
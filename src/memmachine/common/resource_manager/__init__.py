@@ -6,6 +6,7 @@ from neo4j import AsyncDriver
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from memmachine.common.embedder import Embedder
+from memmachine.common.episode_store import EpisodeStorage
 from memmachine.common.language_model import LanguageModel
 from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.reranker import Reranker
@@ -58,3 +59,7 @@ class CommonResourceManager(Protocol):
     async def get_session_data_manager(self) -> SessionDataManager:
         """Return the session data manager."""
         raise NotImplementedError
+
+    async def get_episode_storage(self) -> EpisodeStorage:
+        """Return the episode storage."""
+        raise NotImplementedError
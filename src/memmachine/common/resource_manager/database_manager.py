@@ -1,4 +1,4 @@
-"""Manage database engines for SQL and Neo4j backends."""
+"""Manage database engines for SQL, Neo4j, and NumPy backends."""
 
 import asyncio
 import logging
@@ -16,6 +16,10 @@ from memmachine.common.vector_graph_store.neo4j_vector_graph_store import (
     Neo4jVectorGraphStore,
     Neo4jVectorGraphStoreParams,
 )
+from memmachine.common.vector_graph_store.numpy_vector_graph_store import (
+    NumpyVectorGraphStore,
+    NumpyVectorGraphStoreParams,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +68,9 @@ class DatabaseManager:
                 tasks.append(self._close_async_driver(name, driver))
             for name, engine in self.sql_engines.items():
                 tasks.append(self._close_async_engine(name, engine))
+            for name, graph_store in self.graph_stores.items():
+                if name in self.conf.numpy_graph_confs:
+                    tasks.append(self._close_graph_store(name, graph_store))
             await asyncio.gather(*tasks)
             self.graph_stores.clear()
             self.neo4j_drivers.clear()
@@ -78,6 +85,13 @@ class DatabaseManager:
         except Exception as ex:
             logger.warning("Error closing Neo4j driver '%s': %s", name, ex)
 
+    @staticmethod
+    async def _close_graph_store(name: str, graph_store: VectorGraphStore) -> None:
+        try:
+            await graph_store.close()
+        except Exception as ex:
+            logger.warning("Error closing vector graph store '%s': %s", name, ex)
+
     @staticmethod
     async def _close_async_engine(name: str, engine: AsyncEngine) -> None:
         try:
@@ -153,9 +167,28 @@ class DatabaseManager:
 
     async def get_vector_graph_store(self, name: str) -> VectorGraphStore:
         """Return a vector graph store, initializing driver lazily if needed."""
+        if name in self.conf.numpy_graph_confs:
+            return await self._async_get_numpy_graph_store(name)
         await self.async_get_neo4j_driver(name, validate=True)
         return self.graph_stores[name]
 
+    # --- NumPy ---
+
+    async def _async_get_numpy_graph_store(self, name: str) -> VectorGraphStore:
+        """Return an in-process NumPy graph store, creating it if necessary (lazy)."""
+        async with self._lock:
+            if name in self.graph_stores:
+                return self.graph_stores[name]
+
+            conf = self.conf.numpy_graph_confs[name]
+            # Loading a snapshot reads files.
+            graph_store = await asyncio.to_thread(
+                NumpyVectorGraphStore,
+                NumpyVectorGraphStoreParams(snapshot_path=conf.snapshot_path),
+            )
+            self.graph_stores[name] = graph_store
+            return graph_store
+
     @staticmethod
     async def validate_neo4j_driver(name: str, driver: AsyncDriver) -> None:
         """Validate connectivity to a Neo4j instance."""
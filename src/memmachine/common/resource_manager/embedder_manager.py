@@ -3,11 +3,17 @@
 import asyncio
 import logging
 from asyncio import Lock
+from typing import TYPE_CHECKING
 
 from memmachine.common.configuration.embedder_conf import EmbeddersConf
 from memmachine.common.embedder import Embedder
 from memmachine.common.errors import InvalidEmbedderError
 
+if TYPE_CHECKING:
+    from memmachine.common.embedder.persistent_caching_embedder import (
+        PersistentCachingEmbedder,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +24,8 @@ class EmbedderManager:
         """Store embedder configuration and initialize caches."""
         self.conf = conf
         self._embedders: dict[str, Embedder] = {}
+        # Persistent caches wrapped by the embedders, closed on shutdown.
+        self._persistent_caching_embedders: dict[str, PersistentCachingEmbedder] = {}
 
         # Lock to protect creation of per-embedder locks
         self._lock = Lock()
@@ -35,6 +43,31 @@ class EmbedderManager:
 
         return self._embedders
 
+    async def close(self) -> None:
+        """Close the persistent caches of the built embedders."""
+        await asyncio.gather(
+            *[
+                self._close_persistent_caching_embedder(name, embedder)
+                for name, embedder in self._persistent_caching_embedders.items()
+            ],
+        )
+        self._persistent_caching_embedders.clear()
+        self._embedders.clear()
+
+    @staticmethod
+    async def _close_persistent_caching_embedder(
+        name: str,
+        embedder: "PersistentCachingEmbedder",
+    ) -> None:
+        try:
+            await embedder.close()
+        except Exception as ex:
+            logger.warning(
+                "Error closing persistent embedder cache of '%s': %s",
+                name,
+                ex,
+            )
+
     async def get_embedder(self, name: str, validate: bool = False) -> Embedder:
         """Return a named embedder, building it on first access."""
         # Return cached if already built
@@ -77,10 +110,70 @@ class EmbedderManager:
             ret = self._build_sentence_transformer_embedders(name)
         if ret is None:
             raise InvalidEmbedderError(f"Embedder with name {name} not found.")
+        ret = self._wrap_with_decorators(name, ret)
         if validate:
             await self._validate_embedder(name, ret)
         return ret
 
+    def _wrap_with_decorators(self, name: str, embedder: Embedder) -> Embedder:
+        """Wrap the embedder in the batching and caches that are configured."""
+        conf = (
+            self.conf.amazon_bedrock.get(name)
+            or self.conf.openai.get(name)
+            or self.conf.sentence_transformer.get(name)
+        )
+        if conf is None:
+            return embedder
+
+        # Batch innermost, so that only cache misses are sent in batches.
+        if conf.batching is not None:
+            from memmachine.common.embedder.batching_embedder import (
+                BatchingEmbedder,
+                BatchingEmbedderParams,
+            )
+
+            batching_params = BatchingEmbedderParams(
+                embedder=embedder,
+                max_batch_size=conf.batching.max_batch_size,
+                max_wait_seconds=conf.batching.max_wait_seconds,
+                max_pending_inputs=conf.batching.max_pending_inputs,
+                metrics_factory=conf.batching.get_metrics_factory(),
+                user_metrics_labels=conf.batching.user_metrics_labels,
+            )
+            embedder = BatchingEmbedder(batching_params)
+
+        if conf.persistent_cache is not None:
+            from memmachine.common.embedder.persistent_caching_embedder import (
+                PersistentCachingEmbedder,
+                PersistentCachingEmbedderParams,
+            )
+
+            persistent_params = PersistentCachingEmbedderParams(
+                embedder=embedder,
+                path=conf.persistent_cache.path,
+                metrics_factory=conf.persistent_cache.get_metrics_factory(),
+                user_metrics_labels=conf.persistent_cache.user_metrics_labels,
+            )
+            embedder = PersistentCachingEmbedder(persistent_params)
+            self._persistent_caching_embedders[name] = embedder
+
+        if conf.cache is not None:
+            from memmachine.common.embedder.caching_embedder import (
+                CachingEmbedder,
+                CachingEmbedderParams,
+            )
+
+            params = CachingEmbedderParams(
+                embedder=embedder,
+                max_size=conf.cache.max_size,
+                ttl_seconds=conf.cache.ttl_seconds,
+                metrics_factory=conf.cache.get_metrics_factory(),
+                user_metrics_labels=conf.cache.user_metrics_labels,
+            )
+            embedder = CachingEmbedder(params)
+
+        return embedder
+
     def _build_amazon_bedrock_embedders(self, name: str) -> Embedder:
         conf = self.conf.amazon_bedrock[name]
 
@@ -111,6 +204,9 @@ class EmbedderManager:
             similarity_metric=conf.similarity_metric,
             max_input_length=conf.max_input_length,
             max_retry_interval_seconds=conf.max_retry_interval_seconds,
+            request_scheduler=conf.build_request_scheduler(
+                conf.max_retry_interval_seconds,
+            ),
         )
         return AmazonBedrockEmbedder(params)
 
@@ -135,6 +231,9 @@ class EmbedderManager:
             dimensions=dimensions,
             max_input_length=conf.max_input_length,
             max_retry_interval_seconds=conf.max_retry_interval_seconds,
+            request_scheduler=conf.build_request_scheduler(
+                conf.max_retry_interval_seconds,
+            ),
             metrics_factory=conf.get_metrics_factory(),
             user_metrics_labels=conf.user_metrics_labels,
         )
@@ -111,6 +111,9 @@ class LanguageModelManager:
                 ),
                 model=conf.model,
                 max_retry_interval_seconds=conf.max_retry_interval_seconds,
+                request_scheduler=conf.build_request_scheduler(
+                    conf.max_retry_interval_seconds,
+                ),
                 metrics_factory=conf.get_metrics_factory(),
                 user_metrics_labels=conf.user_metrics_labels,
             ),
@@ -134,6 +137,9 @@ class LanguageModelManager:
                 ),
                 model=conf.model,
                 max_retry_interval_seconds=conf.max_retry_interval_seconds,
+                request_scheduler=conf.build_request_scheduler(
+                    conf.max_retry_interval_seconds,
+                ),
                 metrics_factory=conf.get_metrics_factory(),
                 user_metrics_labels=conf.user_metrics_labels,
             ),
@@ -176,6 +182,9 @@ class LanguageModelManager:
                 inference_config=conf.inference_config,
                 additional_model_request_fields=conf.additional_model_request_fields,
                 max_retry_interval_seconds=conf.max_retry_interval_seconds,
+                request_scheduler=conf.build_request_scheduler(
+                    conf.max_retry_interval_seconds,
+                ),
                 metrics_factory=conf.get_metrics_factory(),
                 user_metrics_labels=conf.user_metrics_labels,
             ),
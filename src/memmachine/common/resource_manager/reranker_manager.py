@@ -2,10 +2,8 @@
 
 import asyncio
 import logging
-import re
 from asyncio import Lock
 from collections import defaultdict
-from collections.abc import Callable
 from typing import Protocol
 
 import boto3
@@ -124,31 +122,12 @@ class RerankerManager:
         return ret
 
     async def _build_bm25_reranker(self, name: str) -> Reranker:
+        from memmachine.common.reranker.bm25_index import get_tokenizer
         from memmachine.common.reranker.bm25_reranker import (
             BM25Reranker,
             BM25RerankerParams,
         )
 
-        def get_tokenizer(name: str, language: str) -> Callable[[str], list[str]]:
-            if name == "default":
-                from nltk import word_tokenize
-                from nltk.corpus import stopwords
-
-                stop_words = stopwords.words(language)
-
-                def _default_tokenize(text: str) -> list[str]:
-                    """Tokenize text by normalizing and filtering stop words."""
-                    alphanumeric_text = re.sub(r"\W+", " ", text)
-                    lower_text = alphanumeric_text.lower()
-                    words = word_tokenize(lower_text, language)
-                    tokens = [word for word in words if word and word not in stop_words]
-                    return tokens
-
-                return _default_tokenize
-            if name == "simple":
-                return lambda text: re.sub(r"\W+", " ", text).lower().split()
-            raise ValueError(f"Unknown tokenizer: {name}")
-
         conf = self.conf.bm25[name]
         self._rerankers[name] = BM25Reranker(
             BM25RerankerParams(
@@ -236,7 +215,10 @@ class RerankerManager:
 
         conf = self.conf.embedder[name]
         embedder = await self._embedder_factory.get_embedder(conf.embedder_id)
-        params = EmbedderRerankerParams(embedder=embedder)
+        params = EmbedderRerankerParams(
+            embedder=embedder,
+            candidate_cache_size=conf.candidate_cache_size,
+        )
         self._rerankers[name] = EmbedderReranker(params)
         return self._rerankers[name]
 
@@ -91,6 +91,7 @@ class ResourceManagerImpl:
             tasks.append(self._semantic_manager.close())
 
         tasks.append(self._database_manager.close())
+        tasks.append(self._embedder_manager.close())
 
         await asyncio.gather(*tasks)
 
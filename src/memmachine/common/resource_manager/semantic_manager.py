@@ -97,7 +97,10 @@ class SemanticResourceManager:
             sql_engine = await self._resource_manager.get_sql_engine(
                 database, validate=True
             )
-            storage = SqlAlchemyPgVectorSemanticStorage(sql_engine)
+            storage = SqlAlchemyPgVectorSemanticStorage(
+                sql_engine,
+                hnsw_ef_search=self._conf.hnsw_ef_search,
+            )
         except ValueError:
             # try graph store
             neo4j_engine = await self._resource_manager.get_neo4j_driver(
@@ -124,6 +127,11 @@ class SemanticResourceManager:
                 resource_retriever=resource_retriever,
                 uningested_time_limit=self._conf.ingestion_trigger_age,
                 uningested_message_limit=self._conf.ingestion_trigger_messages,
+                ingestion_batch_token_budget=self._conf.ingestion_batch_token_budget,
+                ingestion_max_concurrency=self._conf.ingestion_concurrency,
+                ingestion_reconcile_interval_sec=(
+                    self._conf.ingestion_reconcile_interval.total_seconds()
+                ),
             ),
         )
         return self._semantic_service
@@ -83,6 +83,15 @@ class Edge:
         return hash(self.uid)
 
 
+@dataclass(kw_only=True)
+class NodeContext:
+    """Node reached through a relation, with its ordered neighbors."""
+
+    node: Node
+    backward_nodes: list[Node] = field(default_factory=list)
+    forward_nodes: list[Node] = field(default_factory=list)
+
+
 _MANGLE_PROPERTY_NAME_PREFIX = "property_"
 _MANGLE_EMBEDDING_NAME_PREFIX = "embedding_"
 
@@ -7,12 +7,13 @@ of a vector graph store using Neo4j as the backend database.
 
 import asyncio
 import logging
+import math
 import re
 import time
-from collections.abc import Awaitable, Iterable, Mapping
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
 from enum import Enum
-from typing import cast
-from uuid import uuid4
+from typing import Any, cast
 
 from neo4j import AsyncDriver
 from neo4j.graph import Node as Neo4jNode
@@ -20,18 +21,13 @@ from neo4j.time import DateTime as Neo4jDateTime
 from pydantic import BaseModel, Field, InstanceOf
 
 from memmachine.common.data_types import FilterablePropertyValue, SimilarityMetric
-from memmachine.common.filter.filter_parser import (
-    And as FilterAnd,
-)
-from memmachine.common.filter.filter_parser import (
-    Comparison as FilterComparison,
+from memmachine.common.filter.filter_compiler import (
+    compile_cypher_filter,
+    filter_shape_key,
 )
 from memmachine.common.filter.filter_parser import (
     FilterExpr,
 )
-from memmachine.common.filter.filter_parser import (
-    Or as FilterOr,
-)
 from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.utils import async_locked
 
@@ -39,6 +35,7 @@ from .data_types import (
     Edge,
     EntityType,
     Node,
+    NodeContext,
     OrderedPropertyValue,
     PropertyValue,
     demangle_embedding_name,
@@ -52,6 +49,14 @@ from .vector_graph_store import VectorGraphStore
 
 logger = logging.getLogger(__name__)
 
+# Weight of a new observation in the moving average of filter selectivity.
+_FILTER_SELECTIVITY_SMOOTHING = 0.2
+_MIN_FILTER_SELECTIVITY = 1e-6
+_MAX_FILTER_SELECTIVITIES = 10_000
+# Extra ANN candidates requested beyond the expected number needed,
+# because the selectivity is only an estimate.
+_FILTERED_QUERY_LIMIT_HEADROOM = 1.5
+
 
 class Neo4jVectorGraphStoreParams(BaseModel):
     """
@@ -66,12 +71,23 @@ class Neo4jVectorGraphStoreParams(BaseModel):
         filtered_similarity_search_fudge_factor (int):
             Fudge factor for filtered similarity search
             because Neo4j vector index search does not
-            support pre-filtering or filtered search.
+            support pre-filtering or filtered search,
+            used until the selectivity of the filter is known
             (default: 4).
+        filtered_similarity_search_growth_factor (float):
+            Factor by which to grow the number of ANN candidates
+            when too few of them match the filter
+            (default: 4.0).
+        filtered_similarity_search_max_query_limit (int):
+            Maximum number of ANN candidates to request
+            for filtered similarity search,
+            beyond which exact similarity search is performed
+            (default: 10,000).
         exact_similarity_search_fallback_threshold (float):
             Threshold ratio of ANN search results to the search limit
             below which to fall back to exact similarity search
-            when performing filtered similarity search
+            when filtered similarity search
+            reaches the maximum number of ANN candidates
             (default: 0.5).
         range_index_hierarchies (list[list[str]]):
             List of property name hierarchies (lists)
@@ -88,6 +104,14 @@ class Neo4jVectorGraphStoreParams(BaseModel):
             in a collection or having a relation
             at which vector indexes may be created
             (default: 10,000).
+        index_state_poll_interval_sec (float):
+            Interval in seconds between polls of index states
+            by the background index state poller
+            (default: 5.0).
+        delete_batch_size (int):
+            Number of nodes to delete per transaction
+            when deleting more nodes than this in one call
+            (default: 10,000).
         metrics_factory (MetricsFactory | None):
             An instance of MetricsFactory for collecting usage metrics
             (default: None).
@@ -110,7 +134,25 @@ class Neo4jVectorGraphStoreParams(BaseModel):
         description=(
             "Fudge factor for filtered similarity search "
             "because Neo4j vector index search does not "
-            "support pre-filtering or filtered search"
+            "support pre-filtering or filtered search, "
+            "used until the selectivity of the filter is known"
+        ),
+        gt=0,
+    )
+    filtered_similarity_search_growth_factor: float = Field(
+        4.0,
+        description=(
+            "Factor by which to grow the number of ANN candidates "
+            "when too few of them match the filter"
+        ),
+        gt=1.0,
+    )
+    filtered_similarity_search_max_query_limit: int = Field(
+        10_000,
+        description=(
+            "Maximum number of ANN candidates to request "
+            "for filtered similarity search, "
+            "beyond which exact similarity search is performed"
         ),
         gt=0,
     )
@@ -119,7 +161,8 @@ class Neo4jVectorGraphStoreParams(BaseModel):
         description=(
             "Threshold ratio of ANN search results to the search limit "
             "below which to fall back to exact similarity search "
-            "when performing filtered similarity search"
+            "when filtered similarity search "
+            "reaches the maximum number of ANN candidates"
         ),
         ge=0.0,
         le=1.0,
@@ -148,6 +191,22 @@ class Neo4jVectorGraphStoreParams(BaseModel):
             "at which vector indexes may be created"
         ),
     )
+    index_state_poll_interval_sec: float = Field(
+        5.0,
+        description=(
+            "Interval in seconds between polls of index states "
+            "by the background index state poller"
+        ),
+        gt=0,
+    )
+    delete_batch_size: int = Field(
+        10_000,
+        description=(
+            "Number of nodes to delete per transaction "
+            "when deleting more nodes than this in one call"
+        ),
+        gt=0,
+    )
     metrics_factory: InstanceOf[MetricsFactory] | None = Field(
         None,
         description="An instance of MetricsFactory for collecting usage metrics",
@@ -169,6 +228,14 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         CREATING = 0
         ONLINE = 1
+        FAILED = 2
+
+    @dataclass(frozen=True)
+    class IndexStatus:
+        """State and population progress of an index as last polled."""
+
+        state: "Neo4jVectorGraphStore.CacheIndexState"
+        population_percent: float
 
     def __init__(self, params: Neo4jVectorGraphStoreParams) -> None:
         """Initialize the graph store with the provided parameters."""
@@ -180,6 +247,12 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         self._filtered_similarity_search_fudge_factor = (
             params.filtered_similarity_search_fudge_factor
         )
+        self._filtered_similarity_search_growth_factor = (
+            params.filtered_similarity_search_growth_factor
+        )
+        self._filtered_similarity_search_max_query_limit = (
+            params.filtered_similarity_search_max_query_limit
+        )
         self._exact_similarity_search_fallback_threshold = (
             params.exact_similarity_search_fallback_threshold
         )
@@ -188,13 +261,37 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         self._vector_index_creation_threshold = params.vector_index_creation_threshold
 
+        self._index_state_poll_interval_sec = params.index_state_poll_interval_sec
+
+        self._delete_batch_size = params.delete_batch_size
+
         self._index_state_cache: dict[str, Neo4jVectorGraphStore.CacheIndexState] = {}
+        self._index_population_percents: dict[str, float] = {}
+        self._is_index_state_cache_populated = False
         self._populate_index_state_cache_lock = asyncio.Lock()
+        self._index_state_poll_task: asyncio.Task | None = None
+        # Indexes whose creation query has not completed,
+        # which may not be shown by Neo4j yet.
+        self._index_names_being_created: set[str] = set()
+        # Counts and embedding specs of collections and relations
+        # past an index creation threshold,
+        # keyed by (entity type, sanitized collection or relation),
+        # whose missing indexes are created by the index state poller.
+        self._indexed_entities: dict[
+            tuple[EntityType, str],
+            tuple[int, dict[str, tuple[int, SimilarityMetric]]],
+        ] = {}
 
         # These are only used for tracking counts approximately.
+        # Keyed by sanitized collection name.
         self._collection_node_counts: dict[str, int] = {}
         self._relation_edge_counts: dict[str, int] = {}
 
+        # Estimated fraction of nodes matching filters of each shape,
+        # keyed by (collection, embedding name, filter shape).
+        # Least recently updated estimates are evicted first.
+        self._filter_selectivities: dict[tuple[str, str, Hashable], float] = {}
+
         self._background_tasks: set[asyncio.Task] = set()
 
         metrics_factory = params.metrics_factory
@@ -203,14 +300,26 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         self._add_nodes_latency_summary = None
         self._add_edges_calls_counter = None
         self._add_edges_latency_summary = None
+        self._add_subgraph_calls_counter = None
+        self._add_subgraph_latency_summary = None
         self._search_similar_nodes_calls_counter = None
         self._search_similar_nodes_latency_summary = None
         self._search_related_nodes_calls_counter = None
         self._search_related_nodes_latency_summary = None
+        self._get_related_nodes_calls_counter = None
+        self._get_related_nodes_latency_summary = None
         self._search_directional_nodes_calls_counter = None
         self._search_directional_nodes_latency_summary = None
+        self._search_similar_node_contexts_calls_counter = None
+        self._search_similar_node_contexts_latency_summary = None
+        self._get_related_node_contexts_calls_counter = None
+        self._get_related_node_contexts_latency_summary = None
         self._search_matching_nodes_calls_counter = None
         self._search_matching_nodes_latency_summary = None
+        self._filtered_similarity_search_strategy_counter = None
+        self._filtered_similarity_search_ann_queries_summary = None
+        self._filter_selectivity_estimate_summary = None
+        self._filter_selectivity_observed_summary = None
         self._get_nodes_calls_counter = None
         self._get_nodes_latency_summary = None
         self._delete_nodes_calls_counter = None
@@ -221,6 +330,9 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         self._count_edges_latency_summary = None
         self._populate_index_state_cache_calls_counter = None
         self._populate_index_state_cache_latency_summary = None
+        self._poll_index_states_calls_counter = None
+        self._poll_index_states_latency_summary = None
+        self._index_states_gauge = None
         self._create_initial_indexes_if_not_exist_calls_counter = None
         self._create_initial_indexes_if_not_exist_latency_summary = None
         self._create_range_index_if_not_exists_calls_counter = None
@@ -254,6 +366,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 "Latency in seconds for add_edges in Neo4jVectorGraphStore",
                 label_names=label_names,
             )
+            self._add_subgraph_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_add_subgraph_calls",
+                "Number of calls to add_subgraph in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._add_subgraph_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_add_subgraph_latency_seconds",
+                "Latency in seconds for add_subgraph in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
 
             self._search_similar_nodes_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_search_similar_nodes_calls",
@@ -275,6 +397,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 "Latency in seconds for search_related_nodes in Neo4jVectorGraphStore",
                 label_names=label_names,
             )
+            self._get_related_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_get_related_nodes_calls",
+                "Number of calls to get_related_nodes in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_get_related_nodes_latency_seconds",
+                "Latency in seconds for get_related_nodes in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
             self._search_directional_nodes_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_search_directional_nodes_calls",
                 "Number of calls to search_directional_nodes in Neo4jVectorGraphStore",
@@ -285,6 +417,27 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 "Latency in seconds for search_directional_nodes in Neo4jVectorGraphStore",
                 label_names=label_names,
             )
+            self._search_similar_node_contexts_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_search_similar_node_contexts_calls",
+                "Number of calls to search_similar_node_contexts in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_similar_node_contexts_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_search_similar_node_contexts_latency_seconds",
+                "Latency in seconds for search_similar_node_contexts in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_node_contexts_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_get_related_node_contexts_calls",
+                "Number of calls to get_related_node_contexts in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_node_contexts_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_get_related_node_contexts_latency_seconds",
+                "Latency in seconds for get_related_node_contexts "
+                "in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
             self._search_matching_nodes_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_search_matching_nodes_calls",
                 "Number of calls to search_matching_nodes in Neo4jVectorGraphStore",
@@ -296,6 +449,27 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 label_names=label_names,
             )
 
+            self._filtered_similarity_search_strategy_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_filtered_similarity_search_strategy",
+                "Number of filtered similarity searches in Neo4jVectorGraphStore by strategy (ann, exact, ann_then_exact)",
+                label_names=[*label_names, "strategy"],
+            )
+            self._filtered_similarity_search_ann_queries_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_filtered_similarity_search_ann_queries",
+                "Number of ANN queries per filtered similarity search in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._filter_selectivity_estimate_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_filter_selectivity_estimate",
+                "Estimated filter selectivity used to plan filtered similarity search in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._filter_selectivity_observed_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_filter_selectivity_observed",
+                "Observed filter selectivity in filtered similarity search in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+
             self._get_nodes_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_get_nodes_calls",
                 "Number of calls to get_nodes in Neo4jVectorGraphStore",
@@ -349,6 +523,21 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 "Latency in seconds for _populate_index_state_cache in Neo4jVectorGraphStore",
                 label_names=label_names,
             )
+            self._poll_index_states_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_poll_index_states_calls",
+                "Number of calls to _poll_index_states in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._poll_index_states_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_poll_index_states_latency_seconds",
+                "Latency in seconds for _poll_index_states in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._index_states_gauge = metrics_factory.get_gauge(
+                "vector_graph_store_neo4j_indexes",
+                "Number of indexes known to Neo4jVectorGraphStore by state (creating, online, failed)",
+                label_names=[*label_names, "state"],
+            )
 
             self._create_initial_indexes_if_not_exist_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_create_initial_indexes_if_not_exist_calls",
@@ -395,49 +584,8 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         """Add nodes to a collection, creating indexes as needed."""
         start_time = time.monotonic()
 
-        if collection not in self._collection_node_counts:
-            # Not async-safe but it's not crucial if the count is off.
-            self._collection_node_counts[collection] = await self._count_nodes(
-                collection,
-            )
-
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
-        sanitized_embedding_names = set()
-
-        query_nodes = []
-        for node in nodes:
-            query_node_properties = Neo4jVectorGraphStore._sanitize_properties(
-                {
-                    mangle_property_name(key): value
-                    for key, value in node.properties.items()
-                },
-            )
-
-            for embedding_name, (
-                embedding,
-                similarity_metric,
-            ) in node.embeddings.items():
-                sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
-                    mangle_embedding_name(embedding_name),
-                )
-                sanitized_similarity_metric_name = Neo4jVectorGraphStore._sanitize_name(
-                    Neo4jVectorGraphStore._similarity_metric_property_name(
-                        embedding_name,
-                    ),
-                )
-
-                sanitized_embedding_names.add(sanitized_embedding_name)
-
-                query_node_properties[sanitized_embedding_name] = embedding
-                query_node_properties[sanitized_similarity_metric_name] = (
-                    similarity_metric.value
-                )
-
-            query_node: dict[str, PropertyValue | dict[str, PropertyValue]] = {
-                "uid": str(node.uid),
-                "properties": query_node_properties,
-            }
-            query_nodes.append(query_node)
+        query_nodes, embedding_specs = Neo4jVectorGraphStore._query_nodes(nodes)
 
         await self._driver.execute_query(
             "UNWIND $nodes AS node\n"
@@ -446,45 +594,11 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             nodes=query_nodes,
         )
 
-        self._collection_node_counts[collection] += len(query_nodes)
-
-        if (
-            self._collection_node_counts[collection]
-            >= self._range_index_creation_threshold
-        ):
-            self._track_task(
-                asyncio.create_task(
-                    self._create_initial_indexes_if_not_exist(
-                        EntityType.NODE,
-                        sanitized_collection,
-                    ),
-                )
-            )
-
-        if (
-            self._collection_node_counts[collection]
-            >= self._vector_index_creation_threshold
-        ):
-            for sanitized_embedding_name in sanitized_embedding_names:
-                if (
-                    Neo4jVectorGraphStore._index_name(
-                        EntityType.NODE,
-                        sanitized_collection,
-                        sanitized_embedding_name,
-                    )
-                    not in self._index_state_cache
-                ):
-                    self._track_task(
-                        asyncio.create_task(
-                            self._create_vector_index_if_not_exists(
-                                entity_type=EntityType.NODE,
-                                sanitized_collection_or_relation=sanitized_collection,
-                                sanitized_embedding_name=sanitized_embedding_name,
-                                dimensions=len(embedding),
-                                similarity_metric=similarity_metric,
-                            ),
-                        )
-                    )
+        await self._handle_nodes_added(
+            collection=collection,
+            num_nodes=len(query_nodes),
+            embedding_specs=embedding_specs,
+        )
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -505,49 +619,8 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         """Add edges between collections, creating indexes as needed."""
         start_time = time.monotonic()
 
-        if relation not in self._relation_edge_counts:
-            # Not async-safe but it's not crucial if the count is off.
-            self._relation_edge_counts[relation] = await self._count_edges(relation)
-
         sanitized_relation = Neo4jVectorGraphStore._sanitize_name(relation)
-        sanitized_embedding_names = set()
-
-        query_edges = []
-        for edge in edges:
-            query_edge_properties = Neo4jVectorGraphStore._sanitize_properties(
-                {
-                    mangle_property_name(key): value
-                    for key, value in edge.properties.items()
-                },
-            )
-
-            for embedding_name, (
-                embedding,
-                similarity_metric,
-            ) in edge.embeddings.items():
-                sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
-                    mangle_embedding_name(embedding_name),
-                )
-                sanitized_similarity_metric_name = Neo4jVectorGraphStore._sanitize_name(
-                    Neo4jVectorGraphStore._similarity_metric_property_name(
-                        embedding_name,
-                    ),
-                )
-
-                sanitized_embedding_names.add(sanitized_embedding_name)
-
-                query_edge_properties[sanitized_embedding_name] = embedding
-                query_edge_properties[sanitized_similarity_metric_name] = (
-                    similarity_metric.value
-                )
-
-            query_edge = {
-                "uid": str(edge.uid),
-                "source_uid": str(edge.source_uid),
-                "target_uid": str(edge.target_uid),
-                "properties": query_edge_properties,
-            }
-            query_edges.append(query_edge)
+        query_edges, embedding_specs = Neo4jVectorGraphStore._query_edges(edges)
 
         sanitized_source_collection = Neo4jVectorGraphStore._sanitize_name(
             source_collection,
@@ -566,42 +639,11 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             edges=query_edges,
         )
 
-        self._relation_edge_counts[relation] += len(query_edges)
-
-        if self._relation_edge_counts[relation] >= self._range_index_creation_threshold:
-            self._track_task(
-                asyncio.create_task(
-                    self._create_initial_indexes_if_not_exist(
-                        EntityType.EDGE,
-                        sanitized_relation,
-                    ),
-                )
-            )
-
-        if (
-            self._relation_edge_counts[relation]
-            >= self._vector_index_creation_threshold
-        ):
-            for sanitized_embedding_name in sanitized_embedding_names:
-                if (
-                    Neo4jVectorGraphStore._index_name(
-                        EntityType.EDGE,
-                        sanitized_relation,
-                        sanitized_embedding_name,
-                    )
-                    not in self._index_state_cache
-                ):
-                    self._track_task(
-                        asyncio.create_task(
-                            self._create_vector_index_if_not_exists(
-                                entity_type=EntityType.EDGE,
-                                sanitized_collection_or_relation=sanitized_relation,
-                                sanitized_embedding_name=sanitized_embedding_name,
-                                dimensions=len(embedding),
-                                similarity_metric=similarity_metric,
-                            ),
-                        )
-                    )
+        await self._handle_edges_added(
+            relation=relation,
+            num_edges=len(query_edges),
+            embedding_specs=embedding_specs,
+        )
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -611,152 +653,470 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             end_time,
         )
 
-    async def search_similar_nodes(
+    async def add_subgraph(
         self,
         *,
-        collection: str,
-        embedding_name: str,
-        query_embedding: list[float],
-        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
-        limit: int | None = 100,
-        property_filter: FilterExpr | None = None,
-    ) -> list[Node]:
-        """Search nodes by vector similarity with optional property filters."""
+        nodes: Mapping[str, Iterable[Node]],
+        relation: str,
+        source_collection: str,
+        target_collection: str,
+        edges: Iterable[Edge],
+    ) -> None:
+        """Add nodes and edges between them in a single write transaction."""
         start_time = time.monotonic()
 
-        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
-        sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
-            mangle_embedding_name(embedding_name),
-        )
+        query_parameters: dict[str, Any] = {}
+        query_parts = []
+        node_indexes: dict[str, dict[str, int]] = {}
+        added_nodes: list[tuple[str, int, dict[str, tuple[int, SimilarityMetric]]]] = []
 
-        query_filter_string, query_filter_params = (
-            Neo4jVectorGraphStore._build_query_filter(
-                "n",
-                "query_filter_params",
-                property_filter,
+        # Each subquery creates the nodes of a collection
+        # and returns them in order, so edges can refer to them by position
+        # instead of matching them again.
+        for collection_index, (collection, collection_nodes) in enumerate(
+            nodes.items(),
+        ):
+            collection_nodes = list(collection_nodes)
+            sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+            query_nodes, embedding_specs = Neo4jVectorGraphStore._query_nodes(
+                collection_nodes,
             )
-        )
-
-        do_exact_similarity_search = self._force_exact_similarity_search
 
-        if not do_exact_similarity_search:
-            await self._populate_index_state_cache()
-
-            vector_index_name = Neo4jVectorGraphStore._index_name(
-                EntityType.NODE,
-                sanitized_collection,
-                sanitized_embedding_name,
+            query_parameters[f"nodes_{collection_index}"] = query_nodes
+            query_parts.append(
+                "CALL {\n"
+                f"    UNWIND range(0, size($nodes_{collection_index}) - 1) AS i\n"
+                f"    WITH i, $nodes_{collection_index}[i] AS node\n"
+                f"    CREATE (n:{sanitized_collection} {{uid: node.uid}})\n"
+                "    SET n += node.properties\n"
+                "    WITH i, n ORDER BY i\n"
+                f"    RETURN collect(n) AS nodes_{collection_index}\n"
+                "}\n",
             )
+            node_indexes[collection] = {
+                str(node.uid): node_index
+                for node_index, node in enumerate(collection_nodes)
+            }
+            added_nodes.append((collection, len(query_nodes), embedding_specs))
 
+        query_edges, edge_embedding_specs = Neo4jVectorGraphStore._query_edges(edges)
+
+        if len(query_edges) > 0:
             if (
-                self._index_state_cache.get(vector_index_name)
-                != Neo4jVectorGraphStore.CacheIndexState.ONLINE
+                source_collection not in node_indexes
+                or target_collection not in node_indexes
             ):
-                do_exact_similarity_search = True
+                raise ValueError(
+                    "Source and target collections of the edges "
+                    "must be among the collections of the nodes added"
+                )
 
-        if not do_exact_similarity_search:
-            # ANN search requires a finite limit.
-            if limit is None:
-                limit = 1000
+            source_indexes = node_indexes[source_collection]
+            target_indexes = node_indexes[target_collection]
+            for query_edge in query_edges:
+                source_uid = query_edge.pop("source_uid")
+                target_uid = query_edge.pop("target_uid")
+                if source_uid not in source_indexes or target_uid not in target_indexes:
+                    raise ValueError(
+                        f"Edge {query_edge['uid']} must connect nodes "
+                        "among the nodes added",
+                    )
+                query_edge["source_index"] = source_indexes[source_uid]
+                query_edge["target_index"] = target_indexes[target_uid]
 
-            query = (
-                "CALL db.index.vector.queryNodes(\n"
-                "    $vector_index_name, $query_limit, $query_embedding\n"
-                ")\n"
-                "YIELD node AS n, score AS similarity\n"
-                f"WHERE {query_filter_string}\n"
-                "RETURN n\n"
-                "ORDER BY similarity DESC\n"
-                "LIMIT $limit"
+            collection_indexes = {
+                collection: collection_index
+                for collection_index, collection in enumerate(nodes)
+            }
+            source_nodes = f"nodes_{collection_indexes[source_collection]}"
+            target_nodes = f"nodes_{collection_indexes[target_collection]}"
+            sanitized_relation = Neo4jVectorGraphStore._sanitize_name(relation)
+
+            query_parameters["edges"] = query_edges
+            query_parts.append(
+                "UNWIND $edges AS edge\n"
+                "WITH edge,\n"
+                f"    {source_nodes}[edge.source_index] AS source,\n"
+                f"    {target_nodes}[edge.target_index] AS target\n"
+                "CREATE (source)"
+                f"    -[r:{sanitized_relation} {{uid: edge.uid}}]->"
+                "    (target)\n"
+                "SET r += edge.properties",
             )
 
-            records, _, _ = await self._driver.execute_query(
-                query,
-                query_embedding=query_embedding,
-                query_limit=(
-                    limit
-                    if property_filter is None
-                    else limit * self._filtered_similarity_search_fudge_factor
-                ),
-                limit=limit,
-                query_filter_params=query_filter_params,
-                vector_index_name=vector_index_name,
-            )
+        if len(query_parts) == 0:
+            return
 
-            if (
-                property_filter is not None
-                and len(records)
-                < limit * self._exact_similarity_search_fallback_threshold
-            ):
-                do_exact_similarity_search = True
-
-        if do_exact_similarity_search:
-            match similarity_metric:
-                case SimilarityMetric.COSINE:
-                    vector_similarity_function = "vector.similarity.cosine"
-                case SimilarityMetric.EUCLIDEAN:
-                    vector_similarity_function = "vector.similarity.euclidean"
-                case _:
-                    vector_similarity_function = "vector.similarity.cosine"
+        await self._driver.execute_query(
+            "".join(query_parts),
+            **query_parameters,
+        )
 
-            query = (
-                f"MATCH (n:{sanitized_collection})\n"
-                f"WHERE n.{sanitized_embedding_name} IS NOT NULL\n"
-                f"AND {query_filter_string}\n"
-                "WITH n,"
-                f"    {vector_similarity_function}("
-                f"        n.{sanitized_embedding_name}, $query_embedding"
-                "    ) AS similarity\n"
-                "RETURN n\n"
-                "ORDER BY similarity DESC\n"
-                f"{'LIMIT $limit' if limit is not None else ''}"
+        # Counts and indexes are maintained off the write path.
+        for collection, num_nodes, embedding_specs in added_nodes:
+            self._track_task(
+                asyncio.create_task(
+                    self._handle_nodes_added(
+                        collection=collection,
+                        num_nodes=num_nodes,
+                        embedding_specs=embedding_specs,
+                    ),
+                ),
             )
-
-            records, _, _ = await self._driver.execute_query(
-                query,
-                query_embedding=query_embedding,
-                limit=limit,
-                query_filter_params=query_filter_params,
+        if len(query_edges) > 0:
+            self._track_task(
+                asyncio.create_task(
+                    self._handle_edges_added(
+                        relation=relation,
+                        num_edges=len(query_edges),
+                        embedding_specs=edge_embedding_specs,
+                    ),
+                ),
             )
 
-        similar_neo4j_nodes = [record["n"] for record in records]
-        similar_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
-            similar_neo4j_nodes
-        )
-
         end_time = time.monotonic()
         self._collect_metrics(
-            self._search_similar_nodes_calls_counter,
-            self._search_similar_nodes_latency_summary,
+            self._add_subgraph_calls_counter,
+            self._add_subgraph_latency_summary,
             start_time,
             end_time,
         )
 
-        return similar_nodes
+    @staticmethod
+    def _query_entity_properties(
+        properties: Mapping[str, PropertyValue],
+        embeddings: Mapping[str, tuple[list[float], SimilarityMetric]],
+        embedding_specs: dict[str, tuple[int, SimilarityMetric]],
+    ) -> dict[str, PropertyValue]:
+        """
+        Convert entity properties and embeddings to Neo4j properties.
 
-    async def search_related_nodes(
-        self,
-        *,
-        relation: str,
-        other_collection: str,
-        this_collection: str,
-        this_node_uid: str,
-        find_sources: bool = True,
-        find_targets: bool = True,
-        limit: int | None = None,
-        edge_property_filter: FilterExpr | None = None,
-        node_property_filter: FilterExpr | None = None,
-    ) -> list[Node]:
-        """Search nodes connected by a relation with optional property filters."""
-        start_time = time.monotonic()
+        Records the dimensions and similarity metric
+        of each sanitized embedding name in embedding_specs.
+        """
+        query_properties = Neo4jVectorGraphStore._sanitize_properties(
+            {mangle_property_name(key): value for key, value in properties.items()},
+        )
 
-        edge_query_filter_string, edge_query_filter_params = (
-            Neo4jVectorGraphStore._build_query_filter(
-                "r",
-                "edge_query_filter_params",
-                edge_property_filter,
+        for embedding_name, (embedding, similarity_metric) in embeddings.items():
+            sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
+                mangle_embedding_name(embedding_name),
             )
-        )
+            sanitized_similarity_metric_name = Neo4jVectorGraphStore._sanitize_name(
+                Neo4jVectorGraphStore._similarity_metric_property_name(
+                    embedding_name,
+                ),
+            )
+
+            embedding_specs[sanitized_embedding_name] = (
+                len(embedding),
+                similarity_metric,
+            )
+
+            query_properties[sanitized_embedding_name] = embedding
+            query_properties[sanitized_similarity_metric_name] = similarity_metric.value
+
+        return query_properties
+
+    @staticmethod
+    def _query_nodes(
+        nodes: Iterable[Node],
+    ) -> tuple[list[dict[str, Any]], dict[str, tuple[int, SimilarityMetric]]]:
+        """Convert nodes to query parameters and collect their embedding specs."""
+        embedding_specs: dict[str, tuple[int, SimilarityMetric]] = {}
+        query_nodes = [
+            {
+                "uid": str(node.uid),
+                "properties": Neo4jVectorGraphStore._query_entity_properties(
+                    node.properties,
+                    node.embeddings,
+                    embedding_specs,
+                ),
+            }
+            for node in nodes
+        ]
+        return query_nodes, embedding_specs
+
+    @staticmethod
+    def _query_edges(
+        edges: Iterable[Edge],
+    ) -> tuple[list[dict[str, Any]], dict[str, tuple[int, SimilarityMetric]]]:
+        """Convert edges to query parameters and collect their embedding specs."""
+        embedding_specs: dict[str, tuple[int, SimilarityMetric]] = {}
+        query_edges = [
+            {
+                "uid": str(edge.uid),
+                "source_uid": str(edge.source_uid),
+                "target_uid": str(edge.target_uid),
+                "properties": Neo4jVectorGraphStore._query_entity_properties(
+                    edge.properties,
+                    edge.embeddings,
+                    embedding_specs,
+                ),
+            }
+            for edge in edges
+        ]
+        return query_edges, embedding_specs
+
+    async def _handle_nodes_added(
+        self,
+        *,
+        collection: str,
+        num_nodes: int,
+        embedding_specs: Mapping[str, tuple[int, SimilarityMetric]],
+    ) -> None:
+        """Update the node count of a collection and create indexes as needed."""
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+
+        if sanitized_collection not in self._collection_node_counts:
+            # Not async-safe but it's not crucial if the count is off.
+            # Counted after the nodes were added, so the count includes them.
+            node_count = await self._count_nodes(collection)
+            self._collection_node_counts[sanitized_collection] = node_count
+        else:
+            self._collection_node_counts[sanitized_collection] += num_nodes
+
+        self._create_indexes_if_needed(
+            entity_type=EntityType.NODE,
+            sanitized_collection_or_relation=sanitized_collection,
+            count=self._collection_node_counts[sanitized_collection],
+            embedding_specs=embedding_specs,
+        )
+
+    async def _handle_edges_added(
+        self,
+        *,
+        relation: str,
+        num_edges: int,
+        embedding_specs: Mapping[str, tuple[int, SimilarityMetric]],
+    ) -> None:
+        """Update the edge count of a relation and create indexes as needed."""
+        if relation not in self._relation_edge_counts:
+            # Not async-safe but it's not crucial if the count is off.
+            # Counted after the edges were added, so the count includes them.
+            self._relation_edge_counts[relation] = await self._count_edges(relation)
+        else:
+            self._relation_edge_counts[relation] += num_edges
+
+        self._create_indexes_if_needed(
+            entity_type=EntityType.EDGE,
+            sanitized_collection_or_relation=Neo4jVectorGraphStore._sanitize_name(
+                relation,
+            ),
+            count=self._relation_edge_counts[relation],
+            embedding_specs=embedding_specs,
+        )
+
+    def _create_indexes_if_needed(
+        self,
+        *,
+        entity_type: EntityType,
+        sanitized_collection_or_relation: str,
+        count: int,
+        embedding_specs: Mapping[str, tuple[int, SimilarityMetric]],
+    ) -> None:
+        """Create indexes in the background once their thresholds are reached."""
+        if count >= min(
+            self._range_index_creation_threshold,
+            self._vector_index_creation_threshold,
+        ):
+            _, indexed_embedding_specs = self._indexed_entities.get(
+                (entity_type, sanitized_collection_or_relation),
+                (count, {}),
+            )
+            self._indexed_entities[(entity_type, sanitized_collection_or_relation)] = (
+                count,
+                indexed_embedding_specs | dict(embedding_specs),
+            )
+
+        if count >= self._range_index_creation_threshold:
+            self._track_task(
+                asyncio.create_task(
+                    self._create_initial_indexes_if_not_exist(
+                        entity_type,
+                        sanitized_collection_or_relation,
+                    ),
+                )
+            )
+
+        if count >= self._vector_index_creation_threshold:
+            for sanitized_embedding_name, (
+                dimensions,
+                similarity_metric,
+            ) in embedding_specs.items():
+                if (
+                    Neo4jVectorGraphStore._index_name(
+                        entity_type,
+                        sanitized_collection_or_relation,
+                        sanitized_embedding_name,
+                    )
+                    not in self._index_state_cache
+                ):
+                    self._track_task(
+                        asyncio.create_task(
+                            self._create_vector_index_if_not_exists(
+                                entity_type=entity_type,
+                                sanitized_collection_or_relation=sanitized_collection_or_relation,
+                                sanitized_embedding_name=sanitized_embedding_name,
+                                dimensions=dimensions,
+                                similarity_metric=similarity_metric,
+                            ),
+                        )
+                    )
+
+    async def search_similar_nodes(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: list[float],
+        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
+        limit: int | None = 100,
+        property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Search nodes by vector similarity with optional property filters."""
+        start_time = time.monotonic()
+
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+        sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
+            mangle_embedding_name(embedding_name),
+        )
+
+        query_filter_string, query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "n",
+                "query_filter_params",
+                property_filter,
+            )
+        )
+
+        query_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "n",
+            include_embeddings=include_embeddings,
+        )
+
+        selectivity_key = Neo4jVectorGraphStore._filter_selectivity_key(
+            sanitized_collection,
+            sanitized_embedding_name,
+            property_filter,
+        )
+
+        vector_index_name = Neo4jVectorGraphStore._index_name(
+            EntityType.NODE,
+            sanitized_collection,
+            sanitized_embedding_name,
+        )
+
+        async def query_ann(query_limit: int) -> tuple[int, int, list[Any]]:
+            # Candidates are counted before filtering
+            # to estimate the selectivity of the filter.
+            records, _, _ = await self._driver.execute_query(
+                "CALL db.index.vector.queryNodes(\n"
+                "    $vector_index_name, $query_limit, $query_embedding\n"
+                ")\n"
+                "YIELD node AS n, score AS similarity\n"
+                "WITH n, similarity\n"
+                "ORDER BY similarity DESC\n"
+                "WITH count(n) AS candidate_count,"
+                f"    collect(CASE WHEN {query_filter_string} THEN n END)"
+                "    AS matched_nodes\n"
+                "RETURN candidate_count, size(matched_nodes) AS matched_count,"
+                f"    [n IN matched_nodes[..$limit] | {query_node_projection}]"
+                "    AS projected_nodes",
+                query_embedding=query_embedding,
+                query_limit=query_limit,
+                limit=limit,
+                query_filter_params=query_filter_params,
+                vector_index_name=vector_index_name,
+            )
+            record = records[0]
+            return (
+                record["candidate_count"],
+                record["matched_count"],
+                record["projected_nodes"],
+            )
+
+        similar_neo4j_nodes = None
+        if await self._can_search_ann(vector_index_name):
+            # ANN search requires a finite limit.
+            if limit is None:
+                limit = 1000
+
+            similar_neo4j_nodes = await self._search_ann(
+                query_ann,
+                limit=limit,
+                selectivity_key=selectivity_key,
+            )
+
+        if similar_neo4j_nodes is None:
+            vector_similarity_function = (
+                Neo4jVectorGraphStore._vector_similarity_function(similarity_metric)
+            )
+
+            records, _, _ = await self._driver.execute_query(
+                f"MATCH (n:{sanitized_collection})\n"
+                f"WHERE n.{sanitized_embedding_name} IS NOT NULL\n"
+                f"AND {query_filter_string}\n"
+                "WITH n,"
+                f"    {vector_similarity_function}("
+                f"        n.{sanitized_embedding_name}, $query_embedding"
+                "    ) AS similarity\n"
+                "ORDER BY similarity DESC\n"
+                "WITH count(n) AS matched_count, collect(n) AS matched_nodes\n"
+                "RETURN matched_count,"
+                f"    [n IN matched_nodes{'[..$limit]' if limit is not None else ''}"
+                f"    | {query_node_projection}] AS projected_nodes",
+                query_embedding=query_embedding,
+                limit=limit,
+                query_filter_params=query_filter_params,
+            )
+
+            record = records[0]
+            self._observe_exact_filter_selectivity(
+                selectivity_key,
+                record["matched_count"],
+            )
+            similar_neo4j_nodes = record["projected_nodes"]
+
+        similar_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+            similar_neo4j_nodes
+        )
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._search_similar_nodes_calls_counter,
+            self._search_similar_nodes_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return similar_nodes
+
+    async def search_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uid: str,
+        find_sources: bool = True,
+        find_targets: bool = True,
+        limit: int | None = None,
+        edge_property_filter: FilterExpr | None = None,
+        node_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Search nodes connected by a relation with optional property filters."""
+        start_time = time.monotonic()
+
+        edge_query_filter_string, edge_query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "r",
+                "edge_query_filter_params",
+                edge_property_filter,
+            )
+        )
         node_query_filter_string, node_query_filter_params = (
             Neo4jVectorGraphStore._build_query_filter(
                 "n",
@@ -765,6 +1125,11 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             )
         )
 
+        query_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "n",
+            include_embeddings=include_embeddings,
+        )
+
         if not (find_sources or find_targets):
             end_time = time.monotonic()
             self._collect_metrics(
@@ -792,7 +1157,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             f"    (n:{sanitized_other_collection})"
             f"WHERE {edge_query_filter_string}\n"
             f"AND {node_query_filter_string}\n"
-            "RETURN DISTINCT n\n"
+            f"RETURN DISTINCT {query_node_projection} AS projected_node\n"
             f"{'LIMIT $limit' if limit is not None else ''}",
             node_uid=str(this_node_uid),
             limit=limit,
@@ -800,7 +1165,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             node_query_filter_params=node_query_filter_params,
         )
 
-        related_neo4j_nodes = [record["n"] for record in records]
+        related_neo4j_nodes = [record["projected_node"] for record in records]
         related_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
             related_neo4j_nodes
         )
@@ -815,6 +1180,73 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         return related_nodes
 
+    async def get_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uids: Iterable[str],
+        find_sources: bool = True,
+        find_targets: bool = True,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Get the distinct nodes connected by a relation to any of the nodes."""
+        start_time = time.monotonic()
+
+        this_node_uids = [str(this_node_uid) for this_node_uid in this_node_uids]
+
+        if not (find_sources or find_targets) or len(this_node_uids) == 0:
+            end_time = time.monotonic()
+            self._collect_metrics(
+                self._get_related_nodes_calls_counter,
+                self._get_related_nodes_latency_summary,
+                start_time,
+                end_time,
+            )
+            return []
+
+        query_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "n",
+            include_embeddings=include_embeddings,
+        )
+
+        sanitized_this_collection = Neo4jVectorGraphStore._sanitize_name(
+            this_collection,
+        )
+        sanitized_other_collection = Neo4jVectorGraphStore._sanitize_name(
+            other_collection,
+        )
+        sanitized_relation = Neo4jVectorGraphStore._sanitize_name(relation)
+
+        records, _, _ = await self._driver.execute_query(
+            "UNWIND $node_uids AS node_uid\n"
+            "MATCH\n"
+            f"    (m:{sanitized_this_collection} {{uid: node_uid}})"
+            f"    {'-' if find_targets else '<-'}"
+            f"    [:{sanitized_relation}]"
+            f"    {'-' if find_sources else '->'}"
+            f"    (n:{sanitized_other_collection})\n"
+            "WITH DISTINCT n\n"
+            f"RETURN {query_node_projection} AS projected_node",
+            node_uids=this_node_uids,
+        )
+
+        related_neo4j_nodes = [record["projected_node"] for record in records]
+        related_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+            related_neo4j_nodes
+        )
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._get_related_nodes_calls_counter,
+            self._get_related_nodes_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return related_nodes
+
     async def search_directional_nodes(
         self,
         *,
@@ -825,6 +1257,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         include_equal_start: bool = False,
         limit: int | None = 1,
         property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
     ) -> list[Node]:
         """Find nodes ordered by property values in a chosen direction."""
         start_time = time.monotonic()
@@ -846,124 +1279,794 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             for by_property in by_properties
         ]
 
-        query_relational_requirements = (
-            Neo4jVectorGraphStore._query_lexicographic_relational_requirements(
+        query_relational_requirements = (
+            Neo4jVectorGraphStore._query_lexicographic_relational_requirements(
+                "n",
+                "starting_at",
+                sanitized_by_properties,
+                starting_at,
+                order_ascending,
+            )
+            + (
+                (
+                    " OR ("
+                    + " AND ".join(
+                        f"(n.{sanitized_by_property} = $starting_at[{index}])"
+                        for index, sanitized_by_property in enumerate(
+                            sanitized_by_properties,
+                        )
+                    )
+                    + ")"
+                )
+                if include_equal_start
+                else ""
+            )
+        )
+
+        query_order_by = (
+            "ORDER BY "
+            + ", ".join(
+                f"n.{sanitized_by_property} {
+                    'ASC' if order_ascending[index] else 'DESC'
+                }"
+                for index, sanitized_by_property in enumerate(sanitized_by_properties)
+            )
+            + "\n"
+        )
+
+        query_filter_string, query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "n",
+                "query_filter_params",
+                property_filter,
+            )
+        )
+
+        query_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "n",
+            include_embeddings=include_embeddings,
+        )
+
+        records, _, _ = await self._driver.execute_query(
+            f"MATCH (n:{sanitized_collection})\n"
+            f"WHERE ({query_relational_requirements})\n"
+            f"AND {query_filter_string}\n"
+            f"RETURN {query_node_projection} AS projected_node\n"
+            f"{query_order_by}"
+            f"{'LIMIT $limit' if limit is not None else ''}",
+            starting_at=starting_at,
+            limit=limit,
+            query_filter_params=query_filter_params,
+        )
+
+        directional_proximal_neo4j_nodes = [
+            record["projected_node"] for record in records
+        ]
+        directional_proximal_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+            directional_proximal_neo4j_nodes,
+        )
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._search_directional_nodes_calls_counter,
+            self._search_directional_nodes_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return directional_proximal_nodes
+
+    @staticmethod
+    def _query_lexicographic_relational_requirements(
+        entity_query_alias: str,
+        starting_at_query_parameter: str,
+        sanitized_by_properties: Iterable[str],
+        starting_at: Iterable[OrderedPropertyValue | None],
+        order_ascending: Iterable[bool],
+    ) -> str:
+        sanitized_by_properties = list(sanitized_by_properties)
+        starting_at = list(starting_at)
+        order_ascending = list(order_ascending)
+
+        lexicographic_relational_requirements = []
+        for index, sanitized_by_property in enumerate(sanitized_by_properties):
+            sanitized_equal_properties = sanitized_by_properties[:index]
+
+            relational_requirements = [
+                (
+                    f"({entity_query_alias}.{sanitized_by_property}"
+                    + (" > " if order_ascending[index] else " < ")
+                    + f"${starting_at_query_parameter}[{index}])"
+                )
+                if starting_at[index] is not None
+                else f"({entity_query_alias}.{sanitized_by_property} IS NOT NULL)",
+            ]
+
+            relational_requirements += [
+                f"({entity_query_alias}.{sanitized_equal_property} = ${starting_at_query_parameter}[{equal_index}])"
+                if starting_at[equal_index] is not None
+                else f"({entity_query_alias}.{sanitized_equal_property} IS NOT NULL)"
+                for equal_index, sanitized_equal_property in enumerate(
+                    sanitized_equal_properties,
+                )
+            ]
+
+            lexicographic_relational_requirement = (
+                f"({' AND '.join(relational_requirements)})"
+            )
+
+            lexicographic_relational_requirements.append(
+                lexicographic_relational_requirement,
+            )
+
+        query_lexicographic_relational_requirements = (
+            f"({' OR '.join(lexicographic_relational_requirements)})"
+        )
+
+        return query_lexicographic_relational_requirements
+
+    async def search_similar_node_contexts(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: list[float],
+        relation: str,
+        context_collection: str,
+        context_by_properties: Iterable[str],
+        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
+        limit: int | None = 100,
+        max_backward_nodes: int = 1,
+        max_forward_nodes: int = 2,
+        property_filter: FilterExpr | None = None,
+        context_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[NodeContext]:
+        """Search contexts of nodes related to similar nodes in a single query."""
+        start_time = time.monotonic()
+
+        context_by_properties = list(context_by_properties)
+        if len(context_by_properties) == 0:
+            raise ValueError("context_by_properties must be nonempty")
+
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+        sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
+            mangle_embedding_name(embedding_name),
+        )
+        sanitized_relation = Neo4jVectorGraphStore._sanitize_name(relation)
+        sanitized_context_collection = Neo4jVectorGraphStore._sanitize_name(
+            context_collection,
+        )
+        sanitized_context_by_properties = [
+            Neo4jVectorGraphStore._sanitize_name(mangle_property_name(by_property))
+            for by_property in context_by_properties
+        ]
+
+        similar_query_filter_string, similar_query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "d",
+                "similar_query_filter_params",
+                property_filter,
+            )
+        )
+        # Similar nodes are collected in order of descending similarity,
+        # so their index in the list is their similarity rank.
+        query_contexts, query_params = (
+            Neo4jVectorGraphStore._query_related_node_contexts(
+                "similar_nodes",
+                sanitized_relation,
+                sanitized_context_collection,
+                sanitized_context_by_properties,
+                max_backward_nodes=max_backward_nodes,
+                max_forward_nodes=max_forward_nodes,
+                context_property_filter=context_property_filter,
+                include_embeddings=include_embeddings,
+            )
+        )
+        query_params["query_embedding"] = query_embedding
+        query_params["similar_query_filter_params"] = similar_query_filter_params
+
+        selectivity_key = Neo4jVectorGraphStore._filter_selectivity_key(
+            sanitized_collection,
+            sanitized_embedding_name,
+            property_filter,
+        )
+
+        vector_index_name = Neo4jVectorGraphStore._index_name(
+            EntityType.NODE,
+            sanitized_collection,
+            sanitized_embedding_name,
+        )
+
+        async def query_ann(query_limit: int) -> tuple[int, int, list[Any]]:
+            records, _, _ = await self._driver.execute_query(
+                "CALL db.index.vector.queryNodes(\n"
+                "    $vector_index_name, $query_limit, $query_embedding\n"
+                ")\n"
+                "YIELD node AS d, score AS similarity\n"
+                "WITH d, similarity\n"
+                "ORDER BY similarity DESC\n"
+                "WITH count(d) AS candidate_count,"
+                f"    collect(CASE WHEN {similar_query_filter_string} THEN d END)"
+                "    AS matched_nodes\n"
+                "WITH candidate_count, size(matched_nodes) AS matched_count,"
+                "    matched_nodes[..$limit] AS similar_nodes\n"
+                f"{query_contexts}"
+                "RETURN candidate_count, matched_count, contexts",
+                parameters_={
+                    **query_params,
+                    "query_limit": query_limit,
+                    "limit": limit,
+                    "vector_index_name": vector_index_name,
+                },
+            )
+            record = records[0]
+            return (
+                record["candidate_count"],
+                record["matched_count"],
+                record["contexts"],
+            )
+
+        contexts = None
+        if await self._can_search_ann(vector_index_name):
+            # ANN search requires a finite limit.
+            if limit is None:
+                limit = 1000
+
+            contexts = await self._search_ann(
+                query_ann,
+                limit=limit,
+                selectivity_key=selectivity_key,
+            )
+
+        if contexts is None:
+            vector_similarity_function = (
+                Neo4jVectorGraphStore._vector_similarity_function(similarity_metric)
+            )
+
+            records, _, _ = await self._driver.execute_query(
+                f"MATCH (d:{sanitized_collection})\n"
+                f"WHERE d.{sanitized_embedding_name} IS NOT NULL\n"
+                f"AND {similar_query_filter_string}\n"
+                "WITH d,"
+                f"    {vector_similarity_function}("
+                f"        d.{sanitized_embedding_name}, $query_embedding"
+                "    ) AS similarity\n"
+                "ORDER BY similarity DESC\n"
+                "WITH count(d) AS matched_count, collect(d) AS matched_nodes\n"
+                "WITH null AS candidate_count, matched_count,"
+                f"    matched_nodes{'[..$limit]' if limit is not None else ''}"
+                "    AS similar_nodes\n"
+                f"{query_contexts}"
+                "RETURN candidate_count, matched_count, contexts",
+                parameters_={**query_params, "limit": limit},
+            )
+
+            record = records[0]
+            self._observe_exact_filter_selectivity(
+                selectivity_key,
+                record["matched_count"],
+            )
+            contexts = record["contexts"]
+
+        node_contexts = [
+            NodeContext(
+                node=Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                    [context["node"]],
+                )[0],
+                backward_nodes=Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                    context["backward_nodes"],
+                ),
+                forward_nodes=Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                    context["forward_nodes"],
+                ),
+            )
+            for context in contexts
+        ]
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._search_similar_node_contexts_calls_counter,
+            self._search_similar_node_contexts_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return node_contexts
+
+    async def get_related_node_contexts(
+        self,
+        *,
+        collection: str,
+        node_uids: Iterable[str],
+        relation: str,
+        context_collection: str,
+        context_by_properties: Iterable[str],
+        max_backward_nodes: int = 1,
+        max_forward_nodes: int = 2,
+        context_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[NodeContext]:
+        """Get contexts of nodes related to the specified nodes in a single query."""
+        start_time = time.monotonic()
+
+        context_by_properties = list(context_by_properties)
+        if len(context_by_properties) == 0:
+            raise ValueError("context_by_properties must be nonempty")
+
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+        sanitized_relation = Neo4jVectorGraphStore._sanitize_name(relation)
+        sanitized_context_collection = Neo4jVectorGraphStore._sanitize_name(
+            context_collection,
+        )
+        sanitized_context_by_properties = [
+            Neo4jVectorGraphStore._sanitize_name(mangle_property_name(by_property))
+            for by_property in context_by_properties
+        ]
+
+        # Specified nodes are collected in the given order,
+        # so their index in the list is their rank.
+        query_contexts, query_params = (
+            Neo4jVectorGraphStore._query_related_node_contexts(
+                "ranked_nodes",
+                sanitized_relation,
+                sanitized_context_collection,
+                sanitized_context_by_properties,
+                max_backward_nodes=max_backward_nodes,
+                max_forward_nodes=max_forward_nodes,
+                context_property_filter=context_property_filter,
+                include_embeddings=include_embeddings,
+            )
+        )
+        query_params["node_uids"] = [str(node_uid) for node_uid in node_uids]
+
+        records, _, _ = await self._driver.execute_query(
+            "UNWIND range(0, size($node_uids) - 1) AS node_index\n"
+            f"MATCH (d:{sanitized_collection} {{uid: $node_uids[node_index]}})\n"
+            "WITH d, node_index\n"
+            "ORDER BY node_index\n"
+            "WITH collect(d) AS ranked_nodes\n"
+            f"{query_contexts}"
+            "RETURN contexts",
+            parameters_=query_params,
+        )
+
+        node_contexts = [
+            NodeContext(
+                node=Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                    [context["node"]],
+                )[0],
+                backward_nodes=Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                    context["backward_nodes"],
+                ),
+                forward_nodes=Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                    context["forward_nodes"],
+                ),
+            )
+            for context in records[0]["contexts"]
+        ]
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._get_related_node_contexts_calls_counter,
+            self._get_related_node_contexts_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return node_contexts
+
+    async def _can_search_ann(self, vector_index_name: str) -> bool:
+        """Check whether ANN search may use the vector index."""
+        if self._force_exact_similarity_search:
+            return False
+
+        await self._populate_index_state_cache()
+        return (
+            self._index_state_cache.get(vector_index_name)
+            == Neo4jVectorGraphStore.CacheIndexState.ONLINE
+        )
+
+    async def _search_ann[T](
+        self,
+        query_ann: Callable[[int], Awaitable[tuple[int, int, T]]],
+        *,
+        limit: int,
+        selectivity_key: tuple[str, str, Hashable] | None,
+    ) -> T | None:
+        """
+        Search the vector index, deepening filtered searches as needed.
+
+        Neo4j vector index search does not support filtering,
+        so filtered searches request more ANN candidates than the limit.
+        The number of candidates starts from the estimated selectivity
+        of the filter and grows geometrically
+        until enough candidates match the filter
+        or the maximum number of candidates is reached.
+
+        Args:
+            query_ann (Callable[[int], Awaitable[tuple[int, int, T]]]):
+                Function querying the given number of ANN candidates,
+                returning the number of candidates,
+                the number of candidates matching the filter,
+                and the results for at most limit matching candidates.
+            limit (int):
+                Maximum number of results.
+            selectivity_key (tuple[str, str, Hashable] | None):
+                Key of the filter selectivity statistics,
+                or None if the search is not filtered.
+
+        Returns:
+            T | None:
+                The results,
+                or None if exact similarity search should be performed instead.
+
+        """
+        if selectivity_key is None:
+            _, _, results = await query_ann(limit)
+            return results
+
+        max_query_limit = max(self._filtered_similarity_search_max_query_limit, limit)
+        query_limit = self._plan_filtered_ann_search(
+            selectivity_key,
+            limit,
+            max_query_limit,
+        )
+        if query_limit is None:
+            self._count_filtered_similarity_search("exact", 0)
+            return None
+
+        num_ann_queries = 0
+        while True:
+            candidate_count, matched_count, results = await query_ann(query_limit)
+            num_ann_queries += 1
+            if candidate_count > 0:
+                self._observe_filter_selectivity(
+                    selectivity_key,
+                    matched_count / candidate_count,
+                )
+
+            # Fewer candidates than requested means that
+            # every node in the vector index was a candidate.
+            if (
+                matched_count >= limit
+                or candidate_count < query_limit
+                or query_limit >= max_query_limit
+            ):
+                break
+
+            next_query_limit = math.ceil(
+                query_limit * self._filtered_similarity_search_growth_factor,
+            )
+            if matched_count > 0:
+                next_query_limit = max(
+                    next_query_limit,
+                    math.ceil(
+                        limit
+                        * candidate_count
+                        / matched_count
+                        * _FILTERED_QUERY_LIMIT_HEADROOM,
+                    ),
+                )
+            query_limit = min(next_query_limit, max_query_limit)
+
+        if (
+            candidate_count == query_limit
+            and matched_count < limit * self._exact_similarity_search_fallback_threshold
+        ):
+            self._count_filtered_similarity_search("ann_then_exact", num_ann_queries)
+            return None
+
+        self._count_filtered_similarity_search("ann", num_ann_queries)
+        return results
+
+    def _plan_filtered_ann_search(
+        self,
+        selectivity_key: tuple[str, str, Hashable],
+        limit: int,
+        max_query_limit: int,
+    ) -> int | None:
+        """
+        Get the initial number of ANN candidates for a filtered search.
+
+        Returns None if more candidates than the maximum
+        or than the nodes in the collection are expected to be needed,
+        in which case exact similarity search is cheaper.
+        """
+        selectivity = self._filter_selectivities.get(selectivity_key)
+        if selectivity is None:
+            return min(
+                limit * self._filtered_similarity_search_fudge_factor,
+                max_query_limit,
+            )
+
+        if self._should_collect_metrics:
+            cast(
+                MetricsFactory.Summary,
+                self._filter_selectivity_estimate_summary,
+            ).observe(value=selectivity, labels=self._user_metrics_labels)
+
+        expected_query_limit = math.ceil(
+            limit
+            / max(selectivity, _MIN_FILTER_SELECTIVITY)
+            * _FILTERED_QUERY_LIMIT_HEADROOM,
+        )
+        if expected_query_limit > max_query_limit:
+            return None
+
+        sanitized_collection, _, _ = selectivity_key
+        collection_node_count = self._collection_node_counts.get(sanitized_collection)
+        if (
+            collection_node_count is not None
+            and expected_query_limit >= collection_node_count
+        ):
+            return None
+
+        return max(expected_query_limit, limit)
+
+    def _observe_filter_selectivity(
+        self,
+        selectivity_key: tuple[str, str, Hashable],
+        selectivity: float,
+    ) -> None:
+        """Update the moving average of the selectivity of a filter."""
+        estimate = self._filter_selectivities.pop(selectivity_key, None)
+        if estimate is None:
+            estimate = selectivity
+        else:
+            estimate += _FILTER_SELECTIVITY_SMOOTHING * (selectivity - estimate)
+
+        self._filter_selectivities[selectivity_key] = estimate
+        if len(self._filter_selectivities) > _MAX_FILTER_SELECTIVITIES:
+            del self._filter_selectivities[next(iter(self._filter_selectivities))]
+
+        if self._should_collect_metrics:
+            cast(
+                MetricsFactory.Summary,
+                self._filter_selectivity_observed_summary,
+            ).observe(value=selectivity, labels=self._user_metrics_labels)
+
+    def _observe_exact_filter_selectivity(
+        self,
+        selectivity_key: tuple[str, str, Hashable] | None,
+        matched_count: int,
+    ) -> None:
+        """
+        Update the selectivity of a filter from an exact similarity search.
+
+        Exact similarity search matches the filter against the whole collection,
+        so a filter estimated to be too selective for ANN search
+        is estimated again as the collection changes.
+        """
+        if selectivity_key is None:
+            return
+
+        sanitized_collection, _, _ = selectivity_key
+        collection_node_count = self._collection_node_counts.get(sanitized_collection)
+        if not collection_node_count:
+            return
+
+        self._observe_filter_selectivity(
+            selectivity_key,
+            min(matched_count / collection_node_count, 1.0),
+        )
+
+    def _count_filtered_similarity_search(
+        self,
+        strategy: str,
+        num_ann_queries: int,
+    ) -> None:
+        """Count a filtered similarity search by strategy."""
+        if self._should_collect_metrics:
+            cast(
+                MetricsFactory.Counter,
+                self._filtered_similarity_search_strategy_counter,
+            ).increment(labels={**self._user_metrics_labels, "strategy": strategy})
+            cast(
+                MetricsFactory.Summary,
+                self._filtered_similarity_search_ann_queries_summary,
+            ).observe(value=num_ann_queries, labels=self._user_metrics_labels)
+
+    @staticmethod
+    def _filter_selectivity_key(
+        sanitized_collection: str,
+        sanitized_embedding_name: str,
+        property_filter: FilterExpr | None,
+    ) -> tuple[str, str, Hashable] | None:
+        """Get the key of the selectivity statistics of a filter."""
+        if property_filter is None:
+            return None
+        return (
+            sanitized_collection,
+            sanitized_embedding_name,
+            filter_shape_key(property_filter),
+        )
+
+    @staticmethod
+    def _vector_similarity_function(similarity_metric: SimilarityMetric) -> str:
+        """Get the Cypher vector similarity function for a similarity metric."""
+        match similarity_metric:
+            case SimilarityMetric.EUCLIDEAN:
+                return "vector.similarity.euclidean"
+            case _:
+                return "vector.similarity.cosine"
+
+    @staticmethod
+    def _query_related_node_contexts(
+        ranked_nodes_alias: str,
+        sanitized_relation: str,
+        sanitized_context_collection: str,
+        sanitized_context_by_properties: list[str],
+        *,
+        max_backward_nodes: int,
+        max_forward_nodes: int,
+        context_property_filter: FilterExpr | None,
+        include_embeddings: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Get the subquery collecting contexts of nodes related to ranked nodes.
+
+        The subquery follows the relation from each node
+        in the list of ranked nodes to the context collection
+        and returns the contexts of the distinct related nodes as contexts,
+        ordered by the rank of the first node related to each.
+        Contexts are collected in a subquery
+        so that the outer query still returns a row without contexts.
+
+        Args:
+            ranked_nodes_alias (str):
+                The query alias of the list of ranked nodes.
+            sanitized_relation (str):
+                The sanitized relation from the ranked nodes.
+            sanitized_context_collection (str):
+                The sanitized collection of the related nodes.
+            sanitized_context_by_properties (list[str]):
+                The sanitized properties to order the context collection by.
+            max_backward_nodes (int):
+                Maximum number of preceding neighbors per related node.
+            max_forward_nodes (int):
+                Maximum number of following neighbors per related node.
+            context_property_filter (FilterExpr | None):
+                Filter expression tree for the related nodes
+                and their neighbors.
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes.
+
+        Returns:
+            tuple[str, dict[str, Any]]:
+                The subquery and its query parameters.
+
+        """
+        related_query_filter_string, related_query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
                 "n",
-                "starting_at",
-                sanitized_by_properties,
-                starting_at,
-                order_ascending,
-            )
-            + (
-                (
-                    " OR ("
-                    + " AND ".join(
-                        f"(n.{sanitized_by_property} = $starting_at[{index}])"
-                        for index, sanitized_by_property in enumerate(
-                            sanitized_by_properties,
-                        )
-                    )
-                    + ")"
-                )
-                if include_equal_start
-                else ""
+                "related_query_filter_params",
+                context_property_filter,
             )
         )
-
-        query_order_by = (
-            "ORDER BY "
-            + ", ".join(
-                f"n.{sanitized_by_property} {
-                    'ASC' if order_ascending[index] else 'DESC'
-                }"
-                for index, sanitized_by_property in enumerate(sanitized_by_properties)
+        backward_query_filter_string, backward_query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "b",
+                "backward_query_filter_params",
+                context_property_filter,
             )
-            + "\n"
         )
-
-        query_filter_string, query_filter_params = (
+        forward_query_filter_string, forward_query_filter_params = (
             Neo4jVectorGraphStore._build_query_filter(
-                "n",
-                "query_filter_params",
-                property_filter,
+                "f",
+                "forward_query_filter_params",
+                context_property_filter,
             )
         )
 
-        records, _, _ = await self._driver.execute_query(
-            f"MATCH (n:{sanitized_collection})\n"
-            f"WHERE ({query_relational_requirements})\n"
-            f"AND {query_filter_string}\n"
-            "RETURN n\n"
-            f"{query_order_by}"
-            f"{'LIMIT $limit' if limit is not None else ''}",
-            starting_at=starting_at,
-            limit=limit,
-            query_filter_params=query_filter_params,
+        query_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "n",
+            include_embeddings=include_embeddings,
         )
-
-        directional_proximal_neo4j_nodes = [record["n"] for record in records]
-        directional_proximal_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
-            directional_proximal_neo4j_nodes,
+        query_backward_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "b",
+            include_embeddings=include_embeddings,
+        )
+        query_forward_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "f",
+            include_embeddings=include_embeddings,
         )
 
-        end_time = time.monotonic()
-        self._collect_metrics(
-            self._search_directional_nodes_calls_counter,
-            self._search_directional_nodes_latency_summary,
-            start_time,
-            end_time,
+        query_contexts = (
+            f"CALL ({ranked_nodes_alias}) {{\n"
+            f"UNWIND range(0, size({ranked_nodes_alias}) - 1) AS rank\n"
+            f"WITH {ranked_nodes_alias}[rank] AS d, rank\n"
+            f"MATCH (d)-[:{sanitized_relation}]->(n:{sanitized_context_collection})\n"
+            f"WHERE {related_query_filter_string}\n"
+            "WITH n, min(rank) AS rank\n"
+            "CALL (n) {\n"
+            f"    MATCH (b:{sanitized_context_collection})\n"
+            f"    WHERE {
+                Neo4jVectorGraphStore._query_lexicographic_anchored_requirements(
+                    'b',
+                    'n',
+                    sanitized_context_by_properties,
+                    order_ascending=False,
+                )
+            }\n"
+            f"    AND {backward_query_filter_string}\n"
+            "    WITH b\n"
+            f"    ORDER BY {
+                ', '.join(
+                    f'b.{sanitized_by_property} DESC'
+                    for sanitized_by_property in sanitized_context_by_properties
+                )
+            }\n"
+            "    LIMIT $max_backward_nodes\n"
+            f"    RETURN collect({query_backward_node_projection}) AS backward_nodes\n"
+            "}\n"
+            "CALL (n) {\n"
+            f"    MATCH (f:{sanitized_context_collection})\n"
+            f"    WHERE {
+                Neo4jVectorGraphStore._query_lexicographic_anchored_requirements(
+                    'f',
+                    'n',
+                    sanitized_context_by_properties,
+                    order_ascending=True,
+                )
+            }\n"
+            f"    AND {forward_query_filter_string}\n"
+            "    WITH f\n"
+            f"    ORDER BY {
+                ', '.join(
+                    f'f.{sanitized_by_property} ASC'
+                    for sanitized_by_property in sanitized_context_by_properties
+                )
+            }\n"
+            "    LIMIT $max_forward_nodes\n"
+            f"    RETURN collect({query_forward_node_projection}) AS forward_nodes\n"
+            "}\n"
+            "WITH n, backward_nodes, forward_nodes, rank\n"
+            "ORDER BY rank\n"
+            f"RETURN collect({{node: {query_node_projection},"
+            "    backward_nodes: backward_nodes, forward_nodes: forward_nodes})"
+            "    AS contexts\n"
+            "}\n"
         )
 
-        return directional_proximal_nodes
+        query_params: dict[str, Any] = {
+            "max_backward_nodes": max_backward_nodes,
+            "max_forward_nodes": max_forward_nodes,
+            "related_query_filter_params": related_query_filter_params,
+            "backward_query_filter_params": backward_query_filter_params,
+            "forward_query_filter_params": forward_query_filter_params,
+        }
+        return query_contexts, query_params
 
     @staticmethod
-    def _query_lexicographic_relational_requirements(
+    def _query_lexicographic_anchored_requirements(
         entity_query_alias: str,
-        starting_at_query_parameter: str,
+        anchor_query_alias: str,
         sanitized_by_properties: Iterable[str],
-        starting_at: Iterable[OrderedPropertyValue | None],
-        order_ascending: Iterable[bool],
+        order_ascending: bool,
     ) -> str:
+        """Require an entity to strictly follow or precede an anchor entity."""
         sanitized_by_properties = list(sanitized_by_properties)
-        starting_at = list(starting_at)
-        order_ascending = list(order_ascending)
 
         lexicographic_relational_requirements = []
         for index, sanitized_by_property in enumerate(sanitized_by_properties):
-            sanitized_equal_properties = sanitized_by_properties[:index]
-
             relational_requirements = [
-                (
-                    f"({entity_query_alias}.{sanitized_by_property}"
-                    + (" > " if order_ascending[index] else " < ")
-                    + f"${starting_at_query_parameter}[{index}])"
-                )
-                if starting_at[index] is not None
-                else f"({entity_query_alias}.{sanitized_by_property} IS NOT NULL)",
+                f"({entity_query_alias}.{sanitized_by_property}"
+                + (" > " if order_ascending else " < ")
+                + f"{anchor_query_alias}.{sanitized_by_property})",
             ]
 
             relational_requirements += [
-                f"({entity_query_alias}.{sanitized_equal_property} = ${starting_at_query_parameter}[{equal_index}])"
-                if starting_at[equal_index] is not None
-                else f"({entity_query_alias}.{sanitized_equal_property} IS NOT NULL)"
-                for equal_index, sanitized_equal_property in enumerate(
-                    sanitized_equal_properties,
-                )
+                f"({entity_query_alias}.{sanitized_equal_property}"
+                f" = {anchor_query_alias}.{sanitized_equal_property})"
+                for sanitized_equal_property in sanitized_by_properties[:index]
             ]
 
-            lexicographic_relational_requirement = (
-                f"({' AND '.join(relational_requirements)})"
-            )
-
             lexicographic_relational_requirements.append(
-                lexicographic_relational_requirement,
+                f"({' AND '.join(relational_requirements)})",
             )
 
-        query_lexicographic_relational_requirements = (
-            f"({' OR '.join(lexicographic_relational_requirements)})"
-        )
-
-        return query_lexicographic_relational_requirements
+        return f"({' OR '.join(lexicographic_relational_requirements)})"
 
     async def search_matching_nodes(
         self,
@@ -971,6 +2074,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         collection: str,
         limit: int | None = None,
         property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
     ) -> list[Node]:
         """Search nodes that match the provided property filters."""
         start_time = time.monotonic()
@@ -985,16 +2089,21 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             )
         )
 
+        query_node_projection = Neo4jVectorGraphStore._query_node_projection(
+            "n",
+            include_embeddings=include_embeddings,
+        )
+
         records, _, _ = await self._driver.execute_query(
             f"MATCH (n:{sanitized_collection})\n"
             f"WHERE {query_filter_string}\n"
-            "RETURN n\n"
+            f"RETURN {query_node_projection} AS projected_node\n"
             f"{'LIMIT $limit' if limit is not None else ''}",
             limit=limit,
             query_filter_params=query_filter_params,
         )
 
-        matching_neo4j_nodes = [record["n"] for record in records]
+        matching_neo4j_nodes = [record["projected_node"] for record in records]
         matching_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
             matching_neo4j_nodes
         )
@@ -1046,17 +2155,39 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         collection: str,
         node_uids: Iterable[str],
     ) -> None:
-        """Delete nodes by uid from a collection."""
+        """
+        Delete nodes by uid from a collection.
+
+        Deleting more nodes than the delete batch size commits
+        one transaction per batch instead of a single transaction,
+        so that large deletions do not hold every affected node
+        and relationship in memory until the end.
+        """
         start_time = time.monotonic()
 
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
-
-        await self._driver.execute_query(
-            "UNWIND $node_uids AS node_uid\n"
-            f"MATCH (n:{sanitized_collection} {{uid: node_uid}})\n"
-            "DETACH DELETE n",
-            node_uids=[str(node_uid) for node_uid in node_uids],
-        )
+        node_uids = [str(node_uid) for node_uid in node_uids]
+
+        if len(node_uids) <= self._delete_batch_size:
+            await self._driver.execute_query(
+                "UNWIND $node_uids AS node_uid\n"
+                f"MATCH (n:{sanitized_collection} {{uid: node_uid}})\n"
+                "DETACH DELETE n",
+                node_uids=node_uids,
+            )
+        else:
+            # CALL { ... } IN TRANSACTIONS requires an implicit transaction.
+            async with self._driver.session() as session:
+                result = await session.run(
+                    "UNWIND $node_uids AS node_uid\n"
+                    "CALL (node_uid) {\n"
+                    f"    MATCH (n:{sanitized_collection} {{uid: node_uid}})\n"
+                    "    DETACH DELETE n\n"
+                    "} IN TRANSACTIONS OF $batch_size ROWS",
+                    node_uids=node_uids,
+                    batch_size=self._delete_batch_size,
+                )
+                await result.consume()
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -1071,9 +2202,40 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         await self._driver.execute_query("MATCH (n) DETACH DELETE n")
 
     async def close(self) -> None:
-        """Close the underlying Neo4j driver."""
+        """Stop the index state poller and close the underlying Neo4j driver."""
+        if self._index_state_poll_task is not None:
+            self._index_state_poll_task.cancel()
+            await asyncio.gather(self._index_state_poll_task, return_exceptions=True)
+            self._index_state_poll_task = None
+
         await self._driver.close()
 
+    def get_index_statuses(self) -> dict[str, "Neo4jVectorGraphStore.IndexStatus"]:
+        """
+        Get the state and population progress of known indexes.
+
+        States are as of the last poll by the background index state poller,
+        except for indexes created by this graph store since then,
+        which are creating.
+
+        Returns:
+            dict[str, Neo4jVectorGraphStore.IndexStatus]:
+                Mapping of index names to their statuses.
+
+        """
+        return {
+            index_name: Neo4jVectorGraphStore.IndexStatus(
+                state=state,
+                population_percent=self._index_population_percents.get(
+                    index_name,
+                    100.0
+                    if state == Neo4jVectorGraphStore.CacheIndexState.ONLINE
+                    else 0.0,
+                ),
+            )
+            for index_name, state in self._index_state_cache.items()
+        }
+
     async def _count_nodes(self, collection: str) -> int:
         """Count the number of nodes in a collection."""
         start_time = time.monotonic()
@@ -1116,36 +2278,32 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         return records[0]["relationship_count"]
 
     async def _populate_index_state_cache(self) -> None:
-        """Populate the index state cache."""
-        start_time = time.monotonic()
-
-        if self._index_state_cache:
-            end_time = time.monotonic()
-            self._collect_metrics(
-                self._populate_index_state_cache_calls_counter,
-                self._populate_index_state_cache_latency_summary,
-                start_time,
-                end_time,
-            )
-            return
-
-        async with self._populate_index_state_cache_lock:
-            if not self._index_state_cache:
-                records, _, _ = await self._driver.execute_query(
-                    "SHOW INDEXES YIELD name RETURN name",
-                )
+        """
+        Populate the index state cache and start the index state poller.
 
-                # This ensures that all the indexes in records are online.
-                await self._driver.execute_query("CALL db.awaitIndexes()")
+        Only the first call queries the index states,
+        without waiting for indexes to come online.
+        Indexes still populating are marked online by the poller later,
+        so searches on cold start do not block on index population.
+        """
+        start_time = time.monotonic()
 
+        if not self._is_index_state_cache_populated:
+            async with self._populate_index_state_cache_lock:
                 # Synchronous code is atomic in asynchronous framework
                 # so double-checked locking works here.
-                self._index_state_cache.update(
-                    {
-                        record["name"]: Neo4jVectorGraphStore.CacheIndexState.ONLINE
-                        for record in records
-                    },
-                )
+                if not self._is_index_state_cache_populated:
+                    await self._poll_index_states()
+                    self._is_index_state_cache_populated = True
+
+        if (
+            self._index_state_poll_task is None
+            or self._index_state_poll_task.done()
+            or self._index_state_poll_task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._index_state_poll_task = asyncio.create_task(
+                self._poll_index_states_loop(),
+            )
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -1155,37 +2313,151 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             end_time,
         )
 
+    async def _poll_index_states_loop(self) -> None:
+        """Poll index states and create missing indexes until closed."""
+        while True:
+            await asyncio.sleep(self._index_state_poll_interval_sec)
+            try:
+                await self._poll_index_states()
+                await self._create_missing_indexes()
+            except Exception:
+                logger.exception("Failed to poll Neo4j index states or create indexes")
+
+    async def _poll_index_states(self) -> None:
+        """Update the index state cache from the indexes in the database."""
+        start_time = time.monotonic()
+
+        records, _, _ = await self._driver.execute_query(
+            "SHOW INDEXES YIELD name, state, populationPercent\n"
+            "RETURN name, state, populationPercent AS population_percent",
+        )
+
+        polled_index_names = set()
+        for record in records:
+            index_name = record["name"]
+            polled_index_names.add(index_name)
+
+            match record["state"]:
+                case "ONLINE":
+                    index_state = Neo4jVectorGraphStore.CacheIndexState.ONLINE
+                case "FAILED":
+                    index_state = Neo4jVectorGraphStore.CacheIndexState.FAILED
+                case _:
+                    index_state = Neo4jVectorGraphStore.CacheIndexState.CREATING
+
+            self._index_state_cache[index_name] = index_state
+            self._index_population_percents[index_name] = record["population_percent"]
+
+        # Forget indexes dropped from the database,
+        # so that they are created again if needed.
+        for index_name in list(self._index_state_cache):
+            if (
+                index_name not in polled_index_names
+                and index_name not in self._index_names_being_created
+            ):
+                del self._index_state_cache[index_name]
+                self._index_population_percents.pop(index_name, None)
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._poll_index_states_calls_counter,
+            self._poll_index_states_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        if self._should_collect_metrics:
+            for index_state in Neo4jVectorGraphStore.CacheIndexState:
+                cast(MetricsFactory.Gauge, self._index_states_gauge).set(
+                    value=sum(
+                        state == index_state
+                        for state in self._index_state_cache.values()
+                    ),
+                    labels={
+                        **self._user_metrics_labels,
+                        "state": index_state.name.lower(),
+                    },
+                )
+
+    async def _create_missing_indexes(self) -> None:
+        """
+        Create missing indexes of collections and relations past the thresholds.
+
+        Indexes are missing if their creation failed or they were dropped.
+        Indexes that Neo4j failed to populate are dropped and created again.
+        """
+        for (entity_type, sanitized_collection_or_relation), (
+            count,
+            embedding_specs,
+        ) in list(self._indexed_entities.items()):
+            sanitized_property_names_list: list[str | list[str]] = []
+            if count >= self._range_index_creation_threshold:
+                sanitized_property_names_list += (
+                    self._initial_range_index_property_names()
+                )
+            if count >= self._vector_index_creation_threshold:
+                sanitized_property_names_list += embedding_specs
+
+            index_names = [
+                Neo4jVectorGraphStore._index_name(
+                    entity_type,
+                    sanitized_collection_or_relation,
+                    sanitized_property_names,
+                )
+                for sanitized_property_names in sanitized_property_names_list
+            ]
+
+            for index_name in index_names:
+                if (
+                    self._index_state_cache.get(index_name)
+                    == Neo4jVectorGraphStore.CacheIndexState.FAILED
+                ):
+                    await self._drop_failed_index(index_name)
+
+            if all(index_name in self._index_state_cache for index_name in index_names):
+                continue
+
+            self._create_indexes_if_needed(
+                entity_type=entity_type,
+                sanitized_collection_or_relation=sanitized_collection_or_relation,
+                count=count,
+                embedding_specs=embedding_specs,
+            )
+
+    def _initial_range_index_property_names(self) -> list[list[str]]:
+        """Get the sanitized property names of the initial range indexes."""
+        return [
+            ["uid"],
+            *(
+                [
+                    Neo4jVectorGraphStore._sanitize_name(
+                        mangle_property_name(property_name),
+                    )
+                    for property_name in property_name_hierarchy
+                ]
+                for range_index_hierarchy in self._range_index_hierarchies
+                for property_name_hierarchy in [
+                    range_index_hierarchy[: i + 1]
+                    for i in range(len(range_index_hierarchy))
+                ]
+            ),
+        ]
+
     async def _create_initial_indexes_if_not_exist(
         self,
         entity_type: EntityType,
         sanitized_collection_or_relation: str,
     ) -> None:
-        """Create initial indexes if missing and wait for them to be online."""
+        """Create initial indexes if missing."""
         start_time = time.monotonic()
 
         tasks = [
             self._create_range_index_if_not_exists(
                 entity_type=entity_type,
                 sanitized_collection_or_relation=sanitized_collection_or_relation,
-                sanitized_property_names="uid",
-            ),
-        ]
-        tasks += [
-            self._create_range_index_if_not_exists(
-                entity_type=entity_type,
-                sanitized_collection_or_relation=sanitized_collection_or_relation,
-                sanitized_property_names=[
-                    Neo4jVectorGraphStore._sanitize_name(
-                        mangle_property_name(property_name),
-                    )
-                    for property_name in property_name_hierarchy
-                ],
+                sanitized_property_names=sanitized_property_names,
             )
-            for range_index_hierarchy in self._range_index_hierarchies
-            for property_name_hierarchy in [
-                range_index_hierarchy[: i + 1]
-                for i in range(len(range_index_hierarchy))
-            ]
+            for sanitized_property_names in self._initial_range_index_property_names()
         ]
 
         end_time = time.monotonic()
@@ -1204,7 +2476,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         sanitized_collection_or_relation: str,
         sanitized_property_names: str | Iterable[str],
     ) -> None:
-        """Create a range index if missing and wait for it to be online."""
+        """Create a range index if missing."""
         start_time = time.monotonic()
 
         if isinstance(sanitized_property_names, str):
@@ -1222,31 +2494,15 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             sanitized_property_names,
         )
 
-        cached_index_state = self._index_state_cache.get(range_index_name)
-        match cached_index_state:
-            case Neo4jVectorGraphStore.CacheIndexState.CREATING:
-                # Wait for the index to be online.
-                await self._await_create_index_if_not_exists(
-                    range_index_name,
-                    asyncio.sleep(0),  # Use as a no-op.
-                )
-                end_time = time.monotonic()
-                self._collect_metrics(
-                    self._create_range_index_if_not_exists_calls_counter,
-                    self._create_range_index_if_not_exists_latency_summary,
-                    start_time,
-                    end_time,
-                )
-                return
-            case Neo4jVectorGraphStore.CacheIndexState.ONLINE:
-                end_time = time.monotonic()
-                self._collect_metrics(
-                    self._create_range_index_if_not_exists_calls_counter,
-                    self._create_range_index_if_not_exists_latency_summary,
-                    start_time,
-                    end_time,
-                )
-                return
+        if range_index_name in self._index_state_cache:
+            end_time = time.monotonic()
+            self._collect_metrics(
+                self._create_range_index_if_not_exists_calls_counter,
+                self._create_range_index_if_not_exists_latency_summary,
+                start_time,
+                end_time,
+            )
+            return
 
         # Code is synchronous between the cache read and this write,
         # so it is effectively atomic in the asynchronous framework.
@@ -1274,10 +2530,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             })",
         )
 
-        await self._await_create_index_if_not_exists(
-            range_index_name,
-            create_index_awaitable,
-        )
+        await self._create_index(range_index_name, create_index_awaitable)
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -1295,7 +2548,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         dimensions: int,
         similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
     ) -> None:
-        """Create a vector index if missing and wait for it to be online."""
+        """Create a vector index if missing."""
         if not (1 <= dimensions <= 4096):
             raise ValueError("dimensions must be between 1 and 4096")
 
@@ -1309,31 +2562,15 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             sanitized_embedding_name,
         )
 
-        cached_index_state = self._index_state_cache.get(vector_index_name)
-        match cached_index_state:
-            case Neo4jVectorGraphStore.CacheIndexState.CREATING:
-                # Wait for the index to be online.
-                await self._await_create_index_if_not_exists(
-                    vector_index_name,
-                    asyncio.sleep(0),  # Use as a no-op.
-                )
-                end_time = time.monotonic()
-                self._collect_metrics(
-                    self._create_vector_index_if_not_exists_calls_counter,
-                    self._create_vector_index_if_not_exists_latency_summary,
-                    start_time,
-                    end_time,
-                )
-                return
-            case Neo4jVectorGraphStore.CacheIndexState.ONLINE:
-                end_time = time.monotonic()
-                self._collect_metrics(
-                    self._create_vector_index_if_not_exists_calls_counter,
-                    self._create_vector_index_if_not_exists_latency_summary,
-                    start_time,
-                    end_time,
-                )
-                return
+        if vector_index_name in self._index_state_cache:
+            end_time = time.monotonic()
+            self._collect_metrics(
+                self._create_vector_index_if_not_exists_calls_counter,
+                self._create_vector_index_if_not_exists_latency_summary,
+                start_time,
+                end_time,
+            )
+            return
 
         # Code is synchronous between the cache read and this write,
         # so it is effectively atomic in the asynchronous framework.
@@ -1374,10 +2611,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             similarity_function=similarity_function,
         )
 
-        await self._await_create_index_if_not_exists(
-            vector_index_name,
-            create_index_awaitable,
-        )
+        await self._create_index(vector_index_name, create_index_awaitable)
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -1387,23 +2621,41 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             end_time,
         )
 
-    @async_locked
-    async def _await_create_index_if_not_exists(
+    async def _create_index(
         self,
         index_name: str,
         create_index_awaitable: Awaitable,
     ) -> None:
-        """Await index creation and mark it online in the cache."""
-        await create_index_awaitable
+        """
+        Await index creation without waiting for the index to be online.
 
-        await self._driver.execute_query(
-            "CALL db.awaitIndex($index_name)",
-            index_name=index_name,
+        The index state poller marks the index online
+        once Neo4j has populated it.
+        """
+        self._index_names_being_created.add(index_name)
+        try:
+            await self._await_create_index_query(create_index_awaitable)
+        except Exception:
+            # Retried by the index state poller.
+            self._index_state_cache.pop(index_name, None)
+            raise
+        finally:
+            self._index_names_being_created.discard(index_name)
+
+    async def _drop_failed_index(self, index_name: str) -> None:
+        """Drop an index that Neo4j failed to populate, so it can be created again."""
+        logger.warning("Dropping failed Neo4j index %s to create it again", index_name)
+        await self._await_create_index_query(
+            self._driver.execute_query(f"DROP INDEX {index_name} IF EXISTS"),
         )
+        self._index_state_cache.pop(index_name, None)
+        self._index_population_percents.pop(index_name, None)
 
-        self._index_state_cache[index_name] = (
-            Neo4jVectorGraphStore.CacheIndexState.ONLINE
-        )
+    @staticmethod
+    @async_locked
+    async def _await_create_index_query(create_index_awaitable: Awaitable) -> None:
+        """Await index creation queries one at a time."""
+        await create_index_awaitable
 
     _SANITIZE_NAME_PREFIX = "SANITIZED_"
 
@@ -1475,15 +2727,51 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         """
         return f"similarity_metric_for_{embedding_name}"
 
+    @staticmethod
+    def _query_node_projection(
+        entity_query_alias: str,
+        include_embeddings: bool = True,
+    ) -> str:
+        """
+        Get the query expression to return a node with.
+
+        Without embeddings, the node is projected to a map
+        of its uid and its (key, value) property pairs
+        so that embedding vectors are never sent back.
+
+        Args:
+            entity_query_alias (str): The query alias of the node.
+            include_embeddings (bool): Whether to include embeddings.
+
+        Returns:
+            str: The query expression.
+
+        """
+        if include_embeddings:
+            return entity_query_alias
+
+        sanitized_property_name_prefix = Neo4jVectorGraphStore._sanitize_name(
+            mangle_property_name(""),
+        )
+        return (
+            f"{{uid: {entity_query_alias}.uid, property_items: ["
+            f"key IN keys({entity_query_alias})"
+            f" WHERE key STARTS WITH '{sanitized_property_name_prefix}'"
+            f" | [key, {entity_query_alias}[key]]"
+            "]}"
+        )
+
     @staticmethod
     def _nodes_from_neo4j_nodes(
-        neo4j_nodes: Iterable[Neo4jNode],
+        neo4j_nodes: Iterable[Neo4jNode | Mapping[str, Any]],
     ) -> list[Node]:
         """
         Convert a collection of Neo4jNodes to a list of Nodes.
 
         Args:
-            neo4j_nodes (Iterable[Neo4jNode]): Iterable of Neo4jNodes.
+            neo4j_nodes (Iterable[Neo4jNode | Mapping[str, Any]]):
+                Iterable of Neo4jNodes
+                or node projections without embeddings.
 
         Returns:
             list[Node]: List of Node objects.
@@ -1494,7 +2782,18 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             node_properties = {}
             node_embeddings = {}
 
-            for neo4j_property_name, neo4j_property_value in neo4j_node.items():
+            if isinstance(neo4j_node, Neo4jNode):
+                neo4j_node_properties = dict(neo4j_node.items())
+            else:
+                # Projection without embeddings.
+                neo4j_node_properties = dict(neo4j_node["property_items"]) | {
+                    "uid": neo4j_node["uid"],
+                }
+
+            for (
+                neo4j_property_name,
+                neo4j_property_value,
+            ) in neo4j_node_properties.items():
                 desanitized_property_name = Neo4jVectorGraphStore._desanitize_name(
                     neo4j_property_name,
                 )
@@ -1517,7 +2816,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                     )
                     similarity_metric = SimilarityMetric(
                         Neo4jVectorGraphStore._python_value_from_neo4j_value(
-                            neo4j_node[
+                            neo4j_node_properties[
                                 Neo4jVectorGraphStore._sanitize_name(
                                     Neo4jVectorGraphStore._similarity_metric_property_name(
                                         embedding_name,
@@ -1533,7 +2832,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
             nodes.append(
                 Node(
-                    uid=neo4j_node["uid"],
+                    uid=neo4j_node_properties["uid"],
                     properties=node_properties,
                     embeddings=node_embeddings,
                 ),
@@ -1588,70 +2887,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 str, FilterablePropertyValue | list[FilterablePropertyValue]
             ] = {}
         else:
-            query_filter_string, query_filter_params = (
-                Neo4jVectorGraphStore._render_filter_expr(
-                    entity_query_alias,
-                    query_value_parameter,
-                    property_filter,
-                )
+            query_filter_string, query_filter_params = compile_cypher_filter(
+                property_filter,
+                entity_query_alias,
+                query_value_parameter,
+                Neo4jVectorGraphStore._render_property_name,
             )
 
         return query_filter_string, query_filter_params
 
     @staticmethod
-    def _render_filter_expr(
-        entity_query_alias: str,
-        query_value_parameter: str,
-        expr: FilterExpr,
-    ) -> tuple[str, dict[str, FilterablePropertyValue | list[FilterablePropertyValue]]]:
-        if isinstance(expr, FilterComparison):
-            field_ref = f"{entity_query_alias}.{
-                Neo4jVectorGraphStore._sanitize_name(mangle_property_name(expr.field))
-            }"
-            param_name = Neo4jVectorGraphStore._sanitize_name(
-                f"filter_expr_param_{uuid4()}"
-            )
-
-            params: dict[
-                str, FilterablePropertyValue | list[FilterablePropertyValue]
-            ] = {}
-            if expr.op in (">", "<", ">=", "<=", "="):
-                if isinstance(expr.value, list):
-                    raise ValueError(
-                        f"'{expr.op}' comparison cannot accept list values"
-                    )
-                condition = (
-                    f"{field_ref} {expr.op} ${query_value_parameter}.{param_name}"
-                )
-                params[param_name] = expr.value
-            elif expr.op == "in":
-                if not isinstance(expr.value, list):
-                    raise ValueError("IN comparison requires a list of values")
-                condition = f"{field_ref} IN ${query_value_parameter}.{param_name}"
-                params[param_name] = expr.value
-            elif expr.op == "is_null":
-                condition = f"{field_ref} IS NULL"
-            elif expr.op == "is_not_null":
-                condition = f"{field_ref} IS NOT NULL"
-            else:
-                raise ValueError(f"Unsupported operator: {expr.op}")
-            return condition, params
-        if isinstance(expr, FilterAnd):
-            left_cond, left_params = Neo4jVectorGraphStore._render_filter_expr(
-                entity_query_alias, query_value_parameter, expr.left
-            )
-            right_cond, right_params = Neo4jVectorGraphStore._render_filter_expr(
-                entity_query_alias, query_value_parameter, expr.right
-            )
-            condition = f"({left_cond}) AND ({right_cond})"
-            return condition, left_params | right_params
-        if isinstance(expr, FilterOr):
-            left_cond, left_params = Neo4jVectorGraphStore._render_filter_expr(
-                entity_query_alias, query_value_parameter, expr.left
-            )
-            right_cond, right_params = Neo4jVectorGraphStore._render_filter_expr(
-                entity_query_alias, query_value_parameter, expr.right
-            )
-            condition = f"({left_cond}) OR ({right_cond})"
-            return condition, left_params | right_params
-        raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+    def _render_property_name(field: str) -> str:
+        """Render a filter field as a sanitized property name."""
+        return Neo4jVectorGraphStore._sanitize_name(mangle_property_name(field))
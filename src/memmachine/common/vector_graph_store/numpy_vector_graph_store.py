@@ -0,0 +1,1574 @@
+"""
+NumPy-based vector graph store implementation.
+
+This module provides an in-process implementation of a vector graph store
+for single-node and test deployments.
+The graph is kept in memory and can be persisted as snapshots
+whose embedding matrices are memory-mapped when loaded.
+"""
+
+import asyncio
+import bisect
+import functools
+import logging
+import operator
+import pickle
+import shutil
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+from pydantic import BaseModel, Field, InstanceOf
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.filter.filter_compiler import compile_predicate
+from memmachine.common.filter.filter_parser import Comparison, FilterExpr
+from memmachine.common.metrics_factory import MetricsFactory
+
+from .data_types import (
+    Edge,
+    Node,
+    NodeContext,
+    OrderedPropertyValue,
+    PropertyValue,
+)
+from .vector_graph_store import VectorGraphStore
+
+logger = logging.getLogger(__name__)
+
+# Nodes are identified by (collection, uid).
+_NodeKey = tuple[str, str]
+
+# Values of different types are ordered by type first.
+_OrderKey = tuple[int, OrderedPropertyValue]
+
+_PropertiesPredicate = Callable[[Mapping[str, PropertyValue]], bool]
+
+_ORDER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+
+class NumpyVectorGraphStoreParams(BaseModel):
+    """
+    Parameters for NumpyVectorGraphStore.
+
+    Attributes:
+        snapshot_path (str | None):
+            Directory to load snapshots from and save snapshots to.
+            Snapshots are loaded with pickle,
+            so the directory must only be writable by trusted users.
+            If None, data is kept in memory only
+            (default: None).
+        initial_capacity (int):
+            Number of rows initially allocated
+            for the embeddings of a collection
+            (default: 1024).
+        metrics_factory (MetricsFactory | None):
+            An instance of MetricsFactory for collecting usage metrics
+            (default: None).
+        user_metrics_labels (dict[str, str]):
+            Labels to attach to the collected metrics
+            (default: {}).
+
+    """
+
+    snapshot_path: str | None = Field(
+        None,
+        description=(
+            "Directory to load snapshots from and save snapshots to. "
+            "Snapshots are loaded with pickle, "
+            "so the directory must only be writable by trusted users. "
+            "If None, data is kept in memory only"
+        ),
+    )
+    initial_capacity: int = Field(
+        1024,
+        description=(
+            "Number of rows initially allocated for the embeddings of a collection"
+        ),
+        gt=0,
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        None,
+        description="An instance of MetricsFactory for collecting usage metrics",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics",
+    )
+
+
+class _EmbeddingMatrix:
+    """Embeddings of one name in a collection, stored as contiguous rows."""
+
+    def __init__(
+        self,
+        *,
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        uids: list[str],
+        similarity_metrics: list[SimilarityMetric],
+    ) -> None:
+        # Rows past the number of uids are unused capacity.
+        self._vectors = vectors
+        self._norms = norms
+        self.uids = uids
+        self.similarity_metrics = similarity_metrics
+        self.rows = {uid: row for row, uid in enumerate(uids)}
+
+    @staticmethod
+    def empty(dimensions: int, capacity: int) -> "_EmbeddingMatrix":
+        return _EmbeddingMatrix(
+            vectors=np.empty((capacity, dimensions), dtype=np.float32),
+            norms=np.empty(capacity, dtype=np.float32),
+            uids=[],
+            similarity_metrics=[],
+        )
+
+    @property
+    def dimensions(self) -> int:
+        return self._vectors.shape[1]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[: len(self.uids)]
+
+    @property
+    def norms(self) -> np.ndarray:
+        return self._norms[: len(self.uids)]
+
+    def put(
+        self,
+        uid: str,
+        vector: list[float],
+        similarity_metric: SimilarityMetric,
+    ) -> None:
+        self._ensure_writable()
+
+        row = self.rows.get(uid)
+        if row is None:
+            row = len(self.uids)
+            if row == self._vectors.shape[0]:
+                self._grow()
+            self.uids.append(uid)
+            self.similarity_metrics.append(similarity_metric)
+            self.rows[uid] = row
+        else:
+            self.similarity_metrics[row] = similarity_metric
+
+        self._vectors[row] = vector
+        self._norms[row] = np.linalg.norm(self._vectors[row])
+
+    def remove(self, uid: str) -> None:
+        row = self.rows.pop(uid, None)
+        if row is None:
+            return
+
+        self._ensure_writable()
+
+        # Move the last row into the removed row to keep the rows contiguous.
+        last_row = len(self.uids) - 1
+        if row != last_row:
+            last_uid = self.uids[last_row]
+            self._vectors[row] = self._vectors[last_row]
+            self._norms[row] = self._norms[last_row]
+            self.uids[row] = last_uid
+            self.similarity_metrics[row] = self.similarity_metrics[last_row]
+            self.rows[last_uid] = row
+
+        self.uids.pop()
+        self.similarity_metrics.pop()
+
+    def get(self, uid: str) -> tuple[list[float], SimilarityMetric]:
+        row = self.rows[uid]
+        return self._vectors[row].tolist(), self.similarity_metrics[row]
+
+    def similarities(
+        self,
+        query_embedding: np.ndarray,
+        similarity_metric: SimilarityMetric,
+    ) -> np.ndarray:
+        """Compute the similarity of every row to the query, higher is closer."""
+        vectors = self.vectors
+        match similarity_metric:
+            case SimilarityMetric.DOT:
+                return vectors @ query_embedding
+            case SimilarityMetric.EUCLIDEAN:
+                # Negative squared distance, without an intermediate matrix.
+                return (
+                    2 * (vectors @ query_embedding)
+                    - np.square(self.norms)
+                    - np.dot(query_embedding, query_embedding)
+                )
+            case SimilarityMetric.MANHATTAN:
+                return -np.abs(vectors - query_embedding).sum(axis=1)
+            case _:
+                denominators = self.norms * np.linalg.norm(query_embedding)
+                return np.divide(
+                    vectors @ query_embedding,
+                    denominators,
+                    out=np.zeros(len(self.uids), dtype=np.float32),
+                    where=denominators > 0,
+                )
+
+    def _grow(self) -> None:
+        capacity = max(2 * self._vectors.shape[0], 1)
+        vectors = np.empty((capacity, self.dimensions), dtype=np.float32)
+        norms = np.empty(capacity, dtype=np.float32)
+        vectors[: len(self.uids)] = self.vectors
+        norms[: len(self.uids)] = self.norms
+        self._vectors = vectors
+        self._norms = norms
+
+    def _ensure_writable(self) -> None:
+        # Matrices loaded from a snapshot are read-only memory maps.
+        if not self._vectors.flags.writeable:
+            self._vectors = np.array(self._vectors)
+            self._norms = np.array(self._norms)
+
+
+class _OrderIndex:
+    """Nodes of a collection sorted by a hierarchy of properties, then by uid."""
+
+    def __init__(
+        self,
+        by_properties: tuple[str, ...],
+        properties_by_uid: Mapping[str, Mapping[str, PropertyValue]],
+    ) -> None:
+        self._by_properties = by_properties
+        self._entries: list[tuple[tuple[_OrderKey, ...], str]] = sorted(
+            (key, uid)
+            for uid, properties in properties_by_uid.items()
+            if (key := self.key(properties)) is not None
+        )
+
+    def key(
+        self,
+        properties: Mapping[str, PropertyValue],
+    ) -> tuple[_OrderKey, ...] | None:
+        """Get the sort key of a node, or None if it cannot be ordered."""
+        key = []
+        for by_property in self._by_properties:
+            order_key = _order_key(properties.get(by_property))
+            if order_key is None:
+                return None
+            key.append(order_key)
+        return tuple(key)
+
+    def add(self, uid: str, properties: Mapping[str, PropertyValue]) -> None:
+        key = self.key(properties)
+        if key is not None:
+            bisect.insort(self._entries, (key, uid))
+
+    def remove(self, uid: str, properties: Mapping[str, PropertyValue]) -> None:
+        key = self.key(properties)
+        if key is None:
+            return
+        position = bisect.bisect_left(self._entries, (key, uid))
+        if position < len(self._entries) and self._entries[position] == (key, uid):
+            del self._entries[position]
+
+    def __iter__(self) -> Iterator[tuple[tuple[_OrderKey, ...], str]]:
+        return iter(self._entries)
+
+    def scan(
+        self,
+        start_key: tuple[_OrderKey, ...],
+        ascending: bool,
+        include_equal_start: bool,
+    ) -> Iterator[str]:
+        """
+        Iterate over uids from a start key in one direction.
+
+        Only the prefix of the keys as long as the start key is compared.
+        """
+        prefix_length = len(start_key)
+
+        def entry_key(
+            entry: tuple[tuple[_OrderKey, ...], str],
+        ) -> tuple[_OrderKey, ...]:
+            return entry[0][:prefix_length]
+
+        entries = self._entries
+        if ascending:
+            bisect_start = (
+                bisect.bisect_left if include_equal_start else bisect.bisect_right
+            )
+            position = bisect_start(entries, start_key, key=entry_key)
+            return (entries[index][1] for index in range(position, len(entries)))
+
+        bisect_end = bisect.bisect_right if include_equal_start else bisect.bisect_left
+        position = bisect_end(entries, start_key, key=entry_key)
+        return (entries[index][1] for index in range(position - 1, -1, -1))
+
+
+@dataclass
+class _Collection:
+    """Nodes of a collection with their embeddings and order indexes."""
+
+    initial_capacity: int
+    properties: dict[str, dict[str, PropertyValue]] = field(default_factory=dict)
+    embeddings: dict[str, _EmbeddingMatrix] = field(default_factory=dict)
+    order_indexes: dict[tuple[str, ...], _OrderIndex] = field(default_factory=dict)
+
+    def put_node(self, node: Node) -> None:
+        old_properties = self.properties.get(node.uid)
+        if old_properties is not None:
+            for order_index in self.order_indexes.values():
+                order_index.remove(node.uid, old_properties)
+            for embedding_name, old_matrix in self.embeddings.items():
+                if embedding_name not in node.embeddings:
+                    old_matrix.remove(node.uid)
+
+        # Stored properties are replaced but never modified in place.
+        properties = dict(node.properties)
+        self.properties[node.uid] = properties
+        for order_index in self.order_indexes.values():
+            order_index.add(node.uid, properties)
+
+        for embedding_name, (vector, similarity_metric) in node.embeddings.items():
+            matrix = self.embeddings.get(embedding_name)
+            if matrix is None:
+                matrix = _EmbeddingMatrix.empty(len(vector), self.initial_capacity)
+                self.embeddings[embedding_name] = matrix
+            matrix.put(node.uid, vector, similarity_metric)
+
+    def remove_node(self, uid: str) -> bool:
+        properties = self.properties.pop(uid, None)
+        if properties is None:
+            return False
+
+        for order_index in self.order_indexes.values():
+            order_index.remove(uid, properties)
+        for matrix in self.embeddings.values():
+            matrix.remove(uid)
+        return True
+
+    def check_embeddings(self, nodes: Iterable[Node]) -> None:
+        """Raise ValueError if the embeddings of the nodes have mismatched dimensions."""
+        dimensions = {
+            embedding_name: matrix.dimensions
+            for embedding_name, matrix in self.embeddings.items()
+        }
+        for node in nodes:
+            for embedding_name, (vector, _) in node.embeddings.items():
+                expected_dimensions = dimensions.setdefault(embedding_name, len(vector))
+                if len(vector) != expected_dimensions:
+                    raise ValueError(
+                        f"Embedding {embedding_name} of node {node.uid} "
+                        f"has {len(vector)} dimensions, "
+                        f"expected {expected_dimensions}",
+                    )
+
+    def order_index(self, by_properties: tuple[str, ...]) -> _OrderIndex:
+        # Built on first use and maintained on writes afterwards.
+        order_index = self.order_indexes.get(by_properties)
+        if order_index is None:
+            order_index = _OrderIndex(by_properties, self.properties)
+            self.order_indexes[by_properties] = order_index
+        return order_index
+
+    def node(self, uid: str, include_embeddings: bool) -> Node:
+        return Node(
+            uid=uid,
+            properties={
+                key: value.copy() if isinstance(value, list) else value
+                for key, value in self.properties[uid].items()
+            },
+            embeddings=(
+                {
+                    embedding_name: matrix.get(uid)
+                    for embedding_name, matrix in self.embeddings.items()
+                    if uid in matrix.rows
+                }
+                if include_embeddings
+                else {}
+            ),
+        )
+
+
+@dataclass
+class _StoredEdge:
+    uid: str
+    source: _NodeKey
+    target: _NodeKey
+    properties: dict[str, PropertyValue]
+    embeddings: dict[str, tuple[list[float], SimilarityMetric]]
+
+
+class NumpyVectorGraphStore(VectorGraphStore):
+    """
+    In-process NumPy-based implementation of VectorGraphStore.
+
+    Embeddings are kept per collection and embedding name
+    in contiguous float32 matrices for vectorized exact similarity search,
+    so returned embeddings have float32 precision.
+    Nodes are ordered by property hierarchies in sorted indexes
+    built on first use, and edges are kept in adjacency maps.
+
+    Snapshots are saved on close and by save_snapshot.
+    Data added since the last snapshot is lost if the process stops abruptly.
+    Loading a snapshot unpickles it, which can execute arbitrary code,
+    so only snapshots written by a trusted process must be loaded.
+    """
+
+    _CURRENT_SNAPSHOT_FILE_NAME = "CURRENT"
+    _GRAPH_FILE_NAME = "graph.pickle"
+
+    def __init__(self, params: NumpyVectorGraphStoreParams) -> None:
+        """Initialize the graph store, loading the latest snapshot if any."""
+        super().__init__()
+
+        self._snapshot_path = (
+            Path(params.snapshot_path) if params.snapshot_path is not None else None
+        )
+        self._initial_capacity = params.initial_capacity
+
+        self._collections: dict[str, _Collection] = {}
+        # Edges by relation, then by source or target node, then by uid.
+        self._outgoing_edges: dict[str, dict[_NodeKey, dict[str, _StoredEdge]]] = {}
+        self._incoming_edges: dict[str, dict[_NodeKey, dict[str, _StoredEdge]]] = {}
+
+        self._save_snapshot_lock = asyncio.Lock()
+
+        if self._snapshot_path is not None:
+            self._load_snapshot(self._snapshot_path)
+
+        metrics_factory = params.metrics_factory
+
+        self._add_nodes_calls_counter = None
+        self._add_nodes_latency_summary = None
+        self._add_edges_calls_counter = None
+        self._add_edges_latency_summary = None
+        self._search_similar_nodes_calls_counter = None
+        self._search_similar_nodes_latency_summary = None
+        self._search_related_nodes_calls_counter = None
+        self._search_related_nodes_latency_summary = None
+        self._get_related_nodes_calls_counter = None
+        self._get_related_nodes_latency_summary = None
+        self._search_directional_nodes_calls_counter = None
+        self._search_directional_nodes_latency_summary = None
+        self._search_similar_node_contexts_calls_counter = None
+        self._search_similar_node_contexts_latency_summary = None
+        self._get_related_node_contexts_calls_counter = None
+        self._get_related_node_contexts_latency_summary = None
+        self._search_matching_nodes_calls_counter = None
+        self._search_matching_nodes_latency_summary = None
+        self._get_nodes_calls_counter = None
+        self._get_nodes_latency_summary = None
+        self._delete_nodes_calls_counter = None
+        self._delete_nodes_latency_summary = None
+        self._save_snapshot_calls_counter = None
+        self._save_snapshot_latency_summary = None
+
+        self._should_collect_metrics = False
+        if metrics_factory is not None:
+            self._should_collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = self._user_metrics_labels.keys()
+
+            self._add_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_add_nodes_calls",
+                "Number of calls to add_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._add_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_add_nodes_latency_seconds",
+                "Latency in seconds for add_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._add_edges_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_add_edges_calls",
+                "Number of calls to add_edges in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._add_edges_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_add_edges_latency_seconds",
+                "Latency in seconds for add_edges in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_similar_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_search_similar_nodes_calls",
+                "Number of calls to search_similar_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_similar_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_search_similar_nodes_latency_seconds",
+                "Latency in seconds for search_similar_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_related_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_search_related_nodes_calls",
+                "Number of calls to search_related_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_related_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_search_related_nodes_latency_seconds",
+                "Latency in seconds for search_related_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_get_related_nodes_calls",
+                "Number of calls to get_related_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_get_related_nodes_latency_seconds",
+                "Latency in seconds for get_related_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_directional_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_search_directional_nodes_calls",
+                "Number of calls to search_directional_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_directional_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_search_directional_nodes_latency_seconds",
+                "Latency in seconds for search_directional_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_similar_node_contexts_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_search_similar_node_contexts_calls",
+                "Number of calls to search_similar_node_contexts in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_similar_node_contexts_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_search_similar_node_contexts_latency_seconds",
+                "Latency in seconds for search_similar_node_contexts in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_node_contexts_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_get_related_node_contexts_calls",
+                "Number of calls to get_related_node_contexts in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_related_node_contexts_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_get_related_node_contexts_latency_seconds",
+                "Latency in seconds for get_related_node_contexts "
+                "in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_matching_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_search_matching_nodes_calls",
+                "Number of calls to search_matching_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._search_matching_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_search_matching_nodes_latency_seconds",
+                "Latency in seconds for search_matching_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_get_nodes_calls",
+                "Number of calls to get_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._get_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_get_nodes_latency_seconds",
+                "Latency in seconds for get_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._delete_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_delete_nodes_calls",
+                "Number of calls to delete_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._delete_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_delete_nodes_latency_seconds",
+                "Latency in seconds for delete_nodes in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._save_snapshot_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_numpy_save_snapshot_calls",
+                "Number of calls to save_snapshot in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+            self._save_snapshot_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_numpy_save_snapshot_latency_seconds",
+                "Latency in seconds for save_snapshot in NumpyVectorGraphStore",
+                label_names=label_names,
+            )
+
+    async def add_nodes(
+        self,
+        *,
+        collection: str,
+        nodes: Iterable[Node],
+    ) -> None:
+        """Add nodes to a collection, replacing nodes with the same uid."""
+        start_time = time.monotonic()
+
+        nodes = list(nodes)
+        stored_collection = self._collections.get(collection)
+        if stored_collection is None:
+            stored_collection = _Collection(initial_capacity=self._initial_capacity)
+
+        # Check before modifying anything so that a failed call has no effect.
+        stored_collection.check_embeddings(nodes)
+
+        self._collections[collection] = stored_collection
+        for node in nodes:
+            stored_collection.put_node(node)
+
+        self._collect_metrics(
+            self._add_nodes_calls_counter,
+            self._add_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+    async def add_edges(
+        self,
+        *,
+        relation: str,
+        source_collection: str,
+        target_collection: str,
+        edges: Iterable[Edge],
+    ) -> None:
+        """Add edges between existing nodes, skipping edges with missing nodes."""
+        start_time = time.monotonic()
+
+        outgoing_edges = self._outgoing_edges.setdefault(relation, {})
+        incoming_edges = self._incoming_edges.setdefault(relation, {})
+
+        for edge in edges:
+            source = (source_collection, edge.source_uid)
+            target = (target_collection, edge.target_uid)
+            if not (self._has_node(source) and self._has_node(target)):
+                continue
+
+            stored_edge = _StoredEdge(
+                uid=edge.uid,
+                source=source,
+                target=target,
+                properties=dict(edge.properties),
+                embeddings=dict(edge.embeddings),
+            )
+            outgoing_edges.setdefault(source, {})[edge.uid] = stored_edge
+            incoming_edges.setdefault(target, {})[edge.uid] = stored_edge
+
+        self._collect_metrics(
+            self._add_edges_calls_counter,
+            self._add_edges_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+    async def search_similar_nodes(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: list[float],
+        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
+        limit: int | None = 100,
+        property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Search nodes by exact vector similarity with optional property filters."""
+        start_time = time.monotonic()
+
+        stored_collection = self._collections.get(collection)
+        similar_nodes = (
+            [
+                stored_collection.node(uid, include_embeddings)
+                for uid in self._search_similar_uids(
+                    stored_collection,
+                    embedding_name,
+                    query_embedding,
+                    similarity_metric,
+                    limit,
+                    NumpyVectorGraphStore._compile_filter(property_filter),
+                )
+            ]
+            if stored_collection is not None
+            else []
+        )
+
+        self._collect_metrics(
+            self._search_similar_nodes_calls_counter,
+            self._search_similar_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return similar_nodes
+
+    async def search_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uid: str,
+        find_sources: bool = True,
+        find_targets: bool = True,
+        limit: int | None = None,
+        edge_property_filter: FilterExpr | None = None,
+        node_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Search nodes connected by a relation with optional property filters."""
+        start_time = time.monotonic()
+
+        this_node = (this_collection, str(this_node_uid))
+        edges: list[tuple[_StoredEdge, _NodeKey]] = []
+        if find_targets:
+            edges += [
+                (edge, edge.target)
+                for edge in self._outgoing_edges.get(relation, {})
+                .get(this_node, {})
+                .values()
+            ]
+        if find_sources:
+            edges += [
+                (edge, edge.source)
+                for edge in self._incoming_edges.get(relation, {})
+                .get(this_node, {})
+                .values()
+            ]
+
+        edge_matches = NumpyVectorGraphStore._compile_filter(edge_property_filter)
+        node_matches = NumpyVectorGraphStore._compile_filter(node_property_filter)
+
+        related_uids: dict[str, None] = {}
+        stored_collection = self._collections.get(other_collection)
+        for edge, (related_collection, related_uid) in edges:
+            if limit is not None and len(related_uids) >= limit:
+                break
+            if (
+                stored_collection is None
+                or related_collection != other_collection
+                or related_uid in related_uids
+            ):
+                continue
+            if (edge_matches is None or edge_matches(edge.properties)) and (
+                node_matches is None
+                or node_matches(stored_collection.properties[related_uid])
+            ):
+                related_uids[related_uid] = None
+
+        related_nodes = [
+            cast(_Collection, stored_collection).node(uid, include_embeddings)
+            for uid in related_uids
+        ]
+
+        self._collect_metrics(
+            self._search_related_nodes_calls_counter,
+            self._search_related_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return related_nodes
+
+    async def get_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uids: Iterable[str],
+        find_sources: bool = True,
+        find_targets: bool = True,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Get the distinct nodes connected by a relation to any of the nodes."""
+        start_time = time.monotonic()
+
+        outgoing_edges = self._outgoing_edges.get(relation, {})
+        incoming_edges = self._incoming_edges.get(relation, {})
+
+        related_uids: dict[str, None] = {}
+        stored_collection = self._collections.get(other_collection)
+        if stored_collection is not None:
+            for this_node_uid in this_node_uids:
+                this_node = (this_collection, str(this_node_uid))
+                related_node_keys: list[_NodeKey] = []
+                if find_targets:
+                    related_node_keys += [
+                        edge.target
+                        for edge in outgoing_edges.get(this_node, {}).values()
+                    ]
+                if find_sources:
+                    related_node_keys += [
+                        edge.source
+                        for edge in incoming_edges.get(this_node, {}).values()
+                    ]
+                for related_collection, related_uid in related_node_keys:
+                    if related_collection == other_collection:
+                        related_uids[related_uid] = None
+
+        related_nodes = [
+            cast(_Collection, stored_collection).node(uid, include_embeddings)
+            for uid in related_uids
+        ]
+
+        self._collect_metrics(
+            self._get_related_nodes_calls_counter,
+            self._get_related_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return related_nodes
+
+    async def search_directional_nodes(
+        self,
+        *,
+        collection: str,
+        by_properties: Iterable[str],
+        starting_at: Iterable[OrderedPropertyValue | None],
+        order_ascending: Iterable[bool],
+        include_equal_start: bool = False,
+        limit: int | None = 1,
+        property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Find nodes ordered by property values in a chosen direction."""
+        start_time = time.monotonic()
+
+        by_properties = tuple(by_properties)
+        starting_at = list(starting_at)
+        order_ascending = list(order_ascending)
+
+        if not (len(by_properties) == len(starting_at) == len(order_ascending) > 0):
+            raise ValueError(
+                "Lengths of "
+                "by_properties, starting_at, and order_ascending "
+                "must be equal and greater than 0.",
+            )
+
+        stored_collection = self._collections.get(collection)
+        directional_nodes = (
+            [
+                stored_collection.node(uid, include_embeddings)
+                for uid in NumpyVectorGraphStore._take_matching(
+                    stored_collection,
+                    NumpyVectorGraphStore._scan_directional_uids(
+                        stored_collection.order_index(by_properties),
+                        starting_at,
+                        order_ascending,
+                        include_equal_start,
+                    ),
+                    NumpyVectorGraphStore._compile_filter(property_filter),
+                    limit,
+                )
+            ]
+            if stored_collection is not None
+            else []
+        )
+
+        self._collect_metrics(
+            self._search_directional_nodes_calls_counter,
+            self._search_directional_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return directional_nodes
+
+    @staticmethod
+    def _scan_directional_uids(
+        order_index: _OrderIndex,
+        starting_at: list[OrderedPropertyValue | None],
+        order_ascending: list[bool],
+        include_equal_start: bool,
+    ) -> Iterable[str]:
+        """Iterate over uids following the start in the order of the properties."""
+        # A start value of None matches any value,
+        # so only the values before the first None bound the search.
+        start_length = next(
+            (index for index, value in enumerate(starting_at) if value is None),
+            len(starting_at),
+        )
+        start_key = tuple(
+            cast(_OrderKey, _order_key(value)) for value in starting_at[:start_length]
+        )
+        include_equal_start = include_equal_start or start_length < len(starting_at)
+
+        if all(order_ascending) or not any(order_ascending):
+            return order_index.scan(start_key, order_ascending[0], include_equal_start)
+
+        # Mixed directions cannot be served by a single sorted index.
+        entries = [
+            (key, uid)
+            for key, uid in order_index
+            if _follows_start(key, start_key, order_ascending, include_equal_start)
+        ]
+        for index in reversed(range(len(order_ascending))):
+            entries.sort(
+                key=functools.partial(_entry_order_key, index=index),
+                reverse=not order_ascending[index],
+            )
+        return (uid for _, uid in entries)
+
+    async def search_similar_node_contexts(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: list[float],
+        relation: str,
+        context_collection: str,
+        context_by_properties: Iterable[str],
+        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
+        limit: int | None = 100,
+        max_backward_nodes: int = 1,
+        max_forward_nodes: int = 2,
+        property_filter: FilterExpr | None = None,
+        context_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[NodeContext]:
+        """Search contexts of nodes related to similar nodes."""
+        start_time = time.monotonic()
+
+        context_by_properties = tuple(context_by_properties)
+        if len(context_by_properties) == 0:
+            raise ValueError("context_by_properties must be nonempty")
+
+        stored_collection = self._collections.get(collection)
+        stored_context_collection = self._collections.get(context_collection)
+        if stored_collection is None or stored_context_collection is None:
+            self._collect_metrics(
+                self._search_similar_node_contexts_calls_counter,
+                self._search_similar_node_contexts_latency_summary,
+                start_time,
+                time.monotonic(),
+            )
+            return []
+
+        similar_uids = self._search_similar_uids(
+            stored_collection,
+            embedding_name,
+            query_embedding,
+            similarity_metric,
+            limit,
+            NumpyVectorGraphStore._compile_filter(property_filter),
+        )
+
+        # Related nodes in order of the similarity of their most similar node.
+        node_contexts = self._related_node_contexts(
+            collection=collection,
+            node_uids=similar_uids,
+            relation=relation,
+            context_collection=context_collection,
+            stored_context_collection=stored_context_collection,
+            context_by_properties=context_by_properties,
+            max_backward_nodes=max_backward_nodes,
+            max_forward_nodes=max_forward_nodes,
+            context_property_filter=context_property_filter,
+            include_embeddings=include_embeddings,
+        )
+
+        self._collect_metrics(
+            self._search_similar_node_contexts_calls_counter,
+            self._search_similar_node_contexts_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return node_contexts
+
+    async def get_related_node_contexts(
+        self,
+        *,
+        collection: str,
+        node_uids: Iterable[str],
+        relation: str,
+        context_collection: str,
+        context_by_properties: Iterable[str],
+        max_backward_nodes: int = 1,
+        max_forward_nodes: int = 2,
+        context_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[NodeContext]:
+        """Get contexts of nodes related to the specified nodes."""
+        start_time = time.monotonic()
+
+        context_by_properties = tuple(context_by_properties)
+        if len(context_by_properties) == 0:
+            raise ValueError("context_by_properties must be nonempty")
+
+        stored_context_collection = self._collections.get(context_collection)
+        if stored_context_collection is None:
+            self._collect_metrics(
+                self._get_related_node_contexts_calls_counter,
+                self._get_related_node_contexts_latency_summary,
+                start_time,
+                time.monotonic(),
+            )
+            return []
+
+        node_contexts = self._related_node_contexts(
+            collection=collection,
+            node_uids=node_uids,
+            relation=relation,
+            context_collection=context_collection,
+            stored_context_collection=stored_context_collection,
+            context_by_properties=context_by_properties,
+            max_backward_nodes=max_backward_nodes,
+            max_forward_nodes=max_forward_nodes,
+            context_property_filter=context_property_filter,
+            include_embeddings=include_embeddings,
+        )
+
+        self._collect_metrics(
+            self._get_related_node_contexts_calls_counter,
+            self._get_related_node_contexts_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return node_contexts
+
+    def _related_node_contexts(
+        self,
+        *,
+        collection: str,
+        node_uids: Iterable[str],
+        relation: str,
+        context_collection: str,
+        stored_context_collection: _Collection,
+        context_by_properties: tuple[str, ...],
+        max_backward_nodes: int,
+        max_forward_nodes: int,
+        context_property_filter: FilterExpr | None,
+        include_embeddings: bool,
+    ) -> list[NodeContext]:
+        """Build contexts of related nodes in order of the nodes they relate to."""
+        context_matches = NumpyVectorGraphStore._compile_filter(
+            context_property_filter,
+        )
+
+        related_uids: dict[str, None] = {}
+        relation_edges = self._outgoing_edges.get(relation, {})
+        for node_uid in node_uids:
+            for edge in relation_edges.get((collection, str(node_uid)), {}).values():
+                related_collection, related_uid = edge.target
+                if (
+                    related_collection == context_collection
+                    and related_uid not in related_uids
+                    and (
+                        context_matches is None
+                        or context_matches(
+                            stored_context_collection.properties[related_uid],
+                        )
+                    )
+                ):
+                    related_uids[related_uid] = None
+
+        order_index = stored_context_collection.order_index(context_by_properties)
+
+        def neighbors(uid: str, ascending: bool, max_nodes: int) -> list[Node]:
+            key = order_index.key(stored_context_collection.properties[uid])
+            if key is None:
+                return []
+            return [
+                stored_context_collection.node(neighbor_uid, include_embeddings)
+                for neighbor_uid in NumpyVectorGraphStore._take_matching(
+                    stored_context_collection,
+                    order_index.scan(key, ascending, include_equal_start=False),
+                    context_matches,
+                    max_nodes,
+                )
+            ]
+
+        return [
+            NodeContext(
+                node=stored_context_collection.node(uid, include_embeddings),
+                backward_nodes=neighbors(uid, False, max_backward_nodes),
+                forward_nodes=neighbors(uid, True, max_forward_nodes),
+            )
+            for uid in related_uids
+        ]
+
+    async def search_matching_nodes(
+        self,
+        *,
+        collection: str,
+        limit: int | None = None,
+        property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """Search nodes that match the provided property filters."""
+        start_time = time.monotonic()
+
+        stored_collection = self._collections.get(collection)
+        matching_nodes = (
+            [
+                stored_collection.node(uid, include_embeddings)
+                for uid in NumpyVectorGraphStore._take_matching(
+                    stored_collection,
+                    stored_collection.properties,
+                    NumpyVectorGraphStore._compile_filter(property_filter),
+                    limit,
+                )
+            ]
+            if stored_collection is not None
+            else []
+        )
+
+        self._collect_metrics(
+            self._search_matching_nodes_calls_counter,
+            self._search_matching_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return matching_nodes
+
+    async def get_nodes(
+        self,
+        *,
+        collection: str,
+        node_uids: Iterable[str],
+    ) -> list[Node]:
+        """Retrieve nodes by uid from a specific collection."""
+        start_time = time.monotonic()
+
+        stored_collection = self._collections.get(collection)
+        nodes = (
+            [
+                stored_collection.node(node_uid, include_embeddings=True)
+                for node_uid in dict.fromkeys(map(str, node_uids))
+                if node_uid in stored_collection.properties
+            ]
+            if stored_collection is not None
+            else []
+        )
+
+        self._collect_metrics(
+            self._get_nodes_calls_counter,
+            self._get_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+        return nodes
+
+    async def delete_nodes(
+        self,
+        *,
+        collection: str,
+        node_uids: Iterable[str],
+    ) -> None:
+        """Delete nodes by uid from a collection along with their edges."""
+        start_time = time.monotonic()
+
+        stored_collection = self._collections.get(collection)
+        if stored_collection is not None:
+            for node_uid in node_uids:
+                if stored_collection.remove_node(str(node_uid)):
+                    self._detach_node((collection, str(node_uid)))
+
+        self._collect_metrics(
+            self._delete_nodes_calls_counter,
+            self._delete_nodes_latency_summary,
+            start_time,
+            time.monotonic(),
+        )
+
+    async def delete_all_data(self) -> None:
+        """Delete all nodes and edges."""
+        self._collections.clear()
+        self._outgoing_edges.clear()
+        self._incoming_edges.clear()
+
+    async def close(self) -> None:
+        """Save a snapshot if a snapshot path is configured."""
+        if self._snapshot_path is not None:
+            await self.save_snapshot()
+
+    async def save_snapshot(self) -> None:
+        """
+        Save a snapshot of all nodes and edges to the snapshot path.
+
+        The snapshot is written to a new directory
+        and becomes current only once complete,
+        so an interrupted save leaves the previous snapshot intact.
+        """
+        if self._snapshot_path is None:
+            raise RuntimeError("No snapshot path is configured")
+
+        async with self._save_snapshot_lock:
+            start_time = time.monotonic()
+
+            # Copied synchronously so that the snapshot is consistent.
+            graph, matrices = self._snapshot_state()
+            await asyncio.to_thread(
+                NumpyVectorGraphStore._write_snapshot,
+                self._snapshot_path,
+                graph,
+                matrices,
+            )
+
+            self._collect_metrics(
+                self._save_snapshot_calls_counter,
+                self._save_snapshot_latency_summary,
+                start_time,
+                time.monotonic(),
+            )
+
+    def _has_node(self, node: _NodeKey) -> bool:
+        collection, uid = node
+        stored_collection = self._collections.get(collection)
+        return stored_collection is not None and uid in stored_collection.properties
+
+    def _detach_node(self, node: _NodeKey) -> None:
+        """Delete the edges of a deleted node."""
+        for relation, outgoing_edges in self._outgoing_edges.items():
+            incoming_edges = self._incoming_edges[relation]
+            for edge in outgoing_edges.pop(node, {}).values():
+                NumpyVectorGraphStore._remove_adjacent_edge(
+                    incoming_edges,
+                    edge.target,
+                    edge.uid,
+                )
+            for edge in incoming_edges.pop(node, {}).values():
+                NumpyVectorGraphStore._remove_adjacent_edge(
+                    outgoing_edges,
+                    edge.source,
+                    edge.uid,
+                )
+
+    @staticmethod
+    def _remove_adjacent_edge(
+        adjacent_edges: dict[_NodeKey, dict[str, _StoredEdge]],
+        node: _NodeKey,
+        edge_uid: str,
+    ) -> None:
+        node_edges = adjacent_edges.get(node)
+        if node_edges is None:
+            return
+        node_edges.pop(edge_uid, None)
+        if not node_edges:
+            del adjacent_edges[node]
+
+    @staticmethod
+    def _search_similar_uids(
+        stored_collection: _Collection,
+        embedding_name: str,
+        query_embedding: list[float],
+        similarity_metric: SimilarityMetric,
+        limit: int | None,
+        matches: _PropertiesPredicate | None,
+    ) -> list[str]:
+        """Get the uids of the nodes most similar to the query embedding."""
+        matrix = stored_collection.embeddings.get(embedding_name)
+        if matrix is None or len(matrix.uids) == 0 or limit == 0:
+            return []
+
+        if len(query_embedding) != matrix.dimensions:
+            raise ValueError(
+                f"Query embedding has {len(query_embedding)} dimensions, "
+                f"expected {matrix.dimensions}",
+            )
+
+        similarities = matrix.similarities(
+            np.asarray(query_embedding, dtype=np.float32),
+            similarity_metric,
+        )
+
+        if matches is None and limit is not None and limit < len(similarities):
+            # Only the top rows need to be sorted without a filter.
+            rows = np.argpartition(-similarities, limit - 1)[:limit]
+            rows = rows[np.argsort(-similarities[rows], kind="stable")]
+        else:
+            # The filter is evaluated lazily in order of similarity.
+            rows = np.argsort(-similarities, kind="stable")
+
+        return NumpyVectorGraphStore._take_matching(
+            stored_collection,
+            (matrix.uids[row] for row in rows.tolist()),
+            matches,
+            limit,
+        )
+
+    @staticmethod
+    def _take_matching(
+        stored_collection: _Collection,
+        uids: Iterable[str],
+        matches: _PropertiesPredicate | None,
+        limit: int | None,
+    ) -> list[str]:
+        """Take uids of nodes matching the filter, up to the limit."""
+        matching_uids: list[str] = []
+        if limit is not None and limit <= 0:
+            return matching_uids
+
+        for uid in uids:
+            if matches is None or matches(stored_collection.properties[uid]):
+                matching_uids.append(uid)
+                if len(matching_uids) == limit:
+                    break
+        return matching_uids
+
+    @staticmethod
+    def _compile_filter(
+        property_filter: FilterExpr | None,
+    ) -> _PropertiesPredicate | None:
+        if property_filter is None:
+            return None
+        return compile_predicate(
+            property_filter,
+            NumpyVectorGraphStore._compile_comparison,
+        )
+
+    @staticmethod
+    def _compile_comparison(comparison: Comparison) -> _PropertiesPredicate:
+        """Compile a comparison into a predicate on node or edge properties."""
+        property_name = comparison.field
+        value = comparison.value
+
+        match comparison.op:
+            case "is_null":
+                return lambda properties: properties.get(property_name) is None
+            case "is_not_null":
+                return lambda properties: properties.get(property_name) is not None
+            case "in":
+                if not isinstance(value, list):
+                    raise TypeError("IN comparison requires a list of values")
+                values = value
+                return lambda properties: any(
+                    _compare(properties.get(property_name), in_value, operator.eq)
+                    for in_value in values
+                )
+            case "=" | ">" | "<" | ">=" | "<=":
+                if isinstance(value, list):
+                    raise TypeError(
+                        f"'{comparison.op}' comparison cannot accept list values",
+                    )
+                compare = _ORDER_OPERATORS.get(comparison.op, operator.eq)
+                return lambda properties: _compare(
+                    properties.get(property_name),
+                    value,
+                    compare,
+                )
+        raise ValueError(f"Unsupported operator: {comparison.op}")
+
+    def _snapshot_state(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, tuple[np.ndarray, np.ndarray]]]:
+        collections: dict[str, Any] = {}
+        matrices: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for collection, stored_collection in self._collections.items():
+            embeddings: dict[str, Any] = {}
+            for embedding_name, matrix in stored_collection.embeddings.items():
+                if len(matrix.uids) == 0:
+                    continue
+                file_prefix = f"embeddings_{len(matrices)}"
+                # Memory-mapped matrices are read-only and need no copy.
+                matrices[file_prefix] = (
+                    np.copy(matrix.vectors)
+                    if matrix.vectors.flags.writeable
+                    else matrix.vectors,
+                    np.copy(matrix.norms)
+                    if matrix.norms.flags.writeable
+                    else matrix.norms,
+                )
+                embeddings[embedding_name] = {
+                    "file_prefix": file_prefix,
+                    "uids": list(matrix.uids),
+                    "similarity_metrics": [
+                        similarity_metric.value
+                        for similarity_metric in matrix.similarity_metrics
+                    ],
+                }
+            collections[collection] = {
+                "properties": dict(stored_collection.properties),
+                "embeddings": embeddings,
+            }
+
+        edges = [
+            (
+                relation,
+                edge.uid,
+                edge.source,
+                edge.target,
+                edge.properties,
+                edge.embeddings,
+            )
+            for relation, outgoing_edges in self._outgoing_edges.items()
+            for node_edges in outgoing_edges.values()
+            for edge in node_edges.values()
+        ]
+
+        return {"collections": collections, "edges": edges}, matrices
+
+    @staticmethod
+    def _write_snapshot(
+        snapshot_path: Path,
+        graph: dict[str, Any],
+        matrices: dict[str, tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        snapshot_name = f"snapshot_{uuid.uuid4().hex}"
+        snapshot_directory = snapshot_path / snapshot_name
+        snapshot_directory.mkdir(parents=True)
+
+        for file_prefix, (vectors, norms) in matrices.items():
+            np.save(snapshot_directory / f"{file_prefix}_vectors.npy", vectors)
+            np.save(snapshot_directory / f"{file_prefix}_norms.npy", norms)
+
+        with (snapshot_directory / NumpyVectorGraphStore._GRAPH_FILE_NAME).open(
+            "wb",
+        ) as graph_file:
+            pickle.dump(graph, graph_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        current_file = snapshot_path / NumpyVectorGraphStore._CURRENT_SNAPSHOT_FILE_NAME
+        temporary_current_file = current_file.with_suffix(".tmp")
+        temporary_current_file.write_text(snapshot_name)
+        temporary_current_file.replace(current_file)
+
+        # Memory maps of older snapshots stay valid after their files are removed.
+        for old_snapshot_directory in snapshot_path.glob("snapshot_*"):
+            if old_snapshot_directory.name != snapshot_name:
+                shutil.rmtree(old_snapshot_directory, ignore_errors=True)
+
+    def _load_snapshot(self, snapshot_path: Path) -> None:
+        current_file = snapshot_path / NumpyVectorGraphStore._CURRENT_SNAPSHOT_FILE_NAME
+        if not current_file.exists():
+            return
+
+        snapshot_directory = snapshot_path / current_file.read_text().strip()
+        with (snapshot_directory / NumpyVectorGraphStore._GRAPH_FILE_NAME).open(
+            "rb",
+        ) as graph_file:
+            graph = pickle.load(graph_file)
+
+        for collection, collection_state in graph["collections"].items():
+            stored_collection = _Collection(
+                initial_capacity=self._initial_capacity,
+                properties=collection_state["properties"],
+            )
+            for embedding_name, embedding_state in collection_state[
+                "embeddings"
+            ].items():
+                file_prefix = embedding_state["file_prefix"]
+                stored_collection.embeddings[embedding_name] = _EmbeddingMatrix(
+                    vectors=np.load(
+                        snapshot_directory / f"{file_prefix}_vectors.npy",
+                        mmap_mode="r",
+                    ),
+                    norms=np.load(
+                        snapshot_directory / f"{file_prefix}_norms.npy",
+                        mmap_mode="r",
+                    ),
+                    uids=embedding_state["uids"],
+                    similarity_metrics=[
+                        SimilarityMetric(similarity_metric)
+                        for similarity_metric in embedding_state["similarity_metrics"]
+                    ],
+                )
+            self._collections[collection] = stored_collection
+
+        for relation, edge_uid, source, target, properties, embeddings in graph[
+            "edges"
+        ]:
+            stored_edge = _StoredEdge(
+                uid=edge_uid,
+                source=source,
+                target=target,
+                properties=properties,
+                embeddings=embeddings,
+            )
+            self._outgoing_edges.setdefault(relation, {}).setdefault(source, {})[
+                edge_uid
+            ] = stored_edge
+            self._incoming_edges.setdefault(relation, {}).setdefault(target, {})[
+                edge_uid
+            ] = stored_edge
+
+        logger.info(
+            "Loaded vector graph store snapshot %s with %d collections and %d edges",
+            snapshot_directory,
+            len(self._collections),
+            len(graph["edges"]),
+        )
+
+    def _collect_metrics(
+        self,
+        calls_counter: MetricsFactory.Counter | None,
+        latency_summary: MetricsFactory.Summary | None,
+        start_time: float,
+        end_time: float,
+    ) -> None:
+        """Increment calls and observe latency."""
+        if self._should_collect_metrics:
+            cast(MetricsFactory.Counter, calls_counter).increment(
+                labels=self._user_metrics_labels
+            )
+            cast(MetricsFactory.Summary, latency_summary).observe(
+                value=end_time - start_time,
+                labels=self._user_metrics_labels,
+            )
+
+
+def _type_rank(value: PropertyValue) -> int:
+    """Rank the type of a value, with equal ranks for comparable types."""
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, int | float):
+        return 1
+    if isinstance(value, str):
+        return 2
+    if isinstance(value, datetime):
+        return 3
+    return 4
+
+
+def _order_key(value: PropertyValue) -> _OrderKey | None:
+    """Get the key to order a value by, or None if it cannot be ordered."""
+    if value is None or isinstance(value, list):
+        return None
+    return _type_rank(value), value
+
+
+def _entry_order_key(
+    entry: tuple[tuple[_OrderKey, ...], str],
+    index: int,
+) -> _OrderKey:
+    """Get the order key of an order index entry at a property index."""
+    return entry[0][index]
+
+
+def _compare(
+    value: PropertyValue,
+    other: PropertyValue,
+    compare: Callable[[Any, Any], bool],
+) -> bool:
+    """Compare values like Cypher, where incomparable values never match."""
+    if value is None or other is None or _type_rank(value) != _type_rank(other):
+        return False
+    try:
+        return compare(value, other)
+    except TypeError:
+        # For example, naive and aware datetimes.
+        return False
+
+
+def _follows_start(
+    key: tuple[_OrderKey, ...],
+    start_key: tuple[_OrderKey, ...],
+    order_ascending: list[bool],
+    include_equal_start: bool,
+) -> bool:
+    """Check whether a key follows the start key lexicographically."""
+    for order_key, start_order_key, ascending in zip(
+        key,
+        start_key,
+        order_ascending,
+        strict=False,
+    ):
+        if order_key != start_order_key:
+            return (order_key > start_order_key) == ascending
+    return include_equal_start
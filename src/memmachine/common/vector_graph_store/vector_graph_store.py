@@ -6,14 +6,14 @@ and deleting nodes and edges.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 
 from memmachine.common.data_types import SimilarityMetric
 from memmachine.common.filter.filter_parser import (
     FilterExpr,
 )
 
-from .data_types import Edge, Node, OrderedPropertyValue
+from .data_types import Edge, Node, NodeContext, OrderedPropertyValue
 
 
 class VectorGraphStore(ABC):
@@ -63,6 +63,46 @@ class VectorGraphStore(ABC):
         """
         raise NotImplementedError
 
+    async def add_subgraph(
+        self,
+        *,
+        nodes: Mapping[str, Iterable[Node]],
+        relation: str,
+        source_collection: str,
+        target_collection: str,
+        edges: Iterable[Edge],
+    ) -> None:
+        """
+        Add nodes and edges between them.
+
+        Equivalent to adding the nodes of each collection
+        and then adding the edges,
+        but performed as a single operation where supported.
+
+        Args:
+            nodes (Mapping[str, Iterable[Node]]):
+                Mapping of collection to the nodes to add to it.
+            relation (str):
+                Relation that the edges represent.
+            source_collection (str):
+                Collection that the source nodes belong to.
+            target_collection (str):
+                Collection that the target nodes belong to.
+            edges (Iterable[Edge]):
+                Iterable of Edge objects to add.
+                Their source and target nodes must be among the nodes added.
+
+        """
+        for collection, collection_nodes in nodes.items():
+            await self.add_nodes(collection=collection, nodes=collection_nodes)
+
+        await self.add_edges(
+            relation=relation,
+            source_collection=source_collection,
+            target_collection=target_collection,
+            edges=edges,
+        )
+
     @abstractmethod
     async def search_similar_nodes(
         self,
@@ -73,6 +113,7 @@ class VectorGraphStore(ABC):
         similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
         limit: int | None = 100,
         property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
     ) -> list[Node]:
         """
         Search for nodes with embeddings similar to the query embedding.
@@ -95,6 +136,9 @@ class VectorGraphStore(ABC):
                 Filter expression tree.
                 If None or empty, no property filtering is applied
                 (default: None).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
 
         Returns:
             list[Node]:
@@ -117,6 +161,7 @@ class VectorGraphStore(ABC):
         limit: int | None = None,
         edge_property_filter: FilterExpr | None = None,
         node_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
     ) -> list[Node]:
         """
         Search for nodes related to the specified node via edges.
@@ -152,6 +197,9 @@ class VectorGraphStore(ABC):
                 Filter expression tree for node properties.
                 If None or empty, no property filtering is applied
                 (default: None).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
 
         Returns:
             list[Node]:
@@ -161,6 +209,53 @@ class VectorGraphStore(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uids: Iterable[str],
+        find_sources: bool = True,
+        find_targets: bool = True,
+        include_embeddings: bool = True,
+    ) -> list[Node]:
+        """
+        Get the nodes related to any of the specified nodes via edges.
+
+        Args:
+            relation (str):
+                Relation that the edges represent.
+            other_collection (str):
+                Collection that the related nodes belong to.
+            this_collection (str):
+                Collection that the specified nodes belong to.
+            this_node_uids (Iterable[str]):
+                Iterable of UIDs of the nodes to find related nodes for.
+            find_sources (bool):
+                Whether to return nodes
+                that are sources of edges
+                pointing to the specified nodes
+                (default: True).
+            find_targets (bool):
+                Whether to return nodes
+                that are targets of edges
+                originating from the specified nodes
+                (default: True).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
+
+        Returns:
+            list[Node]:
+                List of distinct Node objects
+                that are related to any of the specified nodes.
+                Order is not guaranteed.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def search_directional_nodes(
         self,
@@ -172,6 +267,7 @@ class VectorGraphStore(ABC):
         include_equal_start: bool = False,
         limit: int | None = 1,
         property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
     ) -> list[Node]:
         """
         Search for nodes ordered by a specific property.
@@ -198,6 +294,9 @@ class VectorGraphStore(ABC):
                 Filter expression tree.
                 If None or empty, no property filtering is applied
                 (default: None).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
 
         Returns:
             list[Node]:
@@ -206,6 +305,146 @@ class VectorGraphStore(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def search_similar_node_contexts(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: list[float],
+        relation: str,
+        context_collection: str,
+        context_by_properties: Iterable[str],
+        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
+        limit: int | None = 100,
+        max_backward_nodes: int = 1,
+        max_forward_nodes: int = 2,
+        property_filter: FilterExpr | None = None,
+        context_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[NodeContext]:
+        """
+        Search for contexts of nodes related to nodes similar to the query embedding.
+
+        Equivalent to searching for similar nodes,
+        following the relation from each similar node
+        to the nodes it targets in the context collection,
+        and searching in both directions from each related node
+        ordered by the context properties,
+        but performed as a single operation.
+
+        Args:
+            collection (str):
+                Collection that the similar nodes belong to.
+            embedding_name (str):
+                The name of the embedding vector property.
+            query_embedding (list[float]):
+                The embedding vector to compare against.
+            relation (str):
+                Relation from the similar nodes to the related nodes.
+            context_collection (str):
+                Collection that the related nodes
+                and their neighbors belong to.
+            context_by_properties (Iterable[str]):
+                Hierarchy of property names to order
+                the context collection by (ascending).
+            similarity_metric (SimilarityMetric):
+                The similarity metric to use
+                (default: SimilarityMetric.COSINE).
+            limit (int | None):
+                Maximum number of similar nodes to match.
+                If None, match as many similar nodes as possible
+                (default: 100).
+            max_backward_nodes (int):
+                Maximum number of neighbors to return
+                that precede each related node
+                (default: 1).
+            max_forward_nodes (int):
+                Maximum number of neighbors to return
+                that follow each related node
+                (default: 2).
+            property_filter (FilterExpr | None):
+                Filter expression tree for the similar nodes.
+                If None or empty, no property filtering is applied
+                (default: None).
+            context_property_filter (FilterExpr | None):
+                Filter expression tree for the related nodes
+                and their neighbors.
+                If None or empty, no property filtering is applied
+                (default: None).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
+
+        Returns:
+            list[NodeContext]:
+                List of NodeContext objects, one per distinct related node,
+                ordered by the similarity of the most similar node
+                related to it.
+                Neighbors are ordered nearest first.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_related_node_contexts(
+        self,
+        *,
+        collection: str,
+        node_uids: Iterable[str],
+        relation: str,
+        context_collection: str,
+        context_by_properties: Iterable[str],
+        max_backward_nodes: int = 1,
+        max_forward_nodes: int = 2,
+        context_property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
+    ) -> list[NodeContext]:
+        """
+        Get contexts of nodes related to the specified nodes.
+
+        Equivalent to search_similar_node_contexts
+        with the specified nodes in place of the similar nodes.
+
+        Args:
+            collection (str):
+                Collection that the specified nodes belong to.
+            node_uids (Iterable[str]):
+                Iterable of UIDs of the nodes, in order of priority.
+            relation (str):
+                Relation from the specified nodes to the related nodes.
+            context_collection (str):
+                Collection that the related nodes
+                and their neighbors belong to.
+            context_by_properties (Iterable[str]):
+                Hierarchy of property names to order
+                the context collection by (ascending).
+            max_backward_nodes (int):
+                Maximum number of neighbors to return
+                that precede each related node
+                (default: 1).
+            max_forward_nodes (int):
+                Maximum number of neighbors to return
+                that follow each related node
+                (default: 2).
+            context_property_filter (FilterExpr | None):
+                Filter expression tree for the related nodes
+                and their neighbors.
+                If None or empty, no property filtering is applied
+                (default: None).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
+
+        Returns:
+            list[NodeContext]:
+                List of NodeContext objects, one per distinct related node,
+                ordered by the first specified node related to it.
+                Neighbors are ordered nearest first.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def search_matching_nodes(
         self,
@@ -213,6 +452,7 @@ class VectorGraphStore(ABC):
         collection: str,
         limit: int | None = None,
         property_filter: FilterExpr | None = None,
+        include_embeddings: bool = True,
     ) -> list[Node]:
         """
         Search for nodes matching the specified properties.
@@ -228,6 +468,9 @@ class VectorGraphStore(ABC):
                 Filter expression tree.
                 If None or empty, no property filtering is applied
                 (default: None).
+            include_embeddings (bool):
+                Whether to return the embeddings of the nodes
+                (default: True).
 
         Returns:
             list[Node]:
@@ -4,7 +4,8 @@ import asyncio
 import datetime
 import json
 import logging
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from contextlib import nullcontext
 from typing import cast
 from uuid import uuid4
 
@@ -24,8 +25,15 @@ from memmachine.common.filter.filter_parser import (
 from memmachine.common.filter.filter_parser import (
     Or as FilterOr,
 )
+from memmachine.common.reranker.bm25_index import BM25Index
+from memmachine.common.reranker.bm25_reranker import bm25_corpus_index
 from memmachine.common.reranker.reranker import Reranker
-from memmachine.common.vector_graph_store import Edge, Node, VectorGraphStore
+from memmachine.common.vector_graph_store import (
+    Edge,
+    Node,
+    NodeContext,
+    VectorGraphStore,
+)
 
 from .data_types import (
     ContentType,
@@ -54,6 +62,17 @@ class DeclarativeMemoryParams(BaseModel):
             Embedder instance for creating embeddings.
         reranker (Reranker):
             Reranker instance for reranking search results.
+        lexical_index (BM25Index | None):
+            BM25Index instance for lexical search over derivatives,
+            dedicated to this session.
+            The index is held in memory by this process:
+            it is loaded from the vector graph store in the background
+            on first use and then updated only by this DeclarativeMemory,
+            so derivatives added or deleted by other processes
+            are not reflected until the index is created again.
+        lexical_index_load_batch_size (int):
+            Number of stored derivatives loaded into the lexical index
+            per query to the vector graph store.
 
     """
 
@@ -77,6 +96,29 @@ class DeclarativeMemoryParams(BaseModel):
         False,
         description="Whether to chunk message episodes into sentences for embedding",
     )
+    lexical_index: InstanceOf[BM25Index] | None = Field(
+        None,
+        description=(
+            "BM25Index instance dedicated to this session "
+            "for lexical search over derivatives alongside vector search. "
+            "The in-memory index is loaded from the store once, "
+            "so changes made by other processes are not reflected. "
+            "If None, only vector search is used"
+        ),
+    )
+    lexical_search_limit: int = Field(
+        20,
+        description="Maximum number of derivatives to match by lexical search",
+        gt=0,
+    )
+    lexical_index_load_batch_size: int = Field(
+        1000,
+        description=(
+            "Number of stored derivatives loaded into the lexical index "
+            "per query to the vector graph store"
+        ),
+        gt=0,
+    )
 
 
 class DeclarativeMemory:
@@ -104,6 +146,13 @@ class DeclarativeMemory:
 
         self._derived_from_relation = f"DERIVED_FROM_{session_id}"
 
+        self._lexical_index = params.lexical_index
+        self._lexical_search_limit = params.lexical_search_limit
+        self._lexical_index_load_batch_size = params.lexical_index_load_batch_size
+        self._lexical_index_load_task: asyncio.Task | None = None
+        # Derivatives deleted while the lexical index is being loaded.
+        self._lexical_index_deleted_uids: set[str] = set()
+
     async def add_episodes(
         self,
         episodes: Iterable[Episode],
@@ -199,25 +248,83 @@ class DeclarativeMemory:
             for derivative in episode_derivatives
         ]
 
-        add_nodes_tasks = [
-            self._vector_graph_store.add_nodes(
-                collection=self._episode_collection,
-                nodes=episode_nodes,
-            ),
-            self._vector_graph_store.add_nodes(
-                collection=self._derivative_collection,
-                nodes=derivative_nodes,
-            ),
-        ]
-        await asyncio.gather(*add_nodes_tasks)
-
-        await self._vector_graph_store.add_edges(
+        await self._vector_graph_store.add_subgraph(
+            nodes={
+                self._episode_collection: episode_nodes,
+                self._derivative_collection: derivative_nodes,
+            },
             relation=self._derived_from_relation,
             source_collection=self._derivative_collection,
             target_collection=self._episode_collection,
             edges=derivative_episode_edges,
         )
 
+        if self._lexical_index is not None:
+            # Derivatives loaded from the store later are not added again.
+            self._start_lexical_index_load(self._lexical_index)
+            await self._lexical_index.add_documents(
+                {derivative.uid: derivative.content for derivative in derivatives},
+            )
+
+    async def wait_for_lexical_index(self) -> None:
+        """Wait until the stored derivatives are loaded into the lexical index."""
+        if self._lexical_index_load_task is not None:
+            await asyncio.shield(self._lexical_index_load_task)
+
+    def _start_lexical_index_load(self, lexical_index: BM25Index) -> None:
+        """
+        Start loading the stored derivatives into the lexical index.
+
+        The derivatives are loaded in batches by a background task,
+        so lexical search serves the derivatives loaded so far.
+        """
+        if self._lexical_index_load_task is None:
+            self._lexical_index_load_task = asyncio.create_task(
+                self._load_lexical_index(lexical_index),
+            )
+
+    async def _load_lexical_index(self, lexical_index: BM25Index) -> None:
+        """Load the stored derivatives into the lexical index in batches."""
+        last_uid: str | None = None
+        try:
+            while True:
+                derivative_nodes = (
+                    await self._vector_graph_store.search_directional_nodes(
+                        collection=self._derivative_collection,
+                        by_properties=("uid",),
+                        starting_at=(last_uid,),
+                        order_ascending=(True,),
+                        limit=self._lexical_index_load_batch_size,
+                        include_embeddings=False,
+                    )
+                )
+                # Derivatives added or deleted since the load started
+                # are already up to date in the index.
+                await lexical_index.add_documents(
+                    {
+                        derivative_node.uid: cast(
+                            "str",
+                            derivative_node.properties["content"],
+                        )
+                        for derivative_node in derivative_nodes
+                        if derivative_node.uid not in lexical_index
+                        and derivative_node.uid not in self._lexical_index_deleted_uids
+                    },
+                )
+                if len(derivative_nodes) < self._lexical_index_load_batch_size:
+                    break
+                last_uid = derivative_nodes[-1].uid
+        except Exception:
+            logger.exception(
+                "Failed to load the lexical index of %s, retrying on next use",
+                self._derivative_collection,
+            )
+            # Derivatives loaded so far are skipped by the next load.
+            self._lexical_index_load_task = None
+            return
+
+        self._lexical_index_deleted_uids.clear()
+
     async def _derive_derivatives(
         self,
         episode: Episode,
@@ -352,60 +459,55 @@ class DeclarativeMemory:
             )
         )[0]
 
-        # Search graph store for vector matches.
-        matched_derivative_nodes = await self._vector_graph_store.search_similar_nodes(
-            collection=self._derivative_collection,
-            embedding_name=(
-                DeclarativeMemory._embedding_name(
-                    self._embedder.model_id,
-                    self._embedder.dimensions,
-                )
-            ),
-            query_embedding=query_embedding,
-            similarity_metric=self._embedder.similarity_metric,
-            limit=100,
-            property_filter=mangled_property_filter,
-        )
-
-        # Get source episodes of matched derivatives.
-        search_derivatives_source_episode_nodes_tasks = [
-            self._vector_graph_store.search_related_nodes(
+        # Search graph store for vector matches,
+        # their source episodes, and the contexts of those episodes.
+        episode_node_contexts = (
+            await self._vector_graph_store.search_similar_node_contexts(
+                collection=self._derivative_collection,
+                embedding_name=(
+                    DeclarativeMemory._embedding_name(
+                        self._embedder.model_id,
+                        self._embedder.dimensions,
+                    )
+                ),
+                query_embedding=query_embedding,
                 relation=self._derived_from_relation,
-                other_collection=self._episode_collection,
-                this_collection=self._derivative_collection,
-                this_node_uid=matched_derivative_node.uid,
-                find_sources=False,
-                find_targets=True,
-                node_property_filter=mangled_property_filter,
+                context_collection=self._episode_collection,
+                context_by_properties=("timestamp", "uid"),
+                similarity_metric=self._embedder.similarity_metric,
+                limit=100,
+                max_backward_nodes=1,
+                max_forward_nodes=2,
+                property_filter=mangled_property_filter,
+                context_property_filter=mangled_property_filter,
+                include_embeddings=False,
             )
-            for matched_derivative_node in matched_derivative_nodes
-        ]
+        )
 
-        # Use a dict instead of a set to preserve order.
-        source_episode_nodes = dict.fromkeys(
-            episode_node
-            for episode_nodes in await asyncio.gather(
-                *search_derivatives_source_episode_nodes_tasks,
+        if self._lexical_index is not None:
+            episode_node_contexts += await self._search_lexical_node_contexts(
+                self._lexical_index,
+                query,
+                excluded_episode_uids={
+                    episode_node_context.node.uid
+                    for episode_node_context in episode_node_contexts
+                },
+                property_filter=mangled_property_filter,
             )
-            for episode_node in episode_nodes
-        )
 
         # Use source episodes as nuclei for contextualization.
         nuclear_episodes = [
-            DeclarativeMemory._episode_from_episode_node(source_episode_node)
-            for source_episode_node in source_episode_nodes
+            DeclarativeMemory._episode_from_episode_node(episode_node_context.node)
+            for episode_node_context in episode_node_contexts
         ]
 
-        contextualize_episode_tasks = [
-            self._contextualize_episode(
-                nuclear_episode,
-                mangled_property_filter=mangled_property_filter,
+        episode_contexts = [
+            DeclarativeMemory._episode_context_from_episode_node_context(
+                episode_node_context,
             )
-            for nuclear_episode in nuclear_episodes
+            for episode_node_context in episode_node_contexts
         ]
 
-        episode_contexts = await asyncio.gather(*contextualize_episode_tasks)
-
         # Rerank episode contexts.
         episode_context_scores = await self._score_episode_contexts(
             query,
@@ -435,55 +537,78 @@ class DeclarativeMemory:
         )
         return unified_scored_episode_context
 
-    async def _contextualize_episode(
+    async def _search_lexical_node_contexts(
         self,
-        nuclear_episode: Episode,
-        max_backward_episodes: int = 1,
-        max_forward_episodes: int = 2,
-        mangled_property_filter: FilterExpr | None = None,
-    ) -> list[Episode]:
-        previous_episode_nodes = (
-            await self._vector_graph_store.search_directional_nodes(
-                collection=self._episode_collection,
-                by_properties=("timestamp", "uid"),
-                starting_at=(
-                    nuclear_episode.timestamp,
-                    str(nuclear_episode.uid),
-                ),
-                order_ascending=(False, False),
-                include_equal_start=False,
-                limit=max_backward_episodes,
-                property_filter=mangled_property_filter,
-            )
+        lexical_index: BM25Index,
+        query: str,
+        *,
+        excluded_episode_uids: set[str],
+        property_filter: FilterExpr | None,
+    ) -> list[NodeContext]:
+        """
+        Search for contexts of episodes with derivatives lexically matching the query.
+
+        Args:
+            lexical_index (BM25Index):
+                The lexical index of the derivatives.
+            query (str):
+                The search query.
+            excluded_episode_uids (set[str]):
+                UIDs of episodes whose contexts are already found.
+            property_filter (FilterExpr | None):
+                Mangled filter expression tree for the episodes.
+
+        Returns:
+            list[NodeContext]:
+                Contexts of the source episodes of the matching derivatives,
+                ordered by the lexical score of the best matching derivative.
+
+        """
+        self._start_lexical_index_load(lexical_index)
+        lexical_matches = await lexical_index.search(
+            query,
+            limit=self._lexical_search_limit,
         )
 
-        next_episode_nodes = await self._vector_graph_store.search_directional_nodes(
-            collection=self._episode_collection,
-            by_properties=("timestamp", "uid"),
-            starting_at=(
-                nuclear_episode.timestamp,
-                str(nuclear_episode.uid),
-            ),
-            order_ascending=(True, True),
-            include_equal_start=False,
-            limit=max_forward_episodes,
-            property_filter=mangled_property_filter,
+        # Episodes are related to derivatives as in vector search,
+        # in order of the lexical score of their best matching derivative.
+        episode_node_contexts = (
+            await self._vector_graph_store.get_related_node_contexts(
+                collection=self._derivative_collection,
+                node_uids=[derivative_uid for derivative_uid, _ in lexical_matches],
+                relation=self._derived_from_relation,
+                context_collection=self._episode_collection,
+                context_by_properties=("timestamp", "uid"),
+                max_backward_nodes=1,
+                max_forward_nodes=2,
+                context_property_filter=property_filter,
+                include_embeddings=False,
+            )
         )
 
-        context = (
+        return [
+            episode_node_context
+            for episode_node_context in episode_node_contexts
+            if episode_node_context.node.uid not in excluded_episode_uids
+        ]
+
+    @staticmethod
+    def _episode_context_from_episode_node_context(
+        episode_node_context: NodeContext,
+    ) -> list[Episode]:
+        """Build a chronological episode context around a nuclear episode."""
+        return (
             [
                 DeclarativeMemory._episode_from_episode_node(episode_node)
-                for episode_node in reversed(previous_episode_nodes)
+                for episode_node in reversed(episode_node_context.backward_nodes)
             ]
-            + [nuclear_episode]
+            + [DeclarativeMemory._episode_from_episode_node(episode_node_context.node)]
             + [
                 DeclarativeMemory._episode_from_episode_node(episode_node)
-                for episode_node in next_episode_nodes
+                for episode_node in episode_node_context.forward_nodes
             ]
         )
 
-        return context
-
     async def _score_episode_contexts(
         self,
         query: str,
@@ -497,7 +622,16 @@ class DeclarativeMemory:
             )
             context_strings.append(context_string)
 
-        episode_context_scores = await self._reranker.score(query, context_strings)
+        # A BM25 reranker weighs terms by their frequency in the whole session.
+        with (
+            bm25_corpus_index(self._lexical_index)
+            if self._lexical_index is not None
+            else nullcontext()
+        ):
+            episode_context_scores = await self._reranker.score(
+                query,
+                context_strings,
+            )
 
         return episode_context_scores
 
@@ -566,44 +700,107 @@ class DeclarativeMemory:
 
         return matching_episodes
 
-    async def delete_episodes(self, uids: Iterable[str]) -> None:
-        """Delete episodes by their UIDs."""
-        uids = list(uids)
+    async def delete_matching_episodes(
+        self,
+        property_filter: FilterExpr | None = None,
+        *,
+        batch_size: int = 1000,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        Delete episodes matching the property filter in batches.
 
-        search_derived_derivative_nodes_tasks = [
-            self._vector_graph_store.search_related_nodes(
-                relation=self._derived_from_relation,
-                other_collection=self._derivative_collection,
-                this_collection=self._episode_collection,
-                this_node_uid=episode_uid,
-                find_sources=True,
-                find_targets=False,
+        Each batch is looked up and deleted on its own,
+        deleting derivatives before their episodes,
+        so an interrupted deletion leaves no orphaned derivatives
+        and can be resumed by calling this method again.
+
+        Args:
+            property_filter (FilterExpr | None):
+                Filter expression tree.
+                If None, all episodes are deleted
+                (default: None).
+            batch_size (int):
+                Maximum number of episodes to delete per batch
+                (default: 1000).
+            progress_callback (Callable[[int], None] | None):
+                Function called after each batch
+                with the number of episodes deleted so far
+                (default: None).
+
+        Returns:
+            int:
+                Number of episodes deleted.
+
+        """
+        mangled_property_filter = DeclarativeMemory._mangle_property_filter(
+            property_filter,
+        )
+
+        num_deleted_episodes = 0
+        while True:
+            episode_nodes = await self._vector_graph_store.search_matching_nodes(
+                collection=self._episode_collection,
+                limit=batch_size,
+                property_filter=mangled_property_filter,
+                include_embeddings=False,
             )
-            for episode_uid in uids
-        ]
+            if len(episode_nodes) == 0:
+                break
 
-        derived_derivative_nodes = [
-            derivative_node
-            for derivative_nodes in await asyncio.gather(
-                *search_derived_derivative_nodes_tasks,
+            await self.delete_episodes(
+                episode_node.uid for episode_node in episode_nodes
             )
-            for derivative_node in derivative_nodes
-        ]
 
-        delete_nodes_tasks = [
-            self._vector_graph_store.delete_nodes(
-                collection=self._episode_collection,
-                node_uids=uids,
-            ),
-            self._vector_graph_store.delete_nodes(
-                collection=self._derivative_collection,
-                node_uids=[
-                    derivative_node.uid for derivative_node in derived_derivative_nodes
-                ],
-            ),
-        ]
+            num_deleted_episodes += len(episode_nodes)
+            if progress_callback is not None:
+                progress_callback(num_deleted_episodes)
+
+            if len(episode_nodes) < batch_size:
+                break
+
+        return num_deleted_episodes
+
+    async def delete_episodes(self, uids: Iterable[str]) -> None:
+        """
+        Delete episodes by their UIDs.
+
+        Derivatives are deleted before the episodes they were derived from,
+        so an interrupted deletion never leaves orphaned derivatives
+        and can be completed by deleting the same episodes again.
+        """
+        uids = list(uids)
+
+        derived_derivative_nodes = await self._vector_graph_store.get_related_nodes(
+            relation=self._derived_from_relation,
+            other_collection=self._derivative_collection,
+            this_collection=self._episode_collection,
+            this_node_uids=uids,
+            find_sources=True,
+            find_targets=False,
+            include_embeddings=False,
+        )
 
-        await asyncio.gather(*delete_nodes_tasks)
+        await self._vector_graph_store.delete_nodes(
+            collection=self._derivative_collection,
+            node_uids=[
+                derivative_node.uid for derivative_node in derived_derivative_nodes
+            ],
+        )
+
+        if self._lexical_index is not None:
+            derivative_uids = [
+                derivative_node.uid for derivative_node in derived_derivative_nodes
+            ]
+            self._lexical_index.remove_documents(derivative_uids)
+            load_task = self._lexical_index_load_task
+            if load_task is not None and not load_task.done():
+                self._lexical_index_deleted_uids.update(derivative_uids)
+
+        await self._vector_graph_store.delete_nodes(
+            collection=self._episode_collection,
+            node_uids=uids,
+        )
 
     @staticmethod
     def _unify_scored_anchored_episode_contexts(
@@ -20,8 +20,8 @@ import datetime
 import json
 import logging
 import time
-from collections.abc import Coroutine, Iterable
-from typing import cast, get_args
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any, cast, get_args
 
 from pydantic import BaseModel, Field, InstanceOf, model_validator
 
@@ -274,15 +274,29 @@ class EpisodicMemory:
             )
         await asyncio.gather(*delete_episodes_coroutines)
 
-    async def delete_session_episodes(self) -> None:
-        """Delete all data from both session and declarative memory for this context."""
+    async def delete_session_episodes(
+        self,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Delete all data from both session and declarative memory for this context.
+
+        Args:
+            progress_callback: Optional function called with the number of
+                long-term memory episodes deleted so far.
+
+        """
         if not self._enabled:
             return
-        tasks = []
+        tasks: list[Coroutine[Any, Any, object]] = []
         if self._short_term_memory:
             tasks.append(self._short_term_memory.clear_memory())
         if self._long_term_memory:
-            tasks.append(self._long_term_memory.delete_matching_episodes())
+            tasks.append(
+                self._long_term_memory.delete_matching_episodes(
+                    progress_callback=progress_callback,
+                )
+            )
         await asyncio.gather(*tasks)
 
     class QueryResponse(BaseModel):
@@ -1,7 +1,7 @@
 """Factory and manager for per-session episodic memory instances."""
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 
 from pydantic import BaseModel, Field, InstanceOf
@@ -266,12 +266,18 @@ class EpisodicMemoryManager:
         finally:
             await self._update_cache(instance, session_key)
 
-    async def delete_episodic_session(self, session_key: str) -> None:
+    async def delete_episodic_session(
+        self,
+        session_key: str,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> None:
         """
         Delete an episodic memory instance and its associated data.
 
         Args:
             session_key: The unique identifier of the session to delete.
+            progress_callback: Optional function called with the number of
+                episodes deleted so far.
 
         """
         async with self._close_lock.read_lock():
@@ -297,7 +303,9 @@ class EpisodicMemoryManager:
                         self._resource_manager,
                     )
                     instance = EpisodicMemory(params)
-                await instance.delete_session_episodes()
+                await instance.delete_session_episodes(
+                    progress_callback=progress_callback,
+                )
                 await instance.close()
                 await self._session_data_manager.delete_session(session_key)
 
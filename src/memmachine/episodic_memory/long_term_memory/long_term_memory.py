@@ -1,6 +1,6 @@
 """Long-term declarative memory coordination."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import cast
 from uuid import uuid4
 
@@ -22,6 +22,7 @@ from memmachine.common.filter.filter_parser import (
     Or as FilterOr,
 )
 from memmachine.common.reranker import Reranker
+from memmachine.common.reranker.bm25_index import BM25Index
 from memmachine.common.vector_graph_store import VectorGraphStore
 from memmachine.episodic_memory.declarative_memory import (
     DeclarativeMemory,
@@ -49,6 +50,9 @@ class LongTermMemoryParams(BaseModel):
             Embedder instance for creating embeddings.
         reranker (Reranker):
             Reranker instance for reranking search results.
+        lexical_index (BM25Index | None):
+            BM25Index instance for lexical search over derivatives,
+            dedicated to this session.
 
     """
 
@@ -72,6 +76,14 @@ class LongTermMemoryParams(BaseModel):
         False,
         description="Whether to chunk message episodes into sentences for embedding",
     )
+    lexical_index: InstanceOf[BM25Index] | None = Field(
+        None,
+        description=(
+            "BM25Index instance dedicated to this session "
+            "for lexical search over derivatives alongside vector search. "
+            "If None, only vector search is used"
+        ),
+    )
 
 
 class LongTermMemory:
@@ -88,6 +100,7 @@ class LongTermMemory:
                 embedder=params.embedder,
                 reranker=params.reranker,
                 message_sentence_chunking=params.message_sentence_chunking,
+                lexical_index=params.lexical_index,
             ),
         )
 
@@ -213,14 +226,12 @@ class LongTermMemory:
     async def delete_matching_episodes(
         self,
         property_filter: FilterExpr | None = None,
-    ) -> None:
-        await self._declarative_memory.delete_episodes(
-            episode.uid
-            for episode in await self._declarative_memory.get_matching_episodes(
-                property_filter=LongTermMemory._sanitize_property_filter(
-                    property_filter
-                ),
-            )
+        *,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> int:
+        return await self._declarative_memory.delete_matching_episodes(
+            property_filter=LongTermMemory._sanitize_property_filter(property_filter),
+            progress_callback=progress_callback,
         )
 
     async def close(self) -> None:
@@ -3,6 +3,11 @@
 from pydantic import InstanceOf
 
 from memmachine.common.configuration.episodic_config import LongTermMemoryConf
+from memmachine.common.reranker.bm25_index import (
+    BM25Index,
+    BM25IndexParams,
+    get_tokenizer,
+)
 from memmachine.common.resource_manager import CommonResourceManager
 
 from .long_term_memory import LongTermMemoryParams
@@ -18,10 +23,23 @@ async def long_term_memory_params_from_config(
     )
     embedder = await resource_manager.get_embedder(config.embedder, validate=True)
     reranker = await resource_manager.get_reranker(config.reranker, validate=True)
+    lexical_index = (
+        BM25Index(
+            BM25IndexParams(
+                tokenize=get_tokenizer(
+                    config.lexical_search_tokenizer,
+                    config.lexical_search_language,
+                ),
+            ),
+        )
+        if config.lexical_search
+        else None
+    )
     return LongTermMemoryParams(
         session_id=config.session_id,
         vector_graph_store=vector_graph_store,
         embedder=embedder,
         reranker=reranker,
         message_sentence_chunking=config.message_sentence_chunking,
+        lexical_index=lexical_index,
     )
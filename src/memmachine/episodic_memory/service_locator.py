@@ -21,6 +21,10 @@ async def episodic_memory_params_from_config(
     resource_manager: InstanceOf[CommonResourceManager],
 ) -> EpisodicMemoryParams:
     """Create EpisodicMemoryParams from configuration and resource manager."""
+    metrics_factory = await resource_manager.get_metrics_factory(
+        config.metrics_factory_id,
+    )
+
     long_term_memory: LongTermMemory | None = None
     if config.long_term_memory and config.long_term_memory_enabled:
         long_term_memory_params = await long_term_memory_params_from_config(
@@ -34,14 +38,13 @@ async def episodic_memory_params_from_config(
         short_term_memory_params = await short_term_memory_params_from_config(
             config.short_term_memory,
             resource_manager,
+            metrics_factory=metrics_factory,
         )
         short_term_memory = await ShortTermMemory.create(short_term_memory_params)
 
     return EpisodicMemoryParams(
         session_key=config.session_key,
-        metrics_factory=await resource_manager.get_metrics_factory(
-            config.metrics_factory_id,
-        ),
+        metrics_factory=metrics_factory,
         long_term_memory=long_term_memory,
         short_term_memory=short_term_memory,
         enabled=config.enabled,
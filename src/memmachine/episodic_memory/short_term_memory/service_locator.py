@@ -3,6 +3,7 @@
 from pydantic import InstanceOf
 
 from memmachine.common.configuration.episodic_config import ShortTermMemoryConf
+from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.resource_manager import CommonResourceManager
 
 from .short_term_memory import ShortTermMemoryParams
@@ -11,6 +12,7 @@ from .short_term_memory import ShortTermMemoryParams
 async def short_term_memory_params_from_config(
     config: ShortTermMemoryConf,
     resource_manager: InstanceOf[CommonResourceManager],
+    metrics_factory: MetricsFactory | None = None,
 ) -> ShortTermMemoryParams:
     """Create ShortTermMemoryParams from configuration and common resources."""
     session_data_manager = await resource_manager.get_session_data_manager()
@@ -20,7 +22,9 @@ async def short_term_memory_params_from_config(
             config.llm_model, validate=True
         ),
         data_manager=session_data_manager,
+        episode_storage=await resource_manager.get_episode_storage(),
         summary_prompt_system=config.summary_prompt_system,
         summary_prompt_user=config.summary_prompt_user,
         message_capacity=config.message_capacity,
+        metrics_factory=metrics_factory,
     )
@@ -13,8 +13,9 @@ import contextlib
 import json
 import logging
 import string
+import time as pytime
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import date, datetime, time
 from typing import cast, get_args
 
@@ -24,9 +25,11 @@ from memmachine.common.data_types import (
     ExternalServiceAPIError,
     FilterablePropertyValue,
 )
-from memmachine.common.episode_store import Episode, EpisodeType
-from memmachine.common.filter.filter_parser import And, Comparison, FilterExpr, Or
+from memmachine.common.episode_store import Episode, EpisodeStorage, EpisodeType
+from memmachine.common.filter.filter_compiler import compile_predicate
+from memmachine.common.filter.filter_parser import Comparison, FilterExpr
 from memmachine.common.language_model import LanguageModel
+from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.session_manager.session_data_manager import SessionDataManager
 
 logger = logging.getLogger(__name__)
@@ -40,9 +43,13 @@ class ShortTermMemoryParams(BaseModel):
         session_key (str): The unique identifier for the session.
         llm_model (LanguageModel): The language model to use for summarization.
         data_manager (SessionDataManager): The session data manager.
+        episode_storage (EpisodeStorage | None): The episode storage
+            to restore recent episodes from.
         summary_prompt_system (str): The system prompt for the summarization.
         summary_prompt_user (str): The user prompt for the summarization.
         message_capacity (int): The maximum number of messages to summarize.
+        metrics_factory (MetricsFactory | None): The metrics factory.
+        user_metrics_labels (dict[str, str]): Labels to attach to the metrics.
 
     """
 
@@ -55,6 +62,10 @@ class ShortTermMemoryParams(BaseModel):
         default=None,
         description="The session data manager",
     )
+    episode_storage: InstanceOf[EpisodeStorage] | None = Field(
+        default=None,
+        description="The episode storage to restore recent episodes from",
+    )
     summary_prompt_system: str = Field(
         ...,
         min_length=1,
@@ -70,6 +81,14 @@ class ShortTermMemoryParams(BaseModel):
         gt=0,
         description="The maximum length of short-term memory",
     )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        default=None,
+        description="An instance of MetricsFactory for collecting usage metrics",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics",
+    )
 
     @field_validator("summary_prompt_user")
     @classmethod
@@ -95,6 +114,13 @@ class ShortTermMemory:
     This class stores a sequence of recent events (episodes) in a deque with a
     fixed capacity. When the memory becomes full (based on the total message length),
     older events are evicted and summarized.
+
+    Summaries are generated by detached background jobs, so reads never wait
+    for the language model. Reads serve the last committed summary together
+    with the episodes currently in memory and the episodes evicted since,
+    which are kept until a summary covering them finishes. Jobs run one after
+    another, and a job only commits its summary if no newer job has committed
+    and the memory has not been cleared since the job was scheduled.
     """
 
     def __init__(
@@ -102,6 +128,7 @@ class ShortTermMemory:
         param: ShortTermMemoryParams,
         summary: str = "",
         episodes: list[Episode] | None = None,
+        last_summarized_seq: int | None = None,
     ) -> None:
         # pylint: disable=too-many-arguments
         # pylint: disable=too-many-positional-arguments
@@ -111,14 +138,43 @@ class ShortTermMemory:
         self._summary_user_prompt = param.summary_prompt_user
         self._summary_system_prompt = param.summary_prompt_system
         self._memory: deque[Episode] = deque()
+        # Evicted episodes with the version of the summary covering them,
+        # served to reads until that summary job finishes.
+        self._evicted: deque[tuple[int, Episode]] = deque()
         self._current_episode_count = 0
         self._max_message_len = param.message_capacity
         self._current_message_len = 0
         self._summary = summary
         self._session_key = param.session_key
         self._summary_task: asyncio.Task | None = None
+        # Version of the latest scheduled and the latest committed summary.
+        self._summary_version = 0
+        self._committed_summary_version = 0
+        # Incremented when the memory is cleared to discard pending summaries.
+        self._generation = 0
         self._closed = False
         self._lock = asyncio.Lock()
+
+        self._episode_storage: EpisodeStorage | None = param.episode_storage
+        # Sequence number of the last episode covered by the restored summary.
+        self._last_summarized_seq = last_summarized_seq
+        self._restore_pending = self._episode_storage is not None
+        self._restore_lock = asyncio.Lock()
+
+        metrics_factory = param.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = dict(param.user_metrics_labels)
+            label_names = self._user_metrics_labels.keys()
+
+            self._summary_wait_latency_summary = metrics_factory.get_summary(
+                "short_term_memory_summary_wait_latency_seconds",
+                "Time from scheduling a short-term memory summary "
+                "until it is committed or discarded in seconds",
+                label_names=label_names,
+            )
         if episodes is not None:
             self._memory.extend(episodes)
             self._current_episode_count = len(episodes)
@@ -127,22 +183,85 @@ class ShortTermMemory:
 
     @classmethod
     async def create(cls, params: ShortTermMemoryParams) -> "ShortTermMemory":
-        """Create a new ShortTermMemory instance."""
+        """
+        Create a new ShortTermMemory instance.
+
+        The summary is restored from the session data manager. Recent
+        episodes are restored from the episode storage on first use.
+        """
         if params.data_manager is not None:
             with contextlib.suppress(ValueError):
                 await params.data_manager.create_tables()
             try:
                 (
                     summary,
-                    _,
+                    last_seq,
                     _,
                 ) = await params.data_manager.get_short_term_memory(params.session_key)
-                # ToDo: Retreive the episodes from raw data storage
-                return ShortTermMemory(params, summary)
+                return ShortTermMemory(
+                    params,
+                    summary,
+                    last_summarized_seq=last_seq,
+                )
             except ValueError:
                 pass
         return ShortTermMemory(params)
 
+    async def _ensure_restored(self, new_episodes: Iterable[Episode] = ()) -> None:
+        """
+        Restore the most recent episodes of the session once.
+
+        Episodes are read from the episode storage in one bounded query,
+        limited to the capacity left after the summary and the episodes
+        already in memory. Episodes after the last summarized sequence
+        number count as not yet summarized.
+
+        Args:
+            new_episodes (Iterable[Episode]):
+                Episodes about to be added, which are already stored
+                and must not be restored (default: ()).
+
+        """
+        if not self._restore_pending:
+            return
+        async with self._restore_lock:
+            if not self._restore_pending:
+                return
+            episode_storage = cast(EpisodeStorage, self._episode_storage)
+            try:
+                latest_episodes = await episode_storage.get_latest_episodes(
+                    self._session_key,
+                    max_content_length=self._max_message_len
+                    - len(self._summary)
+                    - self._current_message_len,
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to restore short-term memory %s", self._session_key
+                )
+                return
+
+            if not self._restore_pending:
+                # Cleared or closed while restoring.
+                return
+            self._restore_pending = False
+
+            known_uids = {episode.uid for episode in self._memory}
+            known_uids.update(episode.uid for episode in new_episodes)
+            restored_episodes = [
+                episode for episode in latest_episodes if episode.uid not in known_uids
+            ]
+            self._memory.extendleft(reversed(restored_episodes))
+            self._current_message_len += sum(
+                len(episode.content) for episode in restored_episodes
+            )
+            self._current_episode_count += sum(
+                1
+                for episode in restored_episodes
+                if self._last_summarized_seq is None
+                or episode.sequence_num > self._last_summarized_seq
+            )
+
     def _is_full(self) -> bool:
         """
         Check if the short-term memory has reached its capacity.
@@ -169,6 +288,7 @@ class ShortTermMemory:
             otherwise.
 
         """
+        await self._ensure_restored(episodes)
         async with self._lock:
             if self._closed:
                 raise RuntimeError(f"Memory is closed {self._session_key}")
@@ -178,15 +298,16 @@ class ShortTermMemory:
             self._current_message_len += sum(len(e.content) for e in episodes)
             full = self._is_full()
             if full:
-                await self._do_evict()
+                self._do_evict()
             return full
 
-    async def _do_evict(self) -> None:
+    def _do_evict(self) -> None:
         """
         Evict episodes to make space while building a summary asynchronously.
 
-        asynchronously. It clears the stats. It keeps as many episode
-        as possible for current capacity.
+        The summary is built by a detached background job, so eviction
+        never waits for the language model. It clears the stats. It keeps
+        as many episode as possible for current capacity.
         """
         result = []
         # Remove old messages that have been summarized
@@ -195,7 +316,10 @@ class ShortTermMemory:
             and self._current_message_len + len(self._summary) > self._max_message_len
         ):
             self._current_message_len -= len(self._memory[0].content)
-            self._memory.popleft()
+            episode = self._memory.popleft()
+            if self._summary_version > self._committed_summary_version:
+                # Not in the committed summary yet.
+                self._evicted.append((self._summary_version, episode))
 
         if (
             len(self._memory) == 0
@@ -206,45 +330,74 @@ class ShortTermMemory:
         result = list(self._memory)
         # Reset the count so it will only count new episodes
         self._current_episode_count = 0
-        # if previous summary task is still running, wait for it
-        if self._summary_task is not None:
-            await self._summary_task
-        self._summary_task = asyncio.create_task(self._create_summary(result))
+        self._summary_version += 1
+        # The job runs after the previous one to roll over its summary.
+        self._summary_task = asyncio.create_task(
+            self._create_summary(
+                result,
+                previous_task=self._summary_task,
+                version=self._summary_version,
+                generation=self._generation,
+                scheduled_time=pytime.monotonic(),
+            ),
+        )
+
+    async def wait_for_summary(self) -> None:
+        """Wait until all scheduled summaries have been committed or discarded."""
+        summary_task = self._summary_task
+        # Jobs may be scheduled while waiting; the latest one runs last.
+        while summary_task is not None and not summary_task.done():
+            await asyncio.shield(summary_task)
+            summary_task = self._summary_task
 
     async def close(self) -> None:
         """
         Clear all events and the summary from the short-term memory.
 
+        Waits for scheduled summaries to be persisted before clearing.
         Resets the message length to zero.
         """
         async with self._lock:
             if self._closed:
                 return
             self._closed = True
-            if self._summary_task is not None:
-                await self._summary_task
-            self._summary_task = None
-            self._memory.clear()
-            self._current_episode_count = 0
-            self._current_message_len = 0
-            self._summary = ""
+            await self.wait_for_summary()
+            await self._reset()
 
     async def clear_memory(self) -> None:
-        """Clear all events and summary. Reset the message length to zero."""
+        """
+        Clear all events and summary. Reset the message length to zero.
+
+        Scheduled summaries are discarded instead of waited for.
+        """
         async with self._lock:
             if self._closed:
                 return
-            if self._summary_task is not None:
-                await self._summary_task
-            self._summary_task = None
-            self._memory.clear()
-            self._current_episode_count = 0
-            self._current_message_len = 0
-            self._summary = ""
+            await self._reset()
+
+    async def _reset(self) -> None:
+        """Clear all events and summary, cancelling scheduled summaries."""
+        self._generation += 1
+        summary_task = self._summary_task
+        self._summary_task = None
+        if summary_task is not None and not summary_task.done():
+            # Cancelling the latest job also cancels the jobs it waits for.
+            summary_task.cancel()
+            await asyncio.wait([summary_task])
+        self._restore_pending = False
+        self._memory.clear()
+        self._evicted.clear()
+        self._current_episode_count = 0
+        self._current_message_len = 0
+        self._summary = ""
 
     async def delete_episode(self, uid: str) -> bool:
         """Delete one episode by UID."""
         async with self._lock:
+            for evicted in self._evicted:
+                if evicted[1].uid == uid:
+                    self._evicted.remove(evicted)
+                    return True
             for index, episode in enumerate(self._memory):
                 if episode.uid == uid:
                     if index >= len(self._memory) - self._current_episode_count:
@@ -255,7 +408,14 @@ class ShortTermMemory:
                     return True
             return False
 
-    async def _create_summary(self, episodes: list[Episode]) -> None:
+    async def _create_summary(
+        self,
+        episodes: list[Episode],
+        previous_task: asyncio.Task | None,
+        version: int,
+        generation: int,
+        scheduled_time: float,
+    ) -> None:
         """
         Generate a new summary of the events currently in memory.
 
@@ -263,7 +423,43 @@ class ShortTermMemory:
         exists, it creates a "rolling" summary that incorporates the previous
         summary and the new episodes. It uses the configured language model
         and prompts to generate the summary.
+
+        The summary is only committed if it is newer than the committed
+        summary and the memory has not been cleared since it was scheduled.
+        Reads are served the previous summary and the evicted episodes until
+        then, so the time from scheduling until the summary is committed or
+        discarded is recorded.
         """
+        try:
+            await self._build_summary(episodes, previous_task, version, generation)
+        finally:
+            if generation == self._generation:
+                self._drop_evicted(version)
+            if self._collect_metrics:
+                self._summary_wait_latency_summary.observe(
+                    value=pytime.monotonic() - scheduled_time,
+                    labels=self._user_metrics_labels,
+                )
+
+    def _drop_evicted(self, version: int) -> None:
+        """Stop serving the evicted episodes covered by the summary version."""
+        while self._evicted and self._evicted[0][0] <= version:
+            self._evicted.popleft()
+
+    async def _build_summary(
+        self,
+        episodes: list[Episode],
+        previous_task: asyncio.Task | None,
+        version: int,
+        generation: int,
+    ) -> None:
+        if previous_task is not None:
+            try:
+                await previous_task
+            except Exception:
+                logger.exception("Previous summary failed %s", self._session_key)
+        if generation != self._generation:
+            return
         try:
             approximate_characters_per_word = 8
             max_summary_length_words = int(
@@ -281,16 +477,25 @@ class ShortTermMemory:
                 system_prompt=self._summary_system_prompt,
                 user_prompt=msg,
             )
-            self._summary = result[0]
+            if (
+                generation != self._generation
+                or version <= self._committed_summary_version
+            ):
+                logger.debug("Discarding stale summary version %d", version)
+                return
+            summary = result[0]
+            self._summary = summary
+            self._committed_summary_version = version
+            self._drop_evicted(version)
             if self._data_manager is not None:
                 await self._data_manager.save_short_term_memory(
                     self._session_key,
-                    self._summary,
+                    summary,
                     episodes[-1].sequence_num,
                     len(episodes),
                 )
 
-            logger.debug("Summary: %s\n", self._summary)
+            logger.debug("Summary: %s\n", summary)
         except ExternalServiceAPIError:
             logger.info("External API error when creating summary")
         except ValueError:
@@ -338,8 +543,8 @@ class ShortTermMemory:
         """Format the time as a string."""
         return time.strftime("%I:%M %p")
 
+    @staticmethod
     def _safe_compare(
-        self,
         a: FilterablePropertyValue,
         b: FilterablePropertyValue | list[FilterablePropertyValue],
         op: str,
@@ -379,8 +584,9 @@ class ShortTermMemory:
                 logger.warning("Unsupported operator: %s", op)
                 return False
 
+    @staticmethod
     def _do_comparision(
-        self, comp: Comparison, value: FilterablePropertyValue | None
+        comp: Comparison, value: FilterablePropertyValue | None
     ) -> bool:
         """Do comparison for a single comparison expression."""
         match comp.op:
@@ -400,42 +606,30 @@ class ShortTermMemory:
                 return value is None
         if value is None or comp.value is None:
             return False
-        return self._safe_compare(value, comp.value, comp.op)
+        return ShortTermMemory._safe_compare(value, comp.value, comp.op)
 
-    def _do_logical_check(self, episode: Episode, filters: FilterExpr) -> bool:
-        """Do logical check for AND/OR expressions."""
-        if isinstance(filters, And):
-            if self._check_filter(episode, filters.left) is False:
-                return False
-            return self._check_filter(episode, filters.right)
-
-        if isinstance(filters, Or):
-            or_filter = cast(Or, filters)
-            if self._check_filter(episode, or_filter.left) is True:
-                return True
-            return self._check_filter(episode, or_filter.right)
-        logger.warning("Unsupported logical filter: %s", type(filters).__name__)
-        return False
-
-    def _check_filter(self, episode: Episode, filters: FilterExpr | None) -> bool:
-        """Check if an episode matches the given filters."""
-        if filters is None:
-            return True
-
-        if isinstance(filters, Comparison):
-            match filters.field:
-                case "producer_id":
-                    return self._do_comparision(filters, episode.producer_id)
-                case "produced_for_id":
-                    return self._do_comparision(filters, episode.produced_for_id)
-                case "producer_role":
-                    return self._do_comparision(filters, episode.producer_role)
-            if filters.field.startswith(("m.", "metadata.")):
-                key = (
-                    filters.field[9:]
-                    if filters.field.startswith("metadata.")
-                    else filters.field[2:]
+    @staticmethod
+    def _compile_comparison(comp: Comparison) -> Callable[[Episode], bool]:
+        """Compile a comparison into a predicate on episodes."""
+        match comp.field:
+            case "producer_id":
+                return lambda episode: ShortTermMemory._do_comparision(
+                    comp, episode.producer_id
+                )
+            case "produced_for_id":
+                return lambda episode: ShortTermMemory._do_comparision(
+                    comp, episode.produced_for_id
                 )
+            case "producer_role":
+                return lambda episode: ShortTermMemory._do_comparision(
+                    comp, episode.producer_role
+                )
+        if comp.field.startswith(("m.", "metadata.")):
+            key = (
+                comp.field[9:] if comp.field.startswith("metadata.") else comp.field[2:]
+            )
+
+            def _check_metadata(episode: Episode) -> bool:
                 if episode.metadata is None or not isinstance(episode.metadata, dict):
                     return False
                 if key not in episode.metadata:
@@ -444,13 +638,13 @@ class ShortTermMemory:
                     episode.metadata[key], get_args(FilterablePropertyValue)
                 ):
                     return False
-                return self._do_comparision(
-                    filters, cast(FilterablePropertyValue, episode.metadata[key])
+                return ShortTermMemory._do_comparision(
+                    comp, cast(FilterablePropertyValue, episode.metadata[key])
                 )
-            logger.warning("Unsupported filter field: %s", filters.field)
-            return False
 
-        return self._do_logical_check(episode, filters)
+            return _check_metadata
+        logger.warning("Unsupported filter field: %s", comp.field)
+        return lambda _: False
 
     async def get_short_term_memory_context(
         self,
@@ -463,7 +657,8 @@ class ShortTermMemory:
         Retrieve context from short-term memory for a given query.
 
         This includes the current summary and as many recent episodes as can
-        fit within a specified message length limit.
+        fit within a specified message length limit. The context is read from
+        a snapshot without waiting for summaries that are being generated.
 
         Args:
             query: The user's query string.
@@ -477,30 +672,35 @@ class ShortTermMemory:
 
         """
         logger.debug("Get session for %s", query)
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError(f"Memory is closed {self._session_key}")
-            if self._summary_task is not None:
-                await self._summary_task
-                self._summary_task = None
-            length = 0 if self._summary is None else len(self._summary)
-            episodes: deque[Episode] = deque()
-
-            for e in reversed(self._memory):
-                if length >= max_message_length > 0:
-                    break
-                if len(episodes) >= limit > 0:
-                    break
-                # check if should filter the message
-                if self._check_filter(e, filters) is False:
-                    continue
-
-                msg_len = self._compute_episode_length(e)
-                if length + msg_len > max_message_length > 0:
-                    break
-                episodes.appendleft(e)
-                length += msg_len
-            return list(episodes), self._summary
+        if self._closed:
+            raise RuntimeError(f"Memory is closed {self._session_key}")
+        await self._ensure_restored()
+        summary = self._summary
+        memory = (*(episode for _, episode in self._evicted), *self._memory)
+
+        length = 0 if summary is None else len(summary)
+        episodes: deque[Episode] = deque()
+        matches_filter = (
+            None
+            if filters is None
+            else compile_predicate(filters, ShortTermMemory._compile_comparison)
+        )
+
+        for e in reversed(memory):
+            if length >= max_message_length > 0:
+                break
+            if len(episodes) >= limit > 0:
+                break
+            # check if should filter the message
+            if matches_filter is not None and not matches_filter(e):
+                continue
+
+            msg_len = self._compute_episode_length(e)
+            if length + msg_len > max_message_length > 0:
+                break
+            episodes.appendleft(e)
+            length += msg_len
+        return list(episodes), summary
 
     def _compute_episode_length(self, episode: Episode) -> int:
         """Compute the message length in an episode."""
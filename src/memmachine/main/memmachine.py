@@ -3,7 +3,8 @@
 import asyncio
 import logging
 from asyncio import Task
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine
+from enum import Enum
 from typing import Any, Final, Protocol, cast
 
 from pydantic import BaseModel, InstanceOf, ValidationError
@@ -16,7 +17,12 @@ from memmachine.common.configuration.episodic_config import (
     LongTermMemoryConfPartial,
     ShortTermMemoryConfPartial,
 )
-from memmachine.common.episode_store import Episode, EpisodeEntry, EpisodeIdT
+from memmachine.common.episode_store import (
+    Episode,
+    EpisodeCursor,
+    EpisodeEntry,
+    EpisodeIdT,
+)
 from memmachine.common.errors import ConfigurationError, SessionNotFoundError
 from memmachine.common.filter.filter_parser import (
     And as FilterAnd,
@@ -43,6 +49,25 @@ logger = logging.getLogger(__name__)
 
 ALL_MEMORY_TYPES: Final[list[MemoryType]] = list(MemoryType)
 
+MAX_SESSION_DELETIONS: Final[int] = 1000
+
+
+class SessionDeletionStatus(Enum):
+    """Status of a session deletion running in the background."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SessionDeletion(BaseModel):
+    """Progress of a session deletion running in the background."""
+
+    session_key: str
+    status: SessionDeletionStatus = SessionDeletionStatus.RUNNING
+    deleted_episodes: int = 0
+    error: str | None = None
+
 
 class MemMachine:
     """MemMachine class."""
@@ -78,6 +103,8 @@ class MemMachine:
             self._resources = ResourceManagerImpl(conf)
         self._initialize_default_episodic_configuration()
         self._started = False
+        self._session_deletions: dict[str, SessionDeletion] = {}
+        self._session_deletion_tasks: dict[str, Task] = {}
 
     def _initialize_default_episodic_configuration(self) -> None:
         # initialize the default value for episodic memory configuration
@@ -124,6 +151,11 @@ class MemMachine:
         await semantic_service.start()
 
     async def stop(self) -> None:
+        session_deletion_tasks = list(self._session_deletion_tasks.values())
+        for task in session_deletion_tasks:
+            task.cancel()
+        await asyncio.gather(*session_deletion_tasks, return_exceptions=True)
+
         if not self._started:
             return
         self._started = False
@@ -191,7 +223,11 @@ class MemMachine:
         session_data_manager = await self._resources.get_session_data_manager()
         return await session_data_manager.get_session_info(session_key)
 
-    async def delete_session(self, session_data: SessionData) -> None:
+    async def delete_session(
+        self,
+        session_data: SessionData,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> None:
         session = await self.get_session(session_data.session_key)
         if session is None:
             raise SessionNotFoundError(session_data.session_key)
@@ -213,7 +249,8 @@ class MemMachine:
             )
 
             await episodic_memory_manager.delete_episodic_session(
-                session_key=session_data.session_key
+                session_key=session_data.session_key,
+                progress_callback=progress_callback,
             )
 
         async def _delete_semantic_memory() -> None:
@@ -236,6 +273,88 @@ class MemMachine:
 
         await asyncio.gather(*tasks)
 
+    async def start_session_deletion(
+        self,
+        session_data: SessionData,
+    ) -> SessionDeletion:
+        """
+        Start deleting a session in the background.
+
+        Episodes are deleted in batches, so the progress of the deletion
+        is reported by the returned SessionDeletion as it runs.
+        If the session is already being deleted,
+        the running deletion is returned instead of starting another one.
+
+        Raises:
+            SessionNotFoundError: If the session does not exist.
+
+        """
+        session_key = session_data.session_key
+
+        deletion = self._session_deletions.get(session_key)
+        if deletion is not None and deletion.status == SessionDeletionStatus.RUNNING:
+            return deletion
+
+        if await self.get_session(session_key) is None:
+            raise SessionNotFoundError(session_key)
+
+        # Another deletion may have started while checking the session.
+        deletion = self._session_deletions.get(session_key)
+        if deletion is not None and deletion.status == SessionDeletionStatus.RUNNING:
+            return deletion
+
+        deletion = SessionDeletion(session_key=session_key)
+        self._session_deletions.pop(session_key, None)
+        self._session_deletions[session_key] = deletion
+        self._prune_session_deletions()
+
+        task = asyncio.create_task(self._run_session_deletion(session_data, deletion))
+        self._session_deletion_tasks[session_key] = task
+        task.add_done_callback(
+            lambda _: self._session_deletion_tasks.pop(session_key, None)
+        )
+        return deletion
+
+    def get_session_deletion(self, session_key: str) -> SessionDeletion | None:
+        """
+        Get the latest background deletion of a session, if any.
+
+        Deletions are tracked in memory by this instance only,
+        so deletions started by another process are not known.
+        """
+        return self._session_deletions.get(session_key)
+
+    async def _run_session_deletion(
+        self,
+        session_data: SessionData,
+        deletion: SessionDeletion,
+    ) -> None:
+        def _report_progress(deleted_episodes: int) -> None:
+            deletion.deleted_episodes = deleted_episodes
+
+        try:
+            await self.delete_session(session_data, progress_callback=_report_progress)
+        except Exception as e:
+            logger.exception("Failed to delete session %s", deletion.session_key)
+            deletion.status = SessionDeletionStatus.FAILED
+            deletion.error = str(e)
+        else:
+            deletion.status = SessionDeletionStatus.COMPLETED
+
+    def _prune_session_deletions(self) -> None:
+        # Forget the oldest finished deletions beyond the limit.
+        num_excess_deletions = len(self._session_deletions) - MAX_SESSION_DELETIONS
+        if num_excess_deletions <= 0:
+            return
+
+        finished_session_keys = [
+            session_key
+            for session_key, deletion in self._session_deletions.items()
+            if deletion.status != SessionDeletionStatus.RUNNING
+        ]
+        for session_key in finished_session_keys[:num_excess_deletions]:
+            del self._session_deletions[session_key]
+
     async def search_sessions(
         self,
         search_filter: FilterExpr | None = None,
@@ -405,8 +524,12 @@ class MemMachine:
         search_filter: str | None = None,
         page_size: int | None = None,
         page_num: int | None = None,
+        episodic_cursor: str | None = None,
     ) -> ListResults:
         search_filter_expr = parse_filter(search_filter) if search_filter else None
+        episode_cursor = (
+            EpisodeCursor.decode(episodic_cursor) if episodic_cursor else None
+        )
 
         episodic_task: Task | None = None
         semantic_task: Task | None = None
@@ -425,7 +548,8 @@ class MemMachine:
             episodic_task = asyncio.create_task(
                 episode_storage.get_episode_messages(
                     page_size=page_size,
-                    page_num=page_num,
+                    page_num=None if episode_cursor is not None else page_num,
+                    cursor=episode_cursor,
                     filter_expr=combined_filter,
                 )
             )
@@ -411,6 +411,7 @@ class Memory:
         page_num: int = 0,
         filter_dict: dict[str, str] | None = None,
         timeout: int | None = None,
+        episodic_cursor: str | None = None,
     ) -> ListResult:
         """
         List memories in this project (v2 API).
@@ -423,6 +424,9 @@ class Memory:
             page_num: Page number (0-based)
             filter_dict: Optional extra filters; merged with built-in context filters
             timeout: Request timeout override
+            episodic_cursor: Cursor returned with the previous page of
+                episodic memories (episodic_memory_next_cursor); listing
+                continues after it and page_num is ignored
 
         Returns:
             ListResult object containing list results
@@ -445,6 +449,7 @@ class Memory:
             project_id=self.__project_id,
             page_size=page_size,
             page_num=page_num,
+            episodic_cursor=episodic_cursor,
             filter=filter_str,
             type=memory_type,
         )
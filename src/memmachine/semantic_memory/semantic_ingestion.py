@@ -6,13 +6,17 @@ import logging
 from itertools import chain
 
 import numpy as np
-from pydantic import BaseModel, InstanceOf, TypeAdapter
+from pydantic import BaseModel, Field, InstanceOf, TypeAdapter
 
 from memmachine.common.embedder import Embedder
 from memmachine.common.episode_store import Episode, EpisodeIdT, EpisodeStorage
 from memmachine.common.filter.filter_parser import And, Comparison
+from memmachine.common.request_scheduler import (
+    RequestPriority,
+    estimate_token_count,
+    request_priority,
+)
 from memmachine.semantic_memory.semantic_llm import (
-    LLMReducedFeature,
     llm_consolidate_features,
     llm_feature_update,
 )
@@ -46,7 +50,8 @@ class IngestionService:
     Processes un-ingested history for each set_id and updates semantic features.
 
     The service pulls pending messages, invokes the LLM to generate mutation commands,
-    applies the resulting changes, and optionally consolidates redundant memories.
+    and applies the resulting changes. Sections with added features are consolidated
+    separately by consolidate_set once they reach the consolidation threshold.
     """
 
     class Params(BaseModel):
@@ -56,6 +61,7 @@ class IngestionService:
         history_store: InstanceOf[EpisodeStorage]
         resource_retriever: InstanceOf[ResourceRetriever]
         consolidated_threshold: int = 20
+        batch_token_budget: int | None = Field(default=None, gt=0)
         debug_fail_loudly: bool = False
 
     def __init__(self, params: Params) -> None:
@@ -64,15 +70,19 @@ class IngestionService:
         self._history_store = params.history_store
         self._resource_retriever = params.resource_retriever
         self._consolidation_threshold = params.consolidated_threshold
+        self._batch_token_budget = params.batch_token_budget
         self._debug_fail_loudly = params.debug_fail_loudly
 
     async def process_set_ids(self, set_ids: list[SetIdT]) -> None:
         logger.info("Starting ingestion processing for set ids: %s", set_ids)
 
-        results = await asyncio.gather(
-            *[self._process_single_set(set_id) for set_id in set_ids],
-            return_exceptions=True,
-        )
+        # Ingestion runs in the background,
+        # so its model calls yield to interactive requests.
+        with request_priority(RequestPriority.BACKGROUND):
+            results = await asyncio.gather(
+                *[self._process_single_set(set_id) for set_id in set_ids],
+                return_exceptions=True,
+            )
 
         errors = [r for r in results if isinstance(r, Exception)]
         if len(errors) > 0:
@@ -122,37 +132,38 @@ class IngestionService:
             logger.debug("No uningested messages for set_id %s, skipping", set_id)
             return
 
-        raw_messages = await asyncio.gather(
-            *[self._history_store.get_episode(h_id) for h_id in history_ids],
-        )
+        raw_messages = await self._history_store.get_episodes(history_ids)
 
-        if len(raw_messages) != len([m for m in raw_messages if m is not None]):
+        if len(raw_messages) != len(history_ids):
             raise ValueError("Failed to retrieve messages. Invalid history_ids")
 
         messages = TypeAdapter(list[Episode]).validate_python(raw_messages)
 
         logger.info("Processing %d messages for set %s", len(messages), set_id)
 
+        for message in messages:
+            if message.uid is None:
+                logger.error("Message ID is None for message %s", message.model_dump())
+
+                raise ValueError(
+                    "Message ID is None for message %s",
+                    message.model_dump(),
+                )
+
+        message_windows = self._window_messages(messages)
+
         async def process_semantic_type(
             semantic_category: InstanceOf[SemanticCategory],
         ) -> None:
             logger.debug(
-                "Processing semantic category '%s' for set_id %s with %d messages",
+                "Processing semantic category '%s' for set_id %s "
+                "with %d messages in %d windows",
                 semantic_category.name,
                 set_id,
                 len(messages),
+                len(message_windows),
             )
-            for message in messages:
-                if message.uid is None:
-                    logger.error(
-                        "Message ID is None for message %s", message.model_dump()
-                    )
-
-                    raise ValueError(
-                        "Message ID is None for message %s",
-                        message.model_dump(),
-                    )
-
+            for window in message_windows:
                 filter_expr = And(
                     left=Comparison(field="set_id", op="=", value=set_id),
                     right=Comparison(
@@ -170,23 +181,27 @@ class IngestionService:
                     semantic_category.name,
                 )
 
+                window_ids = [message.uid for message in window]
+
                 try:
                     commands = await llm_feature_update(
                         features=features,
-                        message_content=message.content,
+                        message_content="\n\n".join(
+                            message.content for message in window
+                        ),
                         model=resources.language_model,
                         update_prompt=semantic_category.prompt.update_prompt,
                     )
                     logger.debug(
-                        "LLM generated %d commands for message %s, category %s",
+                        "LLM generated %d commands for messages %s, category %s",
                         len(commands),
-                        message.uid,
+                        window_ids,
                         semantic_category.name,
                     )
                 except Exception:
                     logger.exception(
-                        "Failed to process message %s for semantic type %s",
-                        message.uid,
+                        "Failed to process messages %s for semantic type %s",
+                        window_ids,
                         semantic_category.name,
                     )
                     if self._debug_fail_loudly:
@@ -198,17 +213,17 @@ class IngestionService:
                     commands=commands,
                     set_id=set_id,
                     category_name=semantic_category.name,
-                    citation_id=message.uid,
+                    citation_ids=window_ids,
                     embedder=resources.embedder,
                 )
                 logger.debug(
-                    "Applied %d commands for message %s, category %s",
+                    "Applied %d commands for messages %s, category %s",
                     len(commands),
-                    message.uid,
+                    window_ids,
                     semantic_category.name,
                 )
 
-                mark_messages.append(message.uid)
+                mark_messages.extend(window_ids)
 
         mark_messages: list[EpisodeIdT] = []
         semantic_category_runners = []
@@ -238,39 +253,138 @@ class IngestionService:
         # Note: Messages are already marked as ingested atomically when claimed
         # via get_history_messages(). No need to mark them again here.
 
-        logger.debug("Starting consolidation for set_id %s", set_id)
-        await self._consolidate_set_memories_if_applicable(
-            set_id=set_id,
-            resources=resources,
+    async def has_unconsolidated_sections(self, set_id: SetIdT) -> bool:
+        """Return whether features were added to the set since its consolidation."""
+        return bool(
+            await self._semantic_storage.get_unconsolidated_set_ids(set_ids=[set_id])
         )
 
+    async def consolidate_set(self, set_id: SetIdT) -> None:
+        """
+        Consolidate the sections of the set changed since its last consolidation.
+
+        Sections with fewer features than the consolidation threshold
+        are not sent to the LLM.
+
+        Args:
+            set_id (SetIdT):
+                The set to consolidate.
+
+        """
+        # Sections are tracked in the storage, so that they survive restarts
+        # and are consolidated by a single process.
+        sections = set(
+            await self._semantic_storage.claim_unconsolidated_sections(set_id)
+        )
+        if not sections:
+            return
+
+        logger.debug("Starting consolidation for set_id %s", set_id)
+        resources = self._resource_retriever.get_resources(set_id)
+
+        # Consolidation yields to ingestion and interactive requests.
+        with request_priority(RequestPriority.MAINTENANCE):
+            try:
+                await self._consolidate_set_memories_if_applicable(
+                    set_id=set_id,
+                    resources=resources,
+                    sections=sections,
+                )
+            except Exception:
+                # The sections are consolidated again in the next attempt.
+                await self._semantic_storage.add_unconsolidated_sections(
+                    set_id,
+                    list(sections),
+                )
+                raise
+
+    def _window_messages(self, messages: list[Episode]) -> list[list[Episode]]:
+        """
+        Group consecutive messages into windows for the LLM feature update.
+
+        Without a batch token budget, each message is its own window.
+        Otherwise, consecutive messages are added to a window
+        while their estimated token count stays within the budget.
+        A message exceeding the budget on its own gets its own window.
+        """
+        if self._batch_token_budget is None:
+            return [[message] for message in messages]
+
+        windows: list[list[Episode]] = []
+        window: list[Episode] = []
+        window_token_count = 0
+        for message in messages:
+            message_token_count = estimate_token_count(message.content)
+            if (
+                window
+                and window_token_count + message_token_count > self._batch_token_budget
+            ):
+                windows.append(window)
+                window = []
+                window_token_count = 0
+
+            window.append(message)
+            window_token_count += message_token_count
+
+        if window:
+            windows.append(window)
+
+        return windows
+
     async def _apply_commands(
         self,
         *,
         commands: list[SemanticCommand],
         set_id: SetIdT,
         category_name: str,
-        citation_id: EpisodeIdT | None,
+        citation_ids: list[EpisodeIdT],
         embedder: InstanceOf[Embedder],
     ) -> None:
+        add_values = [
+            command.value
+            for command in commands
+            if command.command == SemanticCommandType.ADD
+        ]
+        add_embeddings = (
+            iter(await embedder.ingest_embed(add_values)) if add_values else iter([])
+        )
+
+        # Consecutive additions are written together,
+        # but stay ordered relative to deletions.
+        pending_features: list[SemanticStorage.NewFeature] = []
+
+        async def flush_pending_features() -> None:
+            if pending_features:
+                # Sections are recorded before their features are written,
+                # so that a failure cannot leave added features unconsolidated.
+                await self._semantic_storage.add_unconsolidated_sections(
+                    set_id,
+                    [
+                        (feature.category_name, feature.tag)
+                        for feature in pending_features
+                    ],
+                )
+                await self._semantic_storage.add_features_bulk(pending_features)
+                pending_features.clear()
+
         for command in commands:
             match command.command:
                 case SemanticCommandType.ADD:
-                    value_embedding = (await embedder.ingest_embed([command.value]))[0]
-
-                    f_id = await self._semantic_storage.add_feature(
-                        set_id=set_id,
-                        category_name=category_name,
-                        feature=command.feature,
-                        value=command.value,
-                        tag=command.tag,
-                        embedding=np.array(value_embedding),
+                    pending_features.append(
+                        SemanticStorage.NewFeature(
+                            set_id=set_id,
+                            category_name=category_name,
+                            feature=command.feature,
+                            value=command.value,
+                            tag=command.tag,
+                            embedding=np.array(next(add_embeddings)),
+                            citations=citation_ids,
+                        ),
                     )
 
-                    if citation_id is not None:
-                        await self._semantic_storage.add_citations(f_id, [citation_id])
-
                 case SemanticCommandType.DELETE:
+                    await flush_pending_features()
+
                     filter_expr = And(
                         left=And(
                             left=Comparison(field="set_id", op="=", value=set_id),
@@ -293,22 +407,27 @@ class IngestionService:
                 case _:
                     logger.error("Command with unknown action: %s", command.command)
 
+        await flush_pending_features()
+
     async def _consolidate_set_memories_if_applicable(
         self,
         *,
         set_id: SetIdT,
         resources: InstanceOf[Resources],
+        sections: set[tuple[str, str]],
     ) -> None:
-        async def _consolidate_type(
+        async def _consolidate_section(
             semantic_category: InstanceOf[SemanticCategory],
+            tag: str,
         ) -> None:
-            from memmachine.common.filter.filter_parser import And, Comparison
-
             filter_expr = And(
-                left=Comparison(field="set_id", op="=", value=set_id),
-                right=Comparison(
-                    field="category_name", op="=", value=semantic_category.name
+                left=And(
+                    left=Comparison(field="set_id", op="=", value=set_id),
+                    right=Comparison(
+                        field="category_name", op="=", value=semantic_category.name
+                    ),
                 ),
+                right=Comparison(field="tag", op="=", value=tag),
             )
 
             features = await self._semantic_storage.get_feature_set(
@@ -316,29 +435,24 @@ class IngestionService:
                 tag_threshold=self._consolidation_threshold,
                 load_citations=True,
             )
+            if not features:
+                return
 
-            consolidation_sections: list[list[SemanticFeature]] = list(
-                SemanticFeature.group_features_by_tag(features).values(),
-            )
-
-            await asyncio.gather(
-                *[
-                    self._deduplicate_features(
-                        set_id=set_id,
-                        memories=section_features,
-                        resources=resources,
-                        semantic_category=semantic_category,
-                    )
-                    for section_features in consolidation_sections
-                ],
+            await self._deduplicate_features(
+                set_id=set_id,
+                memories=features,
+                resources=resources,
+                semantic_category=semantic_category,
             )
 
-        category_tasks = []
-        for t in resources.semantic_categories:
-            task = _consolidate_type(t)
-            category_tasks.append(task)
+        section_tasks = [
+            _consolidate_section(semantic_category, tag)
+            for semantic_category in resources.semantic_categories
+            for category_name, tag in sorted(sections)
+            if category_name == semantic_category.name
+        ]
 
-        await asyncio.gather(*category_tasks)
+        await asyncio.gather(*section_tasks)
 
     async def _deduplicate_features(
         self,
@@ -387,23 +501,27 @@ class IngestionService:
             list(merged_citations),
         )
 
-        async def _add_feature(f: LLMReducedFeature) -> None:
-            value_embedding = (await resources.embedder.ingest_embed([f.value]))[0]
-
-            f_id = await self._semantic_storage.add_feature(
-                set_id=set_id,
-                category_name=semantic_category.name,
-                tag=f.tag,
-                feature=f.feature,
-                value=f.value,
-                embedding=np.array(value_embedding),
-            )
+        consolidated_memories = consolidate_resp.consolidated_memories
+        if not consolidated_memories:
+            return
 
-            await self._semantic_storage.add_citations(f_id, citation_ids)
+        value_embeddings = await resources.embedder.ingest_embed(
+            [f.value for f in consolidated_memories],
+        )
 
-        await asyncio.gather(
-            *[
-                _add_feature(feature)
-                for feature in consolidate_resp.consolidated_memories
+        await self._semantic_storage.add_features_bulk(
+            [
+                SemanticStorage.NewFeature(
+                    set_id=set_id,
+                    category_name=semantic_category.name,
+                    tag=f.tag,
+                    feature=f.feature,
+                    value=f.value,
+                    embedding=np.array(value_embedding),
+                    citations=citation_ids,
+                )
+                for f, value_embedding in zip(
+                    consolidated_memories, value_embeddings, strict=True
+                )
             ],
         )
@@ -0,0 +1,343 @@
+"""
+Event-driven scheduling of semantic ingestion.
+
+Sets are scheduled for ingestion when history is added to them, instead of
+polling the history table for sets with uningested messages. A set becomes
+ready when it has enough uningested messages or when its oldest uningested
+message is old enough. Ready sets are processed by a bounded pool of workers,
+oldest uningested message first, one batch per turn. Sets with features
+added by ingestion are consolidated by the same workers when no set is ready
+for ingestion.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel, Field, InstanceOf
+
+from .semantic_ingestion import IngestionService
+from .semantic_model import SetIdT
+from .storage.storage_base import SemanticStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingSet:
+    num_uningested: int
+    oldest_uningested_at: float
+    deadline_handle: asyncio.TimerHandle | None = None
+
+
+class IngestionScheduler:
+    """
+    Schedules sets with uningested history for ingestion.
+
+    Sets are reported by notify, by the storage for history added
+    by other processes, and by a periodic reconciliation query
+    that catches sets missed by notifications (e.g. after a restart).
+    """
+
+    class Params(BaseModel):
+        """Dependencies and tuning knobs for ingestion scheduling."""
+
+        semantic_storage: InstanceOf[SemanticStorage]
+        ingestion_service: InstanceOf[IngestionService]
+        uningested_message_limit: int = Field(default=5, gt=0)
+        uningested_time_limit: timedelta = timedelta(minutes=5)
+        max_concurrency: int = Field(default=4, gt=0)
+        reconcile_interval_sec: float = Field(default=60.0, gt=0)
+        poll_interval_sec: float = Field(default=2.0, gt=0)
+        debug_fail_loudly: bool = False
+
+    def __init__(self, params: Params) -> None:
+        """Initialize the scheduler with storage and ingestion dependencies."""
+        self._semantic_storage = params.semantic_storage
+        self._ingestion_service = params.ingestion_service
+        self._message_limit = params.uningested_message_limit
+        self._time_limit_sec = params.uningested_time_limit.total_seconds()
+        self._max_concurrency = params.max_concurrency
+        self._debug_fail_loudly = params.debug_fail_loudly
+
+        self._reconcile_interval_sec = params.reconcile_interval_sec
+        self._poll_interval_sec = params.poll_interval_sec
+
+        self._pending: dict[SetIdT, _PendingSet] = {}
+        # Heap of (time waiting since, sequence number, set id).
+        self._ready: list[tuple[float, int, SetIdT]] = []
+        self._ready_set_ids: set[SetIdT] = set()
+        self._running_set_ids: set[SetIdT] = set()
+        self._sequence_number = 0
+        self._consolidation_ready: deque[SetIdT] = deque()
+        self._consolidation_ready_set_ids: set[SetIdT] = set()
+
+        self._work_available = asyncio.Event()
+        self._is_stopping = False
+
+        # Whether history added by other processes is being reported.
+        self._is_watching = False
+        self._watch_stopped = asyncio.Event()
+
+    def notify(self, set_id: SetIdT, num_messages: int = 1) -> None:
+        """
+        Report history added to a set.
+
+        Args:
+            set_id (SetIdT):
+                The set the history was added to.
+            num_messages (int):
+                Number of history messages added (default: 1).
+
+        """
+        if num_messages <= 0:
+            return
+
+        pending = self._pending.get(set_id)
+        if pending is None:
+            pending = _PendingSet(
+                num_uningested=0,
+                oldest_uningested_at=time.monotonic(),
+            )
+            self._pending[set_id] = pending
+
+        pending.num_uningested += num_messages
+        if pending.num_uningested >= self._message_limit:
+            self._mark_ready(set_id)
+        elif pending.deadline_handle is None:
+            self._schedule_deadline(set_id, pending)
+
+    def _schedule_deadline(self, set_id: SetIdT, pending: _PendingSet) -> None:
+        delay = pending.oldest_uningested_at + self._time_limit_sec - time.monotonic()
+        pending.deadline_handle = asyncio.get_running_loop().call_later(
+            max(delay, 0),
+            self._mark_ready,
+            set_id,
+        )
+
+    def _mark_ready(self, set_id: SetIdT, waiting_since: float | None = None) -> None:
+        """Queue the set for ingestion unless it is queued or being ingested."""
+        pending = self._pending.get(set_id)
+        if pending is not None and pending.deadline_handle is not None:
+            pending.deadline_handle.cancel()
+            pending.deadline_handle = None
+
+        if set_id in self._ready_set_ids or set_id in self._running_set_ids:
+            # A set being ingested is checked again when its turn ends.
+            return
+
+        if waiting_since is None:
+            waiting_since = (
+                pending.oldest_uningested_at
+                if pending is not None
+                else time.monotonic()
+            )
+        heapq.heappush(
+            self._ready,
+            (waiting_since, self._sequence_number, set_id),
+        )
+        self._sequence_number += 1
+        self._ready_set_ids.add(set_id)
+        self._work_available.set()
+
+    async def run(self) -> None:
+        """Run the workers and the reconciliation loop until stopped."""
+        workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._max_concurrency)
+        ]
+        loops = [asyncio.create_task(self._reconcile_loop())]
+        if self._semantic_storage.notifies_history_added:
+            loops.append(asyncio.create_task(self._watch_loop()))
+
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in [*workers, *loops]:
+                task.cancel()
+            await asyncio.gather(*workers, *loops, return_exceptions=True)
+            self._is_stopping = False
+
+    def stop(self) -> None:
+        """Stop the workers after their current turn."""
+        self._is_stopping = True
+        self._work_available.set()
+
+    def _queue_consolidation(self, set_id: SetIdT) -> None:
+        if set_id in self._consolidation_ready_set_ids:
+            return
+
+        self._consolidation_ready.append(set_id)
+        self._consolidation_ready_set_ids.add(set_id)
+        self._work_available.set()
+
+    async def _worker(self) -> None:
+        while not self._is_stopping:
+            if self._ready:
+                _, _, set_id = heapq.heappop(self._ready)
+                self._ready_set_ids.discard(set_id)
+                await self._ingest(set_id)
+            elif self._consolidation_ready:
+                set_id = self._consolidation_ready.popleft()
+                self._consolidation_ready_set_ids.discard(set_id)
+                await self._consolidate(set_id)
+            else:
+                self._work_available.clear()
+                await self._work_available.wait()
+
+    async def _ingest(self, set_id: SetIdT) -> None:
+        """Ingest one batch of the set and requeue it if history remains."""
+        self._running_set_ids.add(set_id)
+        turn_started_at = time.monotonic()
+        pending = self._pending.pop(set_id, None)
+        if pending is not None and pending.deadline_handle is not None:
+            pending.deadline_handle.cancel()
+
+        try:
+            await self._ingestion_service.process_set_ids([set_id])
+            num_uningested = await self._semantic_storage.get_history_messages_count(
+                set_ids=[set_id],
+                is_ingested=False,
+            )
+            needs_consolidation = (
+                await self._ingestion_service.has_unconsolidated_sections(set_id)
+            )
+        except Exception:
+            if self._debug_fail_loudly:
+                raise
+            # Reconciliation retries the set later.
+            logger.exception("Failed to ingest semantic history for set %s", set_id)
+            return
+        finally:
+            self._running_set_ids.discard(set_id)
+
+        if needs_consolidation:
+            self._queue_consolidation(set_id)
+
+        # History notified during the turn may have been added
+        # after the count, so it is kept even if the count is zero.
+        remaining = self._pending.get(set_id)
+        if remaining is None:
+            if num_uningested == 0:
+                return
+            remaining = _PendingSet(
+                num_uningested=0,
+                oldest_uningested_at=turn_started_at,
+            )
+            self._pending[set_id] = remaining
+        remaining.num_uningested = max(remaining.num_uningested, num_uningested)
+
+        # The set gets another turn behind the sets that became ready
+        # during this turn.
+        if remaining.num_uningested >= self._message_limit:
+            self._mark_ready(set_id, waiting_since=time.monotonic())
+        elif remaining.deadline_handle is None:
+            self._schedule_deadline(set_id, remaining)
+
+    async def _consolidate(self, set_id: SetIdT) -> None:
+        """Consolidate the set unless it is being ingested."""
+        if set_id in self._running_set_ids:
+            # Queued again when its ingestion turn ends.
+            return
+
+        self._running_set_ids.add(set_id)
+        try:
+            await self._ingestion_service.consolidate_set(set_id)
+        except Exception:
+            if self._debug_fail_loudly:
+                raise
+            logger.exception(
+                "Failed to consolidate semantic features for set %s",
+                set_id,
+            )
+        finally:
+            self._running_set_ids.discard(set_id)
+
+        # A set that became ready during the turn was not queued.
+        pending = self._pending.get(set_id)
+        if pending is not None and pending.deadline_handle is None:
+            self._mark_ready(set_id)
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            try:
+                set_ids = await self._semantic_storage.get_history_set_ids(
+                    min_uningested_messages=self._message_limit,
+                    older_than=datetime.now(tz=UTC)
+                    - timedelta(seconds=self._time_limit_sec),
+                )
+            except Exception:
+                logger.exception("Failed to find sets with uningested history")
+            else:
+                await self._mark_reconciled_sets_ready(set_ids)
+
+            # Sections left unconsolidated by a restart or another process.
+            try:
+                set_ids = await self._semantic_storage.get_unconsolidated_set_ids()
+            except Exception:
+                logger.exception("Failed to find sets with unconsolidated sections")
+            else:
+                for set_id in set_ids:
+                    self._queue_consolidation(set_id)
+
+            # Without notifications from other processes,
+            # reconciliation is the only way to see their history.
+            if self._is_watching:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._watch_stopped.wait(),
+                        timeout=self._reconcile_interval_sec,
+                    )
+            else:
+                await asyncio.sleep(self._poll_interval_sec)
+
+    async def _mark_reconciled_sets_ready(self, set_ids: list[SetIdT]) -> None:
+        """Queue the sets in the order their oldest uningested history was added."""
+        try:
+            oldest_uningested_times = (
+                await self._semantic_storage.get_oldest_uningested_times(set_ids)
+            )
+        except Exception:
+            logger.exception("Failed to find the oldest uningested history of sets")
+            oldest_uningested_times = {}
+
+        now = time.monotonic()
+        now_datetime = datetime.now(tz=UTC)
+        for set_id in set_ids:
+            oldest_uningested_at = oldest_uningested_times.get(set_id)
+            if oldest_uningested_at is None:
+                self._mark_ready(set_id)
+                continue
+
+            waiting_since = now - max(
+                (now_datetime - oldest_uningested_at).total_seconds(),
+                0,
+            )
+            pending = self._pending.get(set_id)
+            if pending is not None:
+                waiting_since = min(waiting_since, pending.oldest_uningested_at)
+            self._mark_ready(set_id, waiting_since=waiting_since)
+
+    async def _watch_loop(self) -> None:
+        while True:
+            self._is_watching = True
+            self._watch_stopped.clear()
+            try:
+                await self._semantic_storage.watch_history_added(self.notify)
+            except Exception:
+                logger.exception(
+                    "Stopped receiving semantic history notifications, reconnecting",
+                )
+            else:
+                logger.warning(
+                    "Semantic history notifications are unavailable, "
+                    "polling for history instead",
+                )
+            finally:
+                self._is_watching = False
+                self._watch_stopped.set()
+            await asyncio.sleep(self._reconcile_interval_sec)
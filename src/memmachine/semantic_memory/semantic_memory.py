@@ -10,7 +10,7 @@ information extraction and a vector database for semantic search capabilities.
 import asyncio
 import logging
 from asyncio import Task
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 import numpy as np
@@ -20,6 +20,7 @@ from memmachine.common.episode_store import EpisodeIdT, EpisodeStorage
 from memmachine.common.filter.filter_parser import FilterExpr
 
 from .semantic_ingestion import IngestionService
+from .semantic_ingestion_scheduler import IngestionScheduler
 from .semantic_model import FeatureIdT, ResourceRetriever, SemanticFeature, SetIdT
 from .storage.storage_base import SemanticStorage
 
@@ -47,6 +48,11 @@ class SemanticService:
         uningested_message_limit: int = 5
         uningested_time_limit: timedelta = timedelta(minutes=5)
 
+        ingestion_batch_token_budget: int | None = None
+
+        ingestion_max_concurrency: int = 4
+        ingestion_reconcile_interval_sec: float = 60.0
+
         resource_retriever: InstanceOf[ResourceRetriever]
 
         debug_fail_loudly: bool = False
@@ -69,23 +75,46 @@ class SemanticService:
             1,
         )
         self._feature_time_limit = params.uningested_time_limit
+        self._ingestion_batch_token_budget = params.ingestion_batch_token_budget
 
         self._ingestion_task: Task | None = None
         self._is_shutting_down = False
         self._debug_fail_loudly = params.debug_fail_loudly
 
+        self._ingestion_scheduler = IngestionScheduler(
+            IngestionScheduler.Params(
+                semantic_storage=self._semantic_storage,
+                ingestion_service=IngestionService(
+                    params=IngestionService.Params(
+                        semantic_storage=self._semantic_storage,
+                        resource_retriever=self._resource_retriever,
+                        history_store=self._episode_storage,
+                        consolidated_threshold=self._consolidation_threshold,
+                        batch_token_budget=self._ingestion_batch_token_budget,
+                    ),
+                ),
+                uningested_message_limit=self._feature_update_message_limit,
+                uningested_time_limit=self._feature_time_limit,
+                max_concurrency=params.ingestion_max_concurrency,
+                reconcile_interval_sec=params.ingestion_reconcile_interval_sec,
+                poll_interval_sec=self._background_ingestion_interval_sec,
+                debug_fail_loudly=self._debug_fail_loudly,
+            ),
+        )
+
     async def start(self) -> None:
         if self._ingestion_task is not None:
             return
 
         self._is_shutting_down = False
-        self._ingestion_task = asyncio.create_task(self._background_ingestion_task())
+        self._ingestion_task = asyncio.create_task(self._ingestion_scheduler.run())
 
     async def stop(self) -> None:
         if self._ingestion_task is None:
             return
 
         self._is_shutting_down = True
+        self._ingestion_scheduler.stop()
         await self._ingestion_task
 
     async def search(
@@ -124,6 +153,7 @@ class SemanticService:
         )
 
         _consolidate_errors_and_raise(res, "Failed to add messages to set")
+        self._ingestion_scheduler.notify(set_id, len(history_ids))
 
     async def add_message_to_sets(
         self,
@@ -142,6 +172,8 @@ class SemanticService:
         )
 
         _consolidate_errors_and_raise(res, "Failed to add message to sets")
+        for set_id in set_ids:
+            self._ingestion_scheduler.notify(set_id)
 
     async def delete_messages(self, *, set_ids: list[SetIdT]) -> None:
         await self._semantic_storage.delete_history_set(set_ids=set_ids)
@@ -258,29 +290,3 @@ class SemanticService:
         await self._semantic_storage.delete_feature_set(
             filter_expr=filter_expr,
         )
-
-    async def _background_ingestion_task(self) -> None:
-        ingestion_service = IngestionService(
-            params=IngestionService.Params(
-                semantic_storage=self._semantic_storage,
-                resource_retriever=self._resource_retriever,
-                history_store=self._episode_storage,
-            ),
-        )
-
-        while not self._is_shutting_down:
-            dirty_sets = await self._semantic_storage.get_history_set_ids(
-                min_uningested_messages=self._feature_update_message_limit,
-                older_than=datetime.now(tz=UTC) - self._feature_time_limit,
-            )
-
-            if len(dirty_sets) == 0:
-                await asyncio.sleep(self._background_ingestion_interval_sec)
-                continue
-
-            try:
-                await ingestion_service.process_set_ids(dirty_sets)
-            except Exception:
-                if self._debug_fail_loudly:
-                    raise
-                logger.exception("background task crashed, restarting")
@@ -0,0 +1,37 @@
+"""
+Add uningested history index.
+
+Revision ID: 4c8e1f7b2a95
+Revises: 9a4d7e2c6f13
+Create Date: 2026-10-18 19:02:44.187305
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c8e1f7b2a95"
+down_revision: str | Sequence[str] | None = "9a4d7e2c6f13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index the uningested history of each set by creation time."""
+    op.create_index(
+        "idx_set_ingested_history_uningested_created_at",
+        "set_ingested_history",
+        ["set_id", "created_at"],
+        postgresql_where=sa.text("NOT ingested"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the uningested history index."""
+    op.drop_index(
+        "idx_set_ingested_history_uningested_created_at",
+        table_name="set_ingested_history",
+    )
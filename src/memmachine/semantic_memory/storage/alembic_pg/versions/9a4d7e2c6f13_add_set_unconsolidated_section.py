@@ -0,0 +1,35 @@
+"""
+Add set unconsolidated section.
+
+Revision ID: 9a4d7e2c6f13
+Revises: e5c2a9f41b7d
+Create Date: 2026-10-18 18:21:09.604418
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4d7e2c6f13"
+down_revision: str | Sequence[str] | None = "e5c2a9f41b7d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the table of sections waiting for consolidation."""
+    op.create_table(
+        "set_unconsolidated_section",
+        sa.Column("set_id", sa.String(), nullable=False),
+        sa.Column("semantic_category_id", sa.String(), nullable=False),
+        sa.Column("tag_id", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("set_id", "semantic_category_id", "tag_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the table of sections waiting for consolidation."""
+    op.drop_table("set_unconsolidated_section")
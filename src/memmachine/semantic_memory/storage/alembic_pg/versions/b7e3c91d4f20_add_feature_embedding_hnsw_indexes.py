@@ -0,0 +1,67 @@
+"""
+Add feature embedding HNSW indexes.
+
+Revision ID: b7e3c91d4f20
+Revises: 62dff1150a46
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3c91d4f20"
+down_revision: str | Sequence[str] | None = "62dff1150a46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# pgvector cannot build HNSW indexes on vectors with more dimensions.
+HNSW_MAX_DIMENSIONS = 2000
+
+
+def upgrade() -> None:
+    """Index the embeddings of every dimensionality already stored."""
+    dimensions = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT DISTINCT vector_dims(embedding) FROM feature "
+                "WHERE embedding IS NOT NULL",
+            ),
+        )
+        .scalars()
+        .all()
+    )
+
+    # Embeddings of other dimensionalities are indexed by the storage
+    # when first written.
+    for dims in sorted(dimensions):
+        if dims > HNSW_MAX_DIMENSIONS:
+            continue
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_feature_embedding_hnsw_{dims} "
+            f"ON feature USING hnsw ((embedding::vector({dims})) vector_cosine_ops) "
+            f"WHERE vector_dims(embedding) = {dims}",
+        )
+
+
+def downgrade() -> None:
+    """Drop the feature embedding HNSW indexes."""
+    index_names = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = 'feature' "
+                "AND indexname LIKE 'idx\\_feature\\_embedding\\_hnsw\\_%'",
+            ),
+        )
+        .scalars()
+        .all()
+    )
+
+    for index_name in index_names:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
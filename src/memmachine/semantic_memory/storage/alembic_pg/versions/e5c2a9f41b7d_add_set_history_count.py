@@ -0,0 +1,58 @@
+"""
+Add set history count.
+
+Revision ID: e5c2a9f41b7d
+Revises: b7e3c91d4f20
+Create Date: 2026-10-18 14:03:27.519844
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c2a9f41b7d"
+down_revision: str | Sequence[str] | None = "b7e3c91d4f20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the set history counts from the existing history."""
+    op.create_table(
+        "set_history_count",
+        sa.Column("set_id", sa.String(), nullable=False),
+        sa.Column(
+            "history_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "uningested_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "oldest_uningested_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("set_id"),
+    )
+    op.execute(
+        "INSERT INTO set_history_count "
+        "(set_id, history_count, uningested_count, oldest_uningested_at) "
+        "SELECT set_id, count(*), "
+        "count(*) FILTER (WHERE NOT ingested), "
+        "min(created_at) FILTER (WHERE NOT ingested) "
+        "FROM set_ingested_history GROUP BY set_id",
+    )
+
+
+def downgrade() -> None:
+    """Drop the set history counts."""
+    op.drop_table("set_history_count")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 import re
-from asyncio import Lock
+from asyncio import Lock, Semaphore, gather
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -96,9 +98,43 @@ class Neo4jSemanticStorage(SemanticStorage):
 
     _VECTOR_INDEX_PREFIX = "feature_embedding_index"
     _DEFAULT_VECTOR_QUERY_CANDIDATES = 100
+    _MAX_CONCURRENT_VECTOR_QUERIES = 8
     _SET_LABEL_PREFIX = "FeatureSet_"
     _METADATA_PROP_PREFIX = "metadata__"
 
+    # Subtracts num_deleted history and num_ingested uningested history
+    # from the count of each set_id, in the query that changed the history.
+    # Expects set_id, num_deleted, num_ingested and removed_oldest_at in scope.
+    # The oldest uningested time is only looked up again through
+    # set_history_uningested_index when the current oldest was removed.
+    _UPDATE_HISTORY_COUNTS_QUERY = """
+        MATCH (c:SetHistoryCount {set_id: set_id})
+        WITH c,
+             removed_oldest_at IS NOT NULL
+             AND removed_oldest_at <= c.oldest_uningested_at AS removed_oldest
+        SET c.history_count = c.history_count - num_deleted,
+            c.uningested_count = c.uningested_count - num_ingested
+        SET c.oldest_uningested_at = CASE
+            WHEN c.uningested_count <= 0 THEN null
+            ELSE c.oldest_uningested_at
+        END
+        WITH c, removed_oldest
+        CALL {
+            WITH c, removed_oldest
+            WITH c
+            WHERE removed_oldest AND c.uningested_count > 0
+            OPTIONAL MATCH (r:SetHistory {set_id: c.set_id, is_ingested: false})
+            WHERE r.created_at IS NOT NULL
+            WITH c, r
+            ORDER BY r.created_at
+            LIMIT 1
+            SET c.oldest_uningested_at = r.created_at
+        }
+        WITH c
+        WHERE c.history_count <= 0
+        DELETE c
+    """
+
     def __init__(
         self,
         driver: InstanceOf[AsyncDriver],
@@ -124,6 +160,13 @@ class Neo4jSemanticStorage(SemanticStorage):
             REQUIRE (h.set_id, h.history_id) IS UNIQUE
             """,
         )
+        await self._driver.execute_query(
+            """
+            CREATE CONSTRAINT set_history_count_unique IF NOT EXISTS
+            FOR (c:SetHistoryCount)
+            REQUIRE c.set_id IS UNIQUE
+            """,
+        )
         await self._driver.execute_query(
             """
             CREATE CONSTRAINT set_embedding_unique IF NOT EXISTS
@@ -131,6 +174,21 @@ class Neo4jSemanticStorage(SemanticStorage):
             REQUIRE s.set_id IS UNIQUE
             """,
         )
+        await self._driver.execute_query(
+            """
+            CREATE CONSTRAINT unconsolidated_section_unique IF NOT EXISTS
+            FOR (u:UnconsolidatedSection)
+            REQUIRE (u.set_id, u.category_name, u.tag) IS UNIQUE
+            """,
+        )
+        await self._driver.execute_query(
+            """
+            CREATE INDEX set_history_uningested_index IF NOT EXISTS
+            FOR (h:SetHistory)
+            ON (h.set_id, h.is_ingested, h.created_at)
+            """,
+        )
+        await self._backfill_history_counts()
         await self._backfill_embedding_dimensions()
         await self._load_set_embedding_dimensions()
         await self._ensure_existing_set_labels()
@@ -143,7 +201,9 @@ class Neo4jSemanticStorage(SemanticStorage):
     async def delete_all(self) -> None:
         await self._driver.execute_query("MATCH (f:Feature) DETACH DELETE f")
         await self._driver.execute_query("MATCH (h:SetHistory) DELETE h")
+        await self._driver.execute_query("MATCH (c:SetHistoryCount) DELETE c")
         await self._driver.execute_query("MATCH (s:SetEmbedding) DELETE s")
+        await self._driver.execute_query("MATCH (u:UnconsolidatedSection) DELETE u")
         records, _, _ = await self._driver.execute_query(
             """
             SHOW VECTOR INDEXES
@@ -217,6 +277,86 @@ class Neo4jSemanticStorage(SemanticStorage):
             raise RuntimeError("Neo4j did not return a feature id")
         return FeatureIdT(str(feature_id))
 
+    async def add_features_bulk(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[FeatureIdT]:
+        if not features:
+            return []
+
+        timestamp = _utc_timestamp()
+
+        rows_by_set_id: dict[str, list[dict[str, Any]]] = {}
+        for index, new_feature in enumerate(features):
+            embedding = [
+                float(x) for x in np.array(new_feature.embedding, dtype=float).tolist()
+            ]
+            metadata_json, metadata_props = self._prepare_metadata_storage(
+                new_feature.metadata,
+            )
+            rows_by_set_id.setdefault(new_feature.set_id, []).append(
+                {
+                    "index": index,
+                    "category_name": new_feature.category_name,
+                    "feature": new_feature.feature,
+                    "value": new_feature.value,
+                    "tag": new_feature.tag,
+                    "embedding": embedding,
+                    "dimensions": len(embedding),
+                    "metadata_json": metadata_json,
+                    "metadata_props": metadata_props,
+                    "citations": sorted(
+                        {str(history_id) for history_id in new_feature.citations},
+                    ),
+                },
+            )
+
+        for set_id, rows in rows_by_set_id.items():
+            for dimensions in {row["dimensions"] for row in rows}:
+                await self._ensure_set_embedding_dimensions(set_id, dimensions)
+
+        # Labels cannot be parameterized, so create each set's features
+        # in its own branch of a single query.
+        query_branches = []
+        query_params: dict[str, Any] = {"ts": timestamp}
+        for set_number, (set_id, rows) in enumerate(rows_by_set_id.items()):
+            set_label = self._set_label_for_set(set_id)
+            query_branches.append(
+                f"""
+                UNWIND $set_{set_number}_rows AS row
+                CREATE (f:Feature:{set_label} {{
+                    set_id: $set_{set_number}_id,
+                    category_name: row.category_name,
+                    feature: row.feature,
+                    value: row.value,
+                    tag: row.tag,
+                    embedding: row.embedding,
+                    embedding_dimensions: row.dimensions,
+                    metadata_json: row.metadata_json,
+                    citations: row.citations,
+                    created_at_ts: $ts,
+                    updated_at_ts: $ts
+                }})
+                SET f += row.metadata_props
+                RETURN row.index AS index, elementId(f) AS feature_id
+                """,
+            )
+            query_params[f"set_{set_number}_id"] = set_id
+            query_params[f"set_{set_number}_rows"] = rows
+
+        records, _, _ = await self._driver.execute_query(
+            "UNION ALL".join(query_branches),
+            query_params,
+        )
+
+        feature_ids: list[FeatureIdT | None] = [None] * len(features)
+        for record in records:
+            feature_ids[record["index"]] = FeatureIdT(str(record["feature_id"]))
+
+        if any(feature_id is None for feature_id in feature_ids):
+            raise RuntimeError("Failed to create feature nodes")
+        return [feature_id for feature_id in feature_ids if feature_id is not None]
+
     async def update_feature(
         self,
         feature_id: FeatureIdT,
@@ -493,7 +633,7 @@ class Neo4jSemanticStorage(SemanticStorage):
     ) -> list[EpisodeIdT]:
         """
         Get history messages, atomically claiming them to prevent duplicate processing.
-        
+
         In Neo4j, we immediately mark messages as ingested in the same query to prevent
         other pods from processing them. Neo4j doesn't have SELECT FOR UPDATE SKIP LOCKED,
         but we achieve similar behavior by marking messages as ingested atomically.
@@ -509,15 +649,34 @@ class Neo4jSemanticStorage(SemanticStorage):
             params["is_ingested"] = is_ingested
         if conditions:
             query.append("WHERE " + " AND ".join(conditions))
-        
-        # Immediately mark as ingested to prevent other pods from claiming them
-        # This achieves atomic claiming similar to SELECT FOR UPDATE SKIP LOCKED
-        query.append("SET h.is_ingested = true")
-        query.append("RETURN h.history_id AS history_id ORDER BY h.history_id")
+
+        query.append("WITH h ORDER BY h.history_id")
         if limit is not None:
             query.append("LIMIT $limit")
             params["limit"] = limit
-        
+
+        # Immediately mark as ingested to prevent other pods from claiming them
+        # This achieves atomic claiming similar to SELECT FOR UPDATE SKIP LOCKED
+        query.append(
+            f"""
+            WITH collect(h) AS claimed
+            CALL {{
+                WITH claimed
+                UNWIND claimed AS h
+                WITH h
+                WHERE coalesce(h.is_ingested, false) = false
+                SET h.is_ingested = true
+                WITH h.set_id AS set_id,
+                     0 AS num_deleted,
+                     count(h) AS num_ingested,
+                     min(h.created_at) AS removed_oldest_at
+                {self._UPDATE_HISTORY_COUNTS_QUERY}
+            }}
+            UNWIND claimed AS h
+            RETURN h.history_id AS history_id
+            """,
+        )
+
         records, _, _ = await self._driver.execute_query("\n".join(query), **params)
         return [EpisodeIdT(record["history_id"]) for record in records]
 
@@ -527,18 +686,17 @@ class Neo4jSemanticStorage(SemanticStorage):
         set_ids: list[str] | None = None,
         is_ingested: bool | None = None,
     ) -> int:
-        query = ["MATCH (h:SetHistory)"]
-        conditions = []
+        query = ["MATCH (c:SetHistoryCount)"]
         params: dict[str, Any] = {}
         if set_ids is not None:
-            conditions.append("h.set_id IN $set_ids")
+            query.append("WHERE c.set_id IN $set_ids")
             params["set_ids"] = set_ids
-        if is_ingested is not None:
-            conditions.append("h.is_ingested = $is_ingested")
-            params["is_ingested"] = is_ingested
-        if conditions:
-            query.append("WHERE " + " AND ".join(conditions))
-        query.append("RETURN count(*) AS cnt")
+        if is_ingested is None:
+            query.append("RETURN sum(c.history_count) AS cnt")
+        elif is_ingested:
+            query.append("RETURN sum(c.history_count - c.uningested_count) AS cnt")
+        else:
+            query.append("RETURN sum(c.uningested_count) AS cnt")
         records, _, _ = await self._driver.execute_query("\n".join(query), **params)
         return int(records[0]["cnt"]) if records else 0
 
@@ -548,65 +706,136 @@ class Neo4jSemanticStorage(SemanticStorage):
         min_uningested_messages: int | None = None,
         older_than: datetime | None = None,
     ) -> list[str]:
-        set_ids: set[str] = set()
-        filters_applied = False
+        conditions = []
+        params: dict[str, Any] = {}
 
         if min_uningested_messages is not None and min_uningested_messages > 0:
-            filters_applied = True
-            records, _, _ = await self._driver.execute_query(
-                """
-                MATCH (h:SetHistory)
-                WITH h.set_id AS set_id,
-                     sum(CASE WHEN coalesce(h.is_ingested, false) = false THEN 1 ELSE 0 END) AS uningested_count
-                WHERE uningested_count >= $min_uningested_messages
-                RETURN set_id
-                """,
-                min_uningested_messages=min_uningested_messages,
-            )
-            set_ids.update(
-                str(record.get("set_id"))
-                for record in records
-                if record.get("set_id") is not None
-            )
+            conditions.append("c.uningested_count >= $min_uningested_messages")
+            params["min_uningested_messages"] = min_uningested_messages
 
         if older_than is not None:
-            filters_applied = True
-            records, _, _ = await self._driver.execute_query(
-                """
-                MATCH (h:SetHistory)
-                WHERE coalesce(h.is_ingested, false) = false
-                  AND h.created_at <= $older_than
-                RETURN DISTINCT h.set_id AS set_id
-                """,
-                older_than=older_than,
-            )
-            set_ids.update(
-                str(record.get("set_id"))
-                for record in records
-                if record.get("set_id") is not None
+            conditions.append(
+                "(c.uningested_count > 0 AND c.oldest_uningested_at <= $older_than)",
             )
+            params["older_than"] = older_than
 
-        if not filters_applied:
-            records, _, _ = await self._driver.execute_query(
-                """
-                MATCH (h:SetHistory)
-                RETURN DISTINCT h.set_id AS set_id
-                """,
-            )
-            set_ids.update(
-                str(record.get("set_id"))
-                for record in records
-                if record.get("set_id") is not None
-            )
+        query = ["MATCH (c:SetHistoryCount)", "WHERE c.history_count > 0"]
+        if conditions:
+            query.append("AND (" + " OR ".join(conditions) + ")")
+        query.append("RETURN c.set_id AS set_id")
+
+        records, _, _ = await self._driver.execute_query("\n".join(query), **params)
+        return [
+            str(record.get("set_id"))
+            for record in records
+            if record.get("set_id") is not None
+        ]
+
+    async def get_oldest_uningested_times(
+        self,
+        set_ids: list[SetIdT],
+    ) -> dict[SetIdT, datetime]:
+        if not set_ids:
+            return {}
+
+        records, _, _ = await self._driver.execute_query(
+            """
+            MATCH (c:SetHistoryCount)
+            WHERE c.set_id IN $set_ids
+              AND c.uningested_count > 0
+              AND c.oldest_uningested_at IS NOT NULL
+            RETURN c.set_id AS set_id, c.oldest_uningested_at AS oldest_uningested_at
+            """,
+            set_ids=set_ids,
+        )
+        return {
+            str(record["set_id"]): record["oldest_uningested_at"].to_native()
+            for record in records
+        }
+
+    async def add_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+        sections: list[tuple[str, str]],
+    ) -> None:
+        if not sections:
+            return
+
+        await self._driver.execute_query(
+            """
+            UNWIND $sections AS section
+            MERGE (:UnconsolidatedSection {
+                set_id: $set_id,
+                category_name: section.category_name,
+                tag: section.tag
+            })
+            """,
+            parameters_={
+                "set_id": str(set_id),
+                "sections": [
+                    {"category_name": category_name, "tag": tag}
+                    for category_name, tag in dict.fromkeys(sections)
+                ],
+            },
+        )
 
-        return list(set_ids)
+    async def claim_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+    ) -> list[tuple[str, str]]:
+        records, _, _ = await self._driver.execute_query(
+            """
+            MATCH (u:UnconsolidatedSection {set_id: $set_id})
+            WITH u, u.category_name AS category_name, u.tag AS tag
+            DELETE u
+            RETURN category_name, tag
+            """,
+            parameters_={"set_id": str(set_id)},
+        )
+        return [
+            (str(record["category_name"]), str(record["tag"])) for record in records
+        ]
+
+    async def get_unconsolidated_set_ids(
+        self,
+        *,
+        set_ids: list[SetIdT] | None = None,
+    ) -> list[SetIdT]:
+        query = ["MATCH (u:UnconsolidatedSection)"]
+        params: dict[str, Any] = {}
+        if set_ids is not None:
+            query.append("WHERE u.set_id IN $set_ids")
+            params["set_ids"] = [str(set_id) for set_id in set_ids]
+        query.append("RETURN DISTINCT u.set_id AS set_id")
+
+        records, _, _ = await self._driver.execute_query(
+            "\n".join(query),
+            parameters_=params,
+        )
+        return [str(record["set_id"]) for record in records]
 
     async def add_history_to_set(self, set_id: str, history_id: EpisodeIdT) -> None:
+        # Only history created by the MERGE is counted.
         await self._driver.execute_query(
             """
             MERGE (h:SetHistory {set_id: $set_id, history_id: $history_id})
             ON CREATE SET h.is_ingested = false,
-                          h.created_at = $created_at
+                          h.created_at = $created_at,
+                          h.is_new = true
+            WITH h
+            WHERE h.is_new
+            REMOVE h.is_new
+            MERGE (c:SetHistoryCount {set_id: $set_id})
+            ON CREATE SET c.history_count = 0,
+                          c.uningested_count = 0
+            SET c.history_count = c.history_count + 1,
+                c.uningested_count = c.uningested_count + 1,
+                c.oldest_uningested_at = CASE
+                    WHEN c.oldest_uningested_at IS NULL
+                      OR $created_at < c.oldest_uningested_at
+                    THEN $created_at
+                    ELSE c.oldest_uningested_at
+                END
             """,
             set_id=set_id,
             history_id=str(history_id),
@@ -618,10 +847,20 @@ class Neo4jSemanticStorage(SemanticStorage):
             return
 
         await self._driver.execute_query(
-            """
+            f"""
             MATCH (h:SetHistory)
             WHERE h.history_id IN $history_ids
+            WITH h,
+                 h.set_id AS set_id,
+                 coalesce(h.is_ingested, false) AS is_ingested,
+                 h.created_at AS created_at
             DELETE h
+            WITH set_id,
+                 count(*) AS num_deleted,
+                 sum(CASE WHEN is_ingested THEN 0 ELSE 1 END) AS num_ingested,
+                 min(CASE WHEN is_ingested THEN null ELSE created_at END)
+                     AS removed_oldest_at
+            {self._UPDATE_HISTORY_COUNTS_QUERY}
             """,
             history_ids=[str(history_id) for history_id in history_ids],
         )
@@ -635,6 +874,10 @@ class Neo4jSemanticStorage(SemanticStorage):
             MATCH (h:SetHistory)
             WHERE h.set_id IN $set_ids
             DELETE h
+            WITH count(*) AS num_deleted
+            MATCH (c:SetHistoryCount)
+            WHERE c.set_id IN $set_ids
+            DELETE c
             """,
             set_ids=[str(set_id) for set_id in set_ids],
         )
@@ -648,15 +891,47 @@ class Neo4jSemanticStorage(SemanticStorage):
         if not history_ids:
             raise ValueError("No ids provided")
         await self._driver.execute_query(
-            """
+            f"""
             MATCH (h:SetHistory)
-            WHERE h.set_id = $set_id AND h.history_id IN $history_ids
+            WHERE h.set_id = $set_id
+              AND h.history_id IN $history_ids
+              AND coalesce(h.is_ingested, false) = false
             SET h.is_ingested = true
+            WITH h.set_id AS set_id,
+                 0 AS num_deleted,
+                 count(h) AS num_ingested,
+                 min(h.created_at) AS removed_oldest_at
+            {self._UPDATE_HISTORY_COUNTS_QUERY}
             """,
             set_id=set_id,
             history_ids=[str(hid) for hid in history_ids],
         )
 
+    async def _backfill_history_counts(self) -> None:
+        # Filter before aggregating, so sets that already have counts
+        # are skipped through the set_history_count_unique index.
+        await self._driver.execute_query(
+            """
+            MATCH (h:SetHistory)
+            WHERE NOT EXISTS { MATCH (:SetHistoryCount {set_id: h.set_id}) }
+            WITH h.set_id AS set_id,
+                 count(h) AS history_count,
+                 sum(
+                     CASE WHEN coalesce(h.is_ingested, false) THEN 0 ELSE 1 END
+                 ) AS uningested_count,
+                 min(
+                     CASE WHEN coalesce(h.is_ingested, false) THEN null
+                     ELSE h.created_at END
+                 ) AS oldest_uningested_at
+            CREATE (:SetHistoryCount {
+                set_id: set_id,
+                history_count: history_count,
+                uningested_count: uningested_count,
+                oldest_uningested_at: oldest_uningested_at
+            })
+            """,
+        )
+
     async def _load_feature_entries(
         self,
         *,
@@ -803,19 +1078,33 @@ class Neo4jSemanticStorage(SemanticStorage):
         )
         query_text = self._vector_query_text(conditions)
 
-        combined: list[tuple[float, _FeatureEntry]] = []
-        for set_id in self._matching_set_ids(filter_expr, embedding_dims):
-            index_name = await self._ensure_vector_index(set_id, embedding_dims)
-            combined.extend(
-                await self._query_vector_index(query_text, index_name, params_base),
-            )
+        semaphore = Semaphore(self._MAX_CONCURRENT_VECTOR_QUERIES)
 
-        combined.sort(key=lambda item: item[0], reverse=True)
-        entries = [entry for _, entry in combined]
-        if limit is not None:
-            start = limit * offset
-            entries = entries[start : start + limit]
-        return entries
+        async def query_set(set_id: str) -> list[tuple[float, _FeatureEntry]]:
+            async with semaphore:
+                index_name = await self._ensure_vector_index(set_id, embedding_dims)
+                return await self._query_vector_index(
+                    query_text,
+                    index_name,
+                    params_base,
+                )
+
+        per_set_results = await gather(
+            *(
+                query_set(set_id)
+                for set_id in self._matching_set_ids(filter_expr, embedding_dims)
+            ),
+        )
+
+        # Each set's results are ordered by descending score,
+        # so merge them lazily instead of sorting the combined candidates.
+        merged = heapq.merge(
+            *per_set_results,
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        start = limit * offset if limit is not None else 0
+        return [entry for _, entry in itertools.islice(merged, start, effective_limit)]
 
     def _vector_query_params(
         self,
@@ -1,8 +1,12 @@
 """SQLAlchemy-backed semantic storage implementation using pgvector."""
 
+import asyncio
 import logging
+from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, overload
+from uuid import uuid4
 
 import numpy as np
 from alembic import command
@@ -12,7 +16,6 @@ from pydantic import AwareDatetime, InstanceOf, TypeAdapter, ValidationError
 from sqlalchemy import (
     Boolean,
     Column,
-    ColumnElement,
     DateTime,
     ForeignKey,
     Index,
@@ -20,40 +23,34 @@ from sqlalchemy import (
     String,
     Table,
     and_,
+    case,
+    cast,
     delete,
     insert,
+    literal_column,
     or_,
     select,
     text,
     update,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import (
     DeclarativeBase,
     InstrumentedAttribute,
     MappedColumn,
-    aliased,
     mapped_column,
 )
-from sqlalchemy.sql import Delete, Select, func
+from sqlalchemy.sql import ColumnElement, Delete, Select, func
 
 from memmachine.common.episode_store.episode_model import EpisodeIdT
 from memmachine.common.errors import InvalidArgumentError, ResourceNotFoundError
-from memmachine.common.filter.filter_parser import (
-    And as FilterAnd,
-)
-from memmachine.common.filter.filter_parser import (
-    Comparison as FilterComparison,
-)
+from memmachine.common.filter.filter_compiler import compile_sql_filter
 from memmachine.common.filter.filter_parser import (
     FilterExpr,
 )
-from memmachine.common.filter.filter_parser import (
-    Or as FilterOr,
-)
-from memmachine.common.filter.sql_filter_util import parse_sql_filter
 from memmachine.semantic_memory.semantic_model import SemanticFeature, SetIdT
 from memmachine.semantic_memory.storage.storage_base import (
     FeatureIdT,
@@ -62,6 +59,17 @@ from memmachine.semantic_memory.storage.storage_base import (
 
 logger = logging.getLogger(__name__)
 
+# pgvector cannot build HNSW indexes on vectors with more dimensions.
+HNSW_MAX_DIMENSIONS = 2000
+
+# Channel notified with "<instance id>:<set id>" for history added to a set.
+HISTORY_ADDED_CHANNEL = "memmachine_semantic_history_added"
+
+
+def vector_index_name(dimensions: int) -> str:
+    """Return the name of the HNSW index for embeddings of the given dimensions."""
+    return f"idx_feature_embedding_hnsw_{dimensions}"
+
 
 class BaseSemanticStorage(DeclarativeBase):
     """Declarative base for semantic memory SQLAlchemy models."""
@@ -158,6 +166,14 @@ class SetIngestedHistory(BaseSemanticStorage):
     """Tracks which history messages have been processed for a set."""
 
     __tablename__ = "set_ingested_history"
+    __table_args__ = (
+        Index(
+            "idx_set_ingested_history_uningested_created_at",
+            "set_id",
+            "created_at",
+            postgresql_where=text("NOT ingested"),
+        ),
+    )
     set_id = mapped_column(String, primary_key=True)
     history_id = mapped_column(
         String,
@@ -170,6 +186,30 @@ class SetIngestedHistory(BaseSemanticStorage):
     ingested = mapped_column(Boolean, default=False, nullable=False)
 
 
+class SetHistoryCount(BaseSemanticStorage):
+    """
+    Maintained history counts of a set.
+
+    Updated in the same transaction as SetIngestedHistory so that
+    counting uningested history does not scan the history table.
+    """
+
+    __tablename__ = "set_history_count"
+    set_id = mapped_column(String, primary_key=True)
+    history_count = mapped_column(Integer, nullable=False, server_default="0")
+    uningested_count = mapped_column(Integer, nullable=False, server_default="0")
+    oldest_uningested_at = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class SetUnconsolidatedSection(BaseSemanticStorage):
+    """A (category, tag) section of a set with features added since consolidation."""
+
+    __tablename__ = "set_unconsolidated_section"
+    set_id = mapped_column(String, primary_key=True)
+    semantic_category_id = mapped_column(String, primary_key=True)
+    tag_id = mapped_column(String, primary_key=True)
+
+
 async def apply_alembic_migrations(engine: AsyncEngine) -> None:
     """Run Alembic migrations for the semantic storage tables."""
     script_location = Path(__file__).parent / "alembic_pg"
@@ -195,13 +235,37 @@ async def apply_alembic_migrations(engine: AsyncEngine) -> None:
 class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
     """Concrete SemanticStorageBase backed by PostgreSQL with pgvector."""
 
-    def __init__(self, sqlalchemy_engine: AsyncEngine) -> None:
-        """Initialize the storage with an async SQLAlchemy engine."""
+    def __init__(
+        self,
+        sqlalchemy_engine: AsyncEngine,
+        *,
+        hnsw_ef_search: int | None = None,
+    ) -> None:
+        """
+        Initialize the storage with an async SQLAlchemy engine.
+
+        Args:
+            sqlalchemy_engine: Engine connected to a PostgreSQL database
+                with the pgvector extension available.
+            hnsw_ef_search: Size of the candidate list scanned by the HNSW
+                indexes during vector search. If None, the server setting
+                is used.
+
+        """
         self._engine = sqlalchemy_engine
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             expire_on_commit=False,
         )
+        self._hnsw_ef_search = hnsw_ef_search
+
+        # Embedding dimensions with an index built or being built
+        # (or that cannot be indexed).
+        self._indexed_dimensions: set[int] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Identifies notifications sent by this instance.
+        self._instance_id = uuid4().hex
 
     def _create_session(self) -> AsyncSession:
         return self._session_factory()
@@ -213,12 +277,104 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
         await self._initialize_db()
 
     async def cleanup(self) -> None:
+        # An interrupted build leaves an invalid index, which is rebuilt later.
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
         await self._engine.dispose()
 
+    async def wait_for_vector_indexes(self) -> None:
+        """Wait until the HNSW indexes being built by this instance are built."""
+        await asyncio.gather(*self._background_tasks)
+
+    def _track_task(self, task: asyncio.Task) -> None:
+        """Keep background tasks from being garbage collected prematurely."""
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _ensure_vector_indexes(
+        self,
+        embeddings: list[InstanceOf[np.ndarray]],
+    ) -> None:
+        """
+        Start building the HNSW index for each embedding dimensionality not seen yet.
+
+        Embeddings of different dimensionalities share the untyped column,
+        so each dimensionality gets a partial expression index
+        on the embedding cast to its typed vector.
+        The indexes are built concurrently in the background,
+        so writes are neither delayed nor blocked by the build.
+        """
+        for dimensions in {len(embedding) for embedding in embeddings}:
+            if dimensions in self._indexed_dimensions:
+                continue
+            self._indexed_dimensions.add(dimensions)
+
+            if dimensions > HNSW_MAX_DIMENSIONS:
+                logger.warning(
+                    "Embeddings with %d dimensions exceed the %d dimensions "
+                    "supported by HNSW indexes, vector search will scan them",
+                    dimensions,
+                    HNSW_MAX_DIMENSIONS,
+                )
+                continue
+
+            self._track_task(
+                asyncio.create_task(self._create_vector_index(dimensions)),
+            )
+
+    async def _create_vector_index(self, dimensions: int) -> None:
+        index_name = vector_index_name(dimensions)
+
+        try:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+            async with self._engine.connect() as conn:
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+                # Only one process sharing the database builds the index.
+                lock_key = func.hashtext(index_name)
+                if not await conn.scalar(select(func.pg_try_advisory_lock(lock_key))):
+                    return
+
+                try:
+                    index_is_valid = await conn.scalar(
+                        text(
+                            "SELECT indisvalid FROM pg_index "
+                            "WHERE indexrelid = to_regclass(:index_name)",
+                        ),
+                        {"index_name": index_name},
+                    )
+                    if index_is_valid:
+                        return
+
+                    if index_is_valid is not None:
+                        # Left behind by an interrupted build.
+                        await conn.exec_driver_sql(
+                            f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}",
+                        )
+
+                    await conn.exec_driver_sql(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                        f"ON {Feature.__tablename__} USING hnsw "
+                        f"((embedding::vector({dimensions})) vector_cosine_ops) "
+                        f"WHERE vector_dims(embedding) = {dimensions}",
+                    )
+                finally:
+                    await conn.execute(select(func.pg_advisory_unlock(lock_key)))
+        except Exception:
+            logger.exception(
+                "Failed to build the HNSW index for %d dimensional embeddings",
+                dimensions,
+            )
+            # Retried when embeddings of these dimensions are next written.
+            self._indexed_dimensions.discard(dimensions)
+
     async def delete_all(self) -> None:
         async with self._create_session() as session:
             await session.execute(delete(citation_association_table))
             await session.execute(delete(SetIngestedHistory))
+            await session.execute(delete(SetHistoryCount))
+            await session.execute(delete(SetUnconsolidatedSection))
             await session.execute(delete(Feature))
             await session.commit()
 
@@ -247,6 +403,8 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             .returning(Feature.id)
         )
 
+        await self._ensure_vector_indexes([embedding])
+
         async with self._create_session() as session:
             result = await session.execute(stmt)
             await session.commit()
@@ -254,6 +412,51 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
 
         return FeatureIdT(feature_id)
 
+    async def add_features_bulk(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[FeatureIdT]:
+        if not features:
+            return []
+
+        feature_rows = [
+            {
+                "set_id": new_feature.set_id,
+                "semantic_category_id": new_feature.category_name,
+                "tag_id": new_feature.tag,
+                "feature": new_feature.feature,
+                "value": new_feature.value,
+                "embedding": new_feature.embedding,
+                "json_metadata": new_feature.metadata,
+            }
+            for new_feature in features
+        ]
+
+        await self._ensure_vector_indexes(
+            [new_feature.embedding for new_feature in features],
+        )
+
+        async with self._create_session() as session:
+            result = await session.execute(
+                insert(Feature).returning(Feature.id, sort_by_parameter_order=True),
+                feature_rows,
+            )
+            feature_ids = list(result.scalars())
+
+            citation_rows = [
+                {"feature_id": feature_id, "history_id": str(history_id)}
+                for feature_id, new_feature in zip(feature_ids, features, strict=True)
+                for history_id in dict.fromkeys(new_feature.citations)
+            ]
+            if citation_rows:
+                await session.execute(
+                    insert(citation_association_table).values(citation_rows),
+                )
+
+            await session.commit()
+
+        return [FeatureIdT(feature_id) for feature_id in feature_ids]
+
     async def update_feature(
         self,
         feature_id: FeatureIdT,
@@ -285,6 +488,7 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             stmt = stmt.values(tag_id=tag)
         if embedding is not None:
             stmt = stmt.values(embedding=embedding)
+            await self._ensure_vector_indexes([embedding])
         if metadata is not None:
             stmt = stmt.values(json_metadata=metadata)
 
@@ -350,6 +554,17 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             raise InvalidArgumentError("Cannot specify offset without limit")
 
         async with self._create_session() as session:
+            if vector_search_opts is not None and self._hnsw_ef_search is not None:
+                await session.execute(
+                    select(
+                        func.set_config(
+                            "hnsw.ef_search",
+                            str(self._hnsw_ef_search),
+                            True,
+                        ),
+                    ),
+                )
+
             result = await session.execute(stmt)
             features = result.scalars().all()
             citations_map: dict[int, list[EpisodeIdT]] = {}
@@ -444,45 +659,17 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             # Claim messages by locking them
             result = await session.execute(stmt)
             history_records = result.scalars().all()
-            
-            if not history_records:
-                await session.commit()
-                return []
-            
+
             # Immediately mark as ingested in the same transaction
             # This ensures other pods cannot claim these messages
             history_ids = [r.history_id for r in history_records]
-            
-            # Optimize: If all records have the same set_id (common case), use single UPDATE
-            # Otherwise, group by set_id for correctness
-            unique_set_ids = {r.set_id for r in history_records}
-            if len(unique_set_ids) == 1:
-                # Common case: all messages from same set_id - single UPDATE
-                set_id = history_records[0].set_id
-                update_stmt = (
-                    update(SetIngestedHistory)
-                    .where(SetIngestedHistory.set_id == set_id)
-                    .where(SetIngestedHistory.history_id.in_(history_ids))
-                    .values(ingested=True)
+            history_ids_by_set: dict[SetIdT, list[EpisodeIdT]] = {}
+            for record in history_records:
+                history_ids_by_set.setdefault(record.set_id, []).append(
+                    record.history_id,
                 )
-                await session.execute(update_stmt)
-            else:
-                # Multiple set_ids - group and update separately
-                history_ids_by_set: dict[str, list[str]] = {}
-                for record in history_records:
-                    if record.set_id not in history_ids_by_set:
-                        history_ids_by_set[record.set_id] = []
-                    history_ids_by_set[record.set_id].append(record.history_id)
-                
-                for set_id, ids in history_ids_by_set.items():
-                    update_stmt = (
-                        update(SetIngestedHistory)
-                        .where(SetIngestedHistory.set_id == set_id)
-                        .where(SetIngestedHistory.history_id.in_(ids))
-                        .values(ingested=True)
-                    )
-                    await session.execute(update_stmt)
-            
+
+            await self._mark_ingested(session, history_ids_by_set)
             await session.commit()
 
         return TypeAdapter(list[EpisodeIdT]).validate_python(history_ids)
@@ -493,13 +680,19 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
         set_ids: list[str] | None = None,
         is_ingested: bool | None = None,
     ) -> int:
-        stmt = select(func.count(SetIngestedHistory.history_id))
+        count_column: InstrumentedAttribute[int] | ColumnElement[int]
+        if is_ingested is None:
+            count_column = SetHistoryCount.history_count
+        elif is_ingested:
+            count_column = (
+                SetHistoryCount.history_count - SetHistoryCount.uningested_count
+            )
+        else:
+            count_column = SetHistoryCount.uningested_count
 
-        stmt = self._apply_history_filter(
-            stmt,
-            set_ids=set_ids,
-            is_ingested=is_ingested,
-        )
+        stmt = select(func.coalesce(func.sum(count_column), 0))
+        if set_ids is not None and len(set_ids) > 0:
+            stmt = stmt.where(SetHistoryCount.set_id.in_(set_ids))
 
         async with self._create_session() as session:
             result = await session.execute(stmt)
@@ -515,17 +708,107 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
         if len(history_ids) == 0:
             raise ValueError("No ids provided")
 
-        stmt = (
-            update(SetIngestedHistory)
-            .where(SetIngestedHistory.set_id == set_id)
-            .where(SetIngestedHistory.history_id.in_(history_ids))
-            .values(ingested=True)
-        )
-
         async with self._create_session() as session:
-            await session.execute(stmt)
+            await self._mark_ingested(session, {set_id: history_ids})
             await session.commit()
 
+    async def _mark_ingested(
+        self,
+        session: AsyncSession,
+        history_ids_by_set: dict[SetIdT, list[EpisodeIdT]],
+    ) -> None:
+        # Sets are updated in a fixed order to avoid deadlocks
+        # between transactions updating the same history counts.
+        for set_id in sorted(history_ids_by_set):
+            result = await session.execute(
+                update(SetIngestedHistory)
+                .where(SetIngestedHistory.set_id == set_id)
+                .where(SetIngestedHistory.history_id.in_(history_ids_by_set[set_id]))
+                .where(SetIngestedHistory.ingested.is_(False))
+                .values(ingested=True)
+                .returning(SetIngestedHistory.created_at),
+            )
+            created_ats = result.scalars().all()
+            if created_ats:
+                await self._update_history_count(
+                    session,
+                    set_id,
+                    num_ingested=len(created_ats),
+                    removed_oldest_at=min(
+                        (created_at for created_at in created_ats if created_at),
+                        default=None,
+                    ),
+                )
+
+    async def _update_history_count(
+        self,
+        session: AsyncSession,
+        set_id: SetIdT,
+        *,
+        num_deleted: int = 0,
+        num_ingested: int = 0,
+        removed_oldest_at: AwareDatetime | None = None,
+    ) -> None:
+        """
+        Subtract ingested or deleted history from the counts of a set.
+
+        The oldest uningested time is only looked up again
+        when the current oldest uningested history was removed.
+
+        Args:
+            session (AsyncSession):
+                Session of the transaction that changed the history.
+            set_id (SetIdT):
+                The set whose history changed.
+            num_deleted (int):
+                Number of history messages deleted from the set.
+            num_ingested (int):
+                Number of uningested history messages
+                ingested or deleted from the set.
+            removed_oldest_at (AwareDatetime | None):
+                Oldest creation time of the uningested history messages
+                ingested or deleted from the set.
+
+        """
+        uningested_count = SetHistoryCount.uningested_count - num_ingested
+        oldest_uningested_at: InstrumentedAttribute[Any] | ColumnElement[Any] = (
+            SetHistoryCount.oldest_uningested_at
+        )
+        if removed_oldest_at is not None:
+            # Matches the predicate of
+            # idx_set_ingested_history_uningested_created_at.
+            next_oldest_uningested_at = (
+                select(SetIngestedHistory.created_at)
+                .where(SetIngestedHistory.set_id == set_id)
+                .where(~SetIngestedHistory.ingested)
+                .order_by(SetIngestedHistory.created_at.asc())
+                .limit(1)
+                .scalar_subquery()
+            )
+            oldest_uningested_at = case(
+                (uningested_count <= 0, None),
+                (
+                    SetHistoryCount.oldest_uningested_at >= removed_oldest_at,
+                    next_oldest_uningested_at,
+                ),
+                else_=SetHistoryCount.oldest_uningested_at,
+            )
+        await session.execute(
+            update(SetHistoryCount)
+            .where(SetHistoryCount.set_id == set_id)
+            .values(
+                history_count=SetHistoryCount.history_count - num_deleted,
+                uningested_count=uningested_count,
+                oldest_uningested_at=oldest_uningested_at,
+            ),
+        )
+        if num_deleted > 0:
+            await session.execute(
+                delete(SetHistoryCount)
+                .where(SetHistoryCount.set_id == set_id)
+                .where(SetHistoryCount.history_count <= 0),
+            )
+
     async def add_history_to_set(
         self,
         set_id: str,
@@ -533,20 +816,129 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
     ) -> None:
         stmt = insert(SetIngestedHistory).values(set_id=set_id, history_id=history_id)
 
+        # now() is the transaction start time, as is created_at of the history.
+        count_stmt = pg_insert(SetHistoryCount).values(
+            set_id=set_id,
+            history_count=1,
+            uningested_count=1,
+            oldest_uningested_at=func.now(),
+        )
+        count_stmt = count_stmt.on_conflict_do_update(
+            index_elements=[SetHistoryCount.set_id],
+            set_={
+                "history_count": SetHistoryCount.history_count + 1,
+                "uningested_count": SetHistoryCount.uningested_count + 1,
+                "oldest_uningested_at": func.least(
+                    SetHistoryCount.oldest_uningested_at,
+                    count_stmt.excluded.oldest_uningested_at,
+                ),
+            },
+        )
+
         async with self._create_session() as session:
             await session.execute(stmt)
+            await session.execute(count_stmt)
+            # Delivered to listeners when the transaction commits.
+            await session.execute(
+                select(
+                    func.pg_notify(
+                        HISTORY_ADDED_CHANNEL,
+                        f"{self._instance_id}:{set_id}",
+                    ),
+                ),
+            )
             await session.commit()
 
+    @property
+    def notifies_history_added(self) -> bool:
+        # Notifications are received through asyncpg connection listeners.
+        return self._engine.dialect.driver == "asyncpg"
+
+    async def watch_history_added(self, callback: Callable[[SetIdT], None]) -> None:
+        def _on_notification(
+            _connection: object,
+            _pid: int,
+            _channel: str,
+            payload: str,
+        ) -> None:
+            instance_id, _, set_id = payload.partition(":")
+            if instance_id != self._instance_id:
+                callback(set_id)
+
+        terminated: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        def _on_termination(_connection: object) -> None:
+            if not terminated.done():
+                terminated.set_exception(
+                    ConnectionError("Semantic history listener connection was lost"),
+                )
+
+        async with self._engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is None or not hasattr(
+                driver_connection,
+                "add_listener",
+            ):
+                # The caller polls for history instead.
+                return
+
+            driver_connection.add_termination_listener(_on_termination)
+            await driver_connection.add_listener(
+                HISTORY_ADDED_CHANNEL,
+                _on_notification,
+            )
+            try:
+                # Raises when the connection is lost, so the caller reconnects.
+                await terminated
+            except ConnectionError:
+                await conn.invalidate()
+                raise
+            finally:
+                driver_connection.remove_termination_listener(_on_termination)
+                await driver_connection.remove_listener(
+                    HISTORY_ADDED_CHANNEL,
+                    _on_notification,
+                )
+
     async def delete_history(self, history_ids: list[EpisodeIdT]) -> None:
         if not history_ids:
             return
 
-        stmt = delete(SetIngestedHistory).where(
-            SetIngestedHistory.history_id.in_(history_ids),
+        stmt = (
+            delete(SetIngestedHistory)
+            .where(SetIngestedHistory.history_id.in_(history_ids))
+            .returning(
+                SetIngestedHistory.set_id,
+                SetIngestedHistory.ingested,
+                SetIngestedHistory.created_at,
+            )
         )
 
         async with self._create_session() as session:
-            await session.execute(stmt)
+            result = await session.execute(stmt)
+
+            num_deleted: Counter[SetIdT] = Counter()
+            num_uningested_deleted: Counter[SetIdT] = Counter()
+            removed_oldest_at: dict[SetIdT, AwareDatetime] = {}
+            for set_id, ingested, created_at in result:
+                num_deleted[set_id] += 1
+                if not ingested:
+                    num_uningested_deleted[set_id] += 1
+                    if created_at is not None and (
+                        set_id not in removed_oldest_at
+                        or created_at < removed_oldest_at[set_id]
+                    ):
+                        removed_oldest_at[set_id] = created_at
+
+            for set_id in sorted(num_deleted):
+                await self._update_history_count(
+                    session,
+                    set_id,
+                    num_deleted=num_deleted[set_id],
+                    num_ingested=num_uningested_deleted[set_id],
+                    removed_oldest_at=removed_oldest_at.get(set_id),
+                )
             await session.commit()
 
     async def delete_history_set(self, set_ids: list[SetIdT]) -> None:
@@ -559,6 +951,9 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
 
         async with self._create_session() as session:
             await session.execute(stmt)
+            await session.execute(
+                delete(SetHistoryCount).where(SetHistoryCount.set_id.in_(set_ids)),
+            )
             await session.commit()
 
     def _apply_history_filter(
@@ -584,20 +979,22 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
         stmt: Select[Any],
         vector_search_opts: SemanticStorage.VectorSearchOpts,
     ) -> Select[Any]:
+        # Match the partial expression index for the query dimensionality.
+        # The dimensions are inlined so that the planner can prove
+        # the index predicate even for generic prepared statement plans.
+        dimensions = len(vector_search_opts.query_embedding)
+        stmt = stmt.where(
+            func.vector_dims(Feature.embedding) == literal_column(str(dimensions)),
+        )
+        distance = cast(Feature.embedding, Vector(dimensions)).cosine_distance(
+            vector_search_opts.query_embedding,
+        )
+
         if vector_search_opts.min_distance is not None:
             threshold = 1 - vector_search_opts.min_distance
-            stmt = stmt.where(
-                Feature.embedding.cosine_distance(
-                    vector_search_opts.query_embedding,
-                )
-                <= threshold,
-            )
+            stmt = stmt.where(distance <= threshold)
 
-        stmt = stmt.order_by(
-            Feature.embedding.cosine_distance(
-                vector_search_opts.query_embedding,
-            ).asc(),
-        )
+        stmt = stmt.order_by(distance.asc())
 
         return stmt
 
@@ -654,7 +1051,10 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
                 vector_search_opts=vector_search_opts,
             )
             if filter_expr is not None:
-                clause = self._compile_feature_filter_expr(filter_expr, Feature)
+                clause = compile_sql_filter(
+                    filter_expr,
+                    SqlAlchemyPgVectorSemanticStorage._resolve_feature_column,
+                )
                 working_stmt = working_stmt.where(clause)
             return working_stmt
 
@@ -665,45 +1065,21 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
 
         delete_stmt = stmt
         if filter_expr is not None:
-            clause = self._compile_feature_filter_expr(filter_expr, Feature)
+            clause = compile_sql_filter(
+                filter_expr,
+                SqlAlchemyPgVectorSemanticStorage._resolve_feature_column,
+            )
             delete_stmt = delete_stmt.where(clause)
 
         return delete_stmt
 
-    def _compile_feature_comparison_expr(
-        self,
-        expr: FilterComparison,
-        table: type[Feature],
-    ) -> ColumnElement[bool] | None:
-        column, is_metadata = self._resolve_feature_field(table, expr.field)
-
-        return parse_sql_filter(
-            column=column,
-            is_metadata=is_metadata,
-            expr=expr,
-        )
-
-    def _compile_feature_filter_expr(
-        self,
-        expr: FilterExpr,
-        table: type[Feature],
-    ) -> ColumnElement[bool] | None:
-        if isinstance(expr, FilterComparison):
-            return self._compile_feature_comparison_expr(expr, table)
-
-        if isinstance(expr, FilterAnd):
-            left = self._compile_feature_filter_expr(expr.left, table)
-            right = self._compile_feature_filter_expr(expr.right, table)
-
-            return and_(left, right)
-
-        if isinstance(expr, FilterOr):
-            left = self._compile_feature_filter_expr(expr.left, table)
-            right = self._compile_feature_filter_expr(expr.right, table)
-
-            return or_(left, right)
-
-        raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
+    @staticmethod
+    def _resolve_feature_column(
+        field: str,
+    ) -> (
+        tuple[MappedColumn[Any] | InstrumentedAttribute[Any], bool] | tuple[None, bool]
+    ):
+        return SqlAlchemyPgVectorSemanticStorage._resolve_feature_field(Feature, field)
 
     @staticmethod
     def _resolve_feature_field(
@@ -764,29 +1140,20 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
         min_uningested_messages: int | None = None,
         older_than: AwareDatetime | None = None,
     ) -> list[SetIdT]:
-        stmt = select(SetIngestedHistory.set_id).distinct()
+        stmt = select(SetHistoryCount.set_id).where(SetHistoryCount.history_count > 0)
 
         conditions = []
 
         if min_uningested_messages is not None and min_uningested_messages > 0:
-            inner = aliased(SetIngestedHistory)
-
-            count_uningested = (
-                select(func.count(inner.set_id))
-                .where(
-                    inner.set_id == SetIngestedHistory.set_id,  # correlate on set_id
-                    inner.ingested.is_(False),
-                )
-                .scalar_subquery()
+            conditions.append(
+                SetHistoryCount.uningested_count >= min_uningested_messages,
             )
 
-            conditions.append(count_uningested >= min_uningested_messages)
-
         if older_than is not None:
             conditions.append(
                 and_(
-                    SetIngestedHistory.created_at <= older_than,
-                    SetIngestedHistory.ingested.is_(False),
+                    SetHistoryCount.uningested_count > 0,
+                    SetHistoryCount.oldest_uningested_at <= older_than,
                 )
             )
 
@@ -800,3 +1167,90 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             set_ids = result.scalars().all()
 
         return TypeAdapter(list[SetIdT]).validate_python(set_ids)
+
+    async def get_oldest_uningested_times(
+        self,
+        set_ids: list[SetIdT],
+    ) -> dict[SetIdT, AwareDatetime]:
+        if not set_ids:
+            return {}
+
+        stmt = select(
+            SetHistoryCount.set_id,
+            SetHistoryCount.oldest_uningested_at,
+        ).where(
+            SetHistoryCount.set_id.in_(set_ids),
+            SetHistoryCount.uningested_count > 0,
+            SetHistoryCount.oldest_uningested_at.is_not(None),
+        )
+
+        async with self._create_session() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        return {
+            SetIdT(set_id): oldest_uningested_at
+            for set_id, oldest_uningested_at in rows
+        }
+
+    async def add_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+        sections: list[tuple[str, str]],
+    ) -> None:
+        if not sections:
+            return
+
+        stmt = (
+            pg_insert(SetUnconsolidatedSection)
+            .values(
+                [
+                    {
+                        "set_id": set_id,
+                        "semantic_category_id": category_name,
+                        "tag_id": tag,
+                    }
+                    for category_name, tag in dict.fromkeys(sections)
+                ],
+            )
+            .on_conflict_do_nothing()
+        )
+
+        async with self._create_session() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def claim_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+    ) -> list[tuple[str, str]]:
+        stmt = (
+            delete(SetUnconsolidatedSection)
+            .where(SetUnconsolidatedSection.set_id == set_id)
+            .returning(
+                SetUnconsolidatedSection.semantic_category_id,
+                SetUnconsolidatedSection.tag_id,
+            )
+        )
+
+        async with self._create_session() as session:
+            result = await session.execute(stmt)
+            sections = [(category_name, tag) for category_name, tag in result]
+            await session.commit()
+
+        return sections
+
+    async def get_unconsolidated_set_ids(
+        self,
+        *,
+        set_ids: list[SetIdT] | None = None,
+    ) -> list[SetIdT]:
+        stmt = select(SetUnconsolidatedSection.set_id).distinct()
+        if set_ids is not None:
+            stmt = stmt.where(SetUnconsolidatedSection.set_id.in_(set_ids))
+
+        async with self._create_session() as session:
+            result = await session.execute(stmt)
+            unconsolidated_set_ids = result.scalars().all()
+
+        return TypeAdapter(list[SetIdT]).validate_python(unconsolidated_set_ids)
@@ -1,7 +1,8 @@
 """Abstract interfaces for semantic storage implementations."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -59,6 +60,33 @@ class SemanticStorage(ABC):
         """Add a new feature to the user."""
         raise NotImplementedError
 
+    @dataclass
+    class NewFeature:
+        """A feature to add, together with the history ids it cites."""
+
+        set_id: SetIdT
+        category_name: str
+        feature: str
+        value: str
+        tag: str
+        embedding: InstanceOf[np.ndarray]
+        metadata: dict[str, Any] | None = None
+        citations: list[EpisodeIdT] = field(default_factory=list)
+
+    @abstractmethod
+    async def add_features_bulk(
+        self,
+        features: list[NewFeature],
+    ) -> list[FeatureIdT]:
+        """
+        Add new features and their citations in a single transaction.
+
+        Returns:
+            The ids of the added features, in the order of the input features.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update_feature(
         self,
@@ -178,3 +206,79 @@ class SemanticStorage(ABC):
     ) -> list[SetIdT]:
         """Return all set id's that match the specified filters."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_oldest_uningested_times(
+        self,
+        set_ids: list[SetIdT],
+    ) -> dict[SetIdT, datetime]:
+        """
+        Return when the oldest uningested history message of each set was added.
+
+        Sets without uningested history are left out.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+        sections: list[tuple[str, str]],
+    ) -> None:
+        """
+        Record sections of a set with features added since its consolidation.
+
+        Args:
+            set_id (SetIdT):
+                The set the features were added to.
+            sections (list[tuple[str, str]]):
+                (category name, tag) sections the features were added to.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+    ) -> list[tuple[str, str]]:
+        """
+        Remove and return the unconsolidated sections of a set.
+
+        Sections are claimed atomically, so that only one process
+        consolidates them. Sections changed after the claim are recorded again.
+
+        Returns:
+            The claimed (category name, tag) sections.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_unconsolidated_set_ids(
+        self,
+        *,
+        set_ids: list[SetIdT] | None = None,
+    ) -> list[SetIdT]:
+        """Return the sets that have unconsolidated sections."""
+        raise NotImplementedError
+
+    @property
+    def notifies_history_added(self) -> bool:
+        """Whether watch_history_added reports history added by other processes."""
+        return False
+
+    async def watch_history_added(self, callback: Callable[[SetIdT], None]) -> None:
+        """
+        Report history added to sets by other processes until cancelled.
+
+        Returns if notifications cannot be received,
+        in which case callers poll for history instead.
+
+        Args:
+            callback (Callable[[SetIdT], None]):
+                Called with the set id for each history message
+                added by another process.
+
+        """
+        raise NotImplementedError
@@ -6,6 +6,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, FastAPI, Response
 from fastapi.exceptions import HTTPException, RequestValidationError
+from fastapi.responses import JSONResponse
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from memmachine import MemMachine
@@ -23,6 +24,7 @@ from memmachine.common.api.spec import (
     ListMemoriesSpec,
     ListResult,
     ProjectConfig,
+    ProjectDeletionResponse,
     ProjectResponse,
     RestErrorModel,
     SearchMemoriesSpec,
@@ -44,6 +46,7 @@ from memmachine.main.memmachine import ALL_MEMORY_TYPES
 from memmachine.server.api_v2.service import (
     _add_messages_to,
     _list_target_memories,
+    _project_deletion_response,
     _search_target_memories,
     _SessionData,
     get_memmachine,
@@ -254,22 +257,56 @@ async def list_projects(
     ]
 
 
-@router.post("/projects/delete", status_code=204, description=RouterDoc.DELETE_PROJECT)
+@router.post(
+    "/projects/delete",
+    status_code=204,
+    description=RouterDoc.DELETE_PROJECT,
+    response_model=None,
+    responses={202: {"model": ProjectDeletionResponse}},
+)
 async def delete_project(
     spec: DeleteProjectSpec,
     memmachine: Annotated[MemMachine, Depends(get_memmachine)],
-) -> None:
+) -> Response | None:
     """Delete a project."""
     session_data = _SessionData(
         org_id=spec.org_id,
         project_id=spec.project_id,
     )
     try:
-        await memmachine.delete_session(session_data)
+        if spec.background:
+            deletion = await memmachine.start_session_deletion(session_data)
+        else:
+            await memmachine.delete_session(session_data)
     except SessionNotFoundError as e:
         raise RestError(code=404, message="Project does not exist", ex=e) from e
     except Exception as e:
         raise RestError(code=500, message="Unable to delete project", ex=e) from e
+    if not spec.background:
+        return None
+    return JSONResponse(
+        status_code=202,
+        content=_project_deletion_response(
+            spec.org_id, spec.project_id, deletion
+        ).model_dump(mode="json"),
+    )
+
+
+@router.post(
+    "/projects/delete/status",
+    description=RouterDoc.GET_PROJECT_DELETION_STATUS,
+)
+async def get_project_deletion_status(
+    spec: GetProjectSpec,
+    memmachine: Annotated[MemMachine, Depends(get_memmachine)],
+) -> ProjectDeletionResponse:
+    """Retrieve the status of a background project deletion."""
+    session_data = _SessionData(
+        org_id=spec.org_id,
+        project_id=spec.project_id,
+    )
+    deletion = memmachine.get_session_deletion(session_data.session_key)
+    return _project_deletion_response(spec.org_id, spec.project_id, deletion)
 
 
 @router.post("/memories", description=RouterDoc.ADD_MEMORIES)
@@ -320,9 +357,12 @@ async def list_memories(
 ) -> ListResult:
     """List memories in a project."""
     target_memories = [spec.type] if spec.type is not None else ALL_MEMORY_TYPES
-    return await _list_target_memories(
-        target_memories=target_memories, spec=spec, memmachine=memmachine
-    )
+    try:
+        return await _list_target_memories(
+            target_memories=target_memories, spec=spec, memmachine=memmachine
+        )
+    except ValueError as e:
+        raise RestError(code=422, message="invalid argument", ex=e) from e
 
 
 @router.post(
@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from fastapi import Request
 
 from memmachine import MemMachine
-
-logger = logging.getLogger(__name__)
 from memmachine.common.api import MemoryType as MemoryTypeE
 from memmachine.common.api.spec import (
     AddMemoriesSpec,
@@ -17,12 +15,17 @@ from memmachine.common.api.spec import (
     ListMemoriesSpec,
     ListResult,
     ListResultContent,
+    ProjectDeletionResponse,
+    ProjectDeletionStatus,
     SearchMemoriesSpec,
     SearchResult,
     SearchResultContent,
     SemanticFeature,
 )
-from memmachine.common.episode_store.episode_model import EpisodeEntry
+from memmachine.common.episode_store.episode_model import EpisodeCursor, EpisodeEntry
+from memmachine.main.memmachine import SessionDeletion
+
+logger = logging.getLogger(__name__)
 
 
 # Placeholder dependency injection function
@@ -152,6 +155,26 @@ async def _add_messages_to(
     return [AddMemoryResult(uid=e_id) for e_id in episode_ids]
 
 
+def _project_deletion_response(
+    org_id: str,
+    project_id: str,
+    deletion: SessionDeletion | None,
+) -> ProjectDeletionResponse:
+    if deletion is None:
+        return ProjectDeletionResponse(
+            org_id=org_id,
+            project_id=project_id,
+            status=ProjectDeletionStatus.UNKNOWN,
+        )
+    return ProjectDeletionResponse(
+        org_id=org_id,
+        project_id=project_id,
+        status=ProjectDeletionStatus(deletion.status.value),
+        deleted_episodes=deletion.deleted_episodes,
+        error=deletion.error,
+    )
+
+
 async def _search_target_memories(
     target_memories: list[MemoryTypeE],
     spec: SearchMemoriesSpec,
@@ -221,6 +244,7 @@ async def _list_target_memories(
         search_filter=spec.filter,
         page_size=spec.page_size,
         page_num=spec.page_num,
+        episodic_cursor=spec.episodic_cursor,
     )
 
     content = ListResultContent(
@@ -231,6 +255,10 @@ async def _list_target_memories(
         content.episodic_memory = [
             Episode(**e.model_dump(mode="json")) for e in results.episodic_memory
         ]
+        if results.episodic_memory and len(results.episodic_memory) == spec.page_size:
+            content.episodic_memory_next_cursor = EpisodeCursor.from_episode(
+                results.episodic_memory[-1]
+            ).encode()
     if results.semantic_memory is not None:
         content.semantic_memory = [
             SemanticFeature(**f.model_dump(mode="json"))
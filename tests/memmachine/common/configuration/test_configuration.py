@@ -38,6 +38,19 @@ def test_update_long_term_memory_conf(long_term_memory_conf: LongTermMemoryConfP
     assert updated.embedder == "embedder_v2"
     assert updated.reranker == "reranker_v1"
     assert updated.vector_graph_store == "store_v1"
+    assert updated.lexical_search_tokenizer == "default"
+    assert updated.lexical_search_language == "english"
+
+    specific = LongTermMemoryConfPartial(
+        session_id="session_123",
+        lexical_search=True,
+        lexical_search_tokenizer="simple",
+    )
+
+    updated = specific.merge(long_term_memory_conf)
+    assert updated.lexical_search
+    assert updated.lexical_search_tokenizer == "simple"
+    assert updated.lexical_search_language == "english"
 
 
 @pytest.fixture
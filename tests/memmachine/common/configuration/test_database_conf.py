@@ -5,6 +5,7 @@ from pydantic import SecretStr
 from memmachine.common.configuration.database_conf import (
     DatabasesConf,
     Neo4jConf,
+    NumpyGraphConf,
     SqlAlchemyConf,
     SupportedDB,
 )
@@ -14,6 +15,7 @@ def test_parse_supported_db_enums():
     assert SupportedDB.from_provider("neo4j") == SupportedDB.NEO4J
     assert SupportedDB.from_provider("postgres") == SupportedDB.POSTGRES
     assert SupportedDB.from_provider("sqlite") == SupportedDB.SQLITE
+    assert SupportedDB.from_provider("numpy") == SupportedDB.NUMPY
 
     neo4j_db = SupportedDB.NEO4J
     assert neo4j_db.is_neo4j
@@ -25,6 +27,12 @@ def test_parse_supported_db_enums():
     assert pg_db.dialect == "postgresql"
     assert pg_db.driver == "asyncpg"
 
+    numpy_db = SupportedDB.NUMPY
+    assert numpy_db.is_numpy
+    assert numpy_db.is_vector_graph_store
+    assert not numpy_db.is_neo4j
+    assert numpy_db.conf_cls == NumpyGraphConf
+
     sqlite_db = SupportedDB.SQLITE
     assert not sqlite_db.is_neo4j
     assert sqlite_db.conf_cls == SqlAlchemyConf
@@ -80,6 +88,12 @@ def db_conf_dict() -> dict:
                     "path": "local.db",
                 },
             },
+            "local_graph": {
+                "provider": "numpy",
+                "config": {
+                    "snapshot_path": "graph_snapshots",
+                },
+            },
         },
     }
 
@@ -122,6 +136,11 @@ def test_parse_valid_storage_dict(db_conf_dict):
     assert isinstance(sqlite_conf, SqlAlchemyConf)
     assert sqlite_conf.uri == "sqlite+aiosqlite:///local.db"
 
+    # NumPy graph check
+    numpy_graph_conf = storage_conf.numpy_graph_confs["local_graph"]
+    assert isinstance(numpy_graph_conf, NumpyGraphConf)
+    assert numpy_graph_conf.snapshot_path == "graph_snapshots"
+
 
 def test_read_db_password_from_env(monkeypatch, db_conf_dict):
     monkeypatch.setenv("MY_DB_PASSWORD", "env-db-password")
@@ -121,6 +121,38 @@ def test_embedder_to_yaml(embedder_conf):
     assert len(conf_cp.amazon_bedrock) == len(conf.amazon_bedrock)
 
 
+def test_embedder_cache_conf(openai_embedder_conf):
+    conf = EmbeddersConf.parse({"embedders": {"openai_embedder": openai_embedder_conf}})
+    assert conf.openai["openai_embedder"].cache is None
+
+    openai_embedder_conf["config"]["cache"] = {"max_size": 32, "ttl_seconds": 60}
+    conf = EmbeddersConf.parse({"embedders": {"openai_embedder": openai_embedder_conf}})
+    cache_conf = conf.openai["openai_embedder"].cache
+    assert cache_conf is not None
+    assert cache_conf.max_size == 32
+    assert cache_conf.ttl_seconds == 60
+
+    assert conf.openai["openai_embedder"].persistent_cache is None
+
+    openai_embedder_conf["config"]["persistent_cache"] = {"path": "embeddings.db"}
+    conf = EmbeddersConf.parse({"embedders": {"openai_embedder": openai_embedder_conf}})
+    persistent_cache_conf = conf.openai["openai_embedder"].persistent_cache
+    assert persistent_cache_conf is not None
+    assert persistent_cache_conf.path == "embeddings.db"
+
+    assert conf.openai["openai_embedder"].batching is None
+
+    openai_embedder_conf["config"]["batching"] = {"max_batch_size": 64}
+    conf = EmbeddersConf.parse({"embedders": {"openai_embedder": openai_embedder_conf}})
+    batching_conf = conf.openai["openai_embedder"].batching
+    assert batching_conf is not None
+    assert batching_conf.max_batch_size == 64
+    assert batching_conf.max_wait_seconds == 0.005
+
+    conf_cp = EmbeddersConf.parse(yaml.safe_load(conf.to_yaml()))
+    assert conf_cp == conf
+
+
 def test_open_ai_embeder_without_key():
     conf_dict = {
         "model": "text-embedding-ada-002",
@@ -123,6 +123,34 @@ def test_serialize_deserialize_language_model_conf(full_model_conf):
     )
 
 
+def test_language_model_scheduler_conf(ollama_model_conf):
+    conf = OpenAIChatCompletionsLanguageModelConf(**ollama_model_conf["config"])
+    assert conf.scheduler is None
+    assert conf.build_request_scheduler(conf.max_retry_interval_seconds) is None
+
+    ollama_model_conf["config"]["scheduler"] = {
+        "max_concurrency": 8,
+        "tokens_per_minute": 100000,
+    }
+    conf = LanguageModelsConf.parse(
+        {"language_models": {"ollama_model": ollama_model_conf}},
+    )
+    chat_completions_conf = conf.openai_chat_completions_language_model_confs[
+        "ollama_model"
+    ]
+    assert chat_completions_conf.scheduler is not None
+    assert chat_completions_conf.scheduler.max_concurrency == 8
+    assert chat_completions_conf.scheduler.min_concurrency == 1
+    assert chat_completions_conf.scheduler.requests_per_minute is None
+
+    scheduler = chat_completions_conf.build_request_scheduler(30)
+    assert scheduler is not None
+    assert scheduler.concurrency_limit == 8
+
+    conf_cp = LanguageModelsConf.parse(yaml.safe_load(conf.to_yaml()))
+    assert conf_cp == conf
+
+
 def test_missing_required_field_openai_model():
     conf_dict = {"model": "gpt-4o-mini"}
     with pytest.raises(ValidationError) as exc_info:
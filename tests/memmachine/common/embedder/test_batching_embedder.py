@@ -0,0 +1,218 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.embedder import Embedder
+from memmachine.common.embedder.batching_embedder import (
+    BatchingEmbedder,
+    BatchingEmbedderParams,
+)
+from memmachine.common.metrics_factory import MetricsFactory
+
+
+class RecordingEmbedder(Embedder):
+    def __init__(self, delay_seconds: float = 0):
+        super().__init__()
+
+        self.search_calls: list[tuple[list[Any], int]] = []
+        self.ingest_calls: list[tuple[list[Any], int]] = []
+        self.fail = False
+        self.max_concurrent_inputs = 0
+        self._concurrent_inputs = 0
+        self._delay_seconds = delay_seconds
+
+    async def _embed(self, inputs: list[Any], sign: float) -> list[list[float]]:
+        self._concurrent_inputs += len(inputs)
+        self.max_concurrent_inputs = max(
+            self.max_concurrent_inputs,
+            self._concurrent_inputs,
+        )
+        try:
+            await asyncio.sleep(self._delay_seconds)
+        finally:
+            self._concurrent_inputs -= len(inputs)
+        if self.fail:
+            raise RuntimeError("embedding failed")
+        return [[float(len(input_)), sign] for input_ in inputs]
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        self.ingest_calls.append((list(inputs), max_attempts))
+        return await self._embed(inputs, 1.0)
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        self.search_calls.append((list(queries), max_attempts))
+        return await self._embed(queries, -1.0)
+
+    @property
+    def model_id(self) -> str:
+        return "recording-model"
+
+    @property
+    def dimensions(self) -> int:
+        return 2
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        return SimilarityMetric.DOT
+
+
+@pytest.fixture
+def wrapped_embedder():
+    return RecordingEmbedder()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_request(wrapped_embedder):
+    embedder = BatchingEmbedder(BatchingEmbedderParams(embedder=wrapped_embedder))
+
+    results = await asyncio.gather(
+        embedder.search_embed(["a"]),
+        embedder.search_embed(["bb", "ccc"]),
+        embedder.ingest_embed(["dddd"]),
+        embedder.search_embed([]),
+    )
+
+    assert results == [
+        [[1.0, -1.0]],
+        [[2.0, -1.0], [3.0, -1.0]],
+        [[4.0, 1.0]],
+        [],
+    ]
+    assert wrapped_embedder.search_calls == [(["a", "bb", "ccc"], 1)]
+    assert wrapped_embedder.ingest_calls == [(["dddd"], 1)]
+
+    assert embedder.model_id == "recording-model"
+    assert embedder.dimensions == 2
+    assert embedder.similarity_metric == SimilarityMetric.DOT
+
+
+@pytest.mark.asyncio
+async def test_calls_with_different_attempts_are_batched_separately(
+    wrapped_embedder,
+):
+    embedder = BatchingEmbedder(BatchingEmbedderParams(embedder=wrapped_embedder))
+
+    await asyncio.gather(
+        embedder.ingest_embed(["a"], max_attempts=1),
+        embedder.ingest_embed(["b"], max_attempts=3),
+        embedder.ingest_embed(["c"], max_attempts=3),
+    )
+
+    assert sorted(wrapped_embedder.ingest_calls) == [
+        (["a"], 1),
+        (["b", "c"], 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting(wrapped_embedder):
+    embedder = BatchingEmbedder(
+        BatchingEmbedderParams(
+            embedder=wrapped_embedder,
+            max_batch_size=3,
+            max_wait_seconds=60,
+        ),
+    )
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            embedder.search_embed(["a", "b"]),
+            embedder.search_embed(["c", "d"]),
+            embedder.search_embed(["e", "f", "g", "h"]),
+        ),
+        timeout=5,
+    )
+
+    assert [len(result) for result in results] == [2, 2, 4]
+    assert [queries for queries, _ in wrapped_embedder.search_calls] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e", "f", "g", "h"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pending_inputs_are_bounded():
+    wrapped_embedder = RecordingEmbedder(delay_seconds=0.01)
+    embedder = BatchingEmbedder(
+        BatchingEmbedderParams(
+            embedder=wrapped_embedder,
+            max_batch_size=2,
+            max_wait_seconds=0,
+            max_pending_inputs=4,
+        ),
+    )
+
+    results = await asyncio.gather(
+        *(embedder.ingest_embed([str(i), str(i)]) for i in range(10)),
+        embedder.ingest_embed(["x"] * 6),
+    )
+
+    assert [len(result) for result in results] == [2] * 10 + [6]
+    assert wrapped_embedder.max_concurrent_inputs == 6
+    assert embedder._num_pending_inputs == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_request_fails_all_calls():
+    wrapped_embedder = RecordingEmbedder()
+    wrapped_embedder.fail = True
+    embedder = BatchingEmbedder(BatchingEmbedderParams(embedder=wrapped_embedder))
+
+    results = await asyncio.gather(
+        embedder.search_embed(["a"]),
+        embedder.search_embed(["b"]),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(wrapped_embedder.search_calls) == 1
+
+    wrapped_embedder.fail = False
+    assert await embedder.search_embed(["a"]) == [[1.0, -1.0]]
+    assert embedder._num_pending_inputs == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics(wrapped_embedder):
+    histograms: dict[str, MagicMock] = {}
+
+    def get_histogram(name, description, label_names=()):
+        return histograms.setdefault(name, MagicMock())
+
+    metrics_factory = MagicMock(spec=MetricsFactory)
+    metrics_factory.get_histogram.side_effect = get_histogram
+
+    embedder = BatchingEmbedder(
+        BatchingEmbedderParams(
+            embedder=wrapped_embedder,
+            metrics_factory=metrics_factory,
+            user_metrics_labels={"label": "value"},
+        ),
+    )
+
+    await asyncio.gather(
+        embedder.search_embed(["a", "b"]),
+        embedder.search_embed(["c"]),
+    )
+
+    labels = {"label": "value", "method": "search"}
+    histograms["embedder_batch_size"].observe.assert_called_once_with(
+        value=3,
+        labels=labels,
+    )
+    histograms["embedder_batch_calls"].observe.assert_called_once_with(
+        value=2,
+        labels=labels,
+    )
+    histograms["embedder_batch_latency_seconds"].observe.assert_called_once()
@@ -0,0 +1,227 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.embedder import Embedder
+from memmachine.common.embedder.caching_embedder import (
+    CachingEmbedder,
+    CachingEmbedderParams,
+)
+from memmachine.common.metrics_factory import MetricsFactory
+
+
+class CountingEmbedder(Embedder):
+    def __init__(self, delay_seconds: float = 0):
+        super().__init__()
+
+        self.search_calls: list[list[Any]] = []
+        self.ingest_calls: list[list[Any]] = []
+        self.fail = False
+        self._delay_seconds = delay_seconds
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        self.ingest_calls.append(list(inputs))
+        return [[float(len(_input)), 1.0] for _input in inputs]
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        self.search_calls.append(list(queries))
+        await asyncio.sleep(self._delay_seconds)
+        if self.fail:
+            raise RuntimeError("embedding failed")
+        return [[float(len(query)), -1.0] for query in queries]
+
+    @property
+    def model_id(self) -> str:
+        return "counting-model"
+
+    @property
+    def dimensions(self) -> int:
+        return 2
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        return SimilarityMetric.DOT
+
+
+@pytest.fixture
+def wrapped_embedder():
+    return CountingEmbedder()
+
+
+@pytest.mark.asyncio
+async def test_search_embed_caches_queries(wrapped_embedder):
+    embedder = CachingEmbedder(CachingEmbedderParams(embedder=wrapped_embedder))
+
+    first = await embedder.search_embed(["a", "bb"])
+    second = await embedder.search_embed(["bb", "ccc", "a"])
+
+    assert first == [[1.0, -1.0], [2.0, -1.0]]
+    assert second == [[2.0, -1.0], [3.0, -1.0], [1.0, -1.0]]
+    assert wrapped_embedder.search_calls == [["a", "bb"], ["ccc"]]
+
+    assert embedder.model_id == "counting-model"
+    assert embedder.dimensions == 2
+    assert embedder.similarity_metric == SimilarityMetric.DOT
+
+
+@pytest.mark.asyncio
+async def test_search_embed_returns_copies(wrapped_embedder):
+    embedder = CachingEmbedder(CachingEmbedderParams(embedder=wrapped_embedder))
+
+    first = await embedder.search_embed(["a"])
+    first[0][0] = 100.0
+
+    assert await embedder.search_embed(["a"]) == [[1.0, -1.0]]
+
+
+@pytest.mark.asyncio
+async def test_ingest_embed_is_not_cached(wrapped_embedder):
+    embedder = CachingEmbedder(CachingEmbedderParams(embedder=wrapped_embedder))
+
+    await embedder.ingest_embed(["a"])
+    await embedder.ingest_embed(["a"])
+    await embedder.search_embed(["a"])
+
+    assert wrapped_embedder.ingest_calls == [["a"], ["a"]]
+    assert wrapped_embedder.search_calls == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_eviction(wrapped_embedder):
+    embedder = CachingEmbedder(
+        CachingEmbedderParams(embedder=wrapped_embedder, max_size=2),
+    )
+
+    await embedder.search_embed(["a", "bb"])
+    await embedder.search_embed(["a"])
+    await embedder.search_embed(["ccc"])
+    await embedder.search_embed(["a"])
+    await embedder.search_embed(["bb"])
+
+    assert wrapped_embedder.search_calls == [["a", "bb"], ["ccc"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiration(wrapped_embedder, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(
+        "memmachine.common.embedder.caching_embedder.time.monotonic",
+        lambda: now,
+    )
+    embedder = CachingEmbedder(
+        CachingEmbedderParams(embedder=wrapped_embedder, ttl_seconds=10),
+    )
+
+    await embedder.search_embed(["a"])
+    now += 5
+    await embedder.search_embed(["a"])
+    now += 10
+    await embedder.search_embed(["a"])
+
+    assert wrapped_embedder.search_calls == [["a"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_request():
+    wrapped_embedder = CountingEmbedder(delay_seconds=0.05)
+    embedder = CachingEmbedder(CachingEmbedderParams(embedder=wrapped_embedder))
+
+    results = await asyncio.gather(
+        embedder.search_embed(["a"]),
+        embedder.search_embed(["a", "bb"]),
+        embedder.search_embed(["a", "a"]),
+    )
+
+    assert results == [
+        [[1.0, -1.0]],
+        [[1.0, -1.0], [2.0, -1.0]],
+        [[1.0, -1.0], [1.0, -1.0]],
+    ]
+    assert wrapped_embedder.search_calls == [["a"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_search_does_not_cancel_waiting_search():
+    wrapped_embedder = CountingEmbedder(delay_seconds=0.05)
+    embedder = CachingEmbedder(CachingEmbedderParams(embedder=wrapped_embedder))
+
+    owner = asyncio.create_task(embedder.search_embed(["a"]))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(embedder.search_embed(["a"]))
+    await asyncio.sleep(0.01)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    assert await waiter == [[1.0, -1.0]]
+    assert wrapped_embedder.search_calls == [["a"]]
+
+    # The request completed, so the embedding is cached.
+    assert await embedder.search_embed(["a"]) == [[1.0, -1.0]]
+    assert wrapped_embedder.search_calls == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_cached():
+    wrapped_embedder = CountingEmbedder(delay_seconds=0.05)
+    wrapped_embedder.fail = True
+    embedder = CachingEmbedder(CachingEmbedderParams(embedder=wrapped_embedder))
+
+    results = await asyncio.gather(
+        embedder.search_embed(["a"]),
+        embedder.search_embed(["a"]),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert wrapped_embedder.search_calls == [["a"]]
+
+    wrapped_embedder.fail = False
+    assert await embedder.search_embed(["a"]) == [[1.0, -1.0]]
+    assert wrapped_embedder.search_calls == [["a"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_metrics(wrapped_embedder):
+    counters: dict[str, MagicMock] = {}
+
+    def get_counter(name, description, label_names=()):
+        return counters.setdefault(name, MagicMock())
+
+    metrics_factory = MagicMock(spec=MetricsFactory)
+    metrics_factory.get_counter.side_effect = get_counter
+
+    embedder = CachingEmbedder(
+        CachingEmbedderParams(
+            embedder=wrapped_embedder,
+            metrics_factory=metrics_factory,
+            user_metrics_labels={"label": "value"},
+        ),
+    )
+
+    await embedder.search_embed(["a", "bb", "a"])
+    await embedder.search_embed(["a", "ccc"])
+
+    def total(name):
+        return sum(
+            call.kwargs["value"] for call in counters[name].increment.call_args_list
+        )
+
+    assert total("embedder_cache_hits") == 1
+    assert total("embedder_cache_misses") == 3
+    assert total("embedder_cache_coalesced") == 1
+    counters["embedder_cache_hits"].increment.assert_called_with(
+        value=1,
+        labels={"label": "value"},
+    )
@@ -0,0 +1,159 @@
+import sqlite3
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.embedder import Embedder
+from memmachine.common.embedder.persistent_caching_embedder import (
+    PersistentCachingEmbedder,
+    PersistentCachingEmbedderParams,
+)
+from memmachine.common.metrics_factory import MetricsFactory
+
+
+class CountingEmbedder(Embedder):
+    def __init__(self, model_id: str = "counting-model"):
+        super().__init__()
+
+        self.ingest_calls: list[list[Any]] = []
+        self.search_calls: list[list[Any]] = []
+        self._model_id = model_id
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        self.ingest_calls.append(list(inputs))
+        return [[float(len(_input)), 0.5] for _input in inputs]
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        self.search_calls.append(list(queries))
+        return [[float(len(query)), -0.5] for query in queries]
+
+    @property
+    def model_id(self) -> str:
+        return self._model_id
+
+    @property
+    def dimensions(self) -> int:
+        return 2
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        return SimilarityMetric.COSINE
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "embeddings.sqlite3")
+
+
+@pytest.mark.asyncio
+async def test_ingest_embed_sends_only_misses(cache_path):
+    wrapped_embedder = CountingEmbedder()
+    embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(embedder=wrapped_embedder, path=cache_path),
+    )
+
+    first = await embedder.ingest_embed(["a", "bb", "a"])
+    second = await embedder.ingest_embed(["bb", "ccc"])
+
+    assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert second == [[2.0, 0.5], [3.0, 0.5]]
+    assert wrapped_embedder.ingest_calls == [["a", "bb"], ["ccc"]]
+
+    assert await embedder.ingest_embed([]) == []
+
+
+@pytest.mark.asyncio
+async def test_embeddings_persist_across_instances(cache_path):
+    first_embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(embedder=CountingEmbedder(), path=cache_path),
+    )
+    await first_embedder.ingest_embed(["a", "bb"])
+
+    wrapped_embedder = CountingEmbedder()
+    second_embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(embedder=wrapped_embedder, path=cache_path),
+    )
+    assert await second_embedder.ingest_embed(["bb", "a"]) == [
+        [2.0, 0.5],
+        [1.0, 0.5],
+    ]
+    assert wrapped_embedder.ingest_calls == []
+
+    other_model_embedder = CountingEmbedder(model_id="other-model")
+    third_embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(
+            embedder=other_model_embedder,
+            path=cache_path,
+        ),
+    )
+    await third_embedder.ingest_embed(["a"])
+    assert other_model_embedder.ingest_calls == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_close(cache_path):
+    embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(embedder=CountingEmbedder(), path=cache_path),
+    )
+    await embedder.ingest_embed(["a"])
+
+    await embedder.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        await embedder.ingest_embed(["a"])
+
+
+@pytest.mark.asyncio
+async def test_search_embed_is_not_cached(cache_path):
+    wrapped_embedder = CountingEmbedder()
+    embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(embedder=wrapped_embedder, path=cache_path),
+    )
+
+    await embedder.search_embed(["a"])
+    await embedder.search_embed(["a"])
+
+    assert wrapped_embedder.search_calls == [["a"], ["a"]]
+    assert embedder.model_id == "counting-model"
+    assert embedder.dimensions == 2
+    assert embedder.similarity_metric == SimilarityMetric.COSINE
+
+
+@pytest.mark.asyncio
+async def test_metrics(cache_path):
+    counters: dict[str, MagicMock] = {}
+
+    def get_counter(name, description, label_names=()):
+        return counters.setdefault(name, MagicMock())
+
+    metrics_factory = MagicMock(spec=MetricsFactory)
+    metrics_factory.get_counter.side_effect = get_counter
+
+    embedder = PersistentCachingEmbedder(
+        PersistentCachingEmbedderParams(
+            embedder=CountingEmbedder(),
+            path=cache_path,
+            metrics_factory=metrics_factory,
+        ),
+    )
+
+    await embedder.ingest_embed(["a", "bb"])
+    await embedder.ingest_embed(["a", "ccc", "ccc"])
+
+    def total(name):
+        return sum(
+            call.kwargs["value"] for call in counters[name].increment.call_args_list
+        )
+
+    assert total("embedder_persistent_cache_hits") == 2
+    assert total("embedder_persistent_cache_misses") == 3
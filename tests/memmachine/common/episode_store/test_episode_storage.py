@@ -7,6 +7,7 @@ import pytest
 import pytest_asyncio
 
 from memmachine.common.episode_store import (
+    EpisodeCursor,
     EpisodeEntry,
     EpisodeIdT,
     EpisodeStorage,
@@ -139,6 +140,72 @@ async def test_add_multiple_episodes_returns_models(
     assert await episode_storage.get_episode_messages() == []
 
 
+@pytest.mark.asyncio
+async def test_add_episodes_with_mixed_fields_keeps_order(
+    episode_storage: EpisodeStorage,
+):
+    entries = [
+        EpisodeEntry(
+            content=f"message-{idx}",
+            producer_id="producer",
+            producer_role="user",
+            metadata={"idx": str(idx)} if idx % 3 == 0 else None,
+            produced_for_id="consumer" if idx % 2 == 0 else None,
+        )
+        for idx in range(10)
+    ]
+
+    episodes = await episode_storage.add_episodes("mixed-session", entries)
+
+    try:
+        assert [e.content for e in episodes] == [e.content for e in entries]
+        assert [e.metadata for e in episodes] == [e.metadata for e in entries]
+        assert [int(e.uid) for e in episodes] == sorted(int(e.uid) for e in episodes)
+        assert await episode_storage.get_episodes([e.uid for e in episodes]) == episodes
+    finally:
+        await episode_storage.delete_episodes([e.uid for e in episodes])
+
+
+@pytest.mark.asyncio
+async def test_import_episodes(episode_storage: EpisodeStorage):
+    base_time = datetime.now(tz=UTC)
+    entries = (
+        EpisodeEntry(
+            content=f"imported-{idx}",
+            producer_id="producer",
+            producer_role="user",
+            metadata={"idx": str(idx)} if idx % 2 == 0 else None,
+            created_at=base_time + timedelta(seconds=idx),
+        )
+        for idx in range(25)
+    )
+    session_filter = _filter("session_key = 'import-session'")
+
+    assert (
+        await episode_storage.get_episode_messages_count(filter_expr=session_filter)
+        == 0
+    )
+    assert await episode_storage.import_episodes("import-session", entries) == 25
+
+    imported = await episode_storage.get_episode_messages(filter_expr=session_filter)
+    try:
+        assert [e.content for e in imported] == [f"imported-{idx}" for idx in range(25)]
+        assert imported[0].metadata == {"idx": "0"}
+        assert imported[1].metadata is None
+        assert (
+            await episode_storage.get_episode_messages_count(
+                filter_expr=session_filter,
+            )
+            == 25
+        )
+    finally:
+        await episode_storage.delete_episodes([e.uid for e in imported])
+
+    assert await episode_storage.import_episodes("import-session", []) == 0
+
+    assert await episode_storage.get_episode_messages() == []
+
+
 @pytest.mark.asyncio
 async def test_history_identity_filters(episode_storage: EpisodeStorage):
     user_message = await create_history_entry(
@@ -316,6 +383,116 @@ async def test_history_pagination_offset_without_limit_raises(
         await episode_storage.get_episode_messages(page_num=1)
 
 
+@pytest.mark.asyncio
+async def test_history_pagination_with_cursor(episode_storage: EpisodeStorage):
+    base_time = datetime.now(tz=UTC)
+    episode_ids = []
+
+    # Episodes sharing a timestamp are ordered by ID.
+    for idx in range(5):
+        created_at = base_time + timedelta(minutes=idx // 2)
+        episode_ids.append(
+            await create_history_entry(
+                episode_storage,
+                content=f"message-{idx}",
+                created_at=created_at,
+            )
+        )
+
+    try:
+        uids = []
+        cursor = None
+        while True:
+            page = await episode_storage.get_episode_messages(
+                page_size=2,
+                cursor=cursor,
+            )
+            uids.extend(entry.uid for entry in page)
+            if len(page) < 2:
+                break
+            cursor = EpisodeCursor.decode(EpisodeCursor.from_episode(page[-1]).encode())
+
+        assert uids == episode_ids
+    finally:
+        await episode_storage.delete_episodes(episode_ids)
+
+
+@pytest.mark.asyncio
+async def test_history_pagination_cursor_with_page_num_raises(
+    episode_storage: EpisodeStorage,
+):
+    cursor = EpisodeCursor(created_at=datetime.now(tz=UTC), uid="1")
+
+    with pytest.raises(InvalidArgumentError):
+        await episode_storage.get_episode_messages(
+            page_size=2,
+            page_num=1,
+            cursor=cursor,
+        )
+
+
+def test_episode_cursor_decode_invalid():
+    with pytest.raises(ValueError, match="cursor"):
+        EpisodeCursor.decode("not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_episodes_in_request_order(episode_storage: EpisodeStorage):
+    episode_ids = [
+        await create_history_entry(episode_storage, content=content)
+        for content in ["first", "second", "third"]
+    ]
+
+    try:
+        episodes = await episode_storage.get_episodes(
+            [episode_ids[2], "999999", episode_ids[0]],
+        )
+        assert [entry.uid for entry in episodes] == [episode_ids[2], episode_ids[0]]
+        assert [entry.content for entry in episodes] == ["third", "first"]
+
+        assert await episode_storage.get_episodes([]) == []
+    finally:
+        await episode_storage.delete_episodes(episode_ids)
+
+
+@pytest.mark.asyncio
+async def test_get_latest_episodes_within_content_length(
+    episode_storage: EpisodeStorage,
+):
+    episode_ids = [
+        await create_history_entry(episode_storage, content=content)
+        for content in ["aaaa", "bbb", "cc", "d"]
+    ]
+    other_session_id = await create_history_entry(
+        episode_storage,
+        content="e",
+        session_key="session-other",
+    )
+
+    try:
+        latest = await episode_storage.get_latest_episodes(
+            DEFAULT_HISTORY_ARGS["session_key"],
+            max_content_length=6,
+        )
+        assert [entry.uid for entry in latest] == episode_ids[1:]
+
+        latest = await episode_storage.get_latest_episodes(
+            DEFAULT_HISTORY_ARGS["session_key"],
+            max_content_length=100,
+        )
+        assert [entry.uid for entry in latest] == episode_ids
+
+        assert (
+            await episode_storage.get_latest_episodes(
+                DEFAULT_HISTORY_ARGS["session_key"],
+                max_content_length=0,
+            )
+            == []
+        )
+    finally:
+        await episode_storage.delete_episodes([*episode_ids, other_session_id])
+
+
 @pytest.mark.asyncio
 async def test_delete_history(episode_storage: EpisodeStorage):
     history_id = await create_history_entry(episode_storage, content="to delete")
@@ -1,6 +1,7 @@
 import socket
 
 import pytest
+from sqlalchemy import inspect, text
 from sqlalchemy.exc import OperationalError
 
 from memmachine.common.episode_store.episode_sqlalchemy_store import (
@@ -48,3 +49,23 @@ async def test_startup_wraps_socket_gaierror():
         await store.startup()
 
     assert isinstance(exc_info.value.__cause__, socket.gaierror)
+
+
+@pytest.mark.asyncio
+async def test_startup_creates_missing_indexes(sqlalchemy_engine):
+    store = SqlAlchemyEpisodeStore(sqlalchemy_engine)
+    await store.startup()
+
+    async with sqlalchemy_engine.begin() as conn:
+        await conn.execute(text("DROP INDEX idx_session_key_id"))
+
+    await store.startup()
+
+    async with sqlalchemy_engine.connect() as conn:
+        index_names = await conn.run_sync(
+            lambda sync_conn: {
+                index["name"]
+                for index in inspect(sync_conn).get_indexes("episodestore")
+            }
+        )
+    assert "idx_session_key_id" in index_names
@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Integer, String, select
+from sqlalchemy.orm import DeclarativeBase, mapped_column
+
+from memmachine.common.filter.filter_compiler import (
+    compile_cypher_filter,
+    compile_predicate,
+    compile_sql_filter,
+    filter_cache_key,
+    filter_shape_key,
+)
+from memmachine.common.filter.filter_parser import Comparison, parse_filter
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Row(_Base):
+    __tablename__ = "filter_compiler_row"
+    id = mapped_column(Integer, primary_key=True)
+    name = mapped_column(String)
+
+
+def _resolve_row_field(field: str):
+    return {"id": _Row.id, "name": _Row.name}.get(field), False
+
+
+def _render_property_name(field: str) -> str:
+    return field.replace(".", "_")
+
+
+def _compile_dict_comparison(comp: Comparison):
+    match comp.op:
+        case "=":
+            return lambda item: item.get(comp.field) == comp.value
+        case "in":
+            return lambda item: item.get(comp.field) in comp.value
+        case ">":
+            return lambda item: item.get(comp.field, 0) > comp.value
+    raise ValueError(comp.op)
+
+
+def test_parse_filter_is_cached() -> None:
+    spec = "a = 1 AND b IN (x, y)"
+    assert parse_filter(spec) is parse_filter(f"  {spec} ")
+
+
+def test_cache_key_distinguishes_value_types() -> None:
+    assert filter_cache_key(parse_filter("a IN (1, 2)")) == filter_cache_key(
+        parse_filter("a IN (1,2)")
+    )
+    assert filter_cache_key(Comparison("a", "=", 1)) != filter_cache_key(
+        Comparison("a", "=", True)
+    )
+    assert filter_cache_key(Comparison("a", "=", 1)) != filter_cache_key(
+        Comparison("a", "=", "1")
+    )
+
+
+def test_shape_key_ignores_values() -> None:
+    assert filter_shape_key(parse_filter("a = 1 AND b IN (x, y)")) == filter_shape_key(
+        parse_filter("a = 2 AND b IN (z)")
+    )
+    assert filter_shape_key(parse_filter("a = 1")) != filter_shape_key(
+        parse_filter("a > 1")
+    )
+    assert filter_shape_key(parse_filter("a = 1 AND b = 1")) != filter_shape_key(
+        parse_filter("a = 1 OR b = 1")
+    )
+
+
+def test_compile_predicate() -> None:
+    expr = parse_filter("(kind = 'a' OR kind = 'b') AND size > 2")
+    predicate = compile_predicate(expr, _compile_dict_comparison)
+
+    assert predicate({"kind": "a", "size": 3})
+    assert predicate({"kind": "b", "size": 5})
+    assert not predicate({"kind": "c", "size": 3})
+    assert not predicate({"kind": "a", "size": 1})
+
+
+def test_compile_predicate_is_cached_by_tree() -> None:
+    compile_comparison = MagicMock(side_effect=_compile_dict_comparison)
+
+    first = compile_predicate(parse_filter("kind IN (a, b)"), compile_comparison)
+    second = compile_predicate(
+        Comparison(field="kind", op="in", value=["a", "b"]),
+        compile_comparison,
+    )
+
+    assert first is second
+    compile_comparison.assert_called_once()
+    assert first({"kind": "b"})
+
+
+def test_compile_cypher_filter() -> None:
+    expr = parse_filter("m.kind = 'a' AND (size IN (1, 2) OR owner IS NULL)")
+
+    condition, params = compile_cypher_filter(
+        expr, "n", "filter_params", _render_property_name
+    )
+
+    assert condition == (
+        "(n.m_kind = $filter_params.filter_expr_param_0) AND "
+        "((n.size IN $filter_params.filter_expr_param_1) OR (n.owner IS NULL))"
+    )
+    assert params == {"filter_expr_param_0": "a", "filter_expr_param_1": [1, 2]}
+
+    params["filter_expr_param_0"] = "changed"
+    _, cached_params = compile_cypher_filter(
+        expr, "n", "filter_params", _render_property_name
+    )
+    assert cached_params["filter_expr_param_0"] == "a"
+
+    other_alias_condition, _ = compile_cypher_filter(
+        expr, "r", "filter_params", _render_property_name
+    )
+    assert other_alias_condition.startswith("(r.m_kind")
+
+
+def test_compile_cypher_filter_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError, match="cannot accept list values"):
+        compile_cypher_filter(
+            Comparison(field="a", op="=", value=[1]),
+            "n",
+            "filter_params",
+            _render_property_name,
+        )
+
+
+def test_compile_sql_filter() -> None:
+    expr = parse_filter("name = 'x' OR id IN (1, 2)")
+
+    clause = compile_sql_filter(expr, _resolve_row_field)
+
+    assert clause is compile_sql_filter(
+        parse_filter("name = 'x' OR id IN (1,2)"), _resolve_row_field
+    )
+    compiled = (
+        select(_Row.id)
+        .where(clause)
+        .compile(
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    assert "filter_compiler_row.name = 'x' OR filter_compiler_row.id IN (1, 2)" in str(
+        compiled
+    )
@@ -278,7 +278,11 @@ async def test_generate_response_retry_on_rate_limit(
 
     mock_client = mock_async_openai.return_value
     mock_client.responses.create.side_effect = [
-        openai.RateLimitError("rate limited", response=MagicMock(), body=None),
+        openai.RateLimitError(
+            "rate limited",
+            response=MagicMock(headers={"retry-after-ms": "1"}),
+            body=None,
+        ),
         mock_response,
     ]
 
@@ -287,12 +291,13 @@ async def test_generate_response_retry_on_rate_limit(
 
     assert content == "Success after retry"
     assert mock_client.responses.create.call_count == 2
-    mock_sleep.assert_awaited_once_with(1)
+    # The retry waits for the scheduler instead of sleeping.
+    mock_sleep.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 @patch("asyncio.sleep", new_callable=AsyncMock)
-async def test_generate_response_retry_on_rate_limit_with_max_retry_interval_seconds(
+async def test_generate_response_rate_limit_exhausts_attempts(
     mock_sleep,
     mock_async_openai,
     max_retry_interval_seconds_config,
@@ -306,7 +311,7 @@ async def test_generate_response_retry_on_rate_limit_with_max_retry_interval_sec
     mock_client = mock_async_openai.return_value
     mock_client.responses.create.side_effect = openai.RateLimitError(
         "rate limited",
-        response=MagicMock(),
+        response=MagicMock(headers={"retry-after-ms": "1"}),
         body=None,
     )
 
@@ -315,15 +320,7 @@ async def test_generate_response_retry_on_rate_limit_with_max_retry_interval_sec
         await lm.generate_response(max_attempts=6)
 
     assert mock_client.responses.create.call_count == 6
-    mock_sleep.assert_has_awaits(
-        [
-            ((1,),),
-            ((2,),),
-            ((4,),),
-            ((4,),),
-            ((4,),),
-        ],
-    )
+    mock_sleep.assert_not_awaited()
 
 
 @pytest.mark.asyncio
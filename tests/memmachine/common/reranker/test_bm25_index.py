@@ -0,0 +1,123 @@
+import re
+
+import pytest
+from rank_bm25 import BM25Okapi
+
+from memmachine.common.reranker.bm25_index import (
+    BM25Index,
+    BM25IndexParams,
+    get_tokenizer,
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return re.sub(r"\W+", " ", text).lower().split()
+
+
+@pytest.fixture
+def index():
+    return BM25Index(BM25IndexParams(tokenize=tokenize))
+
+
+DOCUMENTS = {
+    "hello": "Hello, world!",
+    "berlin": "Berlin is the capital of Germany.",
+    "paris": "Paris is the capital of France.",
+    "france": "France is a country in Europe. France has cheese.",
+    "tomato": "Tomatoes are fruits.",
+    "apple": "Apples are red or green.",
+    "cell": "The mitochondria is the powerhouse of the cell.",
+    "rock": "Rocks make good pets.",
+}
+
+
+@pytest.mark.asyncio
+async def test_search_matches_okapi_scores(index):
+    await index.add_documents(DOCUMENTS)
+
+    results = await index.search("What is the capital of France?")
+
+    okapi = BM25Okapi([tokenize(document) for document in DOCUMENTS.values()])
+    expected_scores = dict(
+        zip(
+            DOCUMENTS.keys(),
+            okapi.get_scores(tokenize("What is the capital of France?")),
+            strict=True,
+        ),
+    )
+
+    assert results[0][0] == "paris"
+    assert {uid for uid, _ in results} == {"paris", "france", "berlin", "cell"}
+    assert [score for _, score in results] == sorted(
+        (score for _, score in results),
+        reverse=True,
+    )
+    for uid, score in results:
+        assert score == pytest.approx(expected_scores[uid])
+
+
+@pytest.mark.asyncio
+async def test_search_limit(index):
+    await index.add_documents(DOCUMENTS)
+
+    results = await index.search("capital France", limit=1)
+    assert [uid for uid, _ in results] == ["paris"]
+
+    assert await index.search("capital France", limit=0) == []
+    assert await index.search("unknown") == []
+
+
+@pytest.mark.asyncio
+async def test_empty_index(index):
+    assert index.num_documents == 0
+    assert await index.search("anything") == []
+
+
+@pytest.mark.asyncio
+async def test_statistics_follow_added_and_removed_documents(index):
+    await index.add_documents({"paris": DOCUMENTS["paris"]})
+    await index.add_documents({"berlin": DOCUMENTS["berlin"]})
+    index.remove_documents(["berlin", "missing"])
+
+    assert index.num_documents == 1
+    assert "paris" in index
+    assert "berlin" not in index
+    assert [uid for uid, _ in await index.search("Germany capital")] == ["paris"]
+
+    reference = BM25Index(BM25IndexParams(tokenize=tokenize))
+    await reference.add_documents({"paris": DOCUMENTS["paris"]})
+    assert await index.search("capital") == await reference.search("capital")
+
+
+@pytest.mark.asyncio
+async def test_adding_existing_document_replaces_it(index):
+    await index.add_documents(DOCUMENTS)
+    await index.add_documents({"hello": "The capital of Italy is Rome."})
+
+    assert index.num_documents == len(DOCUMENTS)
+    assert await index.search("hello") == []
+    assert "hello" in [uid for uid, _ in await index.search("capital")]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_results(index):
+    await index.add_documents(
+        {f"filler{i}": f"filler document number {i}" for i in range(200)},
+    )
+    await index.add_documents(DOCUMENTS)
+    index.remove_documents(f"filler{i}" for i in range(200))
+
+    reference = BM25Index(BM25IndexParams(tokenize=tokenize))
+    await reference.add_documents(DOCUMENTS)
+
+    assert index.num_documents == len(DOCUMENTS)
+    assert await index.search("capital of France") == await reference.search(
+        "capital of France",
+    )
+
+
+def test_get_tokenizer():
+    assert get_tokenizer("simple", "english")("Hello, World!") == ["hello", "world"]
+
+    with pytest.raises(ValueError, match="Unknown tokenizer"):
+        get_tokenizer("unknown", "english")
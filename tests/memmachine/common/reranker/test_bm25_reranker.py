@@ -3,7 +3,16 @@ import re
 import pytest
 
 from memmachine import setup_nltk
-from memmachine.common.reranker.bm25_reranker import BM25Reranker, BM25RerankerParams
+from memmachine.common.reranker.bm25_index import (
+    BM25Index,
+    BM25IndexParams,
+    get_tokenizer,
+)
+from memmachine.common.reranker.bm25_reranker import (
+    BM25Reranker,
+    BM25RerankerParams,
+    bm25_corpus_index,
+)
 
 
 @pytest.fixture
@@ -56,3 +65,26 @@ async def test_score_values(reranker):
 
     assert scores == sorted(scores)
     assert scores != reversed(scores)
+
+
+@pytest.mark.asyncio
+async def test_score_with_corpus_index(reranker):
+    index = BM25Index(BM25IndexParams(tokenize=get_tokenizer("simple", "english")))
+    await index.add_documents(
+        {
+            "zebra": "The zebra runs.",
+            **{f"lion-{i}": f"The lion {i} sleeps." for i in range(10)},
+        },
+    )
+
+    query = "Is it a lion or a zebra?"
+    candidates = ["The lion sleeps.", "The zebra runs."]
+
+    # Each term occurs in one of the two candidates, so both weigh the same.
+    scores = await reranker.score(query, candidates)
+    assert scores[0] == scores[1]
+
+    # The zebra is rare in the corpus, so matching it scores higher.
+    with bm25_corpus_index(index):
+        corpus_scores = await reranker.score(query, candidates)
+    assert corpus_scores[1] > corpus_scores[0]
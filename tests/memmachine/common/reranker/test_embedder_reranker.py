@@ -78,3 +78,42 @@ async def test_score():
     embedder.similarity_metric = SimilarityMetric.MANHATTAN
     scores = await reranker.score("query", ["candidate1", "candidate2"])
     assert scores[0] == scores[1]
+
+
+class RecordingEmbedder(FakeEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.ingest_calls = []
+
+    async def ingest_embed(self, inputs, max_attempts=1):
+        self.ingest_calls.append(list(inputs))
+        return await super().ingest_embed(inputs, max_attempts)
+
+
+@pytest.mark.asyncio
+async def test_candidate_embeddings_are_cached():
+    embedder = RecordingEmbedder()
+    reranker = EmbedderReranker(
+        EmbedderRerankerParams(embedder=embedder, candidate_cache_size=2),
+    )
+
+    first = await reranker.score("query", ["a", "bb", "a"])
+    second = await reranker.score("query", ["bb", "ccc", "a"])
+    await reranker.score("query", ["a", "bb"])
+
+    assert first == [first[0], first[1], first[0]]
+    assert second[0] == first[1]
+    assert embedder.ingest_calls == [["a", "bb"], ["ccc"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_candidate_cache_disabled():
+    embedder = RecordingEmbedder()
+    reranker = EmbedderReranker(
+        EmbedderRerankerParams(embedder=embedder, candidate_cache_size=0),
+    )
+
+    await reranker.score("query", ["a"])
+    await reranker.score("query", ["a"])
+
+    assert embedder.ingest_calls == [["a"], ["a"]]
@@ -7,10 +7,15 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from memmachine.common.configuration.database_conf import (
     DatabasesConf,
     Neo4jConf,
+    NumpyGraphConf,
     SqlAlchemyConf,
 )
 from memmachine.common.resource_manager.database_manager import DatabaseManager
 from memmachine.common.vector_graph_store import VectorGraphStore
+from memmachine.common.vector_graph_store.data_types import Node
+from memmachine.common.vector_graph_store.numpy_vector_graph_store import (
+    NumpyVectorGraphStore,
+)
 
 
 @pytest.fixture
@@ -38,6 +43,7 @@ def mock_conf():
             path="test.db",
         ),
     }
+    conf.numpy_graph_confs = {"numpy1": NumpyGraphConf()}
     conf.sqlite_confs = {}
     return conf
 
@@ -115,3 +121,25 @@ async def test_build_all_without_validation(mock_conf):
     assert "sqlite1" in builder.sql_engines
     assert "pg1" in builder.sql_engines
     assert "neo1" in builder.graph_stores
+
+
+@pytest.mark.asyncio
+async def test_get_numpy_vector_graph_store(mock_conf, tmp_path):
+    mock_conf.numpy_graph_confs = {
+        "numpy1": NumpyGraphConf(snapshot_path=str(tmp_path)),
+    }
+    builder = DatabaseManager(mock_conf)
+
+    graph_store = await builder.get_vector_graph_store("numpy1")
+    assert isinstance(graph_store, NumpyVectorGraphStore)
+    assert await builder.get_vector_graph_store("numpy1") is graph_store
+
+    await graph_store.add_nodes(collection="Entity", nodes=[Node(uid="node")])
+    await builder.close()
+    assert "numpy1" not in builder.graph_stores
+
+    # The snapshot saved on close is loaded by the next store.
+    graph_store = await builder.get_vector_graph_store("numpy1")
+    assert await graph_store.get_nodes(collection="Entity", node_uids=["node"]) == [
+        Node(uid="node"),
+    ]
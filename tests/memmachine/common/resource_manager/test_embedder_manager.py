@@ -1,3 +1,5 @@
+import sqlite3
+
 import pytest
 from pydantic import SecretStr
 
@@ -78,3 +80,86 @@ async def test_build_all(mock_conf):
 
     for embedder in all_embedders.values():
         assert isinstance(embedder, Embedder)
+
+
+@pytest.mark.asyncio
+async def test_build_cached_embedder(tmp_path):
+    from memmachine.common.configuration.embedder_conf import (
+        EmbedderCacheConf,
+        EmbedderPersistentCacheConf,
+    )
+    from memmachine.common.embedder.caching_embedder import CachingEmbedder
+    from memmachine.common.embedder.persistent_caching_embedder import (
+        PersistentCachingEmbedder,
+    )
+
+    conf = EmbeddersConf(
+        openai={
+            "openai_embedder_id": OpenAIEmbedderConf(
+                model="text-embedding-ada-002",
+                api_key=SecretStr("<OPENAI_API_KEY>"),
+                cache=EmbedderCacheConf(max_size=16, ttl_seconds=30),
+                persistent_cache=EmbedderPersistentCacheConf(
+                    path=str(tmp_path / "embeddings.sqlite3"),
+                ),
+            ),
+        },
+    )
+    builder = EmbedderManager(conf)
+    embedder = await builder.get_embedder("openai_embedder_id")
+
+    assert isinstance(embedder, CachingEmbedder)
+    assert isinstance(embedder._wrapped, PersistentCachingEmbedder)
+    assert embedder.model_id == "text-embedding-ada-002"
+    assert await builder.get_embedder("openai_embedder_id") is embedder
+
+    persistent_embedder = embedder._wrapped
+    await builder.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        persistent_embedder._connection.execute("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_build_batching_embedder():
+    from memmachine.common.configuration.embedder_conf import (
+        EmbedderBatchingConf,
+        EmbedderCacheConf,
+    )
+    from memmachine.common.embedder.batching_embedder import BatchingEmbedder
+    from memmachine.common.embedder.caching_embedder import CachingEmbedder
+
+    conf = EmbeddersConf(
+        openai={
+            "openai_embedder_id": OpenAIEmbedderConf(
+                model="text-embedding-ada-002",
+                api_key=SecretStr("<OPENAI_API_KEY>"),
+                cache=EmbedderCacheConf(),
+                batching=EmbedderBatchingConf(max_batch_size=64),
+            ),
+        },
+    )
+    builder = EmbedderManager(conf)
+    embedder = await builder.get_embedder("openai_embedder_id")
+
+    assert isinstance(embedder, CachingEmbedder)
+    assert isinstance(embedder._wrapped, BatchingEmbedder)
+    assert embedder._wrapped._max_batch_size == 64
+
+
+@pytest.mark.asyncio
+async def test_build_embedder_with_scheduler():
+    from memmachine.common.configuration.mixin_confs import RequestSchedulerConf
+
+    conf = EmbeddersConf(
+        openai={
+            "openai_embedder_id": OpenAIEmbedderConf(
+                model="text-embedding-ada-002",
+                api_key=SecretStr("<OPENAI_API_KEY>"),
+                scheduler=RequestSchedulerConf(max_concurrency=4),
+            ),
+        },
+    )
+    builder = EmbedderManager(conf)
+    embedder = await builder.get_embedder("openai_embedder_id")
+
+    assert embedder._request_scheduler.concurrency_limit == 4
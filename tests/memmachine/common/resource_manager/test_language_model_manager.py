@@ -7,6 +7,7 @@ from memmachine.common.configuration.language_model_conf import (
     OpenAIChatCompletionsLanguageModelConf,
     OpenAIResponsesLanguageModelConf,
 )
+from memmachine.common.configuration.mixin_confs import RequestSchedulerConf
 from memmachine.common.resource_manager.language_model_manager import (
     LanguageModelManager,
 )
@@ -78,3 +79,17 @@ async def test_build_openai_chat_completions_model(mock_conf):
 
     model = builder.get_language_model("ollama_model")
     assert model is not None
+
+
+@pytest.mark.asyncio
+async def test_build_model_with_scheduler(mock_conf):
+    mock_conf.openai_responses_language_model_confs[
+        "openai_4o_mini"
+    ].scheduler = RequestSchedulerConf(max_concurrency=4)
+    builder = LanguageModelManager(mock_conf)
+
+    model = await builder.get_language_model("openai_4o_mini")
+    assert model._request_scheduler.concurrency_limit == 4
+
+    model = await builder.get_language_model("openai_3_5_turbo")
+    assert model._request_scheduler.concurrency_limit is None
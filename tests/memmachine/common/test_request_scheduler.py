@@ -0,0 +1,237 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from memmachine.common.metrics_factory import MetricsFactory
+from memmachine.common.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    RequestSchedulerParams,
+    current_request_priority,
+    estimate_token_count,
+    request_priority,
+)
+
+
+def test_request_priority_context():
+    assert current_request_priority() == RequestPriority.INTERACTIVE
+    with request_priority(RequestPriority.BACKGROUND):
+        assert current_request_priority() == RequestPriority.BACKGROUND
+    assert current_request_priority() == RequestPriority.INTERACTIVE
+
+
+def test_estimate_token_count():
+    assert estimate_token_count() == 1
+    assert estimate_token_count("a" * 40, None, "b" * 40) == 21
+
+
+def test_invalid_concurrency_bounds():
+    with pytest.raises(ValidationError):
+        RequestSchedulerParams(max_concurrency=2, min_concurrency=3)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited():
+    scheduler = RequestScheduler(RequestSchedulerParams(max_concurrency=2))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send():
+        nonlocal in_flight, max_in_flight
+        async with scheduler.request():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(send() for _ in range(6)))
+
+    assert max_in_flight == 2
+    assert scheduler.num_waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_start_first():
+    scheduler = RequestScheduler(RequestSchedulerParams(max_concurrency=1))
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.request():
+            await release.wait()
+
+    async def send(name: str, priority: RequestPriority):
+        with request_priority(priority):
+            async with scheduler.request():
+                started.append(name)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    background = asyncio.create_task(send("background", RequestPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(
+        send("interactive", RequestPriority.INTERACTIVE),
+    )
+    await asyncio.sleep(0)
+    assert scheduler.num_waiting == 2
+
+    release.set()
+    await asyncio.gather(holder, background, interactive)
+
+    assert started == ["interactive", "background"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_decreases_on_rate_limit_and_recovers():
+    scheduler = RequestScheduler(
+        RequestSchedulerParams(max_concurrency=4, min_concurrency=2),
+    )
+    assert scheduler.concurrency_limit == 4
+
+    async with scheduler.request() as permit:
+        permit.report_rate_limited({"retry-after-ms": "1"})
+    assert scheduler.concurrency_limit == 2
+
+    async with scheduler.request() as permit:
+        permit.report_rate_limited({"retry-after-ms": "1"})
+    assert scheduler.concurrency_limit == 2
+
+    for _ in range(3):
+        async with scheduler.request():
+            pass
+    assert scheduler.concurrency_limit == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rate_limits_decrease_once():
+    scheduler = RequestScheduler(RequestSchedulerParams(max_concurrency=8))
+    rate_limited = asyncio.Event()
+
+    async def send():
+        async with scheduler.request() as permit:
+            await rate_limited.wait()
+            permit.report_rate_limited({"retry-after-ms": "1"})
+
+    tasks = [asyncio.create_task(send()) for _ in range(4)]
+    await asyncio.sleep(0)
+    rate_limited.set()
+    await asyncio.gather(*tasks)
+
+    assert scheduler.concurrency_limit == 4
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_all_requests():
+    scheduler = RequestScheduler(RequestSchedulerParams())
+
+    async with scheduler.request() as permit:
+        permit.report_rate_limited({"retry-after": "0.05"})
+
+    start = time.monotonic()
+    async with scheduler.request():
+        waited = time.monotonic() - start
+
+    assert waited >= 0.04
+    assert scheduler.concurrency_limit is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_are_learned_from_headers():
+    scheduler = RequestScheduler(RequestSchedulerParams())
+    scheduler.update_rate_limits(
+        {
+            "x-ratelimit-limit-requests": "600",
+            "x-ratelimit-remaining-requests": "0",
+        },
+    )
+
+    start = time.monotonic()
+    async with scheduler.request():
+        waited = time.monotonic() - start
+
+    assert waited >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_requests_are_spaced_by_tokens_per_minute():
+    scheduler = RequestScheduler(RequestSchedulerParams(tokens_per_minute=600))
+
+    async with scheduler.request(estimated_tokens=1) as permit:
+        permit.report_usage(600)
+
+    start = time.monotonic()
+    async with scheduler.request(estimated_tokens=1):
+        waited = time.monotonic() - start
+
+    assert waited >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_block_queue():
+    scheduler = RequestScheduler(RequestSchedulerParams(max_concurrency=1))
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.request():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+    await holder
+
+    async with scheduler.request():
+        pass
+    assert scheduler.num_waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics():
+    metrics: dict[str, MagicMock] = {}
+
+    def get_metric(name, description, label_names=()):
+        return metrics.setdefault(name, MagicMock())
+
+    metrics_factory = MagicMock(spec=MetricsFactory)
+    metrics_factory.get_gauge.side_effect = get_metric
+    metrics_factory.get_summary.side_effect = get_metric
+    metrics_factory.get_counter.side_effect = get_metric
+
+    scheduler = RequestScheduler(
+        RequestSchedulerParams(
+            max_concurrency=2,
+            metrics_factory=metrics_factory,
+            user_metrics_labels={"label": "value"},
+        ),
+    )
+
+    with request_priority(RequestPriority.BACKGROUND):
+        async with scheduler.request() as permit:
+            permit.report_rate_limited({"retry-after-ms": "1"})
+
+    labels = {"label": "value"}
+    metrics["request_scheduler_wait_seconds"].observe.assert_called_once()
+    assert metrics["request_scheduler_wait_seconds"].observe.call_args.kwargs[
+        "labels"
+    ] == {"label": "value", "priority": "BACKGROUND"}
+    metrics["request_scheduler_rate_limited"].increment.assert_called_once_with(
+        labels=labels,
+    )
+    metrics["request_scheduler_in_flight"].set.assert_called_with(
+        value=0,
+        labels=labels,
+    )
+    metrics["request_scheduler_queue_depth"].set.assert_called_with(
+        value=0,
+        labels=labels,
+    )
+    metrics["request_scheduler_concurrency_limit"].set.assert_called_with(
+        value=1,
+        labels=labels,
+    )
@@ -20,7 +20,12 @@ from memmachine.common.filter.filter_parser import (
 from memmachine.common.metrics_factory.prometheus_metrics_factory import (
     PrometheusMetricsFactory,
 )
-from memmachine.common.vector_graph_store.data_types import Edge, EntityType, Node
+from memmachine.common.vector_graph_store.data_types import (
+    Edge,
+    EntityType,
+    Node,
+    mangle_embedding_name,
+)
 from memmachine.common.vector_graph_store.neo4j_vector_graph_store import (
     Neo4jVectorGraphStore,
     Neo4jVectorGraphStoreParams,
@@ -265,6 +270,96 @@ async def test_add_edges(neo4j_driver, vector_graph_store):
     assert len(records) == 5
 
 
+@pytest.mark.asyncio
+async def test_add_subgraph(vector_graph_store):
+    episode_uids = [str(uuid4()) for _ in range(2)]
+    derivative_uids = [str(uuid4()) for _ in range(3)]
+
+    episodes = [
+        Node(uid=uid, properties={"name": f"Episode{index}"})
+        for index, uid in enumerate(episode_uids)
+    ]
+    derivatives = [
+        Node(
+            uid=uid,
+            properties={"name": f"Derivative{index}"},
+            embeddings={
+                "embedding_name": (
+                    [0.1, 0.2, float(index)],
+                    SimilarityMetric.COSINE,
+                ),
+            },
+        )
+        for index, uid in enumerate(derivative_uids)
+    ]
+    edges = [
+        Edge(
+            uid=str(uuid4()),
+            source_uid=derivative_uid,
+            target_uid=episode_uid,
+            properties={"description": f"{derivative_uid} to {episode_uid}"},
+        )
+        for derivative_uid, episode_uid in [
+            (derivative_uids[0], episode_uids[0]),
+            (derivative_uids[1], episode_uids[0]),
+            (derivative_uids[2], episode_uids[1]),
+        ]
+    ]
+
+    await vector_graph_store.add_subgraph(
+        nodes={"Episode": episodes, "Derivative": derivatives},
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=edges,
+    )
+
+    added_episodes = await vector_graph_store.get_nodes(
+        collection="Episode",
+        node_uids=episode_uids,
+    )
+    assert sorted(added_episodes, key=lambda node: node.uid) == sorted(
+        episodes,
+        key=lambda node: node.uid,
+    )
+    added_derivatives = await vector_graph_store.get_nodes(
+        collection="Derivative",
+        node_uids=derivative_uids,
+    )
+    assert sorted(added_derivatives, key=lambda node: node.uid) == sorted(
+        derivatives,
+        key=lambda node: node.uid,
+    )
+
+    added_edges = set()
+    for episode_uid in episode_uids:
+        source_nodes = await vector_graph_store.search_related_nodes(
+            relation="DERIVED_FROM",
+            other_collection="Derivative",
+            this_collection="Episode",
+            this_node_uid=episode_uid,
+            find_sources=True,
+            find_targets=False,
+        )
+        added_edges |= {(node.uid, episode_uid) for node in source_nodes}
+    assert added_edges == {(edge.source_uid, edge.target_uid) for edge in edges}
+
+    with pytest.raises(ValueError, match="among the nodes added"):
+        await vector_graph_store.add_subgraph(
+            nodes={"Derivative": [Node(uid=str(uuid4()))]},
+            relation="DERIVED_FROM",
+            source_collection="Derivative",
+            target_collection="Derivative",
+            edges=[
+                Edge(
+                    uid=str(uuid4()),
+                    source_uid=derivative_uids[0],
+                    target_uid=derivative_uids[1],
+                ),
+            ],
+        )
+
+
 @pytest.mark.asyncio
 async def test_search_similar_nodes(vector_graph_store, vector_graph_store_ann):
     nodes = [
@@ -391,6 +486,20 @@ async def test_search_similar_nodes(vector_graph_store, vector_graph_store_ann):
     )
     assert len(results) == 5
     assert results[0].properties["name"] == "Node1"
+    assert results[0] == nodes[0]
+
+    results = await vector_graph_store.search_similar_nodes(
+        collection="Entity",
+        query_embedding=[1.0, 0.0],
+        embedding_name="embedding1",
+        similarity_metric=SimilarityMetric.COSINE,
+        limit=5,
+        include_embeddings=False,
+    )
+    assert len(results) == 5
+    assert results[0].uid == nodes[0].uid
+    assert results[0].properties == nodes[0].properties
+    assert results[0].embeddings == {}
 
     results = await vector_graph_store.search_similar_nodes(
         collection="Entity",
@@ -472,6 +581,158 @@ async def test_search_similar_nodes(vector_graph_store, vector_graph_store_ann):
     )
     assert 0 < len(results) <= 5
 
+    results = await vector_graph_store_ann.search_similar_nodes(
+        collection="Entity",
+        query_embedding=[1.0, 0.0],
+        embedding_name="embedding1",
+        similarity_metric=SimilarityMetric.COSINE,
+        limit=1,
+        property_filter=FilterComparison(
+            field="include?",
+            op="=",
+            value="yes",
+        ),
+    )
+    assert [result.properties["name"] for result in results] == ["Node2"]
+
+
+@pytest.mark.asyncio
+async def test__search_ann(neo4j_driver, metrics_factory):
+    vector_graph_store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=neo4j_driver,
+            filtered_similarity_search_fudge_factor=2,
+            filtered_similarity_search_growth_factor=2.0,
+            filtered_similarity_search_max_query_limit=100,
+            exact_similarity_search_fallback_threshold=0.5,
+            metrics_factory=metrics_factory,
+        ),
+    )
+
+    query_limits = []
+
+    def make_query_ann(num_indexed_nodes, selectivity_denominator):
+        async def query_ann(query_limit):
+            query_limits.append(query_limit)
+            candidate_count = min(query_limit, num_indexed_nodes)
+            matched_count = candidate_count // selectivity_denominator
+            return candidate_count, matched_count, list(range(min(matched_count, 5)))
+
+        return query_ann
+
+    # Unfiltered searches request exactly the limit.
+    assert await vector_graph_store._search_ann(
+        make_query_ann(1000, 1),
+        limit=5,
+        selectivity_key=None,
+    ) == [0, 1, 2, 3, 4]
+    assert query_limits == [5]
+
+    # Without statistics, the number of candidates starts from the fudge factor
+    # and jumps to the number expected from the observed selectivity.
+    query_limits.clear()
+    selectivity_key = ("Entity", "embedding", "filter shape")
+    assert await vector_graph_store._search_ann(
+        make_query_ann(1000, 10),
+        limit=5,
+        selectivity_key=selectivity_key,
+    ) == [0, 1, 2, 3, 4]
+    assert query_limits == [10, 75]
+
+    # With statistics, the expected number of candidates is requested up front.
+    query_limits.clear()
+    assert await vector_graph_store._search_ann(
+        make_query_ann(1000, 10),
+        limit=5,
+        selectivity_key=selectivity_key,
+    ) == [0, 1, 2, 3, 4]
+    assert len(query_limits) == 1
+
+    # Exact search is chosen up front
+    # when more candidates than the maximum are expected to be needed.
+    query_limits.clear()
+    assert (
+        await vector_graph_store._search_ann(
+            make_query_ann(1000, 10),
+            limit=10,
+            selectivity_key=selectivity_key,
+        )
+        is None
+    )
+    assert query_limits == []
+
+    # Too few matches at the maximum number of candidates fall back to exact search.
+    query_limits.clear()
+    assert (
+        await vector_graph_store._search_ann(
+            make_query_ann(1000, 100),
+            limit=5,
+            selectivity_key=("Entity", "embedding", "other filter shape"),
+        )
+        is None
+    )
+    assert query_limits == [10, 20, 40, 80, 100]
+
+    # Every indexed node was a candidate, so the results are complete.
+    query_limits.clear()
+    assert await vector_graph_store._search_ann(
+        make_query_ann(30, 10),
+        limit=5,
+        selectivity_key=("Entity", "embedding", "another filter shape"),
+    ) == [0, 1, 2]
+    assert query_limits == [10, 75]
+
+
+@pytest.mark.asyncio
+async def test_exact_search_updates_filter_selectivity(neo4j_driver):
+    vector_graph_store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=neo4j_driver,
+            filtered_similarity_search_max_query_limit=100,
+        ),
+    )
+
+    await vector_graph_store.add_nodes(
+        collection="Entity",
+        nodes=[
+            Node(
+                uid=str(uuid4()),
+                properties={"even": i % 2 == 0},
+                embeddings={
+                    "embedding": ([1.0, i / 100], SimilarityMetric.COSINE),
+                },
+            )
+            for i in range(100)
+        ],
+    )
+
+    property_filter = FilterComparison(field="even", op="=", value=True)
+    selectivity_key = Neo4jVectorGraphStore._filter_selectivity_key(
+        Neo4jVectorGraphStore._sanitize_name("Entity"),
+        Neo4jVectorGraphStore._sanitize_name(mangle_embedding_name("embedding")),
+        property_filter,
+    )
+
+    # A filter estimated to be too selective is searched exactly.
+    vector_graph_store._observe_filter_selectivity(selectivity_key, 0.001)
+    assert vector_graph_store._plan_filtered_ann_search(selectivity_key, 5, 100) is None
+
+    # Exact searches observe the selectivity against the collection size
+    # until ANN search is chosen again.
+    for _ in range(20):
+        results = await vector_graph_store.search_similar_nodes(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=[1.0, 0.0],
+            similarity_metric=SimilarityMetric.COSINE,
+            limit=5,
+            property_filter=property_filter,
+        )
+        assert len(results) == 5
+
+    assert vector_graph_store._filter_selectivities[selectivity_key] > 0.4
+    assert vector_graph_store._plan_filtered_ann_search(selectivity_key, 5, 100) == 16
+
 
 @pytest.mark.asyncio
 async def test_search_related_nodes(vector_graph_store):
@@ -682,6 +943,66 @@ async def test_search_related_nodes(vector_graph_store):
     assert len(results) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_related_nodes(vector_graph_store):
+    episode_uids = [str(uuid4()) for _ in range(3)]
+    derivative_uids = [str(uuid4()) for _ in range(4)]
+
+    await vector_graph_store.add_nodes(
+        collection="Episode",
+        nodes=[Node(uid=uid) for uid in episode_uids],
+    )
+    await vector_graph_store.add_nodes(
+        collection="Derivative",
+        nodes=[Node(uid=uid) for uid in derivative_uids],
+    )
+    await vector_graph_store.add_edges(
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=[
+            Edge(
+                uid=str(uuid4()),
+                source_uid=derivative_uids[derivative_index],
+                target_uid=episode_uids[episode_index],
+            )
+            for derivative_index, episode_index in [
+                (0, 0),
+                (1, 0),
+                (1, 1),
+                (2, 1),
+                (3, 2),
+            ]
+        ],
+    )
+
+    results = await vector_graph_store.get_related_nodes(
+        relation="DERIVED_FROM",
+        other_collection="Derivative",
+        this_collection="Episode",
+        this_node_uids=[episode_uids[0], episode_uids[1], str(uuid4())],
+        find_targets=False,
+    )
+    assert sorted(node.uid for node in results) == sorted(derivative_uids[:3])
+
+    results = await vector_graph_store.get_related_nodes(
+        relation="DERIVED_FROM",
+        other_collection="Derivative",
+        this_collection="Episode",
+        this_node_uids=[episode_uids[0], episode_uids[1]],
+        find_sources=False,
+    )
+    assert results == []
+
+    results = await vector_graph_store.get_related_nodes(
+        relation="DERIVED_FROM",
+        other_collection="Derivative",
+        this_collection="Episode",
+        this_node_uids=[],
+    )
+    assert results == []
+
+
 @pytest.mark.asyncio
 async def test_search_directional_nodes(vector_graph_store):
     time = datetime.now(tz=UTC)
@@ -1054,6 +1375,293 @@ async def test_search_directional_nodes_multiple_by_properties(
     assert results[7].properties["name"] == "Event1"
 
 
+@pytest.mark.asyncio
+async def test_search_similar_node_contexts(vector_graph_store):
+    time = datetime.now(tz=UTC)
+    delta = timedelta(days=1)
+
+    episode_nodes = [
+        Node(
+            uid=f"episode{i}",
+            properties={
+                "name": f"Episode{i}",
+                "timestamp": time + i * delta,
+                "include?": "no" if i == 3 else "yes",
+            },
+        )
+        for i in range(1, 7)
+    ]
+
+    derivative_nodes = [
+        Node(
+            uid="derivative2",
+            properties={"name": "Derivative2", "include?": "yes"},
+            embeddings={"embedding": ([1.0, 0.0], SimilarityMetric.COSINE)},
+        ),
+        Node(
+            uid="derivative5",
+            properties={"name": "Derivative5", "include?": "yes"},
+            embeddings={"embedding": ([1.0, 1.0], SimilarityMetric.COSINE)},
+        ),
+        Node(
+            uid="derivative5b",
+            properties={"name": "Derivative5b", "include?": "yes"},
+            embeddings={"embedding": ([0.0, 1.0], SimilarityMetric.COSINE)},
+        ),
+        Node(
+            uid="derivative3",
+            properties={"name": "Derivative3", "include?": "no"},
+            embeddings={"embedding": ([1.0, 0.1], SimilarityMetric.COSINE)},
+        ),
+    ]
+
+    derived_from_edges = [
+        Edge(
+            uid=str(uuid4()),
+            source_uid=derivative_uid,
+            target_uid=episode_uid,
+        )
+        for derivative_uid, episode_uid in [
+            ("derivative2", "episode2"),
+            ("derivative5", "episode5"),
+            ("derivative5b", "episode5"),
+            ("derivative3", "episode3"),
+        ]
+    ]
+
+    await vector_graph_store.add_nodes(collection="Episode", nodes=episode_nodes)
+    await vector_graph_store.add_nodes(
+        collection="Derivative",
+        nodes=derivative_nodes,
+    )
+    await vector_graph_store.add_edges(
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=derived_from_edges,
+    )
+
+    results = await vector_graph_store.search_similar_node_contexts(
+        collection="Derivative",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+        max_backward_nodes=1,
+        max_forward_nodes=2,
+    )
+    assert [result.node.uid for result in results] == [
+        "episode2",
+        "episode3",
+        "episode5",
+    ]
+    assert [node.uid for node in results[0].backward_nodes] == ["episode1"]
+    assert [node.uid for node in results[0].forward_nodes] == [
+        "episode3",
+        "episode4",
+    ]
+    assert [node.uid for node in results[2].backward_nodes] == ["episode4"]
+    assert [node.uid for node in results[2].forward_nodes] == ["episode6"]
+
+    property_filter = FilterComparison(field="include?", op="=", value="yes")
+    results = await vector_graph_store.search_similar_node_contexts(
+        collection="Derivative",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+        limit=2,
+        max_backward_nodes=2,
+        max_forward_nodes=1,
+        property_filter=property_filter,
+        context_property_filter=property_filter,
+    )
+    assert [result.node.uid for result in results] == ["episode2", "episode5"]
+    assert [node.uid for node in results[0].backward_nodes] == ["episode1"]
+    assert [node.uid for node in results[0].forward_nodes] == ["episode4"]
+    assert [node.uid for node in results[1].backward_nodes] == [
+        "episode4",
+        "episode2",
+    ]
+    assert [node.uid for node in results[1].forward_nodes] == ["episode6"]
+
+    results = await vector_graph_store.search_similar_node_contexts(
+        collection="Derivative",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+        context_property_filter=FilterComparison(
+            field="include?",
+            op="=",
+            value="maybe",
+        ),
+    )
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_search_similar_node_contexts_without_related_nodes(
+    neo4j_driver,
+    monkeypatch,
+):
+    vector_graph_store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=neo4j_driver,
+            filtered_similarity_search_fudge_factor=2,
+            exact_similarity_search_fallback_threshold=0.5,
+            range_index_creation_threshold=0,
+            vector_index_creation_threshold=0,
+            index_state_poll_interval_sec=0.1,
+        ),
+    )
+
+    await vector_graph_store.add_nodes(
+        collection="Derivative",
+        nodes=[
+            Node(
+                uid=f"derivative{i}",
+                properties={"include?": "yes"},
+                embeddings={"embedding": ([1.0, i / 10], SimilarityMetric.COSINE)},
+            )
+            for i in range(10)
+        ],
+    )
+
+    vector_index_name = Neo4jVectorGraphStore._index_name(
+        EntityType.NODE,
+        Neo4jVectorGraphStore._sanitize_name("Derivative"),
+        Neo4jVectorGraphStore._sanitize_name(mangle_embedding_name("embedding")),
+    )
+    for _ in range(100):
+        index_status = vector_graph_store.get_index_statuses().get(vector_index_name)
+        if (
+            index_status is not None
+            and index_status.state == Neo4jVectorGraphStore.CacheIndexState.ONLINE
+        ):
+            break
+        await asyncio.sleep(0.1)
+
+    similarity_queries: list[str] = []
+    execute_query = neo4j_driver.execute_query
+
+    async def record_execute_query(query, *args, **kwargs):
+        if "ORDER BY similarity DESC" in query:
+            similarity_queries.append(query)
+        return await execute_query(query, *args, **kwargs)
+
+    monkeypatch.setattr(neo4j_driver, "execute_query", record_execute_query)
+
+    # Enough ANN matches without related nodes do not fall back to exact search.
+    results = await vector_graph_store.search_similar_node_contexts(
+        collection="Derivative",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+        limit=5,
+        property_filter=FilterComparison(field="include?", op="=", value="yes"),
+    )
+    assert results == []
+    assert len(similarity_queries) == 1
+    assert "db.index.vector.queryNodes" in similarity_queries[0]
+
+    # close() also closes the shared driver, so only the poller is stopped.
+    vector_graph_store._index_state_poll_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_get_related_node_contexts(vector_graph_store):
+    time = datetime.now(tz=UTC)
+    delta = timedelta(days=1)
+
+    episode_nodes = [
+        Node(
+            uid=f"episode{i}",
+            properties={
+                "name": f"Episode{i}",
+                "timestamp": time + i * delta,
+                "include?": "no" if i == 3 else "yes",
+            },
+        )
+        for i in range(1, 7)
+    ]
+
+    derivative_nodes = [
+        Node(uid=derivative_uid, properties={"name": derivative_uid})
+        for derivative_uid in ["derivative2", "derivative3", "derivative5"]
+    ]
+
+    await vector_graph_store.add_nodes(collection="Episode", nodes=episode_nodes)
+    await vector_graph_store.add_nodes(
+        collection="Derivative",
+        nodes=derivative_nodes,
+    )
+    await vector_graph_store.add_edges(
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=[
+            Edge(
+                uid=str(uuid4()),
+                source_uid=derivative_uid,
+                target_uid=episode_uid,
+            )
+            for derivative_uid, episode_uid in [
+                ("derivative2", "episode2"),
+                ("derivative3", "episode3"),
+                ("derivative5", "episode5"),
+            ]
+        ],
+    )
+
+    results = await vector_graph_store.get_related_node_contexts(
+        collection="Derivative",
+        node_uids=["derivative5", "missing", "derivative2", "derivative5"],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+        max_backward_nodes=1,
+        max_forward_nodes=2,
+    )
+    assert [result.node.uid for result in results] == ["episode5", "episode2"]
+    assert [node.uid for node in results[0].backward_nodes] == ["episode4"]
+    assert [node.uid for node in results[0].forward_nodes] == ["episode6"]
+    assert [node.uid for node in results[1].backward_nodes] == ["episode1"]
+    assert [node.uid for node in results[1].forward_nodes] == [
+        "episode3",
+        "episode4",
+    ]
+
+    property_filter = FilterComparison(field="include?", op="=", value="yes")
+    results = await vector_graph_store.get_related_node_contexts(
+        collection="Derivative",
+        node_uids=["derivative3", "derivative2"],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+        context_property_filter=property_filter,
+    )
+    assert [result.node.uid for result in results] == ["episode2"]
+    assert [node.uid for node in results[0].forward_nodes] == [
+        "episode4",
+        "episode5",
+    ]
+
+    results = await vector_graph_store.get_related_node_contexts(
+        collection="Derivative",
+        node_uids=[],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=["timestamp", "uid"],
+    )
+    assert results == []
+
+
 @pytest.mark.asyncio
 async def test_search_matching_nodes(vector_graph_store):
     person_nodes = [
@@ -1558,6 +2166,128 @@ async def test__create_vector_index_if_not_exists(
     assert len(updated_indexes) == len(existing_indexes) + 8
 
 
+@pytest.mark.asyncio
+async def test_index_state_polling(neo4j_driver):
+    vector_graph_store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=neo4j_driver,
+            range_index_creation_threshold=0,
+            vector_index_creation_threshold=0,
+            index_state_poll_interval_sec=0.1,
+        ),
+    )
+
+    vector_index_name = Neo4jVectorGraphStore._index_name(
+        EntityType.NODE,
+        Neo4jVectorGraphStore._sanitize_name("Entity"),
+        Neo4jVectorGraphStore._sanitize_name(mangle_embedding_name("embedding")),
+    )
+
+    async def wait_for_index_state(state):
+        for _ in range(100):
+            index_status = vector_graph_store.get_index_statuses().get(
+                vector_index_name
+            )
+            if index_status is not None and index_status.state == state:
+                return index_status
+            await asyncio.sleep(0.1)
+        raise AssertionError(f"Index did not become {state}")
+
+    await vector_graph_store.add_nodes(
+        collection="Entity",
+        nodes=[
+            Node(
+                uid=str(uuid4()),
+                embeddings={"embedding": ([1.0, 0.0], SimilarityMetric.COSINE)},
+            ),
+        ],
+    )
+
+    # Searches do not wait for indexes to come online.
+    await vector_graph_store.search_similar_nodes(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+    )
+
+    index_status = await wait_for_index_state(
+        Neo4jVectorGraphStore.CacheIndexState.ONLINE,
+    )
+    assert index_status.population_percent == 100.0
+
+    # Dropped indexes are created again by the poller.
+    await neo4j_driver.execute_query(f"DROP INDEX {vector_index_name}")
+    for _ in range(100):
+        records, _, _ = await neo4j_driver.execute_query(
+            "SHOW VECTOR INDEXES YIELD name WHERE name = $name RETURN name",
+            name=vector_index_name,
+        )
+        if records:
+            break
+        await asyncio.sleep(0.1)
+    assert records
+
+    await wait_for_index_state(Neo4jVectorGraphStore.CacheIndexState.ONLINE)
+
+    # close() also closes the shared driver, so only the poller is stopped.
+    vector_graph_store._index_state_poll_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_failed_index_recreated(neo4j_driver):
+    vector_graph_store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=neo4j_driver,
+            range_index_creation_threshold=0,
+            vector_index_creation_threshold=0,
+            index_state_poll_interval_sec=3600,
+        ),
+    )
+
+    vector_index_name = Neo4jVectorGraphStore._index_name(
+        EntityType.NODE,
+        Neo4jVectorGraphStore._sanitize_name("FailedEntity"),
+        Neo4jVectorGraphStore._sanitize_name(mangle_embedding_name("embedding")),
+    )
+
+    async def wait_for_index_id(previous_index_id=None):
+        for _ in range(100):
+            records, _, _ = await neo4j_driver.execute_query(
+                "SHOW INDEXES YIELD name, id WHERE name = $name RETURN id",
+                name=vector_index_name,
+            )
+            if records and records[0]["id"] != previous_index_id:
+                return records[0]["id"]
+            await asyncio.sleep(0.1)
+        raise AssertionError("Index was not created")
+
+    await vector_graph_store.add_nodes(
+        collection="FailedEntity",
+        nodes=[
+            Node(
+                uid=str(uuid4()),
+                embeddings={"embedding": ([1.0, 0.0], SimilarityMetric.COSINE)},
+            ),
+        ],
+    )
+    index_id = await wait_for_index_id()
+
+    # Neo4j cannot be made to fail populating an index on demand.
+    vector_graph_store._index_state_cache[vector_index_name] = (
+        Neo4jVectorGraphStore.CacheIndexState.FAILED
+    )
+    await vector_graph_store._create_missing_indexes()
+
+    assert await wait_for_index_id(index_id) != index_id
+    assert (
+        vector_graph_store.get_index_statuses()[vector_index_name].state
+        != Neo4jVectorGraphStore.CacheIndexState.FAILED
+    )
+
+    # close() also closes the shared driver, so only the poller is stopped.
+    vector_graph_store._index_state_poll_task.cancel()
+
+
 def test__sanitize_desanitize_name():
     names = [
         "normal_name",
@@ -1674,3 +2404,21 @@ async def test__nodes_from_neo4j_nodes(neo4j_driver, vector_graph_store):
     assert len(fetched_nodes) == 3
 
     assert all(fetched_node in nodes for fetched_node in fetched_nodes)
+
+    records, _, _ = await neo4j_driver.execute_query(
+        "MATCH (n) "
+        f"RETURN {
+            Neo4jVectorGraphStore._query_node_projection(
+                'n',
+                include_embeddings=False,
+            )
+        } AS projected_node",
+    )
+    projected_neo4j_nodes = [record["projected_node"] for record in records]
+    fetched_nodes = vector_graph_store._nodes_from_neo4j_nodes(projected_neo4j_nodes)
+    assert len(fetched_nodes) == 3
+
+    assert all(
+        Node(uid=node.uid, properties=node.properties) in fetched_nodes
+        for node in nodes
+    )
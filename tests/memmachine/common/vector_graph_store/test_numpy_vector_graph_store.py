@@ -0,0 +1,455 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.filter.filter_parser import parse_filter
+from memmachine.common.vector_graph_store.data_types import Edge, Node
+from memmachine.common.vector_graph_store.numpy_vector_graph_store import (
+    NumpyVectorGraphStore,
+    NumpyVectorGraphStoreParams,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def vector_graph_store():
+    return NumpyVectorGraphStore(NumpyVectorGraphStoreParams(initial_capacity=1))
+
+
+def make_node(index: int, embedding: list[float], **properties) -> Node:
+    return Node(
+        uid=f"node-{index}",
+        properties={"index": index, **properties},
+        embeddings={"embedding": (embedding, SimilarityMetric.COSINE)},
+    )
+
+
+async def test_add_and_get_nodes(vector_graph_store):
+    nodes = [
+        make_node(0, [1.0, 0.0], name="Alice"),
+        make_node(1, [0.0, 1.0], name="Bob"),
+    ]
+    await vector_graph_store.add_nodes(collection="Entity", nodes=nodes)
+
+    assert await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=["node-1", "node-0", "missing"],
+    ) == [nodes[1], nodes[0]]
+    assert (
+        await vector_graph_store.get_nodes(
+            collection="Other",
+            node_uids=["node-0"],
+        )
+        == []
+    )
+
+    replacement = Node(uid="node-0", properties={"name": "Carol"})
+    await vector_graph_store.add_nodes(collection="Entity", nodes=[replacement])
+    assert await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=["node-0"],
+    ) == [replacement]
+
+    with pytest.raises(ValueError, match="dimensions"):
+        await vector_graph_store.add_nodes(
+            collection="Entity",
+            nodes=[make_node(2, [1.0, 0.0, 0.0])],
+        )
+
+
+async def test_search_similar_nodes(vector_graph_store):
+    nodes = [
+        make_node(index, [1.0, index / 8], group="even" if index % 2 == 0 else "odd")
+        for index in range(10)
+    ]
+    await vector_graph_store.add_nodes(collection="Entity", nodes=nodes)
+
+    results = await vector_graph_store.search_similar_nodes(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        limit=3,
+    )
+    assert [node.uid for node in results] == ["node-0", "node-1", "node-2"]
+
+    results = await vector_graph_store.search_similar_nodes(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        limit=3,
+        property_filter=parse_filter("group = 'odd'"),
+        include_embeddings=False,
+    )
+    assert [node.uid for node in results] == ["node-1", "node-3", "node-5"]
+    assert all(node.embeddings == {} for node in results)
+
+    results = await vector_graph_store.search_similar_nodes(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[0.0, 2.0],
+        similarity_metric=SimilarityMetric.EUCLIDEAN,
+        limit=None,
+        property_filter=parse_filter("index >= 7"),
+    )
+    assert [node.uid for node in results] == ["node-9", "node-8", "node-7"]
+
+    await vector_graph_store.delete_nodes(
+        collection="Entity",
+        node_uids=["node-0", "node-1"],
+    )
+    results = await vector_graph_store.search_similar_nodes(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+        limit=1,
+    )
+    # Embeddings are stored with float32 precision.
+    assert results == [nodes[2]]
+
+
+async def test_search_related_nodes(vector_graph_store):
+    await vector_graph_store.add_nodes(
+        collection="Person",
+        nodes=[Node(uid="alice"), Node(uid="bob"), Node(uid="carol")],
+    )
+    await vector_graph_store.add_edges(
+        relation="KNOWS",
+        source_collection="Person",
+        target_collection="Person",
+        edges=[
+            Edge(
+                uid=str(uuid4()),
+                source_uid="alice",
+                target_uid="bob",
+                properties={"since": 2020},
+            ),
+            Edge(
+                uid=str(uuid4()),
+                source_uid="carol",
+                target_uid="alice",
+                properties={"since": 2010},
+            ),
+            Edge(uid=str(uuid4()), source_uid="alice", target_uid="missing"),
+        ],
+    )
+
+    async def related(**kwargs) -> set[str]:
+        nodes = await vector_graph_store.search_related_nodes(
+            relation="KNOWS",
+            other_collection="Person",
+            this_collection="Person",
+            this_node_uid="alice",
+            **kwargs,
+        )
+        return {node.uid for node in nodes}
+
+    assert await related() == {"bob", "carol"}
+    assert await related(find_sources=False) == {"bob"}
+    assert await related(find_targets=False) == {"carol"}
+    assert await related(edge_property_filter=parse_filter("since < 2015")) == {"carol"}
+
+    await vector_graph_store.delete_nodes(collection="Person", node_uids=["bob"])
+    assert await related() == {"carol"}
+
+
+async def test_get_related_nodes(vector_graph_store):
+    await vector_graph_store.add_nodes(
+        collection="Episode",
+        nodes=[Node(uid="episode-1"), Node(uid="episode-2"), Node(uid="episode-3")],
+    )
+    await vector_graph_store.add_nodes(
+        collection="Derivative",
+        nodes=[Node(uid=f"derivative-{index}") for index in range(4)],
+    )
+    await vector_graph_store.add_edges(
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=[
+            Edge(uid=str(uuid4()), source_uid=source_uid, target_uid=target_uid)
+            for source_uid, target_uid in [
+                ("derivative-0", "episode-1"),
+                ("derivative-1", "episode-1"),
+                ("derivative-1", "episode-2"),
+                ("derivative-2", "episode-2"),
+                ("derivative-3", "episode-3"),
+            ]
+        ],
+    )
+
+    async def related(this_node_uids, **kwargs) -> list[str]:
+        nodes = await vector_graph_store.get_related_nodes(
+            relation="DERIVED_FROM",
+            other_collection="Derivative",
+            this_collection="Episode",
+            this_node_uids=this_node_uids,
+            **kwargs,
+        )
+        return sorted(node.uid for node in nodes)
+
+    assert await related(["episode-1", "episode-2", "missing"]) == [
+        "derivative-0",
+        "derivative-1",
+        "derivative-2",
+    ]
+    assert await related(["episode-1", "episode-2"], find_sources=False) == []
+    assert await related([]) == []
+
+
+async def test_search_directional_nodes(vector_graph_store):
+    base_time = datetime(2025, 1, 1, tzinfo=UTC)
+    nodes = [
+        Node(
+            uid=f"episode-{index}",
+            properties={
+                "timestamp": base_time + timedelta(minutes=index // 2),
+                "uid": f"episode-{index}",
+                "producer_id": "user" if index % 3 == 0 else "assistant",
+            },
+        )
+        for index in range(6)
+    ]
+    await vector_graph_store.add_nodes(collection="Episode", nodes=nodes)
+
+    async def directional(starting_at, order_ascending, **kwargs) -> list[str]:
+        results = await vector_graph_store.search_directional_nodes(
+            collection="Episode",
+            by_properties=("timestamp", "uid"),
+            starting_at=starting_at,
+            order_ascending=order_ascending,
+            **kwargs,
+        )
+        return [node.uid for node in results]
+
+    anchor = (base_time + timedelta(minutes=1), "episode-2")
+    assert await directional(anchor, (True, True), limit=2) == [
+        "episode-3",
+        "episode-4",
+    ]
+    assert await directional(
+        anchor,
+        (True, True),
+        limit=2,
+        include_equal_start=True,
+    ) == ["episode-2", "episode-3"]
+    assert await directional(anchor, (False, False), limit=None) == [
+        "episode-1",
+        "episode-0",
+    ]
+    assert await directional((anchor[0], None), (False, False), limit=None) == [
+        "episode-3",
+        "episode-2",
+        "episode-1",
+        "episode-0",
+    ]
+    assert await directional((None, None), (True, False), limit=3) == [
+        "episode-1",
+        "episode-0",
+        "episode-3",
+    ]
+    assert await directional(
+        (None, None),
+        (True, True),
+        limit=None,
+        property_filter=parse_filter("producer_id = 'user'"),
+    ) == ["episode-0", "episode-3"]
+
+    with pytest.raises(ValueError, match="Lengths"):
+        await directional((None,), (True, True))
+
+
+async def test_search_similar_node_contexts(vector_graph_store):
+    base_time = datetime(2025, 1, 1, tzinfo=UTC)
+    episodes = [
+        Node(
+            uid=f"episode-{index}",
+            properties={
+                "timestamp": base_time + timedelta(minutes=index),
+                "uid": f"episode-{index}",
+                "session": "a" if index < 5 else "b",
+            },
+        )
+        for index in range(8)
+    ]
+    derivatives = [
+        make_node(index, [1.0, index / 10], session="a" if index < 5 else "b")
+        for index in range(8)
+    ]
+    await vector_graph_store.add_subgraph(
+        nodes={"Episode": episodes, "Derivative": derivatives},
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=[
+            Edge(
+                uid=str(uuid4()),
+                source_uid=derivative.uid,
+                target_uid=episode.uid,
+            )
+            for derivative, episode in zip(derivatives, episodes, strict=True)
+        ],
+    )
+
+    contexts = await vector_graph_store.search_similar_node_contexts(
+        collection="Derivative",
+        embedding_name="embedding",
+        query_embedding=[0.0, 1.0],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=("timestamp", "uid"),
+        limit=2,
+        max_backward_nodes=1,
+        max_forward_nodes=2,
+        property_filter=parse_filter("session = 'a'"),
+        context_property_filter=parse_filter("session = 'a'"),
+    )
+
+    assert [context.node.uid for context in contexts] == ["episode-4", "episode-3"]
+    assert [node.uid for node in contexts[0].backward_nodes] == ["episode-3"]
+    assert contexts[0].forward_nodes == []
+    assert [node.uid for node in contexts[1].backward_nodes] == ["episode-2"]
+    assert [node.uid for node in contexts[1].forward_nodes] == ["episode-4"]
+
+
+async def test_get_related_node_contexts(vector_graph_store):
+    base_time = datetime(2025, 1, 1, tzinfo=UTC)
+    episodes = [
+        Node(
+            uid=f"episode-{index}",
+            properties={
+                "timestamp": base_time + timedelta(minutes=index),
+                "uid": f"episode-{index}",
+                "session": "a" if index < 5 else "b",
+            },
+        )
+        for index in range(8)
+    ]
+    derivatives = [make_node(index, [1.0, 0.0]) for index in range(8)]
+    await vector_graph_store.add_subgraph(
+        nodes={"Episode": episodes, "Derivative": derivatives},
+        relation="DERIVED_FROM",
+        source_collection="Derivative",
+        target_collection="Episode",
+        edges=[
+            Edge(
+                uid=str(uuid4()),
+                source_uid=derivative.uid,
+                target_uid=episode.uid,
+            )
+            for derivative, episode in zip(derivatives, episodes, strict=True)
+        ],
+    )
+
+    contexts = await vector_graph_store.get_related_node_contexts(
+        collection="Derivative",
+        node_uids=["node-3", "node-6", "missing", "node-1", "node-3"],
+        relation="DERIVED_FROM",
+        context_collection="Episode",
+        context_by_properties=("timestamp", "uid"),
+        max_backward_nodes=1,
+        max_forward_nodes=2,
+        context_property_filter=parse_filter("session = 'a'"),
+    )
+
+    assert [context.node.uid for context in contexts] == ["episode-3", "episode-1"]
+    assert [node.uid for node in contexts[0].backward_nodes] == ["episode-2"]
+    assert [node.uid for node in contexts[0].forward_nodes] == ["episode-4"]
+    assert [node.uid for node in contexts[1].backward_nodes] == ["episode-0"]
+    assert [node.uid for node in contexts[1].forward_nodes] == [
+        "episode-2",
+        "episode-3",
+    ]
+
+    assert (
+        await vector_graph_store.get_related_node_contexts(
+            collection="Derivative",
+            node_uids=[],
+            relation="DERIVED_FROM",
+            context_collection="Episode",
+            context_by_properties=("timestamp", "uid"),
+        )
+        == []
+    )
+
+
+async def test_search_matching_nodes(vector_graph_store):
+    nodes = [
+        Node(uid=f"node-{index}", properties={"index": index, "flag": index < 2})
+        for index in range(4)
+    ]
+    await vector_graph_store.add_nodes(collection="Entity", nodes=nodes)
+
+    assert await vector_graph_store.search_matching_nodes(
+        collection="Entity",
+        property_filter=parse_filter("flag = true OR index IN (3)"),
+    ) == [nodes[0], nodes[1], nodes[3]]
+    assert await vector_graph_store.search_matching_nodes(
+        collection="Entity",
+        limit=1,
+        property_filter=parse_filter("missing IS NULL AND index > 0"),
+    ) == [nodes[1]]
+    # Values of different types are never equal.
+    assert (
+        await vector_graph_store.search_matching_nodes(
+            collection="Entity",
+            property_filter=parse_filter("flag = 1"),
+        )
+        == []
+    )
+
+    await vector_graph_store.delete_all_data()
+    assert await vector_graph_store.search_matching_nodes(collection="Entity") == []
+
+
+async def test_snapshot_round_trip(tmp_path):
+    params = NumpyVectorGraphStoreParams(snapshot_path=str(tmp_path / "graph"))
+    vector_graph_store = NumpyVectorGraphStore(params)
+
+    nodes = [make_node(index, [1.0, index / 4]) for index in range(4)]
+    await vector_graph_store.add_nodes(collection="Entity", nodes=nodes)
+    await vector_graph_store.add_edges(
+        relation="NEXT",
+        source_collection="Entity",
+        target_collection="Entity",
+        edges=[Edge(uid="edge", source_uid="node-0", target_uid="node-1")],
+    )
+    await vector_graph_store.close()
+
+    restored_store = NumpyVectorGraphStore(params)
+    assert (
+        await restored_store.get_nodes(
+            collection="Entity",
+            node_uids=[node.uid for node in nodes],
+        )
+        == nodes
+    )
+    related_nodes = await restored_store.search_related_nodes(
+        relation="NEXT",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uid="node-0",
+    )
+    assert related_nodes == [nodes[1]]
+
+    # Memory-mapped embeddings are copied on the first write.
+    await restored_store.delete_nodes(collection="Entity", node_uids=["node-0"])
+    await restored_store.add_nodes(
+        collection="Entity",
+        nodes=[make_node(4, [0.0, 1.0])],
+    )
+    results = await restored_store.search_similar_nodes(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[0.0, 1.0],
+        limit=2,
+    )
+    assert [node.uid for node in results] == ["node-4", "node-3"]
+    await restored_store.save_snapshot()
+
+    assert len(list((tmp_path / "graph").glob("snapshot_*"))) == 1
+    restored_again_store = NumpyVectorGraphStore(params)
+    results = await restored_again_store.search_matching_nodes(collection="Entity")
+    assert {node.uid for node in results} == {"node-1", "node-2", "node-3", "node-4"}
@@ -732,6 +732,44 @@ async def test_delete_episodes(declarative_memory):
     assert all(episode not in all_episodes for episode in special_episodes)
 
 
+@pytest.mark.asyncio
+async def test_delete_matching_episodes(declarative_memory):
+    now = datetime.now(tz=UTC)
+    episodes = [
+        Episode(
+            uid=str(uuid4()),
+            timestamp=now + i * timedelta(seconds=1),
+            source="filler",
+            content_type=ContentType.MESSAGE,
+            content=str(uuid4()),
+            filterable_properties={"project": "memmachine" if i < 7 else "other"},
+        )
+        for i in range(10)
+    ]
+
+    await declarative_memory.add_episodes(episodes)
+
+    progress = []
+    num_deleted_episodes = await declarative_memory.delete_matching_episodes(
+        property_filter=FilterComparison(
+            field="project",
+            op="=",
+            value="memmachine",
+        ),
+        batch_size=3,
+        progress_callback=progress.append,
+    )
+    assert num_deleted_episodes == 7
+    assert progress == [3, 6, 7]
+
+    all_episodes = await declarative_memory.get_matching_episodes()
+    assert set(all_episodes) == set(episodes[7:])
+
+    num_deleted_episodes = await declarative_memory.delete_matching_episodes()
+    assert num_deleted_episodes == 3
+    assert await declarative_memory.get_matching_episodes() == []
+
+
 def test_string_from_episode_context():
     now = datetime.now(tz=UTC)
     episode1 = Episode(
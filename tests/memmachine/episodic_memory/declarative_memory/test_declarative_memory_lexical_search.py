@@ -0,0 +1,201 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.embedder import Embedder
+from memmachine.common.filter.filter_parser import parse_filter
+from memmachine.common.reranker import Reranker
+from memmachine.common.reranker.bm25_index import (
+    BM25Index,
+    BM25IndexParams,
+    get_tokenizer,
+)
+from memmachine.common.vector_graph_store.numpy_vector_graph_store import (
+    NumpyVectorGraphStore,
+    NumpyVectorGraphStoreParams,
+)
+from memmachine.episodic_memory.declarative_memory import (
+    ContentType,
+    DeclarativeMemory,
+    DeclarativeMemoryParams,
+    Episode,
+)
+
+pytestmark = pytest.mark.asyncio
+
+NUM_FILLER_EPISODES = 100
+
+
+class LengthEmbedder(Embedder):
+    """Embed text so that longer text is less similar to any query."""
+
+    def __init__(self):
+        super().__init__()
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        return [[1.0, float(len(_input))] for _input in inputs]
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        return [[1.0, 0.0] for _ in queries]
+
+    @property
+    def model_id(self) -> str:
+        return "length-model"
+
+    @property
+    def dimensions(self) -> int:
+        return 2
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        return SimilarityMetric.COSINE
+
+
+class KeywordReranker(Reranker):
+    """Score candidates containing a keyword, shorter candidates higher."""
+
+    def __init__(self, keyword: str):
+        super().__init__()
+        self._keyword = keyword
+
+    async def score(self, query: str, candidates: list[str]) -> list[float]:
+        return [
+            float(self._keyword in candidate) / len(candidate)
+            for candidate in candidates
+        ]
+
+
+@pytest.fixture
+def vector_graph_store():
+    return NumpyVectorGraphStore(NumpyVectorGraphStoreParams())
+
+
+def make_declarative_memory(
+    vector_graph_store,
+    *,
+    lexical_search: bool,
+    lexical_index_load_batch_size: int = 1000,
+):
+    return DeclarativeMemory(
+        DeclarativeMemoryParams(
+            session_id="test_session",
+            embedder=LengthEmbedder(),
+            reranker=KeywordReranker("zebra"),
+            vector_graph_store=vector_graph_store,
+            lexical_index=(
+                BM25Index(BM25IndexParams(tokenize=get_tokenizer("simple", "english")))
+                if lexical_search
+                else None
+            ),
+            lexical_index_load_batch_size=lexical_index_load_batch_size,
+        ),
+    )
+
+
+@pytest.fixture
+def episodes():
+    base_time = datetime(2025, 1, 1, tzinfo=UTC)
+    filler_episodes = [
+        Episode(
+            uid=f"filler-{index}",
+            timestamp=base_time + timedelta(minutes=index),
+            source="user",
+            content_type=ContentType.MESSAGE,
+            content=f"Filler message {index:03d}.",
+            filterable_properties={"group": "filler"},
+        )
+        for index in range(NUM_FILLER_EPISODES)
+    ]
+    # Longest content, so it is the least similar to every query
+    # and beyond the vector search limit.
+    zebra_episode = Episode(
+        uid="zebra",
+        timestamp=base_time + timedelta(minutes=NUM_FILLER_EPISODES),
+        source="user",
+        content_type=ContentType.MESSAGE,
+        content="The zebra escaped from the zoo and wandered through the park.",
+        filterable_properties={"group": "zebra"},
+    )
+    return [*filler_episodes, zebra_episode]
+
+
+async def test_search_merges_lexical_matches(vector_graph_store, episodes):
+    declarative_memory = make_declarative_memory(
+        vector_graph_store,
+        lexical_search=True,
+    )
+    await declarative_memory.add_episodes(episodes)
+
+    results = await declarative_memory.search(
+        "Where is the zebra?",
+        max_num_episodes=1,
+    )
+    assert [episode.uid for episode in results] == ["zebra"]
+
+    results = await declarative_memory.search(
+        "Where is the zebra?",
+        max_num_episodes=1,
+        property_filter=parse_filter("group = 'filler'"),
+    )
+    assert "zebra" not in [episode.uid for episode in results]
+
+
+async def test_search_without_lexical_index_misses_match(
+    vector_graph_store,
+    episodes,
+):
+    declarative_memory = make_declarative_memory(
+        vector_graph_store,
+        lexical_search=False,
+    )
+    await declarative_memory.add_episodes(episodes)
+
+    results = await declarative_memory.search(
+        "Where is the zebra?",
+        max_num_episodes=1,
+    )
+    assert [episode.uid for episode in results] == [
+        f"filler-{NUM_FILLER_EPISODES - 1}",
+    ]
+
+
+async def test_lexical_index_loaded_from_store(vector_graph_store, episodes):
+    await make_declarative_memory(
+        vector_graph_store,
+        lexical_search=False,
+    ).add_episodes(episodes)
+
+    declarative_memory = make_declarative_memory(
+        vector_graph_store,
+        lexical_search=True,
+        lexical_index_load_batch_size=7,
+    )
+    lexical_index = declarative_memory._lexical_index
+
+    # The first search starts loading the stored derivatives in the background.
+    await declarative_memory.search("Where is the zebra?", max_num_episodes=1)
+    await declarative_memory.wait_for_lexical_index()
+    assert lexical_index.num_documents == len(episodes)
+
+    results = await declarative_memory.search(
+        "Where is the zebra?",
+        max_num_episodes=1,
+    )
+    assert [episode.uid for episode in results] == ["zebra"]
+
+    await declarative_memory.delete_episodes(["zebra"])
+    results = await declarative_memory.search(
+        "Where is the zebra?",
+        max_num_episodes=1,
+    )
+    assert "zebra" not in [episode.uid for episode in results]
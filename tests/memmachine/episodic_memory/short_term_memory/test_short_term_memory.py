@@ -1,6 +1,8 @@
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from typing import Any, TypeVar
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
@@ -11,9 +13,11 @@ from memmachine.common.configuration.episodic_config import (
 from memmachine.common.episode_store import (
     ContentType,
     Episode,
+    EpisodeStorage,
 )
 from memmachine.common.filter.filter_parser import parse_filter
 from memmachine.common.language_model import LanguageModel
+from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.session_manager.session_data_manager import SessionDataManager
 from memmachine.episodic_memory.short_term_memory.short_term_memory import (
     ShortTermMemory,
@@ -127,6 +131,27 @@ class MockLanguageModel(LanguageModel):
         return "summary"
 
 
+class BlockingLanguageModel(MockLanguageModel):
+    """Language model that returns numbered summaries once released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def generate_response(
+        self,
+        system_prompt: str | None = None,
+        user_prompt: str | None = None,
+        tools: list | None = None,
+        tool_choice: str | dict[str, str] | None = None,
+        max_attempts: int = 1,
+    ) -> tuple[str, Any]:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return f"summary {call}", ""
+
+
 @pytest.fixture
 def mock_model():
     """Fixture for a mocked language model."""
@@ -189,6 +214,7 @@ class TestSessionMemoryPublicAPI:
         # session memory is full
         episode3 = create_test_episode(content="!" * 7)
         await memory.add_episodes([episode3])
+        await memory.wait_for_summary()
 
         episodes, summary = await memory.get_short_term_memory_context(query="test")
         assert episodes == [episode1, episode2, episode3]
@@ -229,6 +255,7 @@ class TestSessionMemoryPublicAPI:
         ep3 = create_test_episode(content="cdefgh")
         # Add episodes, it should trigger summarization
         await memory.add_episodes([ep1, ep2, ep3])
+        await memory.wait_for_summary()
         episodes, summary = await memory.get_short_term_memory_context(query="test")
         assert episodes == [ep1, ep2, ep3]
         assert summary == "summary"
@@ -259,6 +286,7 @@ class TestSessionMemoryPublicAPI:
         ep2 = create_test_episode(content="b" * 6)
         ep3 = create_test_episode(content="c" * 6)
         await memory.add_episodes([ep1, ep2, ep3])
+        await memory.wait_for_summary()
 
         # Test with message length limit that fits all
         episodes, summary = await memory.get_short_term_memory_context(
@@ -366,3 +394,199 @@ class TestSessionMemoryPublicAPI:
         )
         assert len(episodes) == 2
         assert episodes == [ep1, ep2]
+
+
+@pytest.fixture
+def blocking_model():
+    return BlockingLanguageModel()
+
+
+@pytest_asyncio.fixture
+async def blocking_memory(short_term_memory_param, blocking_model):
+    short_term_memory_param.llm_model = blocking_model
+    return await ShortTermMemory.create(short_term_memory_param)
+
+
+@pytest.mark.asyncio
+class TestSessionMemoryBackgroundSummary:
+    """Test suite for summaries generated in the background."""
+
+    async def test_read_does_not_wait_for_summary(
+        self, blocking_memory, blocking_model, mock_data_manager
+    ):
+        episodes = [create_test_episode(content=c * 6) for c in "abc"]
+        await asyncio.wait_for(blocking_memory.add_episodes(episodes), timeout=1)
+
+        context, summary = await asyncio.wait_for(
+            blocking_memory.get_short_term_memory_context(query="test"),
+            timeout=1,
+        )
+        assert context == episodes
+        assert summary == ""
+
+        blocking_model.release.set()
+        await blocking_memory.wait_for_summary()
+        _, summary = await blocking_memory.get_short_term_memory_context(query="test")
+        assert summary == "summary 1"
+        assert mock_data_manager.data["session1"] == ("summary 1", 1, 3)
+
+    async def test_read_keeps_evicted_episodes_until_summary_commits(
+        self, blocking_memory, blocking_model
+    ):
+        episodes = [create_test_episode(content=c * 6) for c in "abc"]
+        await blocking_memory.add_episodes(episodes)
+        new_episode = create_test_episode(content="d" * 6)
+        await blocking_memory.add_episodes([new_episode])
+
+        # The summary of the evicted episodes is still being generated.
+        context, summary = await blocking_memory.get_short_term_memory_context(
+            query="test"
+        )
+        assert context == [*episodes, new_episode]
+        assert summary == ""
+
+        blocking_model.release.set()
+        await blocking_memory.wait_for_summary()
+        context, summary = await blocking_memory.get_short_term_memory_context(
+            query="test"
+        )
+        assert context == [episodes[2], new_episode]
+        assert summary == "summary 1"
+
+    async def test_add_episodes_does_not_wait_for_summary(
+        self, blocking_memory, blocking_model
+    ):
+        await blocking_memory.add_episodes(
+            [create_test_episode(content=c * 6) for c in "abc"]
+        )
+        await asyncio.wait_for(
+            blocking_memory.add_episodes([create_test_episode(content="d" * 6)]),
+            timeout=1,
+        )
+        await asyncio.wait_for(
+            blocking_memory.add_episodes(
+                [create_test_episode(content=c * 6) for c in "ef"]
+            ),
+            timeout=1,
+        )
+
+        blocking_model.release.set()
+        await blocking_memory.wait_for_summary()
+        _, summary = await blocking_memory.get_short_term_memory_context(query="test")
+        assert blocking_model.calls == 2
+        assert summary == "summary 2"
+
+    async def test_clear_discards_pending_summary(
+        self, blocking_memory, blocking_model, mock_data_manager
+    ):
+        await blocking_memory.add_episodes(
+            [create_test_episode(content=c * 6) for c in "abc"]
+        )
+        await asyncio.sleep(0)
+        summary_task = blocking_memory._summary_task
+        await asyncio.wait_for(blocking_memory.clear_memory(), timeout=1)
+        assert summary_task.cancelled()
+
+        blocking_model.release.set()
+        await asyncio.sleep(0)
+        await blocking_memory.wait_for_summary()
+        episodes, summary = await blocking_memory.get_short_term_memory_context(
+            query="test"
+        )
+        assert episodes == []
+        assert summary == ""
+        assert "session1" not in mock_data_manager.data
+
+    async def test_summary_wait_metrics(self, short_term_memory_param, blocking_model):
+        summary_metric = MagicMock()
+        metrics_factory = MagicMock(spec=MetricsFactory)
+        metrics_factory.get_summary.return_value = summary_metric
+        short_term_memory_param.llm_model = blocking_model
+        short_term_memory_param.metrics_factory = metrics_factory
+        short_term_memory_param.user_metrics_labels = {"label": "value"}
+        memory = await ShortTermMemory.create(short_term_memory_param)
+
+        await memory.add_episodes([create_test_episode(content=c * 6) for c in "abc"])
+        close_task = asyncio.create_task(memory.close())
+        await asyncio.sleep(0)
+        blocking_model.release.set()
+        await close_task
+
+        metrics_factory.get_summary.assert_called_once()
+        assert (
+            metrics_factory.get_summary.call_args.args[0]
+            == "short_term_memory_summary_wait_latency_seconds"
+        )
+        assert (
+            metrics_factory.get_summary.call_args.kwargs["label_names"]
+            == {"label": "value"}.keys()
+        )
+        summary_metric.observe.assert_called_once()
+        assert summary_metric.observe.call_args.kwargs["labels"] == {"label": "value"}
+
+
+@pytest.mark.asyncio
+class TestSessionMemoryRestore:
+    """Test suite for restoring episodes from the episode storage."""
+
+    @pytest.fixture
+    def episode_storage(self):
+        storage = MagicMock(spec=EpisodeStorage)
+        storage.get_latest_episodes = AsyncMock(return_value=[])
+        return storage
+
+    async def test_restore_on_first_read(
+        self, short_term_memory_param, episode_storage, mock_data_manager
+    ):
+        await mock_data_manager.save_short_term_memory("session1", "sum", 2, 2)
+        stored = [
+            create_test_episode(content="aa", sequence_num=2),
+            create_test_episode(content="bb", sequence_num=3),
+        ]
+        episode_storage.get_latest_episodes.return_value = stored
+        short_term_memory_param.episode_storage = episode_storage
+
+        memory = await ShortTermMemory.create(short_term_memory_param)
+        episode_storage.get_latest_episodes.assert_not_called()
+
+        episodes, summary = await memory.get_short_term_memory_context(query="test")
+        assert episodes == stored
+        assert summary == "sum"
+        episode_storage.get_latest_episodes.assert_awaited_once_with(
+            "session1",
+            max_content_length=16 - len("sum"),
+        )
+        assert memory._current_episode_count == 1
+
+        await memory.get_short_term_memory_context(query="test")
+        episode_storage.get_latest_episodes.assert_awaited_once()
+
+    async def test_restore_skips_added_episodes(
+        self, short_term_memory_param, episode_storage
+    ):
+        stored = create_test_episode(content="aa")
+        new = create_test_episode(content="bb")
+        episode_storage.get_latest_episodes.return_value = [stored, new]
+        short_term_memory_param.episode_storage = episode_storage
+
+        memory = await ShortTermMemory.create(short_term_memory_param)
+        await memory.add_episodes([new])
+
+        episodes, _ = await memory.get_short_term_memory_context(query="test")
+        assert episodes == [stored, new]
+        episode_storage.get_latest_episodes.assert_awaited_once()
+
+    async def test_no_restore_after_clear(
+        self, short_term_memory_param, episode_storage
+    ):
+        episode_storage.get_latest_episodes.return_value = [
+            create_test_episode(content="aa"),
+        ]
+        short_term_memory_param.episode_storage = episode_storage
+
+        memory = await ShortTermMemory.create(short_term_memory_param)
+        await memory.clear_memory()
+
+        episodes, _ = await memory.get_short_term_memory_context(query="test")
+        assert episodes == []
+        episode_storage.get_latest_episodes.assert_not_called()
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import json
-from datetime import timedelta
 from pathlib import Path
 
 import pytest
@@ -154,9 +153,9 @@ class TestMemMachineLongMemEval:
         long_mem_conversations,
     ) -> None:
         semantic_service = await memmachine._resources.get_semantic_service()
-        semantic_service._feature_update_message_limit = 0
-        semantic_service._background_ingestion_interval_sec = 0.05
-        semantic_service._feature_time_limit = timedelta(seconds=1)
+        ingestion_scheduler = semantic_service._ingestion_scheduler
+        ingestion_scheduler._message_limit = 1
+        ingestion_scheduler._time_limit_sec = 1
 
         smoke_convo = list(long_mem_conversations[0])
         if len(smoke_convo) > 2:
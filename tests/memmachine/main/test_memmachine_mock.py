@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
@@ -21,7 +22,11 @@ from memmachine.common.errors import SessionNotFoundError
 from memmachine.common.filter.filter_parser import And as FilterAnd
 from memmachine.common.filter.filter_parser import Comparison as FilterComparison
 from memmachine.episodic_memory import EpisodicMemory
-from memmachine.main.memmachine import MemMachine, MemoryType
+from memmachine.main.memmachine import (
+    MemMachine,
+    MemoryType,
+    SessionDeletionStatus,
+)
 from memmachine.semantic_memory.semantic_model import SemanticFeature
 
 
@@ -58,6 +63,56 @@ async def test_delete_session_raises_session_not_found(
         await memmachine.delete_session(DummySessionData("missing-session"))
 
 
+@pytest.mark.asyncio
+async def test_start_session_deletion_reports_progress(
+    minimal_conf, patched_resource_manager
+):
+    session_manager = AsyncMock()
+    session_manager.get_session_info = AsyncMock(return_value=MagicMock())
+    patched_resource_manager.get_session_data_manager = AsyncMock(
+        return_value=session_manager
+    )
+
+    reported = asyncio.Event()
+    proceed = asyncio.Event()
+
+    async def delete_episodic_session(*, session_key, progress_callback):
+        progress_callback(2)
+        reported.set()
+        await proceed.wait()
+        progress_callback(3)
+
+    episodic_manager = AsyncMock()
+    episodic_manager.delete_episodic_session = AsyncMock(
+        side_effect=delete_episodic_session
+    )
+    patched_resource_manager.get_episodic_memory_manager = AsyncMock(
+        return_value=episodic_manager
+    )
+
+    memmachine = MemMachine(minimal_conf, patched_resource_manager)
+    session_data = DummySessionData("session-1")
+
+    deletion = await memmachine.start_session_deletion(session_data)
+    await asyncio.wait_for(reported.wait(), timeout=1)
+    assert deletion.status == SessionDeletionStatus.RUNNING
+    assert deletion.deleted_episodes == 2
+    # A running deletion is not started again.
+    assert await memmachine.start_session_deletion(session_data) is deletion
+
+    proceed.set()
+    await asyncio.sleep(0.01)
+    assert memmachine.get_session_deletion("session-1") is deletion
+    assert deletion.status == SessionDeletionStatus.COMPLETED
+    assert deletion.deleted_episodes == 3
+    episodic_manager.delete_episodic_session.assert_awaited_once()
+
+    session_manager.get_session_info.return_value = None
+    with pytest.raises(SessionNotFoundError):
+        await memmachine.start_session_deletion(DummySessionData("missing-session"))
+    assert memmachine.get_session_deletion("missing-session") is None
+
+
 def _minimal_conf(
     short_memory_enabled: bool = True, long_term_memory_enabled: bool = True
 ) -> Configuration:
@@ -24,6 +24,7 @@ class MockSemanticStorage(SemanticStorage):
         self.get_history_messages_mock = AsyncMock()
         self.get_feature_set_mock = AsyncMock()
         self.add_feature_mock = AsyncMock()
+        self.add_features_bulk_mock = AsyncMock()
         self.add_citations_mock = AsyncMock()
         self.delete_feature_set_mock = AsyncMock()
         self.mark_messages_ingested_mock = AsyncMock()
@@ -62,6 +63,12 @@ class MockSemanticStorage(SemanticStorage):
             metadata=metadata,
         )
 
+    async def add_features_bulk(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[int]:
+        return await self.add_features_bulk_mock(features)
+
     async def update_feature(
         self,
         feature_id: int,
@@ -22,6 +22,8 @@ LEGACY_SCHEMA_FILE = Path(__file__).with_name("original_schema.sql")
 RESET_STATEMENTS: tuple[str, ...] = (
     "DROP TABLE IF EXISTS citations CASCADE",
     "DROP TABLE IF EXISTS set_ingested_history CASCADE",
+    "DROP TABLE IF EXISTS set_history_count CASCADE",
+    "DROP TABLE IF EXISTS set_unconsolidated_section CASCADE",
     "DROP TABLE IF EXISTS feature CASCADE",
     "DROP TABLE IF EXISTS history CASCADE",
     "DROP TABLE IF EXISTS prof CASCADE",
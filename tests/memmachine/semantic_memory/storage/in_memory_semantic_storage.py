@@ -71,6 +71,7 @@ class InMemorySemanticStorage(SemanticStorage):
         self._set_history_map: dict[str, dict[EpisodeIdT, bool]] = {}
         self._history_created_at: dict[tuple[str, EpisodeIdT], datetime] = {}
         self._history_to_sets: dict[EpisodeIdT, dict[str, bool]] = {}
+        self._unconsolidated_sections: dict[str, set[tuple[str, str]]] = {}
         self._next_feature_id = 1
         self._next_history_id = 1
         self._lock = asyncio.Lock()
@@ -88,6 +89,7 @@ class InMemorySemanticStorage(SemanticStorage):
             self._set_history_map.clear()
             self._history_created_at.clear()
             self._history_to_sets.clear()
+            self._unconsolidated_sections.clear()
             self._next_feature_id = 1
             self._next_history_id = 1
 
@@ -133,6 +135,25 @@ class InMemorySemanticStorage(SemanticStorage):
             self._feature_ids_by_set.setdefault(set_id, []).append(feature_id)
             return feature_id
 
+    async def add_features_bulk(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[FeatureIdT]:
+        feature_ids: list[FeatureIdT] = []
+        for new_feature in features:
+            feature_id = await self.add_feature(
+                set_id=new_feature.set_id,
+                category_name=new_feature.category_name,
+                feature=new_feature.feature,
+                value=new_feature.value,
+                tag=new_feature.tag,
+                embedding=new_feature.embedding,
+                metadata=new_feature.metadata,
+            )
+            await self.add_citations(feature_id, new_feature.citations)
+            feature_ids.append(feature_id)
+        return feature_ids
+
     async def update_feature(
         self,
         feature_id: FeatureIdT,
@@ -325,6 +346,53 @@ class InMemorySemanticStorage(SemanticStorage):
 
             return set_ids
 
+    async def get_oldest_uningested_times(
+        self,
+        set_ids: list[SetIdT],
+    ) -> dict[SetIdT, datetime]:
+        async with self._lock:
+            oldest_uningested_times: dict[SetIdT, datetime] = {}
+            for set_id in set_ids:
+                created_ats = [
+                    self._history_created_at.get((set_id, history_id), _utcnow())
+                    for history_id, ingested in self._set_history_map.get(
+                        set_id, {}
+                    ).items()
+                    if not ingested
+                ]
+                if created_ats:
+                    oldest_uningested_times[set_id] = min(created_ats)
+            return oldest_uningested_times
+
+    async def add_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+        sections: list[tuple[str, str]],
+    ) -> None:
+        if not sections:
+            return
+        async with self._lock:
+            self._unconsolidated_sections.setdefault(set_id, set()).update(sections)
+
+    async def claim_unconsolidated_sections(
+        self,
+        set_id: SetIdT,
+    ) -> list[tuple[str, str]]:
+        async with self._lock:
+            return list(self._unconsolidated_sections.pop(set_id, set()))
+
+    async def get_unconsolidated_set_ids(
+        self,
+        *,
+        set_ids: list[SetIdT] | None = None,
+    ) -> list[SetIdT]:
+        async with self._lock:
+            return [
+                set_id
+                for set_id in self._unconsolidated_sections
+                if set_ids is None or set_id in set_ids
+            ]
+
     def _handle_set_change(
         self,
         entry: _FeatureEntry,
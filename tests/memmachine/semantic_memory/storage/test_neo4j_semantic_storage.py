@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from neo4j import AsyncDriver
+
+from memmachine.semantic_memory.storage.neo4j_semantic_storage import (
+    Neo4jSemanticStorage,
+)
+from memmachine.semantic_memory.storage.storage_base import SemanticStorage
+
+EMBEDDING_DIMENSIONS = 2
+
+
+def _feature_record(set_id: str, value: str, score: float) -> dict:
+    return {
+        "score": score,
+        "node": {
+            "id": f"{set_id}-{value}",
+            "set_id": set_id,
+            "category_name": "default",
+            "tag": "food",
+            "feature": "likes",
+            "value": value,
+        },
+    }
+
+
+def _storage_with_sets(
+    set_ids: list[str],
+    execute_query: AsyncMock,
+) -> Neo4jSemanticStorage:
+    driver = MagicMock(spec=AsyncDriver)
+    driver.execute_query = execute_query
+    storage = Neo4jSemanticStorage(driver)
+    for set_id in set_ids:
+        storage._set_embedding_dimensions[set_id] = EMBEDDING_DIMENSIONS
+        storage._vector_index_by_set[set_id] = EMBEDDING_DIMENSIONS
+    return storage
+
+
+def _vector_search_opts() -> SemanticStorage.VectorSearchOpts:
+    return SemanticStorage.VectorSearchOpts(
+        query_embedding=np.array([1.0, 0.0], dtype=float),
+    )
+
+
+@pytest.mark.asyncio
+async def test_vector_search_merges_sets_by_score():
+    records_by_set = {
+        "user1": [
+            _feature_record("user1", "pizza", 0.9),
+            _feature_record("user1", "sushi", 0.4),
+        ],
+        "user2": [
+            _feature_record("user2", "fish", 0.7),
+            _feature_record("user2", "chips", 0.1),
+        ],
+    }
+    storage = _storage_with_sets(list(records_by_set), AsyncMock())
+    index_set_ids = {
+        storage._vector_index_name(set_id): set_id for set_id in records_by_set
+    }
+
+    async def execute_query(query, **params):
+        return records_by_set[index_set_ids[params["index_name"]]], None, None
+
+    storage._driver.execute_query.side_effect = execute_query
+
+    features = await storage.get_feature_set(vector_search_opts=_vector_search_opts())
+    assert [feature.value for feature in features] == [
+        "pizza",
+        "fish",
+        "sushi",
+        "chips",
+    ]
+
+    features = await storage.get_feature_set(
+        page_size=2,
+        page_num=1,
+        vector_search_opts=_vector_search_opts(),
+    )
+    assert [feature.value for feature in features] == ["sushi", "chips"]
+
+
+@pytest.mark.asyncio
+async def test_vector_search_bounds_concurrent_set_queries():
+    set_ids = [
+        f"user{index}"
+        for index in range(2 * Neo4jSemanticStorage._MAX_CONCURRENT_VECTOR_QUERIES)
+    ]
+    num_queries = 0
+    num_running_queries = 0
+    max_running_queries = 0
+
+    async def execute_query(query, **params):
+        nonlocal num_queries, num_running_queries, max_running_queries
+        num_queries += 1
+        num_running_queries += 1
+        max_running_queries = max(max_running_queries, num_running_queries)
+        await asyncio.sleep(0.01)
+        num_running_queries -= 1
+        return [], None, None
+
+    storage = _storage_with_sets(set_ids, AsyncMock(side_effect=execute_query))
+
+    assert await storage.get_feature_set(vector_search_opts=_vector_search_opts()) == []
+    assert num_queries == len(set_ids)
+    assert max_running_queries == Neo4jSemanticStorage._MAX_CONCURRENT_VECTOR_QUERIES
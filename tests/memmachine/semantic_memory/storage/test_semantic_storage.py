@@ -441,6 +441,92 @@ async def test_add_feature_with_citations(
     )
 
 
+@pytest.mark.asyncio
+async def test_add_features_bulk(
+    semantic_storage: SemanticStorage,
+    episode_storage: EpisodeStorage,
+):
+    episodes = await episode_storage.add_episodes(
+        episodes=[
+            EpisodeEntry(
+                content="first",
+                producer_id="profile_id",
+                producer_role="dev",
+            ),
+            EpisodeEntry(
+                content="second",
+                producer_id="profile_id",
+                producer_role="dev",
+            ),
+        ],
+        session_key="session_id",
+    )
+    first_id, second_id = [e.uid for e in episodes]
+
+    assert await semantic_storage.add_features_bulk([]) == []
+
+    feature_ids = await semantic_storage.add_features_bulk(
+        [
+            SemanticStorage.NewFeature(
+                set_id="user",
+                category_name="default",
+                feature="food",
+                value="pizza",
+                tag="preferences",
+                embedding=np.array([1.0, 0.0]),
+                citations=[first_id, second_id],
+            ),
+            SemanticStorage.NewFeature(
+                set_id="other_user",
+                category_name="default",
+                feature="drink",
+                value="tea",
+                tag="preferences",
+                embedding=np.array([0.0, 1.0]),
+                metadata={"source": "bulk"},
+            ),
+            SemanticStorage.NewFeature(
+                set_id="user",
+                category_name="default",
+                feature="color",
+                value="blue",
+                tag="preferences",
+                embedding=np.array([1.0, 1.0]),
+                citations=[second_id],
+            ),
+        ],
+    )
+
+    assert len(feature_ids) == 3
+    assert len(set(feature_ids)) == 3
+
+    pizza, tea, blue = [
+        await semantic_storage.get_feature(feature_id, load_citations=True)
+        for feature_id in feature_ids
+    ]
+
+    assert pizza is not None
+    assert (pizza.set_id, pizza.feature_name, pizza.value) == ("user", "food", "pizza")
+    assert set(pizza.metadata.citations) == {first_id, second_id}
+
+    assert tea is not None
+    assert (tea.set_id, tea.feature_name, tea.value) == ("other_user", "drink", "tea")
+    assert tea.metadata.citations == []
+    assert tea.metadata.other == {"source": "bulk"}
+
+    assert blue is not None
+    assert (blue.set_id, blue.feature_name, blue.value) == ("user", "color", "blue")
+    assert list(blue.metadata.citations) == [second_id]
+
+    results = await semantic_storage.get_feature_set(
+        filter_expr=_expr("set_id IN ('user')"),
+        vector_search_opts=SemanticStorage.VectorSearchOpts(
+            query_embedding=np.array([1.0, 0.0]),
+        ),
+    )
+    assert results[0].value == "pizza"
+
+
 @pytest.mark.asyncio
 async def test_get_feature_without_citations(
     semantic_storage: SemanticStorage,
@@ -859,6 +945,77 @@ async def test_history_ingestion_tracking(
     )
 
 
+@pytest.mark.asyncio
+async def test_history_counts_follow_claims_and_deletes(
+    semantic_storage: SemanticStorage,
+    episode_storage,
+):
+    history_ids = [
+        await _add_episode(episode_storage, content=f"message-{idx}")
+        for idx in range(4)
+    ]
+    beta_history_id = await _add_episode(episode_storage, content="beta")
+
+    for h_id in history_ids:
+        await semantic_storage.add_history_to_set(set_id="alpha", history_id=h_id)
+    await semantic_storage.add_history_to_set(
+        set_id="beta",
+        history_id=beta_history_id,
+    )
+
+    claimed = await semantic_storage.get_history_messages(
+        set_ids=["alpha"],
+        limit=2,
+        is_ingested=False,
+    )
+    assert len(claimed) == 2
+
+    # Claiming or marking ingested history again does not change the counts.
+    await semantic_storage.mark_messages_ingested(set_id="alpha", history_ids=claimed)
+
+    assert (
+        await semantic_storage.get_history_messages_count(
+            set_ids=["alpha"],
+            is_ingested=False,
+        )
+        == 2
+    )
+    assert (
+        await semantic_storage.get_history_messages_count(
+            set_ids=["alpha"],
+            is_ingested=True,
+        )
+        == 2
+    )
+
+    unclaimed = [h_id for h_id in history_ids if h_id not in claimed]
+    await semantic_storage.delete_history([claimed[0], unclaimed[0]])
+
+    assert await semantic_storage.get_history_messages_count(set_ids=["alpha"]) == 2
+    assert (
+        await semantic_storage.get_history_messages_count(
+            set_ids=["alpha"],
+            is_ingested=False,
+        )
+        == 1
+    )
+    assert (
+        await semantic_storage.get_history_messages_count(
+            set_ids=None,
+            is_ingested=False,
+        )
+        == 2
+    )
+    assert set(
+        await semantic_storage.get_history_set_ids(min_uningested_messages=1),
+    ) == {"alpha", "beta"}
+
+    await semantic_storage.delete_history([beta_history_id])
+
+    assert await semantic_storage.get_history_messages_count(set_ids=["beta"]) == 0
+    assert await semantic_storage.get_history_set_ids() == ["alpha"]
+
+
 @pytest.mark.asyncio
 async def test_get_set_ids(
     semantic_storage: SemanticStorage,
@@ -882,6 +1039,36 @@ async def test_get_set_ids(
     assert set_ids == ["user_a", "user_b", "user_c"]
 
 
+@pytest.mark.asyncio
+async def test_unconsolidated_sections_are_claimed_once(
+    semantic_storage: SemanticStorage,
+):
+    await semantic_storage.add_unconsolidated_sections(
+        "user_a",
+        [("default", "food"), ("default", "drink")],
+    )
+    await semantic_storage.add_unconsolidated_sections(
+        "user_a",
+        [("default", "food")],
+    )
+    await semantic_storage.add_unconsolidated_sections("user_b", [("default", "car")])
+
+    assert sorted(await semantic_storage.get_unconsolidated_set_ids()) == [
+        "user_a",
+        "user_b",
+    ]
+    assert await semantic_storage.get_unconsolidated_set_ids(
+        set_ids=["user_a", "user_c"],
+    ) == ["user_a"]
+
+    assert sorted(await semantic_storage.claim_unconsolidated_sections("user_a")) == [
+        ("default", "drink"),
+        ("default", "food"),
+    ]
+    assert await semantic_storage.claim_unconsolidated_sections("user_a") == []
+    assert await semantic_storage.get_unconsolidated_set_ids() == ["user_b"]
+
+
 @pytest.mark.asyncio
 async def test_get_set_ids_with_min_uningested(
     semantic_storage: SemanticStorage,
@@ -978,6 +1165,84 @@ async def test_get_set_ids_with_older_than(
     assert set_ids_after_ingest == set()
 
 
+@pytest.mark.asyncio
+async def test_oldest_uningested_time_follows_removed_history(
+    semantic_storage: SemanticStorage,
+    episode_storage,
+):
+    history_ids = []
+    cutoffs = []
+    for idx in range(3):
+        history_id = await _add_episode(episode_storage, content=f"message-{idx}")
+        await semantic_storage.add_history_to_set(
+            set_id="user",
+            history_id=history_id,
+        )
+        history_ids.append(history_id)
+        await asyncio.sleep(0.01)
+        cutoffs.append(datetime.now(UTC))
+        await asyncio.sleep(0.01)
+
+    # Removing newer history keeps the oldest uningested time.
+    await semantic_storage.delete_history([history_ids[1]])
+    assert await semantic_storage.get_history_set_ids(older_than=cutoffs[0]) == [
+        "user",
+    ]
+
+    # Removing the oldest history moves it to the next uningested history.
+    await semantic_storage.mark_messages_ingested(
+        set_id="user",
+        history_ids=[history_ids[0]],
+    )
+    assert await semantic_storage.get_history_set_ids(older_than=cutoffs[1]) == []
+    assert await semantic_storage.get_history_set_ids(older_than=cutoffs[2]) == [
+        "user",
+    ]
+
+    await semantic_storage.delete_history([history_ids[2]])
+    assert await semantic_storage.get_history_set_ids(older_than=cutoffs[2]) == []
+
+
+@pytest.mark.asyncio
+async def test_get_oldest_uningested_times(
+    semantic_storage: SemanticStorage,
+    episode_storage,
+):
+    history_ids = []
+    cutoffs = []
+    for idx in range(2):
+        history_id = await _add_episode(episode_storage, content=f"message-{idx}")
+        await semantic_storage.add_history_to_set(
+            set_id="user",
+            history_id=history_id,
+        )
+        history_ids.append(history_id)
+        await asyncio.sleep(0.01)
+        cutoffs.append(datetime.now(UTC))
+        await asyncio.sleep(0.01)
+
+    oldest_uningested_times = await semantic_storage.get_oldest_uningested_times(
+        ["user", "other_user"],
+    )
+    assert list(oldest_uningested_times) == ["user"]
+    assert oldest_uningested_times["user"] <= cutoffs[0]
+
+    await semantic_storage.mark_messages_ingested(
+        set_id="user",
+        history_ids=[history_ids[0]],
+    )
+    oldest_uningested_times = await semantic_storage.get_oldest_uningested_times(
+        ["user"],
+    )
+    assert cutoffs[0] < oldest_uningested_times["user"] <= cutoffs[1]
+
+    await semantic_storage.mark_messages_ingested(
+        set_id="user",
+        history_ids=[history_ids[1]],
+    )
+    assert await semantic_storage.get_oldest_uningested_times(["user"]) == {}
+
+
 @pytest.mark.asyncio
 async def test_get_set_ids_with_older_than_and_min_uningested(
     semantic_storage: SemanticStorage,
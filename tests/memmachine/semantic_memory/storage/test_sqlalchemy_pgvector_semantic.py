@@ -0,0 +1,195 @@
+import asyncio
+import contextlib
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from memmachine.common.filter.filter_parser import parse_filter
+from memmachine.semantic_memory.storage.sqlalchemy_pgvector_semantic import (
+    SqlAlchemyPgVectorSemanticStorage,
+    vector_index_name,
+)
+from memmachine.semantic_memory.storage.storage_base import SemanticStorage
+
+pytestmark = pytest.mark.integration
+
+
+@pytest_asyncio.fixture
+async def storage(sqlalchemy_pg_engine: AsyncEngine):
+    storage = SqlAlchemyPgVectorSemanticStorage(
+        sqlalchemy_pg_engine,
+        hnsw_ef_search=20,
+    )
+    await storage.startup()
+    yield storage
+    await storage.delete_all()
+    await storage.cleanup()
+
+
+async def _index_names(engine: AsyncEngine) -> set[str]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = 'feature'"),
+        )
+        return set(result.scalars().all())
+
+
+async def _add_feature(
+    storage: SqlAlchemyPgVectorSemanticStorage,
+    value: str,
+    embedding: list[float],
+) -> None:
+    await storage.add_feature(
+        set_id="user",
+        category_name="default",
+        feature="likes",
+        value=value,
+        tag="food",
+        embedding=np.array(embedding, dtype=float),
+    )
+
+
+@pytest.mark.asyncio
+async def test_adding_features_creates_index_per_dimension(
+    storage: SqlAlchemyPgVectorSemanticStorage,
+    sqlalchemy_pg_engine: AsyncEngine,
+):
+    await _add_feature(storage, "pizza", [1.0, 0.0, 0.0])
+    await storage.add_features_bulk(
+        [
+            SemanticStorage.NewFeature(
+                set_id="user",
+                category_name="default",
+                feature="likes",
+                value="sushi",
+                tag="food",
+                embedding=np.array([1.0, 0.0, 0.0, 0.0]),
+            ),
+        ],
+    )
+    await storage.wait_for_vector_indexes()
+
+    index_names = await _index_names(sqlalchemy_pg_engine)
+    assert vector_index_name(3) in index_names
+    assert vector_index_name(4) in index_names
+
+
+@pytest.mark.asyncio
+async def test_vector_search_ignores_other_dimensions(
+    storage: SqlAlchemyPgVectorSemanticStorage,
+):
+    await _add_feature(storage, "pizza", [1.0, 0.0])
+    await _add_feature(storage, "sushi", [0.0, 1.0])
+    await _add_feature(storage, "pasta", [1.0, 0.0, 0.0])
+
+    results = await storage.get_feature_set(
+        filter_expr=parse_filter("set_id IN (user)"),
+        page_size=10,
+        vector_search_opts=SemanticStorage.VectorSearchOpts(
+            query_embedding=np.array([1.0, 0.1]),
+            min_distance=None,
+        ),
+    )
+
+    assert [feature.value for feature in results] == ["pizza", "sushi"]
+
+
+@pytest.mark.asyncio
+async def test_vector_search_uses_dimension_index(
+    storage: SqlAlchemyPgVectorSemanticStorage,
+    sqlalchemy_pg_engine: AsyncEngine,
+):
+    await _add_feature(storage, "pizza", [1.0, 0.0])
+    await storage.wait_for_vector_indexes()
+
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "ORDER BY" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(sqlalchemy_pg_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await storage.get_feature_set(
+            page_size=5,
+            vector_search_opts=SemanticStorage.VectorSearchOpts(
+                query_embedding=np.array([1.0, 0.0]),
+                min_distance=None,
+            ),
+        )
+    finally:
+        event.remove(
+            sqlalchemy_pg_engine.sync_engine,
+            "before_cursor_execute",
+            capture,
+        )
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+
+    async with sqlalchemy_pg_engine.begin() as conn:
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plan = "\n".join(result.scalars().all())
+
+    assert vector_index_name(2) in plan
+
+
+@pytest.mark.asyncio
+async def test_watch_history_added_reports_other_instances(
+    storage: SqlAlchemyPgVectorSemanticStorage,
+    sqlalchemy_pg_engine: AsyncEngine,
+):
+    other_storage = SqlAlchemyPgVectorSemanticStorage(sqlalchemy_pg_engine)
+    notified_set_ids: list[str] = []
+    notified = asyncio.Event()
+
+    def callback(set_id: str) -> None:
+        notified_set_ids.append(set_id)
+        notified.set()
+
+    assert storage.notifies_history_added
+    watch_task = asyncio.create_task(storage.watch_history_added(callback))
+    try:
+        # Wait for the listener to be registered.
+        await asyncio.sleep(0.2)
+
+        await storage.add_history_to_set(set_id="own", history_id="1")
+        await other_storage.add_history_to_set(set_id="other", history_id="2")
+
+        await asyncio.wait_for(notified.wait(), timeout=5)
+    finally:
+        watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watch_task
+
+    assert notified_set_ids == ["other"]
+
+
+@pytest.mark.asyncio
+async def test_watch_history_added_raises_when_connection_lost(
+    storage: SqlAlchemyPgVectorSemanticStorage,
+    sqlalchemy_pg_engine: AsyncEngine,
+):
+    watch_task = asyncio.create_task(storage.watch_history_added(lambda _: None))
+    try:
+        # Wait for the listener to be registered.
+        await asyncio.sleep(0.2)
+
+        async with sqlalchemy_pg_engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE query LIKE 'LISTEN %' AND pid <> pg_backend_pid()",
+                ),
+            )
+
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(watch_task, timeout=5)
+    finally:
+        watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+            await watch_task
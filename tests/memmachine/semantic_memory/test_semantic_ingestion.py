@@ -206,6 +206,67 @@ async def test_process_single_set_applies_commands(
     assert embedder_double.ingest_calls == [["blue"]]
 
 
+@pytest.mark.asyncio
+async def test_process_single_set_batches_messages_within_token_budget(
+    semantic_storage: SemanticStorage,
+    episode_storage: EpisodeStorage,
+    resource_retriever: MockResourceRetriever,
+    semantic_category: SemanticCategory,
+    monkeypatch,
+):
+    first_id = await add_history(episode_storage, content="I love blue cars")
+    second_id = await add_history(episode_storage, content="I drive a sedan")
+    third_id = await add_history(episode_storage, content="x" * 200)
+    for message_id in [first_id, second_id, third_id]:
+        await semantic_storage.add_history_to_set(
+            set_id="user-123",
+            history_id=message_id,
+        )
+
+    ingestion_service = IngestionService(
+        IngestionService.Params(
+            semantic_storage=semantic_storage,
+            history_store=episode_storage,
+            resource_retriever=resource_retriever,
+            batch_token_budget=20,
+        ),
+    )
+
+    commands = [
+        SemanticCommand(
+            command="add",
+            feature="favorite_car",
+            tag="car",
+            value="blue sedan",
+        ),
+    ]
+    llm_feature_update_mock = AsyncMock(side_effect=[commands, []])
+    monkeypatch.setattr(
+        "memmachine.semantic_memory.semantic_ingestion.llm_feature_update",
+        llm_feature_update_mock,
+    )
+
+    await ingestion_service._process_single_set("user-123")
+
+    assert llm_feature_update_mock.await_count == 2
+    first_call, second_call = llm_feature_update_mock.await_args_list
+    assert first_call.kwargs["message_content"] == (
+        "I love blue cars\n\nI drive a sedan"
+    )
+    assert second_call.kwargs["message_content"] == "x" * 200
+
+    filter_str = (
+        f"set_id IN ('user-123') AND category_name IN ('{semantic_category.name}')"
+    )
+    features = await semantic_storage.get_feature_set(
+        filter_expr=parse_filter(filter_str),
+        load_citations=True,
+    )
+    assert len(features) == 1
+    assert features[0].metadata.citations is not None
+    assert set(features[0].metadata.citations) == {first_id, second_id}
+
+
 @pytest.mark.asyncio
 async def test_consolidation_groups_by_tag(
     ingestion_service: IngestionService,
@@ -243,6 +304,7 @@ async def test_consolidation_groups_by_tag(
     await ingestion_service._consolidate_set_memories_if_applicable(
         set_id="user-456",
         resources=resources,
+        sections={(semantic_category.name, "food")},
     )
 
     assert dedupe_mock.await_count == 1
@@ -254,6 +316,65 @@ async def test_consolidation_groups_by_tag(
     assert call.kwargs["resources"] == resources
 
 
+@pytest.mark.asyncio
+async def test_consolidate_set_only_consolidates_changed_sections(
+    ingestion_service: IngestionService,
+    semantic_storage: SemanticStorage,
+    episode_storage: EpisodeStorage,
+    resource_retriever: MockResourceRetriever,
+    semantic_category: SemanticCategory,
+    monkeypatch,
+):
+    for tag, value in [("food", "thin crust"), ("drink", "tea"), ("drink", "coffee")]:
+        await semantic_storage.add_feature(
+            set_id="user-456",
+            category_name=semantic_category.name,
+            feature="favorite",
+            value=value,
+            tag=tag,
+            embedding=np.array([1.0, -1.0]),
+        )
+
+    message_id = await add_history(episode_storage, content="I like deep dish")
+    await semantic_storage.add_history_to_set(set_id="user-456", history_id=message_id)
+
+    commands = [
+        SemanticCommand(command="add", feature="favorite", tag="food", value="deep"),
+        SemanticCommand(command="add", feature="favorite", tag="car", value="sedan"),
+    ]
+    monkeypatch.setattr(
+        "memmachine.semantic_memory.semantic_ingestion.llm_feature_update",
+        AsyncMock(return_value=commands),
+    )
+    await ingestion_service._process_single_set("user-456")
+
+    # The changed sections are kept in the storage,
+    # so another service consolidates them, e.g. after a restart.
+    consolidating_service = IngestionService(
+        IngestionService.Params(
+            semantic_storage=semantic_storage,
+            history_store=episode_storage,
+            resource_retriever=resource_retriever,
+            consolidated_threshold=2,
+        ),
+    )
+    dedupe_mock = AsyncMock()
+    monkeypatch.setattr(consolidating_service, "_deduplicate_features", dedupe_mock)
+    assert await consolidating_service.has_unconsolidated_sections("user-456")
+
+    await consolidating_service.consolidate_set("user-456")
+
+    # The unchanged drink section and the car section below the threshold
+    # are not consolidated.
+    assert dedupe_mock.await_count == 1
+    memories: list[SemanticFeature] = dedupe_mock.await_args.kwargs["memories"]
+    assert {m.value for m in memories} == {"thin crust", "deep"}
+    assert not await consolidating_service.has_unconsolidated_sections("user-456")
+
+    await consolidating_service.consolidate_set("user-456")
+    assert dedupe_mock.await_count == 1
+
+
 @pytest.mark.asyncio
 async def test_deduplicate_features_merges_and_relabels(
     ingestion_service: IngestionService,
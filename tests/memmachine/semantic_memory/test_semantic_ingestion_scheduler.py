@@ -0,0 +1,305 @@
+"""Tests for the event-driven semantic ingestion scheduler."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from memmachine.semantic_memory.semantic_ingestion import IngestionService
+from memmachine.semantic_memory.semantic_ingestion_scheduler import (
+    IngestionScheduler,
+)
+from memmachine.semantic_memory.storage.storage_base import SemanticStorage
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def storage():
+    storage = MagicMock(spec=SemanticStorage)
+    storage.notifies_history_added = False
+    storage.get_history_set_ids = AsyncMock(return_value=[])
+    storage.get_unconsolidated_set_ids = AsyncMock(return_value=[])
+    storage.get_oldest_uningested_times = AsyncMock(return_value={})
+    storage.get_history_messages_count = AsyncMock(return_value=0)
+    return storage
+
+
+@pytest.fixture
+def processed_set_ids() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def ingestion_service(processed_set_ids):
+    async def process_set_ids(set_ids):
+        await asyncio.sleep(0.01)
+        processed_set_ids.extend(set_ids)
+
+    service = MagicMock(spec=IngestionService)
+    service.process_set_ids = AsyncMock(side_effect=process_set_ids)
+    service.has_unconsolidated_sections.return_value = False
+    return service
+
+
+@asynccontextmanager
+async def running(storage, ingestion_service, **kwargs):
+    params = {
+        "uningested_message_limit": 2,
+        "uningested_time_limit": timedelta(minutes=5),
+        "poll_interval_sec": 60,
+        **kwargs,
+    }
+    scheduler = IngestionScheduler(
+        IngestionScheduler.Params(
+            semantic_storage=storage,
+            ingestion_service=ingestion_service,
+            **params,
+        ),
+    )
+    task = asyncio.create_task(scheduler.run())
+    try:
+        yield scheduler
+    finally:
+        scheduler.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+
+async def test_set_is_ingested_at_message_limit(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    async with running(storage, ingestion_service) as scheduler:
+        scheduler.notify("set-a")
+        await asyncio.sleep(0.05)
+        assert processed_set_ids == []
+
+        scheduler.notify("set-a")
+        await asyncio.sleep(0.05)
+        assert processed_set_ids == ["set-a"]
+
+    storage.get_history_messages_count.assert_awaited_with(
+        set_ids=["set-a"],
+        is_ingested=False,
+    )
+
+
+async def test_set_is_ingested_after_time_limit(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    async with running(
+        storage,
+        ingestion_service,
+        uningested_message_limit=10,
+        uningested_time_limit=timedelta(milliseconds=50),
+    ) as scheduler:
+        scheduler.notify("set-a")
+        await asyncio.sleep(0.01)
+        assert processed_set_ids == []
+
+        await asyncio.sleep(0.1)
+        assert processed_set_ids == ["set-a"]
+
+
+async def test_concurrency_is_bounded(storage, ingestion_service):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def process_set_ids(set_ids):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+
+    ingestion_service.process_set_ids.side_effect = process_set_ids
+
+    async with running(storage, ingestion_service, max_concurrency=2) as scheduler:
+        for i in range(6):
+            scheduler.notify(f"set-{i}", 2)
+        await asyncio.sleep(0.2)
+
+    assert ingestion_service.process_set_ids.await_count == 6
+    assert max_in_flight == 2
+
+
+async def test_set_with_remaining_history_waits_behind_older_sets(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    remaining = {"set-a": [5, 0]}
+
+    async def get_history_messages_count(*, set_ids, is_ingested):
+        counts = remaining.get(set_ids[0], [0])
+        return counts.pop(0) if len(counts) > 1 else counts[0]
+
+    storage.get_history_messages_count.side_effect = get_history_messages_count
+
+    async with running(storage, ingestion_service, max_concurrency=1) as scheduler:
+        scheduler.notify("set-a", 2)
+        # Notify the other sets during the first turn of set-a.
+        await asyncio.sleep(0.005)
+        scheduler.notify("set-c", 2)
+        scheduler.notify("set-b", 2)
+        await asyncio.sleep(0.1)
+
+    assert processed_set_ids == ["set-a", "set-c", "set-b", "set-a"]
+
+
+async def test_set_is_not_ingested_concurrently(storage, ingestion_service):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def process_set_ids(set_ids):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+
+    ingestion_service.process_set_ids.side_effect = process_set_ids
+
+    async with running(storage, ingestion_service, max_concurrency=4) as scheduler:
+        scheduler.notify("set-a", 2)
+        await asyncio.sleep(0)
+        scheduler.notify("set-a", 2)
+        scheduler.notify("set-a", 2)
+        await asyncio.sleep(0.1)
+
+    assert max_in_flight == 1
+
+
+async def test_reconciliation_finds_unreported_sets(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    storage.get_history_set_ids.return_value = ["set-a"]
+
+    async with running(storage, ingestion_service):
+        await asyncio.sleep(0.05)
+
+    assert processed_set_ids == ["set-a"]
+    assert storage.get_history_set_ids.await_args.kwargs["min_uningested_messages"] == 2
+
+
+async def test_reconciled_sets_are_ingested_oldest_history_first(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    now = datetime.now(tz=UTC)
+    storage.get_history_set_ids.return_value = ["set-a", "set-b", "set-c"]
+    storage.get_oldest_uningested_times.return_value = {
+        "set-a": now - timedelta(minutes=1),
+        "set-b": now - timedelta(minutes=10),
+        "set-c": now - timedelta(minutes=5),
+    }
+
+    async with running(storage, ingestion_service, max_concurrency=1):
+        await asyncio.sleep(0.1)
+
+    assert processed_set_ids == ["set-b", "set-c", "set-a"]
+
+
+async def test_reconciliation_consolidates_stored_sections(
+    storage,
+    ingestion_service,
+):
+    storage.get_unconsolidated_set_ids.return_value = ["set-a"]
+
+    async with running(storage, ingestion_service):
+        await asyncio.sleep(0.05)
+
+    ingestion_service.consolidate_set.assert_awaited_once_with("set-a")
+
+
+async def test_storage_notifications_are_scheduled(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    async def watch_history_added(callback):
+        callback("set-a")
+        callback("set-a")
+        await asyncio.Event().wait()
+
+    storage.notifies_history_added = True
+    storage.watch_history_added = AsyncMock(side_effect=watch_history_added)
+
+    async with running(storage, ingestion_service):
+        await asyncio.sleep(0.05)
+
+    assert processed_set_ids == ["set-a"]
+
+
+async def test_unavailable_notifications_fall_back_to_polling(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    storage.notifies_history_added = True
+    storage.watch_history_added = AsyncMock(return_value=None)
+
+    async with running(
+        storage,
+        ingestion_service,
+        reconcile_interval_sec=60,
+        poll_interval_sec=0.01,
+    ):
+        await asyncio.sleep(0.02)
+        storage.get_history_set_ids.return_value = ["set-a"]
+        await asyncio.sleep(0.1)
+
+    # Found by polling well before the reconciliation interval.
+    assert set(processed_set_ids) == {"set-a"}
+
+
+async def test_failed_ingestion_does_not_stop_scheduler(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    async def process_set_ids(set_ids):
+        if set_ids == ["set-a"]:
+            raise ExceptionGroup("Failed to process set ids", [ValueError()])
+        processed_set_ids.extend(set_ids)
+
+    ingestion_service.process_set_ids.side_effect = process_set_ids
+
+    async with running(storage, ingestion_service) as scheduler:
+        scheduler.notify("set-a", 2)
+        await asyncio.sleep(0.02)
+        scheduler.notify("set-b", 2)
+        await asyncio.sleep(0.02)
+
+    assert processed_set_ids == ["set-b"]
+
+
+async def test_consolidation_waits_for_ready_ingestion(
+    storage,
+    ingestion_service,
+    processed_set_ids,
+):
+    async def consolidate_set(set_id):
+        await asyncio.sleep(0.01)
+        processed_set_ids.append(f"consolidate {set_id}")
+
+    ingestion_service.has_unconsolidated_sections.side_effect = lambda set_id: (
+        set_id == "set-a"
+    )
+    ingestion_service.consolidate_set = AsyncMock(side_effect=consolidate_set)
+
+    async with running(storage, ingestion_service, max_concurrency=1) as scheduler:
+        scheduler.notify("set-a", 2)
+        await asyncio.sleep(0.005)
+        scheduler.notify("set-b", 2)
+        await asyncio.sleep(0.1)
+
+    assert processed_set_ids == ["set-a", "set-b", "consolidate set-a"]
@@ -12,7 +12,12 @@ from memmachine.common.errors import (
     SessionAlreadyExistsError,
     SessionNotFoundError,
 )
-from memmachine.main.memmachine import ALL_MEMORY_TYPES, MemoryType
+from memmachine.main.memmachine import (
+    ALL_MEMORY_TYPES,
+    MemoryType,
+    SessionDeletion,
+    SessionDeletionStatus,
+)
 from memmachine.server.api_v2.router import RestError, get_memmachine
 from memmachine.server.api_v2.service import _SessionData
 from memmachine.server.app import MemMachineAPI
@@ -213,6 +218,54 @@ def test_delete_project(client, mock_memmachine):
     assert "Unable to delete project" in response.json()["detail"]["message"]
 
 
+def test_delete_project_in_background(client, mock_memmachine):
+    payload = {"org_id": "test_org", "project_id": "test_proj", "background": True}
+
+    mock_memmachine.start_session_deletion.return_value = SessionDeletion(
+        session_key="test_org/test_proj"
+    )
+    response = client.post("/api/v2/projects/delete", json=payload)
+    assert response.status_code == 202
+    assert response.json() == {
+        "org_id": "test_org",
+        "project_id": "test_proj",
+        "status": "running",
+        "deleted_episodes": 0,
+        "error": None,
+    }
+    mock_memmachine.start_session_deletion.assert_awaited_once()
+    mock_memmachine.delete_session.assert_not_awaited()
+
+    mock_memmachine.start_session_deletion.side_effect = SessionNotFoundError(
+        "test_org/test_proj"
+    )
+    response = client.post("/api/v2/projects/delete", json=payload)
+    assert response.status_code == 404
+
+
+def test_get_project_deletion_status(client, mock_memmachine):
+    payload = {"org_id": "test_org", "project_id": "test_proj"}
+
+    mock_memmachine.get_session_deletion = MagicMock(
+        return_value=SessionDeletion(
+            session_key="test_org/test_proj",
+            status=SessionDeletionStatus.COMPLETED,
+            deleted_episodes=42,
+        )
+    )
+    response = client.post("/api/v2/projects/delete/status", json=payload)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert response.json()["deleted_episodes"] == 42
+    mock_memmachine.get_session_deletion.assert_called_once_with("test_org/test_proj")
+
+    mock_memmachine.get_session_deletion.return_value = None
+    response = client.post("/api/v2/projects/delete/status", json=payload)
+    assert response.status_code == 200
+    assert response.json()["status"] == "unknown"
+    assert response.json()["deleted_episodes"] == 0
+
+
 def test_add_memories(client, mock_memmachine):
     payload = {
         "org_id": "test_org",